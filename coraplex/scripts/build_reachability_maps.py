@@ -0,0 +1,48 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# This script builds the reachability maps of the arms of a robot, which ReachabilityCostmap uses to rank base poses.
+# The robot description is loaded from its ROS package and sampled with its joints at their default positions.
+# Usage: python build_reachability_maps.py PR2 --resolution 0.1 --reach 1.0
+# ----------------------------------------------------------------------------------------------------------------------
+import argparse
+import logging
+
+from coraplex.datastructures.enums import Arms
+from coraplex.locations.reachability import (
+    build_reachability_map,
+    default_reachability_map_directory,
+)
+from semantic_digital_twin.adapters.urdf import URDFParser
+from semantic_digital_twin.robots.hsrb import HSRB
+from semantic_digital_twin.robots.pr2 import PR2
+from semantic_digital_twin.robots.stretch import Stretch
+from semantic_digital_twin.robots.tiago import Tiago
+
+robots = {robot.__name__: robot for robot in [PR2, HSRB, Stretch, Tiago]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("robot", choices=sorted(robots))
+    parser.add_argument("--resolution", type=float, default=0.1)
+    parser.add_argument("--reach", type=float, default=1.0)
+    parser.add_argument("--directory", default=default_reachability_map_directory)
+    arguments = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    robot_class = robots[arguments.robot]
+    world = URDFParser.from_file(file_path=robot_class.get_ros_file_path()).parse()
+    robot = robot_class.from_world(world)
+
+    # Robots with a single arm use it for every arm, see ViewManager.get_all_arm_views
+    reachability_map = None
+    for arm in [Arms.LEFT, Arms.RIGHT]:
+        if reachability_map is None or len(robot.get_arms()) > 1:
+            reachability_map = build_reachability_map(
+                robot, arm, resolution=arguments.resolution, reach=arguments.reach
+            )
+        reachability_map.arm = arm
+        print(f"Saved {reachability_map.save(arguments.directory)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,9 @@ from dataclasses import is_dataclass
 import numpy as np
 
 import giskardpy  # type: ignore
+import coraplex.locations.backends
 import coraplex.locations.costmaps
+import coraplex.locations.reachability
 import semantic_digital_twin.orm.ormatic_interface
 from krrood.adapters.json_serializer import SubclassJSONSerializer
 
@@ -25,7 +27,12 @@ import giskardpy.qp.solvers
 
 ignored_classes = set(classes_of_package(giskardpy.qp.solvers))
 ignored_classes |= set(classes_of_module(coraplex.locations.costmaps))
+ignored_classes |= set(classes_of_module(coraplex.locations.reachability))
 ignored_classes |= {SubclassJSONSerializer}
+ignored_classes |= {
+    coraplex.locations.backends.CandidateEvaluation,
+    coraplex.locations.backends.CandidateEvaluationStatistics,
+}
 
 dependencies = [semantic_digital_twin.orm.ormatic_interface]
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from typing_extensions import TYPE_CHECKING, Type, List
 
@@ -63,6 +64,25 @@ class TipLinkDoesNotMatchAnyArm(DataclassException):
         return "ensure the tip_link is the tool frame of one of the robot's arms."
 
 
+@dataclass
+class ForkWithLiveThreads(DataclassException):
+    """
+    Raised when worker processes would be forked while other threads of the calling process are alive.
+    The workers would inherit locks that these threads hold, e.g. in ROS executors, and could deadlock on them.
+    """
+
+    threads: List[threading.Thread]
+    """
+    The threads that were alive besides the calling thread.
+    """
+
+    def error_message(self) -> str:
+        return f"cannot fork worker processes while other threads are alive: {[thread.name for thread in self.threads]}"
+
+    def suggest_correction(self) -> str:
+        return "evaluate in the calling process with number_of_workers=0, or stop the other threads before iterating."
+
+
 @dataclass
 class ConditionNotSatisfied(PlanFailure):
 
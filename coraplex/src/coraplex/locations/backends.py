@@ -1,7 +1,13 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+import time
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from typing_extensions import List, Union, Iterable
+import numpy as np
+from typing_extensions import List, Union, Iterable, Optional, Iterator, Tuple
 
 from giskardpy.executor import Executor
 from giskardpy.motion_statechart.context import MotionStatechartContext
@@ -17,8 +23,15 @@ from giskardpy.qp.exceptions import InfeasibleException
 from giskardpy.qp.qp_controller_config import QPControllerConfig
 from coraplex.datastructures.enums import Arms
 from coraplex.datastructures.grasp import GraspDescription, GraspPose
-from coraplex.locations.base import Location, PoseGeneratorBackend
-from coraplex.locations.costmaps import Costmap, OccupancyCostmap, GaussianCostmap
+from coraplex.exceptions import ForkWithLiveThreads
+from coraplex.locations.base import Location, PoseGeneratorBackend, logger
+from coraplex.locations.costmaps import (
+    Costmap,
+    OccupancyCostmap,
+    GaussianCostmap,
+    ReachabilityCostmap,
+)
+from coraplex.locations.reachability import ReachabilityMap
 from coraplex.view_manager import ViewManager
 from semantic_digital_twin.collision_checking.collision_rules import (
     AvoidExternalCollisions,
@@ -26,11 +39,182 @@ from semantic_digital_twin.collision_checking.collision_rules import (
     AllowCollisionBetweenGroups,
 )
 from semantic_digital_twin.robots.robot_parts import AbstractRobot, EndEffector
-from semantic_digital_twin.spatial_types.spatial_types import Pose
+from semantic_digital_twin.spatial_types.spatial_types import (
+    Pose,
+    HomogeneousTransformationMatrix,
+)
 from semantic_digital_twin.world import World
 from semantic_digital_twin.world_description.world_entity import Body
 
 
+@dataclass
+class CandidateEvaluationStatistics:
+    """
+    Statistics of the evaluation of the base pose candidates of a GiskardLocationBackend.
+    """
+
+    number_of_workers: int
+    """
+    The number of worker processes that evaluated the candidates, 0 if they were evaluated in the calling process.
+    """
+
+    number_of_evaluated_candidates: int = 0
+    """
+    The number of candidates whose evaluation has finished.
+    """
+
+    number_of_valid_candidates: int = 0
+    """
+    The number of candidates for which the motion reached its end.
+    """
+
+    number_of_stalled_candidates: int = 0
+    """
+    The number of candidates that were aborted because the task error stopped decreasing.
+    """
+
+    number_of_ticks: int = 0
+    """
+    The number of control cycles that were spent on all candidates.
+    """
+
+    time_to_first_valid_pose: Optional[float] = None
+    """
+    The time in seconds from the start of the iteration until the first valid pose was found.
+    """
+
+
+@dataclass
+class CandidateEvaluation:
+    """
+    The outcome of running the motion of a GiskardLocationBackend from one base pose candidate.
+    """
+
+    robot_root_pose: np.ndarray
+    """
+    The pose of the robot root in the world root at the end of the evaluation, as 4x4 matrix.
+    """
+
+    valid: bool
+    """
+    Whether the motion reached its end.
+    """
+
+    stalled: bool
+    """
+    Whether the evaluation was aborted because the task error stopped decreasing.
+    """
+
+    number_of_ticks: int
+    """
+    The number of control cycles that were spent on the candidate.
+    """
+
+
+@dataclass
+class TaskErrorStallDetector:
+    """
+    Stop condition for `Executor.tick_until_end` that detects when the task error, the distance of the tool frame to
+    the goal position, stopped decreasing.
+    """
+
+    world: World
+    """
+    The world in which the motion is executed.
+    """
+
+    end_effector: EndEffector
+    """
+    The end effector whose tool frame is moved to the goal position.
+    """
+
+    goal_position: np.ndarray
+    """
+    The position of the last pose of the sequence in the world root.
+    """
+
+    stall_window: int
+    """
+    Number of control cycles after which the motion counts as stalled if its task error did not decrease in them.
+    """
+
+    minimum_improvement: float
+    """
+    Decrease of the task error in meters that counts as progress.
+    """
+
+    stalled: bool = False
+    """
+    Whether the task error stopped decreasing.
+    """
+
+    _best_error: float = field(default=np.inf, init=False)
+    """
+    The smallest task error so far.
+    """
+
+    _ticks_since_improvement: int = field(default=0, init=False)
+    """
+    The number of control cycles since the task error last decreased by the minimum improvement.
+    """
+
+    def __call__(self) -> bool:
+        """
+        :return: Whether the motion stalled, to be called after every control cycle.
+        """
+        error = np.linalg.norm(
+            self.world.compute_forward_kinematics_np(
+                self.world.root, self.end_effector.tool_frame
+            )[:3, 3]
+            - self.goal_position
+        )
+        if error < self._best_error - self.minimum_improvement:
+            self._best_error = error
+            self._ticks_since_improvement = 0
+        else:
+            self._ticks_since_improvement += 1
+            self.stalled = self._ticks_since_improvement >= self.stall_window
+        return self.stalled
+
+
+_worker_backend: Optional[GiskardLocationBackend] = None
+"""
+The backend that is evaluated in a worker process, inherited from the parent process when the worker is forked.
+"""
+
+_worker_executor: Optional[Tuple[Executor, EndEffector, np.ndarray]] = None
+"""
+The executor of a worker process together with the controlled end effector and the goal position.
+"""
+
+
+def _initialize_worker(backend: GiskardLocationBackend):
+    """
+    Compiles the executor of a worker process on the copy of the world that the process got when it was forked.
+    """
+    global _worker_backend, _worker_executor
+    _worker_backend = backend
+    _worker_executor = backend._setup_candidate_evaluation()
+
+
+def _evaluate_candidate_in_worker(
+    candidate: Tuple[List[float], List[float]],
+) -> CandidateEvaluation:
+    """
+    Evaluates a candidate, given as position and quaternion in the world root, in a worker process.
+    """
+    executor, end_effector, goal_position = _worker_executor
+    world = _worker_backend.world
+    return _worker_backend.evaluate_candidate(
+        Pose.from_xyz_quaternion(
+            *candidate[0], *candidate[1], reference_frame=world.root
+        ),
+        executor,
+        end_effector,
+        goal_position,
+    )
+
+
 @dataclass
 class GiskardLocationBackend(PoseGeneratorBackend):
     """
@@ -71,6 +255,41 @@ class GiskardLocationBackend(PoseGeneratorBackend):
     Distance by which the obstacles should be inflated, is set to the radius of the mobile base by default
     """
 
+    number_of_workers: int = 0
+    """
+    Number of worker processes that evaluate candidates concurrently, each on its own copy of the world with its own
+    compiled executor. If 0, the candidates are evaluated one after another in the calling process.
+    Workers are forked from the calling process, so they are only available on platforms that support forking and
+    only while no other threads, e.g. of ROS nodes, run in the calling process.
+    """
+
+    ticks_per_candidate: int = 3_000
+    """
+    Maximum number of control cycles that are spent on a candidate.
+    """
+
+    stall_window: int = 100
+    """
+    Number of control cycles after which a candidate is aborted if its task error did not decrease in them.
+    """
+
+    minimum_improvement: float = 0.005
+    """
+    Decrease of the task error in meters that counts as progress for the stall detection.
+    """
+
+    maximum_time_to_first_valid_pose: Optional[float] = None
+    """
+    Time in seconds after which the iteration stops if no valid pose has been found until then. Unlimited if None.
+    """
+
+    _statistics: Optional[CandidateEvaluationStatistics] = field(
+        default=None, init=False, repr=False
+    )
+    """
+    Statistics of the last iteration.
+    """
+
     def __post_init__(self):
         base_bb = self.robot.mobile_base.bounding_box
         self.distance_to_obstacle = (base_bb.width / 2 + base_bb.depth / 2) / 2 + 0.5
@@ -78,6 +297,8 @@ class GiskardLocationBackend(PoseGeneratorBackend):
     def setup_costmap(self, pose: Pose) -> Costmap:
         """
         Setup the reachability costmap for initial pose estimation.
+        If a reachability map has been built for the arm of the robot, the base poses are ranked by it, otherwise by a
+        gaussian around the target.
         """
         ground_pose = deepcopy(pose)
         ground_pose.z = 0.0
@@ -93,15 +314,28 @@ class GiskardLocationBackend(PoseGeneratorBackend):
             origin=ground_pose,
             distance_to_obstacle=self.distance_to_obstacle,
         )
-        gaussian_map = GaussianCostmap(
-            resolution=0.02,
-            origin=ground_pose,
-            mean=200,
-            sigma=15,
-            world=self.world,
-        )
+        arm_reachability_map = ReachabilityMap.of_robot(self.robot, self.arm)
+        if arm_reachability_map is None:
+            arm_map = GaussianCostmap(
+                resolution=0.02,
+                origin=ground_pose,
+                mean=200,
+                sigma=15,
+                world=self.world,
+            )
+        else:
+            arm_map = ReachabilityCostmap(
+                resolution=0.02,
+                height=200,
+                width=200,
+                origin=ground_pose,
+                reachability_map=arm_reachability_map,
+                target_height=pose.to_position().to_np()[2]
+                - self.robot.root.global_pose.to_position().to_np()[2],
+                world=self.world,
+            )
 
-        reachability_map = occupancy_map + gaussian_map
+        reachability_map = occupancy_map + arm_map
         reachability_map.number_of_samples = 5
 
         return reachability_map
@@ -172,30 +406,181 @@ class GiskardLocationBackend(PoseGeneratorBackend):
 
         return executor
 
-    def __iter__(self):
+    @property
+    def statistics(self) -> Optional[CandidateEvaluationStatistics]:
+        """
+        :return: The statistics of the last iteration, or None if the backend has not been iterated.
+        """
+        return self._statistics
+
+    @property
+    def _target_pose(self) -> Pose:
+        """
+        :return: The pose of the target.
+        """
+        return self.target if isinstance(self.target, Pose) else self.target.global_pose
+
+    def _setup_candidate_evaluation(self) -> Tuple[Executor, EndEffector, np.ndarray]:
+        """
+        Compiles the executor that moves the end effector along the grasp pose sequence in the world of this backend.
+
+        :return: The executor, the controlled end effector and the position of the last pose of the sequence in
+            the world root.
+        """
         with self.world.modify_world():
             self.robot._setup_collision_rules()
 
-        target_pose = (
-            self.target if isinstance(self.target, Pose) else self.target.global_pose
-        )
-
         test_ee = ViewManager.get_end_effector_view(self.arm, self.robot)
-        target_sequence = self.grasp_description._pose_sequence(target_pose)
+        target_sequence = self.grasp_description._pose_sequence(self._target_pose)
+        goal_position = (
+            self.world.transform(target_sequence[-1], self.world.root)
+            .to_position()
+            .to_np()[:3]
+        )
 
         executor = self.setup_giskard_executor(
             target_sequence, self.world, self.robot, test_ee
         )
+        return executor, test_ee, goal_position
 
-        for pose_candidate in self.setup_costmap(target_pose):
-            self.robot.root.parent_connection.origin = pose_candidate
+    def evaluate_candidate(
+        self,
+        pose_candidate: Pose,
+        executor: Executor,
+        end_effector: EndEffector,
+        goal_position: np.ndarray,
+    ) -> CandidateEvaluation:
+        """
+        Places the robot at a base pose candidate and runs the motion until it ends, the tick budget is used up or the
+        task error, the distance of the tool frame to the goal position, stops decreasing.
+
+        :param pose_candidate: The base pose candidate.
+        :param executor: The compiled executor of the world of this backend.
+        :param end_effector: The end effector that is controlled by the executor.
+        :param goal_position: The position of the last pose of the sequence in the world root.
+        :return: The outcome of the evaluation.
+        """
+        self.robot.root.parent_connection.origin = pose_candidate
+        world = executor.context.world
+        stall_detector = TaskErrorStallDetector(
+            world=world,
+            end_effector=end_effector,
+            goal_position=goal_position,
+            stall_window=self.stall_window,
+            minimum_improvement=self.minimum_improvement,
+        )
+        control_cycles = executor.control_cycles
+        valid = False
+        try:
+            executor.tick_until_end(
+                timeout=self.ticks_per_candidate, stop_condition=stall_detector
+            )
+            valid = executor.motion_statechart.is_end_motion()
+        except (InfeasibleException, TimeoutError):
+            pass
 
-            try:
-                executor.tick_until_end(3_000)
-            except (TimeoutError, InfeasibleException) as e:
-                pass
+        return CandidateEvaluation(
+            robot_root_pose=world.compute_forward_kinematics_np(
+                world.root, self.robot.root
+            ),
+            valid=valid,
+            stalled=stall_detector.stalled,
+            number_of_ticks=int(executor.control_cycles - control_cycles),
+        )
+
+    def _evaluate_sequentially(self) -> Iterator[CandidateEvaluation]:
+        """
+        Evaluates the candidates one after another in the world of this backend.
+        """
+        executor, end_effector, goal_position = self._setup_candidate_evaluation()
+        for pose_candidate in self.setup_costmap(self._target_pose):
+            yield self.evaluate_candidate(
+                pose_candidate, executor, end_effector, goal_position
+            )
+
+    def _evaluate_in_workers(self, start: float) -> Iterator[CandidateEvaluation]:
+        """
+        Evaluates the candidates concurrently in forked worker processes and yields the evaluations as they finish.
+        The worker processes are terminated when the iteration stops.
+
+        Forking is refused while other threads of the calling process are alive, since locks that these threads hold,
+        e.g. in ROS executors, would stay locked forever in the workers.
+
+        :param start: The time at which the iteration started, as given by `time.perf_counter`.
+        """
+        live_threads = [
+            thread
+            for thread in threading.enumerate()
+            if thread is not threading.current_thread()
+        ]
+        if live_threads:
+            raise ForkWithLiveThreads(live_threads)
+        candidates = [
+            (
+                pose_candidate.to_position().to_np()[:3].tolist(),
+                pose_candidate.to_quaternion().to_np().tolist(),
+            )
+            for pose_candidate in self.setup_costmap(self._target_pose)
+        ]
+        with multiprocessing.get_context("fork").Pool(
+            self.number_of_workers,
+            initializer=_initialize_worker,
+            initargs=(self,),
+        ) as pool:
+            evaluations = pool.imap_unordered(_evaluate_candidate_in_worker, candidates)
+            for _ in candidates:
+                try:
+                    yield evaluations.next(timeout=self._remaining_time(start))
+                except multiprocessing.TimeoutError:
+                    return
+
+    def _remaining_time(self, start: float) -> Optional[float]:
+        """
+        :param start: The time at which the iteration started, as given by `time.perf_counter`.
+        :return: The time in seconds that is left to find the first valid pose, or None if it is unlimited.
+        """
+        if (
+            self.maximum_time_to_first_valid_pose is None
+            or self._statistics.time_to_first_valid_pose is not None
+        ):
+            return None
+        return max(
+            0.0, start + self.maximum_time_to_first_valid_pose - time.perf_counter()
+        )
 
-            yield self.robot.root.global_pose
+    def __iter__(self) -> Iterator[Pose]:
+        """
+        Evaluates the base pose candidates of the reachability costmap and yields the resulting poses of the robot
+        root for the candidates from which the motion reached its end.
+        """
+        self._statistics = CandidateEvaluationStatistics(
+            number_of_workers=self.number_of_workers
+        )
+        start = time.perf_counter()
+        evaluations = (
+            self._evaluate_in_workers(start)
+            if self.number_of_workers > 0
+            else self._evaluate_sequentially()
+        )
+        try:
+            for evaluation in evaluations:
+                self._statistics.number_of_evaluated_candidates += 1
+                self._statistics.number_of_ticks += evaluation.number_of_ticks
+                self._statistics.number_of_stalled_candidates += evaluation.stalled
+                if not evaluation.valid:
+                    if self._remaining_time(start) == 0.0:
+                        return
+                    continue
+                self._statistics.number_of_valid_candidates += 1
+                if self._statistics.time_to_first_valid_pose is None:
+                    self._statistics.time_to_first_valid_pose = (
+                        time.perf_counter() - start
+                    )
+                yield HomogeneousTransformationMatrix(
+                    evaluation.robot_root_pose, reference_frame=self.world.root
+                ).to_pose()
+        finally:
+            logger.debug(f"Evaluated base pose candidates: {self._statistics}")
 
 
 @dataclass
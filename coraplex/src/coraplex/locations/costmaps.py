@@ -15,7 +15,6 @@ from typing_extensions import Tuple, List, Optional, Iterator, Callable, TYPE_CH
 
 from coraplex.locations.base import PoseGeneratorBackend
 from semantic_digital_twin.robots.robot_parts import AbstractRobot
-from semantic_digital_twin.spatial_computations.raytracer import RayTracer
 from semantic_digital_twin.spatial_types import (
     HomogeneousTransformationMatrix,
     Quaternion,
@@ -27,6 +26,7 @@ from semantic_digital_twin.world_description.world_entity import Body
 
 if TYPE_CHECKING:
     from coraplex.datastructures.dataclasses import Context
+    from coraplex.locations.reachability import ReachabilityMap
 
 logger = logging.getLogger("coraplex")
 
@@ -495,8 +495,7 @@ class OccupancyCostmap(Costmap):
 
         res = np.ones(len(rays))
 
-        ray_tracer = RayTracer(self.world)
-        r_t = ray_tracer.ray_test(rays[:, 0], rays[:, 1])
+        r_t = self.world.ray_tracer.ray_test(rays[:, 0], rays[:, 1])
         if self.robot_view:
             res[r_t[1]] = [
                 (
@@ -619,7 +618,7 @@ class VisibilityCostmap(Costmap):
         """
         images = []
 
-        r_t = RayTracer(self.world)
+        r_t = self.world.ray_tracer
 
         origin_copy = deepcopy(self.origin).to_homogeneous_matrix()
 
@@ -877,6 +876,44 @@ class RingCostmap(Costmap):
         return ring_costmap
 
 
+@dataclass
+class ReachabilityCostmap(Costmap):
+    """
+    Projects the reachability map of an arm around the origin, such that every cell holds the reachability index of
+    the origin for a robot base at the cell that faces the origin, as the default orientation generator samples it.
+    """
+
+    reachability_map: ReachabilityMap
+    """
+    The reachability map of the arm with which the origin should be reached.
+    """
+
+    target_height: float
+    """
+    The height of the origin above the robot root.
+    """
+
+    def __post_init__(self):
+        self.map = self._project_reachability_map()
+
+    def _project_reachability_map(self) -> np.ndarray:
+        """
+        :return: The reachability index of the origin from every cell.
+        """
+        indices = np.indices((self.height, self.width)).transpose(1, 2, 0)
+        center = np.array([self.height // 2, self.width // 2])
+        distance = np.linalg.norm((indices - center) * self.resolution, axis=-1)
+        origin_in_base = np.stack(
+            [
+                distance,
+                np.zeros_like(distance),
+                np.full_like(distance, self.target_height),
+            ],
+            axis=-1,
+        )
+        return self.reachability_map.reachability_at(origin_in_base)
+
+
 cmap = colors.ListedColormap(["white", "black", "green", "red", "blue"])
 
 
@@ -10,11 +10,17 @@ from coraplex.datastructures.enums import Arms, ApproachDirection, VerticalAlign
 from coraplex.datastructures.grasp import GraspDescription
 from coraplex.locations.backends import GiskardLocationBackend
 from coraplex.locations.base import Location
-from coraplex.locations.costmaps import OccupancyCostmap, RingCostmap, VisibilityCostmap
+from coraplex.locations.costmaps import (
+    OccupancyCostmap,
+    RingCostmap,
+    VisibilityCostmap,
+    ReachabilityCostmap,
+)
 from coraplex.locations.pose_validator import (
     AreReachableBy,
     IsVisibleBy,
 )
+from coraplex.locations.reachability import ReachabilityMap
 from coraplex.view_manager import ViewManager
 from semantic_digital_twin.robots.robot_parts import AbstractRobot
 from semantic_digital_twin.semantic_annotations.semantic_annotations import (
@@ -78,7 +84,7 @@ def reachability_location(
     :param context: The context in which to create the location
     :param arm: The arm with which to reach the target
     :param grasp_description: The grasp description with which to grasp the target
-    :param mean_distance_to_target: The mean distance between the base pose of the robot and the target pose in the xy-plane, can be imagined as a ring around the target pose from which poses are sampled. The mean distance is the radius of the ring.
+    :param mean_distance_to_target: The mean distance between the base pose of the robot and the target pose in the xy-plane, can be imagined as a ring around the target pose from which poses are sampled. The mean distance is the radius of the ring. Only used if no reachability map has been built for the arm of the robot.
     :returns: A location that is reachable from the target pose.
     """
     target_pose, target_body = (
@@ -91,15 +97,29 @@ def reachability_location(
         VerticalAlignment.NoAlignment,
         man,
     )
-    costmap = OccupancyCostmap.default_map(context, target_pose) & RingCostmap(
-        resolution=0.02,
-        width=200,
-        height=200,
-        std=15,
-        distance=mean_distance_to_target,  # That needs to be replaced with an estimate of the reachability space of the robot arms
-        world=context.world,
-        origin=target_pose,
-    )
+    reachability_map = ReachabilityMap.of_robot(context.robot, arm)
+    if reachability_map is None:
+        arm_costmap = RingCostmap(
+            resolution=0.02,
+            width=200,
+            height=200,
+            std=15,
+            distance=mean_distance_to_target,
+            world=context.world,
+            origin=target_pose,
+        )
+    else:
+        arm_costmap = ReachabilityCostmap(
+            resolution=0.02,
+            width=200,
+            height=200,
+            reachability_map=reachability_map,
+            target_height=target_pose.to_position().to_np()[2]
+            - context.robot.root.global_pose.to_position().to_np()[2],
+            world=context.world,
+            origin=target_pose,
+        )
+    costmap = OccupancyCostmap.default_map(context, target_pose) & arm_costmap
     return Location(
         context,
         target_pose,
@@ -190,6 +210,7 @@ def giskard_reachability_location(
     context: Context,
     arm: Arms,
     grasp_description: GraspDescription = None,
+    number_of_workers: int = 0,
 ) -> Location:
     """
     Factory method that creates a location with a Giskard backend, the giskard backend uses the Giskard full-body control
@@ -199,6 +220,8 @@ def giskard_reachability_location(
     :param context: Plan context in which to create the location
     :param arm: Arm to use for reachability estimation
     :param grasp_description: Grap that should be used for reachability estimation
+    :param number_of_workers: Number of worker processes that evaluate base pose candidates concurrently, 0 to evaluate
+        them one after another
     :returns: A location that is reachable from the target pose, using Giskard for reachability estimation.
     """
     target_pose, target_body = (
@@ -214,7 +237,12 @@ def giskard_reachability_location(
     )
 
     backend = GiskardLocationBackend(
-        target, arm, grasp_description, context.robot, context.world
+        target,
+        arm,
+        grasp_description,
+        context.robot,
+        context.world,
+        number_of_workers=number_of_workers,
     )
 
     return Location(
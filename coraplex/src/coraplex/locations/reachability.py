@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+
+import numpy as np
+from typing_extensions import Optional, Sequence, Tuple
+
+from coraplex.datastructures.enums import Arms
+from coraplex.view_manager import ViewManager
+from semantic_digital_twin.robots.robot_parts import AbstractRobot
+from semantic_digital_twin.spatial_computations.ik_solver import IKSolverException
+from semantic_digital_twin.spatial_types import (
+    HomogeneousTransformationMatrix,
+    RotationMatrix,
+)
+
+logger = logging.getLogger("coraplex")
+
+default_reachability_map_directory = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "resources", "reachability_maps"
+)
+"""
+The directory in which the reachability maps of the robots are stored.
+"""
+
+default_orientations: Tuple[Tuple[float, float, float], ...] = (
+    (0.0, 0.0, 0.0),
+    (0.0, 0.0, np.pi / 4),
+    (0.0, 0.0, -np.pi / 4),
+    (0.0, np.pi / 4, 0.0),
+)
+"""
+Roll, pitch and yaw in the robot root frame by which the orientation of the tool frame is rotated to sample the
+orientations of the workspace.
+"""
+
+
+@dataclass
+class ReachabilityMap:
+    """
+    Voxelized workspace of an arm of a robot in the frame of the robot root.
+
+    Every voxel holds the fraction of the sampled tool frame orientations for which the inverse kinematics found a
+    solution at the center of the voxel, which is the reachability index of the voxel.
+    The map is computed offline with `build_reachability_map` for the joint state the robot had at that time, e.g.
+    with parked arms, and is stored as compressed numpy file per robot and arm.
+    """
+
+    robot_name: str
+    """
+    The name of the class of the robot.
+    """
+
+    arm: Arms
+    """
+    The arm whose workspace is described.
+    """
+
+    resolution: float
+    """
+    The edge length of a voxel in meter.
+    """
+
+    origin: np.ndarray
+    """
+    The center of the voxel with index (0, 0, 0) in the robot root frame.
+    """
+
+    reachability: np.ndarray
+    """
+    The reachability index of every voxel, between 0 and 1, indexed by x, y and z.
+    """
+
+    @staticmethod
+    def file_name(robot_name: str, arm: Arms) -> str:
+        """
+        :param robot_name: The name of the class of a robot.
+        :param arm: An arm of the robot.
+        :return: The name of the file in which the map of the arm is stored.
+        """
+        return f"{robot_name}_{arm.name.lower()}.npz"
+
+    def save(self, directory: str = default_reachability_map_directory) -> str:
+        """
+        Stores the map as compressed numpy file.
+
+        :param directory: The directory in which the map is stored.
+        :return: The path of the file.
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, self.file_name(self.robot_name, self.arm))
+        np.savez_compressed(
+            path,
+            resolution=self.resolution,
+            origin=self.origin,
+            reachability=self.reachability.astype(np.float32),
+        )
+        return path
+
+    @classmethod
+    def load(
+        cls,
+        robot_name: str,
+        arm: Arms,
+        directory: str = default_reachability_map_directory,
+    ) -> ReachabilityMap:
+        """
+        :param robot_name: The name of the class of a robot.
+        :param arm: An arm of the robot.
+        :param directory: The directory in which the map is stored.
+        :return: The map of the arm.
+        """
+        with np.load(os.path.join(directory, cls.file_name(robot_name, arm))) as data:
+            return cls(
+                robot_name=robot_name,
+                arm=arm,
+                resolution=float(data["resolution"]),
+                origin=data["origin"],
+                reachability=data["reachability"],
+            )
+
+    @classmethod
+    def of_robot(
+        cls,
+        robot: AbstractRobot,
+        arm: Arms,
+        directory: str = default_reachability_map_directory,
+    ) -> Optional[ReachabilityMap]:
+        """
+        :param robot: A robot.
+        :param arm: An arm of the robot.
+        :param directory: The directory in which the maps are stored.
+        :return: The map of the arm, or None if no map has been built for it.
+        """
+        robot_name = type(robot).__name__
+        if not os.path.exists(os.path.join(directory, cls.file_name(robot_name, arm))):
+            return None
+        return cls.load(robot_name, arm, directory)
+
+    def reachability_at(self, points: np.ndarray) -> np.ndarray:
+        """
+        :param points: Points in the robot root frame, with x, y and z along the last axis.
+        :return: The reachability index of the voxels that contain the points, 0 for points outside the map.
+        """
+        indices = np.round((points - self.origin) / self.resolution).astype(int)
+        inside = np.all((indices >= 0) & (indices < self.reachability.shape), axis=-1)
+        result = np.zeros(points.shape[:-1])
+        result[inside] = self.reachability[tuple(indices[inside].T)]
+        return result
+
+
+def build_reachability_map(
+    robot: AbstractRobot,
+    arm: Arms,
+    resolution: float = 0.1,
+    reach: float = 1.0,
+    orientations: Sequence[Tuple[float, float, float]] = default_orientations,
+    max_iterations: int = 100,
+) -> ReachabilityMap:
+    """
+    Samples the workspace of an arm with the inverse kinematics solver of the world, from the robot root to the tool
+    frame, such that the torso is included.
+    The voxels within the reach around the root of the arm are sampled with the current orientation of the tool frame
+    rotated by each of the orientations.
+
+    :param robot: The robot whose arm is sampled, in its current joint state.
+    :param arm: The arm that is sampled.
+    :param resolution: The edge length of a voxel in meter.
+    :param reach: The distance from the root of the arm up to which voxels are sampled, in meter.
+    :param orientations: Roll, pitch and yaw in the robot root frame by which the orientation of the tool frame is
+        rotated.
+    :param max_iterations: Maximum number of iterations of the inverse kinematics solver per sample.
+    :return: The reachability map of the arm.
+    """
+    world = robot._world
+    arm_view = ViewManager.get_arm_view(arm, robot)
+    tool_frame = arm_view.end_effector.tool_frame
+    arm_position = world.compute_forward_kinematics_np(robot.root, arm_view.root)[:3, 3]
+    root_R_tool = world.compute_forward_kinematics_np(robot.root, tool_frame)[:3, :3]
+    rotations = [
+        RotationMatrix.from_rpy(*orientation).to_np()[:3, :3] @ root_R_tool
+        for orientation in orientations
+    ]
+
+    number_of_voxels = int(np.ceil(2 * reach / resolution)) + 1
+    origin = arm_position - reach
+    reachability = np.zeros((number_of_voxels,) * 3)
+    for index in np.ndindex(reachability.shape):
+        position = origin + np.array(index) * resolution
+        if np.linalg.norm(position - arm_position) > reach:
+            continue
+        number_of_solutions = 0
+        for rotation in rotations:
+            root_T_tool = np.eye(4)
+            root_T_tool[:3, :3] = rotation
+            root_T_tool[:3, 3] = position
+            try:
+                world.compute_inverse_kinematics(
+                    root=robot.root,
+                    tip=tool_frame,
+                    target=HomogeneousTransformationMatrix(
+                        root_T_tool, reference_frame=robot.root
+                    ),
+                    max_iterations=max_iterations,
+                )
+            except IKSolverException:
+                continue
+            number_of_solutions += 1
+        reachability[index] = number_of_solutions / len(rotations)
+    logger.info(
+        f"Built reachability map of {type(robot).__name__} {arm}: "
+        f"{np.count_nonzero(reachability)} of {reachability.size} voxels reachable"
+    )
+
+    return ReachabilityMap(
+        robot_name=type(robot).__name__,
+        arm=arm,
+        resolution=resolution,
+        origin=origin,
+        reachability=reachability,
+    )
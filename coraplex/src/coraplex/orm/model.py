@@ -9,6 +9,7 @@ from krrood.ormatic.data_access_objects.alternative_mappings import (
 from sqlalchemy import TypeDecorator, types
 from typing_extensions import Optional
 
+from giskardpy.motion_statechart.motion_statechart import StateHistory
 from coraplex.datastructures.dataclasses import Context
 from coraplex.datastructures.enums import Arms
 from coraplex.datastructures.grasp import GraspPose, GraspDescription
@@ -91,6 +92,41 @@ class GrasPoseMapping(PoseMapping, AlternativeMapping[GraspPose]):
         )
 
 
+@dataclass(eq=False)
+class StateHistoryMapping(AlternativeMapping[StateHistory]):
+    """
+    Persists the transitions of a StateHistory as flat arrays, with the number of nodes to restore their rows.
+    """
+
+    max_length: Optional[int]
+    number_of_transitions: int
+    number_of_nodes: int
+    control_cycles: np.ndarray
+    life_cycle_states: np.ndarray
+    observation_states: np.ndarray
+
+    @classmethod
+    def from_domain_object(cls, obj: StateHistory) -> Self:
+        return cls(
+            max_length=obj.max_length,
+            number_of_transitions=obj.number_of_transitions,
+            number_of_nodes=obj.life_cycle_states.shape[1],
+            control_cycles=obj.control_cycles.astype(np.float64),
+            life_cycle_states=obj.life_cycle_states.ravel(),
+            observation_states=obj.observation_states.ravel(),
+        )
+
+    def to_domain_object(self) -> StateHistory:
+        shape = (len(self.control_cycles), self.number_of_nodes)
+        return StateHistory.from_transitions(
+            control_cycles=np.asarray(self.control_cycles, dtype=np.int64),
+            life_cycle_states=np.reshape(self.life_cycle_states, shape),
+            observation_states=np.reshape(self.observation_states, shape),
+            max_length=self.max_length,
+            number_of_transitions=self.number_of_transitions,
+        )
+
+
 class NumpyType(TypeDecorator):
     """
     Type that casts field which are of numpy nd array type
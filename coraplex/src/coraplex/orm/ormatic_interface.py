@@ -595,25 +595,6 @@ class NodeArtifactsDAO_debug_expressions_association(Base, AssociationDataAccess
     )
 
 
-class StateHistoryDAO_history_association(Base, AssociationDataAccessObject):
-    __tablename__ = "_11324474356284115438064536054771040293678091484130188708645472"
-
-    database_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-
-    source_statehistorydao_id: Mapped[int] = mapped_column(
-        ForeignKey("StateHistoryDAO.database_id")
-    )
-    target_statehistoryitemdao_id: Mapped[int] = mapped_column(
-        ForeignKey("StateHistoryItemDAO.database_id")
-    )
-
-    target: Mapped[StateHistoryItemDAO] = relationship(
-        "StateHistoryItemDAO",
-        foreign_keys=[target_statehistoryitemdao_id],
-        lazy="selectin",
-    )
-
-
 class CartesianPositionTrajectoryDAO_goal_points_association(
     Base, AssociationDataAccessObject
 ):
@@ -783,25 +764,6 @@ class Sage10kSceneDAO_rooms_association(Base, AssociationDataAccessObject):
     )
 
 
-class CollisionCheckingResultDAO_contacts_association(
-    Base, AssociationDataAccessObject
-):
-    __tablename__ = "_30943416093470573366535430635148087213656332547341162949685825"
-
-    database_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-
-    source_collisioncheckingresultdao_id: Mapped[int] = mapped_column(
-        ForeignKey("CollisionCheckingResultDAO.database_id")
-    )
-    target_closestpointsdao_id: Mapped[int] = mapped_column(
-        ForeignKey("ClosestPointsDAO.database_id")
-    )
-
-    target: Mapped[ClosestPointsDAO] = relationship(
-        "ClosestPointsDAO", foreign_keys=[target_closestpointsdao_id], lazy="selectin"
-    )
-
-
 class CollisionGroupDAO_bodies_association(Base, AssociationDataAccessObject):
     __tablename__ = "_61428407002132739694257719785249721483169019459943026085884624"
 
@@ -2819,6 +2781,15 @@ class GiskardLocationBackendDAO(
     distance_to_obstacle: Mapped[builtins.float] = mapped_column(
         use_existing_column=True
     )
+    number_of_workers: Mapped[builtins.int] = mapped_column(use_existing_column=True)
+    ticks_per_candidate: Mapped[builtins.int] = mapped_column(use_existing_column=True)
+    stall_window: Mapped[builtins.int] = mapped_column(use_existing_column=True)
+    minimum_improvement: Mapped[builtins.float] = mapped_column(
+        use_existing_column=True
+    )
+    maximum_time_to_first_valid_pose: Mapped[typing.Optional[builtins.float]] = (
+        mapped_column(use_existing_column=True)
+    )
 
     arm: Mapped[coraplex.datastructures.enums.Arms] = mapped_column(
         krrood.ormatic.custom_types.PolymorphicEnumType,
@@ -9505,58 +9476,31 @@ class ObservationStateDAO(
     }
 
 
-class StateHistoryDAO(
-    Base, DataAccessObject[giskardpy.motion_statechart.motion_statechart.StateHistory]
+class StateHistoryMappingDAO(
+    Base, DataAccessObject[coraplex.orm.model.StateHistoryMapping]
 ):
-    __tablename__ = "StateHistoryDAO"
+    __tablename__ = "StateHistoryMappingDAO"
 
     database_id: Mapped[builtins.int] = mapped_column(
         Integer, primary_key=True, use_existing_column=True
     )
 
-    history: Mapped[builtins.list[StateHistoryDAO_history_association]] = relationship(
-        "StateHistoryDAO_history_association",
-        collection_class=builtins.list,
-        cascade="all, delete-orphan",
-        foreign_keys="[StateHistoryDAO_history_association.source_statehistorydao_id]",
-        lazy="selectin",
+    max_length: Mapped[typing.Optional[builtins.int]] = mapped_column(
+        use_existing_column=True
     )
-
-
-class StateHistoryItemDAO(
-    Base,
-    DataAccessObject[giskardpy.motion_statechart.motion_statechart.StateHistoryItem],
-):
-    __tablename__ = "StateHistoryItemDAO"
-
-    database_id: Mapped[builtins.int] = mapped_column(
-        Integer, primary_key=True, use_existing_column=True
+    number_of_transitions: Mapped[builtins.int] = mapped_column(
+        use_existing_column=True
     )
+    number_of_nodes: Mapped[builtins.int] = mapped_column(use_existing_column=True)
 
-    control_cycle: Mapped[builtins.int] = mapped_column(use_existing_column=True)
-
-    life_cycle_state_id: Mapped[int] = mapped_column(
-        ForeignKey("LifeCycleStateDAO.database_id", use_alter=True),
-        nullable=True,
-        use_existing_column=True,
-    )
-    observation_state_id: Mapped[int] = mapped_column(
-        ForeignKey("ObservationStateDAO.database_id", use_alter=True),
-        nullable=True,
-        use_existing_column=True,
+    control_cycles: Mapped[numpy.ndarray] = mapped_column(
+        coraplex.orm.model.NumpyType, nullable=False, use_existing_column=True
     )
-
-    life_cycle_state: Mapped[LifeCycleStateDAO] = relationship(
-        "LifeCycleStateDAO",
-        uselist=False,
-        foreign_keys=[life_cycle_state_id],
-        post_update=True,
+    life_cycle_states: Mapped[numpy.ndarray] = mapped_column(
+        coraplex.orm.model.NumpyType, nullable=False, use_existing_column=True
     )
-    observation_state: Mapped[ObservationStateDAO] = relationship(
-        "ObservationStateDAO",
-        uselist=False,
-        foreign_keys=[observation_state_id],
-        post_update=True,
+    observation_states: Mapped[numpy.ndarray] = mapped_column(
+        coraplex.orm.model.NumpyType, nullable=False, use_existing_column=True
     )
 
 
@@ -14967,29 +14911,6 @@ class ClosestPointsDAO(
     )
 
 
-class CollisionCheckingResultDAO(
-    Base,
-    DataAccessObject[
-        semantic_digital_twin.collision_checking.collision_detector.CollisionCheckingResult
-    ],
-):
-    __tablename__ = "CollisionCheckingResultDAO"
-
-    database_id: Mapped[builtins.int] = mapped_column(
-        Integer, primary_key=True, use_existing_column=True
-    )
-
-    contacts: Mapped[builtins.list[CollisionCheckingResultDAO_contacts_association]] = (
-        relationship(
-            "CollisionCheckingResultDAO_contacts_association",
-            collection_class=builtins.list,
-            cascade="all, delete-orphan",
-            foreign_keys="[CollisionCheckingResultDAO_contacts_association.source_collisioncheckingresultdao_id]",
-            lazy="selectin",
-        )
-    )
-
-
 class CollisionGroupDAO(
     Base,
     DataAccessObject[
@@ -16374,6 +16295,48 @@ class QuaternionConversionErrorDAO(
     }
 
 
+class ReadOnlyTrajectoryErrorDAO(
+    LogicalErrorDAO,
+    DataAccessObject[semantic_digital_twin.exceptions.ReadOnlyTrajectoryError],
+):
+    __tablename__ = "ReadOnlyTrajectoryErrorDAO"
+
+    database_id: Mapped[builtins.int] = mapped_column(
+        ForeignKey(LogicalErrorDAO.database_id),
+        primary_key=True,
+        use_existing_column=True,
+    )
+
+    directory: Mapped[builtins.str] = mapped_column(use_existing_column=True)
+
+    __mapper_args__ = {
+        "polymorphic_identity": "ReadOnlyTrajectoryErrorDAO",
+        "inherit_condition": database_id == LogicalErrorDAO.database_id,
+        "polymorphic_load": "selectin",
+    }
+
+
+class UnknownMeshContentErrorDAO(
+    LogicalErrorDAO,
+    DataAccessObject[semantic_digital_twin.exceptions.UnknownMeshContentError],
+):
+    __tablename__ = "UnknownMeshContentErrorDAO"
+
+    database_id: Mapped[builtins.int] = mapped_column(
+        ForeignKey(LogicalErrorDAO.database_id),
+        primary_key=True,
+        use_existing_column=True,
+    )
+
+    content_hash: Mapped[builtins.str] = mapped_column(use_existing_column=True)
+
+    __mapper_args__ = {
+        "polymorphic_identity": "UnknownMeshContentErrorDAO",
+        "inherit_condition": database_id == LogicalErrorDAO.database_id,
+        "polymorphic_load": "selectin",
+    }
+
+
 class RootNodeNotFoundErrorDAO(
     Base, DataAccessObject[semantic_digital_twin.exceptions.RootNodeNotFoundError]
 ):
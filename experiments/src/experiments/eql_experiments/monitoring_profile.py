@@ -5,11 +5,13 @@ EQL adds two independent monitoring layers around query construction and evaluat
 
 - **Layer 1 - call-stack capture** (the ``@monitored`` decorator in
   :mod:`krrood.entity_query_language._monitoring`). On every monitored object's
-  ``__post_init__`` it runs :func:`inspect.stack`, builds a
-  :class:`~krrood.entity_query_language._stack.StackFrame` per frame and filters out
-  site-packages. It fires for ``Variable``, ``InstantiatedVariable`` and ``Query`` both at
-  construction time and during evaluation when inferred instances are created. It is globally
-  toggleable through :meth:`~krrood.entity_query_language._monitoring.MonitoredRegistry.disabled`.
+  ``__post_init__`` it records the code object, line number and owning class of every frame
+  outside site-packages in a :class:`~krrood.entity_query_language._stack.DeferredCallStack`;
+  the :class:`~krrood.entity_query_language._stack.StackFrame` objects are only built when an
+  explanation asks for the stack. It fires for ``Variable``, ``InstantiatedVariable`` and
+  ``Query`` both at construction time and during evaluation when inferred instances are created. It is globally
+  toggleable through :meth:`~krrood.entity_query_language._monitoring.MonitoredRegistry.disable`
+  and :meth:`~krrood.entity_query_language._monitoring.MonitoredRegistry.disabled`.
 - **Layer 2 - evaluation observers** (:mod:`krrood.entity_query_language.evaluation`). The
   default evaluation context attaches ``EvaluationTracker``, ``SatisfiedConditionTracker`` and
   ``InferenceRecorder``, which are invoked for every ``on_evaluate_enter`` / ``on_result_yielded``
@@ -54,7 +56,7 @@ from line_profiler import LineProfiler
 
 import krrood.entity_query_language.factories as eql
 from krrood.entity_query_language._monitoring import MonitoredRegistry, monitored
-from krrood.entity_query_language._stack import CallStack, StackFrame
+from krrood.entity_query_language._stack import CallStack, DeferredCallStack, StackFrame
 from krrood.entity_query_language.core.base_expressions import SymbolicExpression
 from krrood.entity_query_language.evaluation import (
     EvaluationTracker,
@@ -349,7 +351,7 @@ def monitoring_target_functions() -> List[Callable]:
     Collect every hot monitoring function to feed to :class:`line_profiler.LineProfiler`.
 
     Layer 1 contributes the wrapped ``__post_init__`` of each monitored class (where
-    :func:`inspect.stack` is called) plus the stack-building helpers. Layer 2 contributes the
+    the stack is captured) plus the stack-building helpers. Layer 2 contributes the
     observer callbacks and the dispatch/wrapper that invokes them.
 
     :return: The functions to profile line by line.
@@ -358,8 +360,11 @@ def monitoring_target_functions() -> List[Callable]:
         StackFrame.from_frame_info,
         StackFrame.from_raw_frame,
         StackFrame._from_frame,
+        StackFrame.from_raw,
         CallStack.capture,
         CallStack.filter,
+        DeferredCallStack.capture,
+        DeferredCallStack.frames.fget,
         MonitoredRegistry.is_monitored,
         EvaluationTracker.on_evaluate_enter,
         EvaluationTracker.on_result_yielded,
@@ -373,7 +378,7 @@ def monitoring_target_functions() -> List[Callable]:
     ]
     for monitored_class in monitored.monitored_classes:
         # The wrapped ``new_post_init`` closure is a distinct function object per monitored
-        # class; profiling it directly is what attributes the ``inspect.stack()`` cost.
+        # class; profiling it directly is what attributes the stack capture cost.
         post_init = monitored_class.__dict__.get("__post_init__")
         if post_init is not None:
             targets.append(post_init)
@@ -0,0 +1,91 @@
+import time
+
+import numpy as np
+
+from giskardpy.motion_statechart.context import MotionStatechartContext
+from giskardpy.motion_statechart.data_types import LifeCycleValues
+from giskardpy.motion_statechart.motion_statechart import MotionStatechart
+from giskardpy.motion_statechart.test_nodes.test_nodes import (
+    ConstFalseNode,
+    ConstTrueNode,
+)
+from semantic_digital_twin.world import World
+
+
+def build_motion_statechart(
+    number_of_nodes: int, context: MotionStatechartContext
+) -> MotionStatechart:
+    """
+    Compiles a motion statechart in which half of the nodes are running and the other half waits
+    for a condition that never becomes true.
+    """
+    msc = MotionStatechart()
+    never_true = ConstFalseNode()
+    msc.add_node(never_true)
+    for i in range(number_of_nodes - 1):
+        node = ConstTrueNode()
+        msc.add_node(node)
+        if i % 2 == 0:
+            node.start_condition = never_true.observation_variable
+    msc.compile(context)
+    return msc
+
+
+def per_node_dispatch(msc: MotionStatechart, context: MotionStatechartContext):
+    """
+    Reference implementation of the dispatch that visits every node in Python on every tick.
+    """
+    msc.observation_state.update_state()
+    for node in msc.nodes:
+        if msc.life_cycle_state[node] == LifeCycleValues.RUNNING:
+            node.on_tick(context=context)
+    previous = msc.life_cycle_state.data.copy()
+    msc.life_cycle_state.update_state()
+    for node in msc.nodes:
+        prev = LifeCycleValues(int(previous[node.index]))
+        curr = LifeCycleValues(int(msc.life_cycle_state.data[node.index]))
+        if prev == curr:
+            continue
+
+
+def indexed_dispatch(msc: MotionStatechart, context: MotionStatechartContext):
+    msc._update_observation_state(context)
+    msc._update_life_cycle_state(context)
+
+
+def time_dispatch(
+    dispatch, msc: MotionStatechart, context: MotionStatechartContext, ticks: int
+) -> np.ndarray:
+    """
+    :return: The latency of each tick in seconds.
+    """
+    latencies = np.empty(ticks)
+    for i in range(ticks):
+        start = time.perf_counter()
+        dispatch(msc, context)
+        latencies[i] = time.perf_counter() - start
+    return latencies
+
+
+def main():
+    number_of_ticks = 1000
+    print("\nPer tick overhead of the motion statechart in steady state:")
+    print(f"{'nodes':>6} {'dispatch':>10} {'mean (ms)':>10} {'p99 (ms)':>9}")
+    for number_of_nodes in [500, 1000, 2000]:
+        context = MotionStatechartContext(world=World())
+        msc = build_motion_statechart(number_of_nodes, context)
+        # let the running nodes start, such that only steady state ticks are measured
+        msc.tick(context)
+        for name, dispatch in [
+            ("per node", per_node_dispatch),
+            ("indexed", indexed_dispatch),
+        ]:
+            latencies = time_dispatch(dispatch, msc, context, number_of_ticks) * 1000
+            print(
+                f"{number_of_nodes:>6} {name:>10} {latencies.mean():>10.3f}"
+                f" {np.percentile(latencies, 99):>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
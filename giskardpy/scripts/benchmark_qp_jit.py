@@ -0,0 +1,122 @@
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from giskardpy.executor import Executor
+from giskardpy.motion_statechart.context import MotionStatechartContext
+from giskardpy.motion_statechart.graph_node import EndMotion
+from giskardpy.motion_statechart.motion_statechart import MotionStatechart
+from giskardpy.motion_statechart.tasks.cartesian_tasks import CartesianPose
+from giskardpy.qp.qp_controller_config import QPControllerConfig
+from krrood.symbolic_math.compile_cache import CompiledFunctionCache
+from krrood.symbolic_math.symbolic_math import CompiledFunction
+from semantic_digital_twin.adapters.urdf import URDFParser
+from semantic_digital_twin.datastructures.prefixed_name import PrefixedName
+from semantic_digital_twin.robots.pr2 import PR2
+from semantic_digital_twin.spatial_types.spatial_types import Pose
+from semantic_digital_twin.world import World
+from semantic_digital_twin.world_description.connections import (
+    Connection6DoF,
+    OmniDrive,
+)
+from semantic_digital_twin.world_description.world_entity import Body
+
+
+def load_pr2_world() -> World:
+    """
+    Loads the PR2 with an omni drive below it.
+    Resolving the PR2 description requires a sourced ROS workspace.
+    """
+    world = URDFParser.from_file(file_path=PR2.get_ros_file_path()).parse()
+    PR2.from_world(world)
+    with world.modify_world():
+        old_root = world.root
+        map = Body(name=PrefixedName("map"))
+        odom = Body(name=PrefixedName("odom_combined"))
+        world.add_connection(Connection6DoF.create_with_dofs(world, map, odom))
+        drive = OmniDrive.create_with_dofs(parent=odom, child=old_root, world=world)
+        world.add_connection(drive)
+        drive.has_hardware_interface = True
+    return world
+
+
+def build_executor(world: World, jit_compile: bool) -> Executor:
+    """
+    Compiles a motion statechart that moves both grippers of the PR2.
+    """
+    msc = MotionStatechart()
+    for tip_link_name, y in [
+        ("l_gripper_tool_frame", 0.3),
+        ("r_gripper_tool_frame", -0.3),
+    ]:
+        goal = CartesianPose(
+            root_link=world.root,
+            tip_link=world.get_kinematic_structure_entity_by_name(tip_link_name),
+            goal_pose=Pose.from_xyz_rpy(x=0.6, y=y, z=0.8, reference_frame=world.root),
+        )
+        msc.add_node(goal)
+        msc.add_node(EndMotion.when_true(goal))
+    executor = Executor(
+        MotionStatechartContext(
+            world=world,
+            qp_controller_config=QPControllerConfig(
+                target_frequency=50, jit_compile=jit_compile, verbose=False
+            ),
+        )
+    )
+    executor.compile(motion_statechart=msc)
+    return executor
+
+
+def time_qp_evaluation(executor: Executor, number_of_iterations: int) -> np.ndarray:
+    """
+    :return: The latency of each evaluation of the QP matrices and vectors in seconds.
+    """
+    qp_data_factory = executor.qp_controller.qp_data_factory
+    world_state = executor.context.world.state._data
+    life_cycle_state = executor.motion_statechart.life_cycle_state.data
+    float_variables = executor.context.float_variable_data.data
+    latencies = np.empty(number_of_iterations)
+    for i in range(number_of_iterations):
+        start = time.perf_counter()
+        qp_data_factory.evaluate(world_state, life_cycle_state, float_variables)
+        latencies[i] = time.perf_counter() - start
+    return latencies
+
+
+def main():
+    world = load_pr2_world()
+    number_of_iterations = 1000
+
+    print("\nQP matrix evaluation on the PR2 (both grippers, CartesianPose):")
+    print(
+        f"{'backend':>12} {'compile (s)':>12} {'mean (ms)':>10} {'p50 (ms)':>9}"
+        f" {'p99 (ms)':>9}"
+    )
+    with tempfile.TemporaryDirectory() as cache_directory:
+        # the first jit compilation builds all shared objects into the empty cache and the second one loads them,
+        # as after a restart
+        CompiledFunction.compile_cache = CompiledFunctionCache(
+            directory=Path(cache_directory)
+        )
+        for backend, jit_compile in [
+            ("VM", False),
+            ("JIT (cold)", True),
+            ("JIT (warm)", True),
+        ]:
+            start = time.perf_counter()
+            executor = build_executor(world, jit_compile)
+            compile_time = time.perf_counter() - start
+            executor.tick()
+            latencies = time_qp_evaluation(executor, number_of_iterations) * 1000
+            print(
+                f"{backend:>12} {compile_time:>12.2f}"
+                f" {latencies.mean():>10.3f} {np.percentile(latencies, 50):>9.3f}"
+                f" {np.percentile(latencies, 99):>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,7 @@ from krrood.symbolic_math.symbolic_math import FloatVariable
 from semantic_digital_twin.world_description.world_state_trajectory_plotter import (
     WorldStateTrajectoryPlotter,
 )
-from typing_extensions import Optional
+from typing_extensions import Optional, Callable
 
 
 @dataclass
@@ -160,10 +160,16 @@ class Executor:
                 self.context.world.state, self.time
             )
 
-    def tick_until_end(self, timeout: int = 1_000):
+    def tick_until_end(
+        self,
+        timeout: int = 1_000,
+        stop_condition: Optional[Callable[[], bool]] = None,
+    ):
         """
         Calls tick until is_end_motion() returns True.
         :param timeout: Max number of ticks to perform.
+        :param stop_condition: Called after every tick that did not end the motion.
+            If it returns True, the loop stops early without an error.
         """
         try:
             for i in range(timeout):
@@ -171,6 +177,8 @@ class Executor:
                 self.pacer.sleep()
                 if self.motion_statechart.is_end_motion():
                     return
+                if stop_condition is not None and stop_condition():
+                    return
             raise TimeoutError("Timeout reached while waiting for end of motion.")
         finally:
             self._set_velocity_acceleration_jerk_to_zero()
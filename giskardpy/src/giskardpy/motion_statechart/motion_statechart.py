@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass, field
 from typing import Dict, Any
 
 import numpy as np
 import rustworkx as rx
-from typing_extensions import List, MutableMapping, ClassVar, Self, Type
+from typing_extensions import List, MutableMapping, ClassVar, Self, Type, Optional
 
 import krrood.symbolic_math.symbolic_math as sm
 from giskardpy.motion_statechart.plotters.gantt_chart_plotter import (
@@ -222,55 +221,215 @@ class ObservationState(State):
         np.copyto(self.data, self._compiled_updater.evaluate())
 
 
-@dataclass(repr=False, eq=False)
-class StateHistoryItem:
-    control_cycle: int
-    life_cycle_state: LifeCycleState
-    observation_state: ObservationState
+@dataclass
+class StateHistory:
+    """
+    Records the life cycle and observation states of all nodes of a motion statechart whenever one of them changes.
+    The states are stored row-wise in preallocated numpy arrays, whose capacity doubles when they are full.
+    """
+
+    max_length: Optional[int] = None
+    """
+    If set, only the last `max_length` transitions are kept.
+    """
+    initial_capacity: ClassVar[int] = 64
+    """
+    Number of rows allocated for the first transitions.
+    """
+    _control_cycles: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.int64), init=False, repr=False
+    )
+    _life_cycle_states: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 0)), init=False, repr=False
+    )
+    _observation_states: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 0)), init=False, repr=False
+    )
+    _length: int = field(default=0, init=False)
+    """
+    Number of rows that are in use.
+    In bounded mode, this can be up to 2 * `max_length`, such that old rows only have to be dropped once every
+    `max_length` transitions.
+    """
+    _number_of_transitions: int = field(default=0, init=False)
 
     def __post_init__(self):
-        self.life_cycle_state = deepcopy(self.life_cycle_state)
-        self.observation_state = deepcopy(self.observation_state)
+        if self.max_length is not None and self.max_length < 1:
+            raise ValueError(
+                f"max_length has to be at least 1 or None, but is {self.max_length}"
+            )
 
-    def __eq__(self, other: StateHistoryItem) -> bool:
-        has_life_cycle_changed = np.any(
-            other.life_cycle_state.data != self.life_cycle_state.data
-        )
-        has_observation_changed = np.any(
-            other.observation_state.data != self.observation_state.data
-        )
-        return not has_life_cycle_changed and not has_observation_changed
+    @classmethod
+    def from_transitions(
+        cls,
+        control_cycles: np.ndarray,
+        life_cycle_states: np.ndarray,
+        observation_states: np.ndarray,
+        max_length: Optional[int] = None,
+        number_of_transitions: Optional[int] = None,
+    ) -> Self:
+        """
+        Creates a history that contains the given transitions, for example to restore a persisted history.
+
+        :param control_cycles: The control cycles in which the transitions happened.
+        :param life_cycle_states: The life cycle states with one row per transition and one column per node.
+        :param observation_states: The observation states with one row per transition and one column per node.
+        :param max_length: If set, only the last `max_length` transitions are kept.
+        :param number_of_transitions: The number of transitions of the original history, including the ones dropped
+            because of `max_length`. Defaults to the number of given transitions.
+        """
+        result = cls(max_length=max_length)
+        result._allocate(number_of_nodes=life_cycle_states.shape[1])
+        for control_cycle, life_cycle_state, observation_state in zip(
+            control_cycles, life_cycle_states, observation_states
+        ):
+            result.append(int(control_cycle), life_cycle_state, observation_state)
+        if number_of_transitions is not None:
+            result._number_of_transitions = number_of_transitions
+        return result
 
-    def __repr__(self) -> str:
-        merged = {
-            node.name: f"{self.observation_state[node]} | {life_cycle.name}"
-            for node, life_cycle in self.life_cycle_state.items()
-        }
-        return str(merged)
+    @property
+    def number_of_transitions(self) -> int:
+        """
+        :return: The number of transitions appended so far, including the ones dropped because of `max_length`.
+        """
+        return self._number_of_transitions
 
+    @property
+    def _start(self) -> int:
+        if self.max_length is None:
+            return 0
+        return max(0, self._length - self.max_length)
 
-@dataclass
-class StateHistory:
-    history: List[StateHistoryItem] = field(default_factory=list)
+    @property
+    def control_cycles(self) -> np.ndarray:
+        """
+        :return: View of the control cycles in which the transitions happened.
+        """
+        return self._control_cycles[self._start : self._length]
 
-    def append(self, next_item: StateHistoryItem):
-        if len(self.history) != 0:
-            if next_item == self.history[-1]:
-                return
-        self.history.append(next_item)
+    @property
+    def life_cycle_states(self) -> np.ndarray:
+        """
+        :return: View of the life cycle states with one row per transition and one column per node.
+        """
+        return self._life_cycle_states[self._start : self._length]
 
-    def get_life_cycle_history_of_node(
-        self, node: MotionStatechartNode
-    ) -> list[LifeCycleValues]:
-        return [history_item.life_cycle_state[node] for history_item in self.history]
+    @property
+    def observation_states(self) -> np.ndarray:
+        """
+        :return: View of the observation states with one row per transition and one column per node.
+        """
+        return self._observation_states[self._start : self._length]
 
-    def get_observation_history_of_node(
-        self, node: MotionStatechartNode
-    ) -> list[ObservationStateValues]:
-        return [history_item.observation_state[node] for history_item in self.history]
+    def append(
+        self,
+        control_cycle: int,
+        life_cycle_state: np.ndarray,
+        observation_state: np.ndarray,
+    ) -> None:
+        """
+        Copies the states into the history, if they differ from the last recorded ones.
+        If the number of nodes changed, the old history is discarded.
+
+        :param control_cycle: The control cycle in which the states were reached.
+        :param life_cycle_state: The life cycle state of all nodes.
+        :param observation_state: The observation state of all nodes.
+        """
+        if life_cycle_state.shape[0] != self._life_cycle_states.shape[1]:
+            self._allocate(number_of_nodes=life_cycle_state.shape[0])
+        elif self._length > 0 and (
+            np.array_equal(self._life_cycle_states[self._length - 1], life_cycle_state)
+            and np.array_equal(
+                self._observation_states[self._length - 1], observation_state
+            )
+        ):
+            return
+        if self._length == self._control_cycles.shape[0]:
+            self._make_room()
+        self._control_cycles[self._length] = control_cycle
+        self._life_cycle_states[self._length] = life_cycle_state
+        self._observation_states[self._length] = observation_state
+        self._length += 1
+        self._number_of_transitions += 1
+
+    def _allocate(self, number_of_nodes: int) -> None:
+        capacity = self.initial_capacity
+        if self.max_length is not None:
+            capacity = min(capacity, 2 * self.max_length)
+        self._control_cycles = np.empty(capacity, dtype=np.int64)
+        self._life_cycle_states = np.empty((capacity, number_of_nodes))
+        self._observation_states = np.empty((capacity, number_of_nodes))
+        self._length = 0
+
+    def _make_room(self) -> None:
+        """
+        Drops the transitions that are no longer needed in bounded mode or doubles the capacity otherwise.
+        """
+        if self.max_length is not None and self._length >= 2 * self.max_length:
+            start = self._start
+            for array in (
+                self._control_cycles,
+                self._life_cycle_states,
+                self._observation_states,
+            ):
+                array[: self.max_length] = array[start : self._length]
+            self._length = self.max_length
+            return
+        capacity = 2 * self._control_cycles.shape[0]
+        if self.max_length is not None:
+            capacity = min(capacity, 2 * self.max_length)
+        self._control_cycles = self._grow(self._control_cycles, capacity)
+        self._life_cycle_states = self._grow(self._life_cycle_states, capacity)
+        self._observation_states = self._grow(self._observation_states, capacity)
+
+    def _grow(self, array: np.ndarray, capacity: int) -> np.ndarray:
+        grown_array = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+        grown_array[: self._length] = array[: self._length]
+        return grown_array
+
+    def get_life_cycle_history_of_node(self, node: MotionStatechartNode) -> np.ndarray:
+        """
+        :return: View of the life cycle states of `node` for all recorded transitions.
+        """
+        return self.life_cycle_states[:, node.index]
+
+    def get_observation_history_of_node(self, node: MotionStatechartNode) -> np.ndarray:
+        """
+        :return: View of the observation states of `node` for all recorded transitions.
+        """
+        return self.observation_states[:, node.index]
 
     def __len__(self) -> int:
-        return len(self.history)
+        return self._length - self._start
+
+
+def create_life_cycle_callback_table() -> np.ndarray:
+    """
+    :return: A table with the name of the node callback that is triggered by a life cycle transition,
+        indexed by the previous and the current life cycle state.
+        Entries of transitions without a callback are None.
+    """
+    table = np.full((len(LifeCycleValues), len(LifeCycleValues)), None, dtype=object)
+    for previous in LifeCycleValues:
+        for current in LifeCycleValues:
+            if previous == current:
+                continue
+            match (previous, current):
+                case (_, LifeCycleValues.NOT_STARTED):
+                    table[previous, current] = "on_reset"
+                case (LifeCycleValues.NOT_STARTED, LifeCycleValues.RUNNING):
+                    table[previous, current] = "on_start"
+                case (LifeCycleValues.RUNNING, LifeCycleValues.PAUSED):
+                    table[previous, current] = "on_pause"
+                case (LifeCycleValues.PAUSED, LifeCycleValues.RUNNING):
+                    table[previous, current] = "on_unpause"
+                case (
+                    (LifeCycleValues.RUNNING | LifeCycleValues.PAUSED),
+                    LifeCycleValues.DONE,
+                ):
+                    table[previous, current] = "on_end"
+    return table
 
 
 @dataclass
@@ -311,6 +470,11 @@ class MotionStatechart(SubclassJSONSerializer):
         6. call is_end_motion() to check if the motion is done.
     """
 
+    life_cycle_callback_table: ClassVar[np.ndarray] = create_life_cycle_callback_table()
+    """
+    Name of the node callback for each transition, indexed by the previous and the current life cycle state.
+    """
+
     rx_graph: rx.PyDiGraph[MotionStatechartNode] = field(
         default_factory=lambda: rx.PyDAG(multigraph=True), init=False, repr=False
     )
@@ -467,11 +631,9 @@ class MotionStatechart(SubclassJSONSerializer):
         self.observation_state.compile(context=context)
         self.life_cycle_state.compile()
         self.history.append(
-            next_item=StateHistoryItem(
-                control_cycle=0,
-                life_cycle_state=self.life_cycle_state,
-                observation_state=self.observation_state,
-            )
+            control_cycle=0,
+            life_cycle_state=self.life_cycle_state.data,
+            observation_state=self.observation_state.data,
         )
 
     def _expand_goals(self, context: MotionStatechartContext):
@@ -497,11 +659,14 @@ class MotionStatechart(SubclassJSONSerializer):
 
     def _update_observation_state(self, context: MotionStatechartContext):
         self.observation_state.update_state()
-        for node in self.nodes:
-            if self.life_cycle_state[node] == LifeCycleValues.RUNNING:
-                observation_overwrite = node.on_tick(context=context)
-                if observation_overwrite is not None:
-                    self.observation_state[node] = observation_overwrite
+        running_node_indices = np.flatnonzero(
+            self.life_cycle_state.data == LifeCycleValues.RUNNING
+        )
+        for node_index in running_node_indices:
+            node = self.get_node_by_index(int(node_index))
+            observation_overwrite = node.on_tick(context=context)
+            if observation_overwrite is not None:
+                self.observation_state.data[node_index] = observation_overwrite
 
     def _update_life_cycle_state(self, context: MotionStatechartContext):
         previous = self.life_cycle_state.data.copy()
@@ -516,29 +681,22 @@ class MotionStatechart(SubclassJSONSerializer):
         current_state: np.ndarray,
         context: MotionStatechartContext,
     ) -> None:
-        for node in self.nodes:
-            prev = LifeCycleValues(int(previous_state[node.index]))
-            curr = LifeCycleValues(int(current_state[node.index]))
-
-            if prev == curr:
-                continue
-
-            match (prev, curr):
-                case (_, LifeCycleValues.NOT_STARTED):
-                    node.on_reset(context=context)
-                case (LifeCycleValues.NOT_STARTED, LifeCycleValues.RUNNING):
-                    node.on_start(context=context)
-                case (LifeCycleValues.RUNNING, LifeCycleValues.PAUSED):
-                    node.on_pause(context=context)
-                case (LifeCycleValues.PAUSED, LifeCycleValues.RUNNING):
-                    node.on_unpause(context=context)
-                case (
-                    (LifeCycleValues.RUNNING | LifeCycleValues.PAUSED),
-                    LifeCycleValues.DONE,
-                ):
-                    node.on_end(context=context)
-                case _:
-                    pass
+        """
+        Calls the life cycle callbacks of all nodes whose life cycle state changed.
+        Only the changed nodes are visited, the callback of each transition is looked up in
+        `life_cycle_callback_table`.
+        """
+        changed_node_indices = np.flatnonzero(previous_state != current_state)
+        if changed_node_indices.size == 0:
+            return
+        callback_names = self.life_cycle_callback_table[
+            previous_state[changed_node_indices].astype(int),
+            current_state[changed_node_indices].astype(int),
+        ]
+        for node_index, callback_name in zip(changed_node_indices, callback_names):
+            if callback_name is not None:
+                node = self.get_node_by_index(int(node_index))
+                getattr(node, callback_name)(context=context)
 
     def tick(self, context: MotionStatechartContext):
         """
@@ -550,11 +708,9 @@ class MotionStatechart(SubclassJSONSerializer):
         self._update_life_cycle_state(context)
         self._raise_if_cancel_motion()
         self.history.append(
-            next_item=StateHistoryItem(
-                control_cycle=len(self.history),
-                life_cycle_state=self.life_cycle_state,
-                observation_state=self.observation_state,
-            )
+            control_cycle=self.history.number_of_transitions,
+            life_cycle_state=self.life_cycle_state.data,
+            observation_state=self.observation_state.data,
         )
 
     def get_nodes_by_type(
@@ -56,11 +56,11 @@ class HistoryGanttChartPlotter:
 
     @property
     def total_control_cycles(self) -> int:
-        return self.motion_statechart.history.history[-1].control_cycle
+        return int(self.motion_statechart.history.control_cycles[-1])
 
     @property
     def num_bars(self) -> int:
-        return len(self.motion_statechart.history.history[0].life_cycle_state)
+        return self.motion_statechart.history.life_cycle_states.shape[1]
 
     @property
     def use_seconds_for_x_axis(self) -> bool:
@@ -106,8 +106,7 @@ class HistoryGanttChartPlotter:
             logger.warning("Gantt chart skipped: no nodes in motion statechart.")
             return
 
-        history = self.motion_statechart.history.history
-        if len(history) == 0:
+        if len(self.motion_statechart.history) == 0:
             logger.warning("Gantt chart skipped: empty StateHistory.")
             return
 
@@ -262,9 +261,7 @@ class HistoryGanttChartPlotter:
         life_cycle_history = (
             self.motion_statechart.history.get_life_cycle_history_of_node(node)
         )
-        control_cycle_indices = [
-            h.control_cycle for h in self.motion_statechart.history.history
-        ]
+        control_cycle_indices = self.motion_statechart.history.control_cycles
         self._plot_node_bar(
             axis=axis,
             node_idx=node_idx,
@@ -295,9 +292,7 @@ class HistoryGanttChartPlotter:
         obs_history = self.motion_statechart.history.get_observation_history_of_node(
             node
         )
-        control_cycle_indices = [
-            h.control_cycle for h in self.motion_statechart.history.history
-        ]
+        control_cycle_indices = self.motion_statechart.history.control_cycles
         self._plot_node_bar(
             axis=axis,
             node_idx=node_idx,
@@ -331,8 +326,8 @@ class HistoryGanttChartPlotter:
         obs_history = self.motion_statechart.history.get_observation_history_of_node(
             node
         )
-        last_lifecycle = life_cycle_history[-1]
-        last_observation = obs_history[-1]
+        last_lifecycle = LifeCycleValues(int(life_cycle_history[-1]))
+        last_observation = ObservationStateValues(obs_history[-1])
 
         # Column spans from padding to 1 - padding
         width = max(0.0, 1.0 - 2 * column_padding)
@@ -360,8 +355,8 @@ class HistoryGanttChartPlotter:
         self,
         axis: plt.Axes,
         node_idx: int,
-        history: List[LifeCycleValues | ObservationStateValues],
-        control_cycle_indices: List[int],
+        history: np.ndarray,
+        control_cycle_indices: np.ndarray,
         color_map: Dict[LifeCycleValues | ObservationStateValues, str],
         top: bool,
     ):
@@ -372,9 +367,9 @@ class HistoryGanttChartPlotter:
 
         :param axis: The matplotlib Axes instance where the bar will be plotted.
         :param node_idx: The index of the node for which the bar is being plotted.
-        :param history: A list of state values indicating the historical lifecycle
+        :param history: The state values indicating the historical lifecycle
             or observation state of the node.
-        :param control_cycle_indices: A list of indices representing the control cycles
+        :param control_cycle_indices: The indices representing the control cycles
             associated with the state transitions.
         :param color_map: A mapping between lifecycle or observation states and their
             associated colors used for visualization.
@@ -382,7 +377,7 @@ class HistoryGanttChartPlotter:
             of the chart.
         """
         current_state = history[0]
-        start_idx = 0
+        start_idx = control_cycle_indices[0]
         for idx, next_state in zip(control_cycle_indices[1:], history[1:]):
             if current_state != next_state:
                 life_cycle_width = (idx - start_idx) * self.x_width_per_control_cycle
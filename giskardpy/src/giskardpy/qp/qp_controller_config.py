@@ -98,6 +98,15 @@ class QPControllerConfig:
     If True, prints config.
     """
 
+    jit_compile: bool = field(default=False)
+    """
+    If True, the QP matrices and vectors are translated to C and built into shared objects with the local
+    C compiler, instead of being evaluated by the CasADi virtual machine.
+    This makes the first compilation of a motion statechart slower, but every control cycle faster.
+    Built shared objects are cached on disk, see krrood.symbolic_math.compile_cache, such that later compilations
+    of the same motion statechart load them instead, even after a restart.
+    """
+
     # %% init false
     model_predictive_control_time_step: float = field(init=False)
     """
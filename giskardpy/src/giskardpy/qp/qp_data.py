@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import lru_cache
 
 import numpy as np
 import scipy.sparse as sp
 from scipy.sparse import issparse
-from typing_extensions import Self
+from typing_extensions import Optional, Self, Tuple
 
 
 @dataclass
@@ -34,6 +34,133 @@ class QPData(ABC):
         """
 
 
+@dataclass
+class SparseMatrixFilter:
+    """
+    Removes rows and columns from csc matrices with a fixed sparsity pattern using a single gather.
+    """
+
+    data_indices: np.ndarray
+    """
+    For each nonzero of the filtered matrix, the index of the corresponding nonzero in the unfiltered matrix.
+    """
+    filtered_matrix: sp.csc_matrix
+    """
+    Preallocated result, its data is overwritten on every call.
+    """
+
+    @classmethod
+    def create(
+        cls, matrix: sp.csc_matrix, row_filter: np.ndarray, column_filter: np.ndarray
+    ) -> Self:
+        """
+        :param matrix: A matrix with the sparsity pattern of all matrices that will be filtered.
+        :param row_filter: Boolean mask of the rows to keep.
+        :param column_filter: Boolean mask of the columns to keep.
+        """
+        # filter a matrix that stores the (1-based) position of each nonzero as value,
+        # such that the filtered values tell us where to gather from
+        index_matrix = sp.csc_matrix(
+            (np.arange(1, matrix.nnz + 1, dtype=float), matrix.indices, matrix.indptr),
+            shape=matrix.shape,
+        )
+        filtered_matrix = index_matrix[row_filter, :][:, column_filter]
+        data_indices = filtered_matrix.data.astype(int) - 1
+        return cls(data_indices=data_indices, filtered_matrix=filtered_matrix)
+
+    def __call__(self, matrix: sp.csc_matrix) -> sp.csc_matrix:
+        np.take(matrix.data, self.data_indices, out=self.filtered_matrix.data)
+        return self.filtered_matrix
+
+
+@dataclass
+class QPDataFilterCache:
+    """
+    Remembers how the sparse matrices of a QPDataExplicit were filtered in `QPDataExplicit.apply_filters`.
+    Most control cycles have the same zero-weight pattern, in that case the filtered matrices are produced without
+    creating new sparse structures.
+    Only the filters for the last mask are kept, a different mask replaces them.
+    """
+
+    hits: int = field(default=0, init=False)
+    """
+    Number of calls that reused the filters.
+    """
+    misses: int = field(default=0, init=False)
+    """
+    Number of calls that had to create new filters, because the mask or the matrices changed.
+    """
+    _key: Optional[Tuple] = field(default=None, init=False, repr=False)
+    """
+    The mask and matrix sparsity patterns for which the filters were created.
+    """
+    _equality_matrix_filter: Optional[SparseMatrixFilter] = field(
+        default=None, init=False, repr=False
+    )
+    _inequality_matrix_filter: Optional[SparseMatrixFilter] = field(
+        default=None, init=False, repr=False
+    )
+
+    def filter_matrices(
+        self,
+        equality_matrix: sp.csc_matrix,
+        inequality_matrix: sp.csc_matrix,
+        bE_filter: np.ndarray,
+        bA_filter: np.ndarray,
+        zero_quadratic_weight_filter: np.ndarray,
+    ) -> Tuple[sp.csc_matrix, sp.csc_matrix]:
+        """
+        Filters the equality and inequality matrix.
+        .. warning:: The returned matrices are reused by subsequent calls with the same mask.
+        :return: The filtered equality and inequality matrix.
+        """
+        # bE_filter and bA_filter are derived from zero_quadratic_weight_filter
+        key = (
+            zero_quadratic_weight_filter.tobytes(),
+            self._sparsity_of(equality_matrix),
+            self._sparsity_of(inequality_matrix),
+        )
+        if key != self._key:
+            self.misses += 1
+            self._equality_matrix_filter = self._create_filter(
+                equality_matrix, bE_filter, zero_quadratic_weight_filter
+            )
+            self._inequality_matrix_filter = self._create_filter(
+                inequality_matrix, bA_filter, zero_quadratic_weight_filter
+            )
+            self._key = key
+        else:
+            self.hits += 1
+        return (
+            self._apply_filter(self._equality_matrix_filter, equality_matrix),
+            self._apply_filter(self._inequality_matrix_filter, inequality_matrix),
+        )
+
+    @staticmethod
+    def _sparsity_of(matrix: sp.csc_matrix) -> Tuple[Tuple[int, int], bytes, bytes]:
+        """
+        :return: The dimensions and the positions of the nonzeros of the matrix, which the filters depend on.
+        """
+        return matrix.shape, matrix.indptr.tobytes(), matrix.indices.tobytes()
+
+    @staticmethod
+    def _create_filter(
+        matrix: sp.csc_matrix, row_filter: np.ndarray, column_filter: np.ndarray
+    ) -> Optional[SparseMatrixFilter]:
+        if len(matrix.shape) > 1 and matrix.shape[0] * matrix.shape[1] > 0:
+            return SparseMatrixFilter.create(matrix, row_filter, column_filter)
+        # empty matrices are not filtered
+        return None
+
+    @staticmethod
+    def _apply_filter(
+        matrix_filter: Optional[SparseMatrixFilter], matrix: sp.csc_matrix
+    ) -> sp.csc_matrix:
+        if matrix_filter is None:
+            return matrix
+        return matrix_filter(matrix)
+
+
 @dataclass
 class QPDataExplicit(QPData):
     """
@@ -85,6 +212,14 @@ class QPDataExplicit(QPData):
     Upper bounds for the inequality matrix multiplied with x.
     """
 
+    filter_cache: Optional[QPDataFilterCache] = field(
+        default=None, repr=False, compare=False
+    )
+    """
+    If set, `apply_filters` reuses the filters of the previous call, as long as the same constraints are filtered.
+    Should be shared between all QPDataExplicit with the same sparsity pattern, e.g. those created by one factory.
+    """
+
     @property
     def dense_eq_matrix(self) -> np.ndarray:
         """
@@ -150,6 +285,22 @@ class QPDataExplicit(QPData):
         if len(bA_part) > 0:
             bA_filter[-len(bA_part) :] = bA_part
 
+        if self.filter_cache is not None:
+            equality_matrix, inequality_matrix = self.filter_cache.filter_matrices(
+                self.equality_matrix,
+                self.inequality_matrix,
+                bE_filter,
+                bA_filter,
+                zero_quadratic_weight_filter,
+            )
+        else:
+            equality_matrix = self._filter_eq_matrix(
+                self.equality_matrix, bE_filter, zero_quadratic_weight_filter
+            )
+            inequality_matrix = self._filter_neq_matrix(
+                self.inequality_matrix, bA_filter, zero_quadratic_weight_filter
+            )
+
         return QPDataExplicit(
             quadratic_weights=self.quadratic_weights[zero_quadratic_weight_filter],
             linear_weights=self.linear_weights[zero_quadratic_weight_filter],
@@ -159,13 +310,9 @@ class QPDataExplicit(QPData):
             box_upper_constraints=self.box_upper_constraints[
                 zero_quadratic_weight_filter
             ],
-            equality_matrix=self._filter_eq_matrix(
-                self.equality_matrix, bE_filter, zero_quadratic_weight_filter
-            ),
+            equality_matrix=equality_matrix,
             equality_bounds=self.equality_bounds[bE_filter],
-            inequality_matrix=self._filter_neq_matrix(
-                self.inequality_matrix, bA_filter, zero_quadratic_weight_filter
-            ),
+            inequality_matrix=inequality_matrix,
             inequality_lower_bounds=self.inequality_lower_bounds[bA_filter],
             inequality_upper_bounds=self.inequality_upper_bounds[bA_filter],
             num_equality_slack_variables=self.num_equality_slack_variables,
@@ -12,7 +12,12 @@ from typing_extensions import (
 )
 
 from giskardpy.qp.exceptions import NoFactoryForQPDataTypeError
-from giskardpy.qp.qp_data import QPData, QPDataExplicit, QPDataTwoSidedInequality
+from giskardpy.qp.qp_data import (
+    QPData,
+    QPDataExplicit,
+    QPDataFilterCache,
+    QPDataTwoSidedInequality,
+)
 from krrood.symbolic_math.symbolic_math import (
     CompiledFunctionWithViews,
     VariableParameters,
@@ -112,6 +117,12 @@ class QPDataExplicitFactory(QPDataFactory[QPDataExplicit]):
     """
     Compiled casadi function computing all vector elements of the QP problem.
     """
+    filter_cache: QPDataFilterCache = field(
+        default_factory=QPDataFilterCache, init=False
+    )
+    """
+    Shared by all QPDataExplicit created by this factory, because their matrices have the same sparsity pattern.
+    """
 
     def compile(
         self,
@@ -148,10 +159,12 @@ class QPDataExplicitFactory(QPDataFactory[QPDataExplicit]):
         self.equality_matrix_compiled = eq_matrix.compile(
             parameters=VariableParameters.from_lists(*free_symbols),
             sparse=True,
+            jit_compile=self.qp_data.qp_controller_config.jit_compile,
         )
         self.inequality_matrix_compiled = neq_matrix.compile(
             parameters=VariableParameters.from_lists(*free_symbols),
             sparse=True,
+            jit_compile=self.qp_data.qp_controller_config.jit_compile,
         )
 
         self.combined_vector_f = CompiledFunctionWithViews(
@@ -165,6 +178,7 @@ class QPDataExplicitFactory(QPDataFactory[QPDataExplicit]):
                 self.qp_data.inequality_upper_bounds,
             ],
             parameters=VariableParameters.from_lists(*free_symbols),
+            jit_compile=self.qp_data.qp_controller_config.jit_compile,
         )
 
     def evaluate(
@@ -202,6 +216,7 @@ class QPDataExplicitFactory(QPDataFactory[QPDataExplicit]):
             inequality_upper_bounds=neq_upper_bounds_np_raw,
             num_equality_slack_variables=self.qp_data.number_equality_slack_variables,
             num_inequality_slack_variables=self.qp_data.number_inequality_slack_variables,
+            filter_cache=self.filter_cache,
         )
 
 
@@ -292,11 +307,13 @@ class QPDataTwoSidedInequalityFactory(QPDataFactory[QPDataTwoSidedInequality]):
                 slice(self.qp_data.quadratic_weights.shape[0], len_lb_be_lba_end),
                 slice(len_lb_be_lba_end, len_ub_be_uba_end),
             ],
+            jit_compile=self.qp_data.qp_controller_config.jit_compile,
         )
 
         self.inequality_matrix_compiled = constraint_matrix.compile(
             parameters=VariableParameters.from_lists(*free_symbols),
             sparse=True,
+            jit_compile=self.qp_data.qp_controller_config.jit_compile,
         )
 
     def evaluate(
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import time
+from collections import deque
 from dataclasses import dataclass, field
 
 import numpy as np
 import piqp
+import scipy.sparse as sp
+from typing_extensions import Optional, Tuple, Deque
 
 from giskardpy.qp.exceptions import InfeasibleException
 from giskardpy.qp.qp_data import QPDataExplicit
@@ -24,6 +28,22 @@ class QPSolverPIQP(QPSolver[QPDataExplicit]):
     .. warning:: This is unsafe because it might lead to instability if the QP was actually infeasible. Only enable it
         when you are certain the problem is feasible.
     """
+    _structure: Optional[Tuple] = field(default=None, init=False, repr=False)
+    """
+    Dimensions and sparsity patterns of the QP that was last passed to `setup`.
+    As long as they don't change, the matrices are passed to `update`, which reuses the symbolic factorization.
+    """
+    number_of_setups: int = field(default=0, init=False)
+    """
+    How often the solver had to be set up from scratch, because the structure of the QP changed.
+    """
+    solve_times: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=1_000), init=False, repr=False
+    )
+    """
+    Durations in seconds of the most recent solver calls, bounded so that long-running controllers don't accumulate
+    them without limit.
+    """
 
     def __post_init__(self):
         self.solver.settings.eps_abs = 1e-6
@@ -33,8 +53,76 @@ class QPSolverPIQP(QPSolver[QPDataExplicit]):
         self.solver.settings.reg_lower_limit = 1e-11
         # self.solver.settings.kkt_solver = piqp.KKTSolver.sparse_multistage
 
+    @staticmethod
+    def _sparsity_of(matrix: sp.csc_matrix) -> Tuple[Tuple[int, int], bytes, bytes]:
+        return matrix.shape, matrix.indptr.tobytes(), matrix.indices.tobytes()
+
+    def _structure_of(self, qp_data: QPDataExplicit) -> Tuple:
+        """
+        :return: A signature of the dimensions and sparsity patterns of the QP.
+            The weight matrix is diagonal, so its structure is determined by the number of variables.
+        """
+        has_inequalities = len(qp_data.inequality_upper_bounds) > 0
+        return (
+            len(qp_data.quadratic_weights),
+            self._sparsity_of(qp_data.equality_matrix),
+            self._sparsity_of(qp_data.inequality_matrix) if has_inequalities else None,
+        )
+
     def solver_call_explicit_interface(self, qp_data: QPDataExplicit) -> np.ndarray:
+        start_time = time.perf_counter()
+        try:
+            return self._solve(qp_data)
+        finally:
+            self.solve_times.append(time.perf_counter() - start_time)
+
+    def _solve(self, qp_data: QPDataExplicit) -> np.ndarray:
         weight_matrix = fast_sparse_diagonal(qp_data.quadratic_weights)
+        structure = self._structure_of(qp_data)
+        if structure == self._structure:
+            self._update(qp_data, weight_matrix)
+        else:
+            self._setup(qp_data, weight_matrix)
+            self._structure = structure
+
+        status = self.solver.solve()
+        if status.value != piqp.PIQP_SOLVED and not self.big_ball_mode:
+            # the next QP is likely different, e.g. with relaxed constraints, start from scratch.
+            self._structure = None
+            raise InfeasibleException(solver_status=str(status.value))
+        return self.solver.result.x
+
+    def _update(self, qp_data: QPDataExplicit, weight_matrix: sp.csc_matrix) -> None:
+        """
+        Passes new values to the solver, assuming the structure of the QP didn't change since the last setup.
+        """
+        if len(qp_data.inequality_upper_bounds) == 0:
+            self.solver.update(
+                P=weight_matrix,
+                c=qp_data.linear_weights,
+                A=qp_data.equality_matrix,
+                b=qp_data.equality_bounds,
+                x_l=qp_data.box_lower_constraints,
+                x_u=qp_data.box_upper_constraints,
+            )
+        else:
+            self.solver.update(
+                P=weight_matrix,
+                c=qp_data.linear_weights,
+                A=qp_data.equality_matrix,
+                b=qp_data.equality_bounds,
+                G=qp_data.inequality_matrix,
+                h_l=qp_data.inequality_lower_bounds,
+                h_u=qp_data.inequality_upper_bounds,
+                x_l=qp_data.box_lower_constraints,
+                x_u=qp_data.box_upper_constraints,
+            )
+
+    def _setup(self, qp_data: QPDataExplicit, weight_matrix: sp.csc_matrix) -> None:
+        """
+        Sets up the solver from scratch, including the symbolic factorization of the KKT system.
+        """
+        self.number_of_setups += 1
         if len(qp_data.inequality_upper_bounds) == 0:
             self.solver.setup(
                 P=weight_matrix,
@@ -57,9 +145,4 @@ class QPSolverPIQP(QPSolver[QPDataExplicit]):
                 x_u=qp_data.box_upper_constraints,
             )
 
-        status = self.solver.solve()
-        if status.value != piqp.PIQP_SOLVED and not self.big_ball_mode:
-            raise InfeasibleException(solver_status=str(status.value))
-        return self.solver.result.x
-
     solver_call = solver_call_explicit_interface
@@ -20,7 +20,9 @@ class PublishFeedback(GiskardBehavior):
         self.last_history_length = -1
 
     def has_state_changed(self):
-        history_length = len(GiskardBlackboard().motion_statechart.history)
+        history_length = (
+            GiskardBlackboard().motion_statechart.history.number_of_transitions
+        )
         has_changed = self.last_history_length != history_length
         if has_changed:
             self.last_history_length = history_length
@@ -14,7 +14,7 @@ from dataclasses import dataclass, field
 from functools import wraps
 from typing_extensions import Any, Optional, Type, Callable, Union
 
-from krrood.entity_query_language._stack import CallStack
+from krrood.entity_query_language._stack import CallStack, DeferredCallStack
 from krrood.singleton import SingletonMeta
 
 
@@ -23,6 +23,10 @@ class MonitoredRegistry(metaclass=SingletonMeta):
     """
     Registry for monitoring EQL object creation stacks.
     Acts as a class decorator and provides lookup methods.
+
+    Creating a monitored object only records the raw frames of its creation stack in a :class:`DeferredCallStack`,
+    whose :class:`StackFrame` objects are built when they are first read.
+    Monitoring can be turned off for the whole process with :meth:`disable`, or temporarily with :meth:`disabled`.
     """
 
     _monitored: set[type] = field(default_factory=set)
@@ -36,7 +40,7 @@ class MonitoredRegistry(metaclass=SingletonMeta):
     """
 
     def __call__(self, cls: Type) -> Type:
-        """Decorate a class to automatically record its creation stack as a :class:`CallStack`."""
+        """Decorate a class to automatically record its creation stack as a :class:`DeferredCallStack`."""
         cls._is_monitored_ = True
         self._monitored.add(cls)
 
@@ -47,17 +51,24 @@ class MonitoredRegistry(metaclass=SingletonMeta):
             if not monitored._is_disabled:
                 # ``skip=1`` drops this ``new_post_init`` frame so capture starts at the caller
                 # of ``__post_init__``; site-packages frames are filtered during the walk.
-                self._creation_stack = CallStack.capture(skip=1)
+                self._creation_stack = DeferredCallStack.capture(skip=1)
             original_post_init(self, *args, **kwargs)
 
         cls.__post_init__ = new_post_init
         return cls
 
     def get_stack(self, instance: Any) -> Optional[CallStack]:
-        """Retrieve the creation stack for a monitored instance."""
+        """
+        Retrieve the creation stack for a monitored instance.
+
+        :param instance: The instance.
+        :return: The creation stack, or ``None`` if the instance is not monitored or was created while monitoring
+            was disabled.
+        """
         if not self.is_monitored(type(instance)):
             return None
-        return instance._creation_stack
+        # Read the instance dictionary, since missing attributes of symbolic expressions are symbolic attributes.
+        return vars(instance).get("_creation_stack")
 
     def is_monitored(self, target: Union[Type, Callable]) -> bool:
         """Check whether a class or callable is monitored."""
@@ -71,14 +82,30 @@ class MonitoredRegistry(metaclass=SingletonMeta):
         if hasattr(cls, "_is_monitored_"):
             del cls._is_monitored_
 
+    @property
+    def is_enabled(self) -> bool:
+        """
+        :return: Whether the creation stacks of monitored objects are captured.
+        """
+        return not self._is_disabled
+
+    def enable(self) -> None:
+        """Capture the creation stacks of monitored objects for the whole process."""
+        self._is_disabled = False
+
+    def disable(self) -> None:
+        """Stop capturing the creation stacks of monitored objects for the whole process."""
+        self._is_disabled = True
+
     @contextmanager
     def disabled(self):
         """Context manager that suppresses stack capture for all monitored classes."""
+        was_disabled = self._is_disabled
         self._is_disabled = True
         try:
             yield
         finally:
-            self._is_disabled = False
+            self._is_disabled = was_disabled
 
     @property
     def monitored_classes(self) -> tuple[type, ...]:
@@ -1,9 +1,11 @@
 """
 Explicit data structures for call stack frames captured during EQL object creation.
 
-Typed, memory-safe dataclasses that eagerly extract all needed data from a live
+Typed, memory-safe dataclasses that extract all needed data from a live
 ``inspect.FrameInfo`` and immediately drop the live frame reference, avoiding
-memory leaks from retained frame objects.
+memory leaks from retained frame objects. :class:`DeferredCallStack` extracts only the
+code object, line number, module globals and owning class of each frame and builds the
+:class:`StackFrame` objects when they are first asked for.
 """
 
 from __future__ import annotations
@@ -12,8 +14,14 @@ import inspect
 import linecache
 import sys
 from dataclasses import dataclass
-from types import FrameType
-from typing_extensions import Callable, List, Optional
+from types import CodeType, FrameType
+from typing_extensions import Any, Callable, Dict, List, Optional, Tuple
+
+RawFrame = Tuple[CodeType, int, Dict[str, Any], Optional[type]]
+"""
+The code object, line number, module globals and owning class of a frame, which is all that is needed to build its
+:class:`StackFrame` after the frame has returned.
+"""
 
 
 @dataclass
@@ -121,11 +129,57 @@ class StackFrame:
         :param code_snippet: One stripped source line, or ``None`` if unavailable.
         :return: The constructed :class:`StackFrame`.
         """
-        instance = frame.f_locals.get("self", None)
-        owner_class: Optional[type] = frame.f_locals.get("cls", None)
-        if owner_class is None and instance is not None:
-            owner_class = type(instance)
-        resolved_function: Optional[Callable] = frame.f_globals.get(function_name, None)
+        return cls._from_frame_data(
+            filename=filename,
+            lineno=lineno,
+            function_name=function_name,
+            code_snippet=code_snippet,
+            owner_class=_owner_class(frame),
+            frame_globals=frame.f_globals,
+        )
+
+    @classmethod
+    def from_raw(cls, raw_frame: RawFrame) -> StackFrame:
+        """
+        Build a :class:`StackFrame` from the data that :meth:`DeferredCallStack.capture` recorded for a frame.
+        The source line is fetched from :mod:`linecache`.
+
+        :param raw_frame: The recorded data of the frame.
+        :return: A self-contained :class:`StackFrame`.
+        """
+        code, lineno, frame_globals, owner_class = raw_frame
+        return cls._from_frame_data(
+            filename=code.co_filename,
+            lineno=lineno,
+            function_name=code.co_name,
+            code_snippet=linecache.getline(code.co_filename, lineno).strip() or None,
+            owner_class=owner_class,
+            frame_globals=frame_globals,
+        )
+
+    @classmethod
+    def _from_frame_data(
+        cls,
+        *,
+        filename: str,
+        lineno: int,
+        function_name: str,
+        code_snippet: Optional[str],
+        owner_class: Optional[type],
+        frame_globals: Dict[str, Any],
+    ) -> StackFrame:
+        """
+        Build a :class:`StackFrame` from the data of a frame and resolve its callable object and module name.
+
+        :param filename: Source file path for the frame.
+        :param lineno: Line number within the source file.
+        :param function_name: Name of the function or method.
+        :param code_snippet: One stripped source line, or ``None`` if unavailable.
+        :param owner_class: The class that owns the method of the frame, or ``None`` for free functions.
+        :param frame_globals: The globals of the module of the frame.
+        :return: The constructed :class:`StackFrame`.
+        """
+        resolved_function: Optional[Callable] = frame_globals.get(function_name, None)
         if resolved_function is None and owner_class is not None:
             resolved_function = owner_class.__dict__.get(function_name, None)
         return cls(
@@ -135,10 +189,67 @@ class StackFrame:
             code_snippet=code_snippet,
             class_object=owner_class,
             function_object=resolved_function,
-            module_name=frame.f_globals.get("__name__"),
+            module_name=frame_globals.get("__name__"),
         )
 
 
+def _owner_class(frame: FrameType) -> Optional[type]:
+    """
+    :param frame: A live frame.
+    :return: The class of the ``cls`` or ``self`` local of the frame, or ``None`` if it has neither.
+    """
+    instance = frame.f_locals.get("self", None)
+    owner_class: Optional[type] = frame.f_locals.get("cls", None)
+    if owner_class is None and instance is not None:
+        owner_class = type(instance)
+    return owner_class
+
+
+_code_properties: Dict[int, Tuple[CodeType, bool, bool]] = {}
+"""
+Cache of whether a code object is in an installed third-party package and whether its frames may have an owning
+class, by the id of the code object. The code object is kept in the entry such that its id is not reused.
+"""
+
+_maximum_number_of_code_properties: int = 4096
+"""
+The number of code objects after which :data:`_code_properties` is cleared, such that it does not keep the code
+objects of functions that were created dynamically alive indefinitely.
+"""
+
+
+def _properties_of_code(code: CodeType) -> Tuple[CodeType, bool, bool]:
+    """
+    Accessing the variable names of a code object creates new tuples, so the checks are cached per code object.
+
+    :param code: The code object of a frame.
+    :return: The code object, whether it is external and whether its frames may have an owning class.
+    """
+    properties = _code_properties.get(id(code))
+    if properties is None or properties[0] is not code:
+        if len(_code_properties) >= _maximum_number_of_code_properties:
+            _code_properties.clear()
+        properties = (
+            code,
+            _is_external_filename(code.co_filename),
+            _may_have_owner_class(code),
+        )
+        _code_properties[id(code)] = properties
+    return properties
+
+
+def _may_have_owner_class(code: CodeType) -> bool:
+    """
+    :param code: The code object of a frame.
+    :return: ``True`` if the frame has a ``self`` or ``cls`` variable, i.e. reading its locals is needed to find the
+        class that owns it.
+    """
+    for names in (code.co_varnames, code.co_cellvars, code.co_freevars):
+        if "self" in names or "cls" in names:
+            return True
+    return False
+
+
 def _is_external_filename(filename: str) -> bool:
     """
     :param filename: A source file path.
@@ -241,3 +352,70 @@ class CallStack:
     def is_from_method(self) -> bool:
         """True if any frame in this stack is inside a class method."""
         return any(frame.is_method for frame in self.frames)
+
+
+class DeferredCallStack(CallStack):
+    """
+    A :class:`CallStack` whose :class:`StackFrame` objects are built when its frames are first accessed.
+
+    Capturing it only records a :data:`RawFrame` per frame that is not in an installed third-party package, which
+    makes it cheap enough to capture whenever a monitored object is created. Diagnostics that read the frames
+    resolve them once.
+    """
+
+    def __init__(self, raw_frames: List[RawFrame]):
+        """
+        :param raw_frames: The recorded data of the frames, innermost frame first.
+        """
+        self.raw_frames: List[RawFrame] = raw_frames
+        self._frames: Optional[List[StackFrame]] = None
+
+    @property
+    def frames(self) -> List[StackFrame]:
+        """
+        :return: The frames of the stack, built from the recorded data on the first access.
+        """
+        if self._frames is None:
+            self._frames = [
+                StackFrame.from_raw(raw_frame) for raw_frame in self.raw_frames
+            ]
+            self.raw_frames = []
+        return self._frames
+
+    def __len__(self) -> int:
+        return len(self.raw_frames) if self._frames is None else len(self._frames)
+
+    def __deepcopy__(self, memo) -> DeferredCallStack:
+        # The recorded frames never change, so copies share them instead of copying the module globals.
+        return self
+
+    def __reduce__(self):
+        return CallStack, (self.frames,)
+
+    @classmethod
+    def capture(cls, skip: int = 0) -> DeferredCallStack:
+        """
+        Record the current call stack, skipping frames in installed third-party packages.
+
+        :param skip: Number of frames to skip starting from the caller of :meth:`capture`, like in
+            :meth:`CallStack.capture`.
+        :return: A new :class:`DeferredCallStack` of the retained frames, innermost first.
+        """
+        try:
+            frame: Optional[FrameType] = sys._getframe(1 + skip)
+        except ValueError:
+            return cls([])
+        raw_frames: List[RawFrame] = []
+        while frame is not None:
+            code, is_external, may_have_owner_class = _properties_of_code(frame.f_code)
+            if not is_external:
+                raw_frames.append(
+                    (
+                        code,
+                        frame.f_lineno,
+                        frame.f_globals,
+                        _owner_class(frame) if may_have_owner_class else None,
+                    )
+                )
+            frame = frame.f_back
+        return cls(raw_frames)
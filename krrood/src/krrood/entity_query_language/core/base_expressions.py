@@ -32,6 +32,7 @@ from typing_extensions import (
     Type,
 )
 
+from krrood.entity_query_language.enums import EvaluationMode
 from krrood.entity_query_language.exceptions import NoExpressionFoundForGivenID
 from krrood.entity_query_language.utils import make_list, T, make_set, is_iterable
 from krrood.symbol_graph.symbol_graph import SymbolGraph
@@ -103,6 +104,12 @@ class SymbolicExpression(ABC):
     """
     The maximum number of results to return during evaluation.
     """
+    _evaluation_mode_: EvaluationMode = field(
+        init=False, repr=False, default=EvaluationMode.Explained
+    )
+    """
+    The mode in which this expression is evaluated when it is the root of an evaluation.
+    """
     _expression_id_cache_: dict[uuid.UUID, SymbolicExpression] = field(
         init=False, repr=False, default_factory=dict, compare=False
     )
@@ -268,22 +275,24 @@ class SymbolicExpression(ABC):
         owns_an_evaluation_context = evaluation_context is None
         if owns_an_evaluation_context:
             from krrood.entity_query_language.evaluation import (
-                create_default_evaluation_context,
+                create_evaluation_context,
             )
 
-            evaluation_context = create_default_evaluation_context()
+            evaluation_context = create_evaluation_context(self._evaluation_mode_)
             context_token = set_evaluation_context(evaluation_context)
         try:
+            if not evaluation_context.observers:
+                yield from self._evaluate_without_observers_(sources)
+                return
             evaluation_context.on_evaluate_enter(expression=self, sources=sources)
             # Normalize sources: always work with an OperationResult
             previous_result = sources
-            if sources is not None:
-                bindings = copy(sources.bindings)
-            else:
-                bindings = {}
+            if sources is None:
                 sources = OperationResult({})  # empty sentinel for _evaluate__()
-            if self._id_ in bindings:
-                result = OperationResult(bindings, False, self, previous_result)
+            if self._id_ in sources.bindings:
+                result = OperationResult(
+                    copy(sources.bindings), False, self, previous_result
+                )
                 evaluation_context.on_result_yielded(expression=self, result=result)
                 yield result
             else:
@@ -298,6 +307,29 @@ class SymbolicExpression(ABC):
             if owns_an_evaluation_context:
                 _evaluation_context_var.reset(context_token)
 
+    def _evaluate_without_observers_(
+        self, sources: Optional[OperationResult]
+    ) -> Iterator[OperationResult]:
+        """
+        Same as the body of ``SymbolicExpression._evaluate_`` for evaluation contexts without observers, which skips
+        the notifications and only evaluates conclusions if this expression has any.
+
+        :param sources: The current OperationResult carrying bindings of variables, or None.
+        :return: An iterator of OperationResult instances.
+        """
+        if sources is None:
+            sources = OperationResult({})
+        elif self._id_ in sources.bindings:
+            yield OperationResult(copy(sources.bindings), False, self, sources)
+            return
+        if self._conclusions_:
+            yield from map(
+                self._evaluate_conclusions_and_update_bindings_,
+                self._evaluate__(sources),
+            )
+        else:
+            yield from self._evaluate__(sources)
+
     def _evaluate_conclusions_and_update_bindings_(
         self, current_result: OperationResult
     ) -> OperationResult:
@@ -308,7 +340,7 @@ class SymbolicExpression(ABC):
         """
         # Only evaluate the conclusions at the root condition expression (i.e. after all conditions have been evaluated)
         # and when the result truth value is True.
-        if not (self._conditions_root_ is self) or current_result.is_false:
+        if current_result.is_false or not (self._conditions_root_ is self):
             return current_result
         for conclusion in self._conclusions_:
             current_result.bindings = next(
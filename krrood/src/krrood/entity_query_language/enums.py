@@ -37,6 +37,23 @@ class EQLMode(Enum):
     """
 
 
+class EvaluationMode(Enum):
+    """
+    The modes in which a query can be evaluated.
+    """
+
+    Explained = auto()
+    """
+    Evaluation observers record the evaluated and satisfied conditions of every result and the explanations of
+    inferred instances, which are needed for debugging and for explaining inferences.
+    """
+    Fast = auto()
+    """
+    No evaluation observers are notified, such that producing a result costs only the evaluation itself.
+    Inferred instances cannot be explained.
+    """
+
+
 class DomainSource(Enum):
     """
     The domain source of a variable.
@@ -80,3 +97,10 @@ class EvaluationContextKey(StrEnum):
     version key: results yielded while the set has a given length share one snapshot instead of
     each copying the whole set.
     """
+
+    HASH_JOINS_KEY = "hash_joins"
+    """
+    A reserved key mapping the IDs of equality comparators to their :class:`HashJoin`, or to ``None`` if they cannot
+    be evaluated as a hash join. The hash tables are built once per evaluation and reused by every later evaluation of
+    the comparator.
+    """
@@ -16,7 +16,7 @@ from krrood.entity_query_language.core.base_expressions import (
     TruthValueOperator,
 )
 from krrood.entity_query_language.core.variable import InstantiatedVariable
-from krrood.entity_query_language.enums import EvaluationContextKey
+from krrood.entity_query_language.enums import EvaluationContextKey, EvaluationMode
 from krrood.entity_query_language.evaluation_context import (
     EvaluationContext,
     EvaluationObserver,
@@ -239,3 +239,24 @@ def create_default_evaluation_context() -> EvaluationContext:
             InferenceRecorder(),
         ]
     )
+
+
+def create_fast_evaluation_context() -> EvaluationContext:
+    """
+    Create an :class:`EvaluationContext` without observers, which makes
+    :meth:`~krrood.entity_query_language.core.base_expressions.SymbolicExpression._evaluate_` skip all observer
+    notifications.
+
+    :return: A new :class:`EvaluationContext` without observers.
+    """
+    return EvaluationContext()
+
+
+def create_evaluation_context(evaluation_mode: EvaluationMode) -> EvaluationContext:
+    """
+    :param evaluation_mode: The mode in which a query is evaluated.
+    :return: A new :class:`EvaluationContext` for the evaluation mode.
+    """
+    if evaluation_mode is EvaluationMode.Fast:
+        return create_fast_evaluation_context()
+    return create_default_evaluation_context()
@@ -21,6 +21,7 @@ from typing_extensions import (
     Any,
     Collection,
     Dict,
+    Set,
     TYPE_CHECKING,
 )
 
@@ -105,6 +106,13 @@ class Aggregator(UnaryExpression, CanBehaveLikeAVariable[T], ABC):
             )
         )
 
+    def create_accumulator(self) -> Optional[Accumulator]:
+        """
+        :return: A new accumulator that aggregates the values of the child one at a time, or None if the aggregation
+         needs all the values at once.
+        """
+        return None
+
     @abstractmethod
     def _apply_aggregation_function_and_get_bindings_(
         self, child_result: OperationResult
@@ -124,6 +132,9 @@ class Count(Aggregator[T]):
     Count the number of child results.
     """
 
+    def create_accumulator(self) -> Optional[Accumulator]:
+        return CountAccumulator(distinct=self._distinct_)
+
     def _apply_aggregation_function_and_get_bindings_(
         self, child_result: OperationResult
     ) -> Iterator[Bindings]:
@@ -161,6 +172,9 @@ class CountRange(Count[T]):
         self._original_child_ = self._child_
         super().__post_init__()
 
+    def create_accumulator(self) -> Optional[Accumulator]:
+        return None
+
     def _apply_aggregation_function_and_get_bindings_(
         self, child_result: OperationResult
     ) -> Iterator[Bindings]:
@@ -265,6 +279,9 @@ class Sum(EntityAggregator[numbers.Number]):
         ):
             yield {self._id_: aggregation_result}
 
+    def create_accumulator(self) -> Optional[Accumulator]:
+        return SumAccumulator(distinct=self._distinct_)
+
     def aggregation_function(
         self, result: Collection[IntOrFloat]
     ) -> Iterator[IntOrFloat]:
@@ -277,6 +294,9 @@ class Average(Sum):
     Calculate the average of the child results.
     """
 
+    def create_accumulator(self) -> Optional[Accumulator]:
+        return AverageAccumulator(distinct=self._distinct_)
+
     def aggregation_function(
         self, result: Collection[IntOrFloat]
     ) -> Iterator[IntOrFloat]:
@@ -307,6 +327,9 @@ class Max(Extreme[T]):
      the value to be compared.
     """
 
+    def create_accumulator(self) -> Optional[Accumulator]:
+        return MaxAccumulator(distinct=self._distinct_, key=self._key_function_)
+
     def aggregation_function(self, values: Iterable) -> Iterator[T]:
         yield max(values, key=self._key_function_)
 
@@ -318,6 +341,9 @@ class Min(Extreme[T]):
      the value to be compared.
     """
 
+    def create_accumulator(self) -> Optional[Accumulator]:
+        return MinAccumulator(distinct=self._distinct_, key=self._key_function_)
+
     def aggregation_function(self, values: Iterable) -> Iterator[T]:
         yield min(values, key=self._key_function_)
 
@@ -342,5 +368,191 @@ class Mode(Extreme[T]):
     first mode value found.
     """
 
+    def create_accumulator(self) -> Optional[Accumulator]:
+        return ModeAccumulator(distinct=self._distinct_)
+
     def aggregation_function(self, values: Iterable) -> Iterator[T]:
         yield statistics.mode(values)
+
+
+@dataclass
+class Accumulator(ABC):
+    """
+    Aggregates the values of the child of an aggregator for a single group one value at a time, such that the values
+    of the group do not have to be collected before they are aggregated.
+    """
+
+    distinct: bool = False
+    """
+    Whether to aggregate only the first occurrence of every value.
+    """
+    seen_values: Set[Any] = field(default_factory=set)
+    """
+    The values that have been aggregated, only kept if distinct is True.
+    """
+
+    def add(self, value: Any):
+        """
+        Add a value to the aggregation, unless only distinct values are aggregated and the value has been added before.
+
+        :param value: The value of the child of the aggregator in a result of the group.
+        """
+        if self.distinct:
+            if value in self.seen_values:
+                return
+            self.seen_values.add(value)
+        self.accumulate(value)
+
+    @abstractmethod
+    def accumulate(self, value: Any):
+        """
+        Update the aggregation with a value.
+
+        :param value: The value to aggregate.
+        """
+        ...
+
+    @property
+    @abstractmethod
+    def result(self) -> Any:
+        """
+        :return: The aggregation of all the values that have been added.
+        """
+        ...
+
+
+@dataclass
+class CountAccumulator(Accumulator):
+    """
+    Counts the values, see :class:`Count`.
+    """
+
+    count: int = 0
+    """
+    The number of aggregated values.
+    """
+
+    def accumulate(self, value: Any):
+        self.count += 1
+
+    @property
+    def result(self) -> int:
+        return self.count
+
+
+@dataclass
+class SumAccumulator(CountAccumulator):
+    """
+    Sums the values in the order they are added, see :class:`Sum`.
+
+    The values are added with their `+` operator, so integer sums are exact. Float sums may differ from the builtin
+    `sum`, which compensates the rounding errors of float additions since Python 3.12, by at most about the machine
+    epsilon times the number of values times the largest magnitude of the values.
+    """
+
+    total: IntOrFloat = 0
+    """
+    The sum of the aggregated values.
+    """
+
+    def accumulate(self, value: IntOrFloat):
+        super().accumulate(value)
+        self.total = self.total + value
+
+    @property
+    def result(self) -> IntOrFloat:
+        return self.total
+
+
+@dataclass
+class AverageAccumulator(SumAccumulator):
+    """
+    Averages the values, see :class:`Average`.
+    """
+
+    @property
+    def result(self) -> IntOrFloat:
+        return self.total / self.count
+
+
+@dataclass
+class ExtremeAccumulator(Accumulator, ABC):
+    """
+    Keeps the first of the extreme values, like the builtins `max` and `min`, see :class:`Extreme`.
+    """
+
+    key: Optional[Callable[[Any], Any]] = None
+    """
+    An optional function that extracts the value to be compared.
+    """
+    extreme_value: Any = None
+    """
+    The extreme value among the aggregated values.
+    """
+    extreme_key: Any = None
+    """
+    The compared value of the extreme value.
+    """
+    is_empty: bool = True
+    """
+    Whether no value has been aggregated yet.
+    """
+
+    def accumulate(self, value: Any):
+        key = self.key(value) if self.key else value
+        if self.is_empty or self.is_more_extreme(key, self.extreme_key):
+            self.extreme_value, self.extreme_key = value, key
+            self.is_empty = False
+
+    @abstractmethod
+    def is_more_extreme(self, key: Any, extreme_key: Any) -> bool:
+        """
+        :param key: The compared value of a new value.
+        :param extreme_key: The compared value of the current extreme value.
+        :return: Whether the new value replaces the current extreme value.
+        """
+        ...
+
+    @property
+    def result(self) -> Any:
+        return self.extreme_value
+
+
+@dataclass
+class MaxAccumulator(ExtremeAccumulator):
+    """
+    Keeps the first maximum value, see :class:`Max`.
+    """
+
+    def is_more_extreme(self, key: Any, extreme_key: Any) -> bool:
+        return key > extreme_key
+
+
+@dataclass
+class MinAccumulator(ExtremeAccumulator):
+    """
+    Keeps the first minimum value, see :class:`Min`.
+    """
+
+    def is_more_extreme(self, key: Any, extreme_key: Any) -> bool:
+        return key < extreme_key
+
+
+@dataclass
+class ModeAccumulator(Accumulator):
+    """
+    Counts the occurrences of every distinct value to find the first mode value, like `statistics.mode`, see
+    :class:`Mode`.
+    """
+
+    counter: Counter = field(default_factory=Counter)
+    """
+    The number of occurrences of every aggregated value.
+    """
+
+    def accumulate(self, value: Any):
+        self.counter[value] += 1
+
+    @property
+    def result(self) -> Any:
+        return self.counter.most_common(1)[0][0]
@@ -8,17 +8,21 @@ including equality, ordering, and membership-style checks.
 from __future__ import annotations
 
 import operator
+import uuid
 from copy import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from typing_extensions import (
     Callable,
     Any,
     ClassVar,
     Dict,
+    List,
     Optional,
     Tuple,
     Iterable,
+    Iterator,
+    Set,
     TYPE_CHECKING,
 )
 
@@ -27,12 +31,20 @@ from krrood.entity_query_language.core.base_expressions import (
     SymbolicExpression,
     BinaryExpression,
     Selectable,
+    Bindings,
+    Filter,
 )
+from krrood.entity_query_language.enums import EvaluationContextKey
+from krrood.entity_query_language.evaluation_context import get_evaluation_context
+from krrood.entity_query_language.operators.core_logical_operators import AND
 from krrood.entity_query_language.operators.set_operations import (
     PerformsCartesianProduct,
 )
 from krrood.entity_query_language.utils import is_iterable, make_set
 
+if TYPE_CHECKING:
+    from krrood.entity_query_language.core.variable import Variable
+
 
 @dataclass(eq=False, repr=False)
 class Comparator(BinaryExpression, PerformsCartesianProduct):
@@ -68,13 +80,79 @@ class Comparator(BinaryExpression, PerformsCartesianProduct):
     ) -> Iterable[OperationResult]:
         """
         Compares the left and right symbolic variables using the "operation".
+        Equality comparisons of independent operands are evaluated as a hash join when only their true results are
+        needed, otherwise every combination of the values of the operands is compared.
         """
+        hash_join = self._hash_join_(sources)
+        if hash_join is not None:
+            yield from hash_join.probe(sources)
+            return
 
         yield from (
             self.get_operation_result(result)
             for result in self._evaluate_product_(sources)
         )
 
+    def _hash_join_(self, sources: OperationResult) -> Optional[HashJoin]:
+        """
+        :param sources: The current OperationResult carrying bindings of variables.
+        :return: The hash join of this comparator in the current evaluation, or None if this comparator has to
+         compare every combination of values for the given sources.
+        """
+        evaluation_context = get_evaluation_context()
+        if evaluation_context is None:
+            return None
+        hash_joins = evaluation_context.data.setdefault(
+            EvaluationContextKey.HASH_JOINS_KEY, {}
+        )
+        if self._id_ not in hash_joins:
+            hash_joins[self._id_] = (
+                HashJoin(self, *self._optimize_operands_order_(None))
+                if self._can_be_evaluated_as_hash_join_
+                else None
+            )
+        hash_join = hash_joins[self._id_]
+        if hash_join is None or hash_join.build_operand_depends_on(sources):
+            return None
+        return hash_join
+
+    @property
+    def _can_be_evaluated_as_hash_join_(self) -> bool:
+        """
+        :return: True if this is an equality comparison whose false results are never used and whose operands
+         can be evaluated independently of each other.
+        """
+        if self.operation is not operator.eq or not self._false_results_are_discarded_:
+            return False
+        if any(expression._conclusions_ for expression in self._all_expressions_):
+            return False
+        left_variables = _variables_of_operand(self.left)
+        right_variables = _variables_of_operand(self.right)
+        return (
+            left_variables is not None
+            and right_variables is not None
+            and left_variables.isdisjoint(right_variables)
+        )
+
+    @property
+    def _false_results_are_discarded_(self) -> bool:
+        """
+        :return: True if this comparator is a condition of a filter, either directly or through conjunctions only,
+         such that its false results are filtered out.
+        """
+        expressions = [self]
+        while expressions:
+            expression = expressions.pop()
+            if not expression._parents_:
+                return False
+            for parent in expression._parents_:
+                if isinstance(parent, Filter) and parent.condition is expression:
+                    continue
+                if not isinstance(parent, AND):
+                    return False
+                expressions.append(parent)
+        return True
+
     def get_operation_result(self, child_result: OperationResult) -> OperationResult:
         """
         Evaluate the comparator operation and return the result.
@@ -118,6 +196,157 @@ class Comparator(BinaryExpression, PerformsCartesianProduct):
             return self.left, self.right
 
 
+@dataclass
+class HashJoin:
+    """
+    Evaluates an equality comparator by evaluating one of its operands once, the build operand, and indexing its
+    results by their value in a hash table. The results of the other operand, the probe operand, are then matched by
+    looking up their value, instead of comparing them with every value of the build operand.
+
+    Values that are not hashable, as well as iterables that are compared as sets, are compared with every value of the
+    other operand as a fallback.
+    """
+
+    comparator: Comparator
+    """
+    The equality comparator.
+    """
+
+    probe_operand: SymbolicExpression
+    """
+    The operand whose results are looked up in the hash table.
+    """
+
+    build_operand: SymbolicExpression
+    """
+    The operand whose results are indexed in the hash table.
+    """
+
+    _build_variable_ids: Set[uuid.UUID] = field(init=False, default_factory=set)
+    """
+    The IDs of the variables of the build operand.
+    """
+
+    _build_bindings: Optional[List[Bindings]] = field(init=False, default=None)
+    """
+    The bindings that the build operand added to its sources for each of its results, or None if the build operand
+    has not been evaluated yet.
+    """
+
+    _indices_of_value: Dict[Any, List[int]] = field(init=False, default_factory=dict)
+    """
+    The indices of the results of the build operand by their hashable value.
+    """
+
+    _unhashable_indices: List[int] = field(init=False, default_factory=list)
+    """
+    The indices of the results of the build operand whose value has to be compared with every probed value.
+    """
+
+    def __post_init__(self):
+        self._build_variable_ids = {
+            variable._id_ for variable in _variables_of_operand(self.build_operand)
+        }
+
+    def build_operand_depends_on(self, sources: OperationResult) -> bool:
+        """
+        :param sources: The current OperationResult carrying bindings of variables.
+        :return: True if a variable of the build operand is bound in the sources, such that its results differ
+         from the ones in the hash table.
+        """
+        return any(id_ in sources.bindings for id_ in self._build_variable_ids)
+
+    def build(self, sources: OperationResult):
+        """
+        Evaluate the build operand and index its results by their value.
+
+        :param sources: The current OperationResult carrying bindings of variables.
+        """
+        self._build_bindings = []
+        for result in self.build_operand._evaluate_(sources):
+            value = self.build_operand._process_result_(result)
+            index = len(self._build_bindings)
+            self._build_bindings.append(
+                {
+                    id_: binding
+                    for id_, binding in result.bindings.items()
+                    if id_ not in sources.bindings
+                }
+            )
+            if _is_hash_join_key(value):
+                self._indices_of_value.setdefault(value, []).append(index)
+            else:
+                self._unhashable_indices.append(index)
+
+    def probe(self, sources: OperationResult) -> Iterator[OperationResult]:
+        """
+        Evaluate the probe operand and yield the true results of the comparator for the matching results of the
+        build operand, in the order in which the cartesian product would yield them.
+
+        :param sources: The current OperationResult carrying bindings of variables.
+        :return: The true results of the comparator.
+        """
+        if self._build_bindings is None:
+            self.build(sources)
+        all_indices = range(len(self._build_bindings))
+        for probe_result in self.probe_operand._evaluate_(sources):
+            value = self.probe_operand._process_result_(probe_result)
+            if not _is_hash_join_key(value):
+                indices = all_indices
+            elif self._unhashable_indices:
+                indices = sorted(
+                    self._indices_of_value.get(value, []) + self._unhashable_indices
+                )
+            else:
+                indices = self._indices_of_value.get(value, ())
+            for index in indices:
+                child_result = OperationResult(
+                    probe_result.bindings | self._build_bindings[index],
+                    False,
+                    self.build_operand,
+                    probe_result,
+                )
+                result = self.comparator.get_operation_result(child_result)
+                if result.is_true:
+                    yield result
+
+
+def _is_hash_join_key(value: Any) -> bool:
+    """
+    :param value: The value of an operand of an equality comparator.
+    :return: True if the value can be used as key of a hash table, i.e. it is hashable and not an iterable that is
+     compared as a set.
+    """
+    if is_iterable(value):
+        return False
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _variables_of_operand(operand: SymbolicExpression) -> Optional[Set[Variable]]:
+    """
+    :param operand: An operand of a comparator.
+    :return: The variables that the values of the operand depend on, or None if its evaluation depends on more than
+     the domains of its variables, i.e. it infers new instances or reads externally set values.
+    """
+    from krrood.entity_query_language.core.variable import (
+        CanHaveDomainSource,
+        Variable,
+    )
+
+    variables = set()
+    for expression in [operand, *operand._descendants_]:
+        if not isinstance(expression, CanHaveDomainSource):
+            continue
+        if not isinstance(expression, Variable):
+            return None
+        variables.add(expression)
+    return variables
+
+
 def not_contains(container, item) -> bool:
     """
     The inverted contains operation.
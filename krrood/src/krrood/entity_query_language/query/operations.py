@@ -7,6 +7,7 @@ symbolic expressions and their aggregated results.
 
 from __future__ import annotations
 
+import heapq
 import uuid
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -22,10 +23,12 @@ from typing_extensions import (
     Dict,
     FrozenSet,
     Hashable,
+    List,
 )
 
 from krrood.entity_query_language.core.variable import Literal, ExternallySetVariable
 from krrood.entity_query_language.operators.aggregators import (
+    Accumulator,
     Aggregator,
     Count,
     CountAll,
@@ -153,13 +156,30 @@ class OrderedBy(BinaryExpression, DerivedExpression):
         """
         return self.right
 
+    @property
+    def limit(self) -> Optional[int]:
+        """
+        The maximum number of ordered results that are consumed, which is the limit of the result quantifier that
+        this expression is the child of, if any.
+        """
+        if self._parent_ is None:
+            return None
+        return self._parent_._limit_
+
     def _evaluate__(self, sources: OperationResult) -> Iterator[OperationResult]:
-        results = list(self.left._evaluate_(sources))
-        yield from sorted(
-            results,
-            key=self.apply_key,
-            reverse=self.descending,
-        )
+        """
+        Order the results of the data source. If only a limited number of them is consumed, only that many of the
+        smallest (or largest) results are kept in a bounded heap while streaming over the data source, which gives the
+        same results as sorting all of them and taking the first ones.
+        """
+        results = self.left._evaluate_(sources)
+        limit = self.limit
+        if limit is None:
+            yield from sorted(results, key=self.apply_key, reverse=self.descending)
+        elif self.descending:
+            yield from heapq.nlargest(limit, results, key=self.apply_key)
+        else:
+            yield from heapq.nsmallest(limit, results, key=self.apply_key)
 
     def apply_key(self, result: OperationResult) -> Any:
         """
@@ -238,6 +258,8 @@ class GroupedBy(MultiArityExpressionThatPerformsACartesianProduct):
         Create a dictionary of groups and a dictionary of group keys to their corresponding counts starting from the
         initial bindings, then applying the constraints in the where expression then grouping by the variables in the
         grouped_by clause.
+        The aggregators that have accumulators are updated with every result in a single pass, such that only the
+        values of the variables that are needed after grouping are collected per group.
 
         :param sources: The initial bindings.
         :return: A tuple containing the dictionary of groups and the dictionary of group keys to their corresponding counts.
@@ -245,6 +267,7 @@ class GroupedBy(MultiArityExpressionThatPerformsACartesianProduct):
 
         groups = defaultdict(lambda: OperationResult({}, False, self))
         group_key_count = defaultdict(lambda: 0)
+        accumulators_of_groups: Dict[GroupKey, List[Accumulator]] = {}
 
         for res in self._evaluate_product_(sources):
 
@@ -255,6 +278,17 @@ class GroupedBy(MultiArityExpressionThatPerformsACartesianProduct):
             res[self._id_] = res.bindings
             group_key_count[group_key] += 1
 
+            accumulators = accumulators_of_groups.get(group_key)
+            if accumulators is None:
+                accumulators = accumulators_of_groups[group_key] = [
+                    aggregator.create_accumulator()
+                    for aggregator in self.accumulated_aggregators
+                ]
+            for aggregator, accumulator in zip(
+                self.accumulated_aggregators, accumulators
+            ):
+                accumulator.add(res[aggregator._child_._id_])
+
             self.update_group_from_bindings(groups[group_key], res.bindings)
 
         if len(groups) == 0:
@@ -262,6 +296,12 @@ class GroupedBy(MultiArityExpressionThatPerformsACartesianProduct):
             for aggregator in self.aggregators:
                 groups[()][aggregator._child_._id_] = []
 
+        for group_key, accumulators in accumulators_of_groups.items():
+            for aggregator, accumulator in zip(
+                self.accumulated_aggregators, accumulators
+            ):
+                groups[group_key][aggregator._id_] = accumulator.result
+
         return groups, group_key_count
 
     def update_group_from_bindings(self, group: OperationResult, results: Bindings):
@@ -271,7 +311,10 @@ class GroupedBy(MultiArityExpressionThatPerformsACartesianProduct):
         :param group: The group to be updated.
         :param results: The results to be added to the group.
         """
-        for id_, val in results.items():
+        for id_ in self.ids_of_collected_variables:
+            if id_ not in results:
+                continue
+            val = results[id_]
             if id_ in self.ids_of_variables_to_group_by:
                 group[id_] = val
             elif self.is_already_grouped(id_):
@@ -316,6 +359,50 @@ class GroupedBy(MultiArityExpressionThatPerformsACartesianProduct):
             if var._child_._id_ in self.ids_of_variables_to_group_by
         ]
 
+    @cached_property
+    def accumulated_aggregators(self) -> Tuple[Aggregator, ...]:
+        """
+        :return: The aggregators that are computed with accumulators while grouping, which are the ones that have
+         accumulators and aggregate the values of a variable that is neither grouped by nor already grouped.
+        """
+        ids_of_evaluated_children = {self._id_} | {
+            child._id_ for child in self._operation_children_
+        }
+        return tuple(
+            aggregator
+            for aggregator in self.aggregators
+            if aggregator.create_accumulator() is not None
+            and aggregator._child_._id_ in ids_of_evaluated_children
+            and aggregator._child_._id_ not in self.ids_of_variables_to_group_by
+            and not self.is_already_grouped(aggregator._child_._id_)
+        )
+
+    @cached_property
+    def ids_of_collected_variables(self) -> FrozenSet[uuid.UUID]:
+        """
+        :return: The binding IDs of the variables whose values are collected per group, which are the variables that
+         are grouped by, selected, or aggregated by aggregators that are not accumulated.
+        """
+        ids_of_accumulated_aggregators = {
+            aggregator._id_ for aggregator in self.accumulated_aggregators
+        }
+        ids_of_accumulated_children = {
+            aggregator._child_._id_ for aggregator in self.accumulated_aggregators
+        }
+        return frozenset(
+            {
+                child._id_
+                for child in self._operation_children_
+                if not isinstance(child, Where)
+                and child._id_ not in ids_of_accumulated_children
+            }
+            | {
+                aggregator._child_._id_
+                for aggregator in self.aggregators
+                if aggregator._id_ not in ids_of_accumulated_aggregators
+            }
+        )
+
     @cached_property
     def ids_of_variables_to_group_by(self) -> Tuple[uuid.UUID, ...]:
         """
@@ -62,7 +62,7 @@ from krrood.entity_query_language.core.variable import (
     Variable,
     ExternallySetVariable,
 )
-from krrood.entity_query_language.enums import DomainSource
+from krrood.entity_query_language.enums import DomainSource, EvaluationMode
 from krrood.entity_query_language.exceptions import (
     UnsupportedNegation,
     TryingToModifyAnAlreadyBuiltQuery,
@@ -277,6 +277,19 @@ class Query(
             self._expression_._limit_ = self._limit_
         return self
 
+    def evaluation_mode(self, mode: EvaluationMode) -> Self:
+        """
+        Set the mode in which the query is evaluated. Use :attr:`EvaluationMode.Fast` to skip the evaluation
+        observers for bulk queries, at the cost of not being able to explain the instances they infer.
+
+        :param mode: The evaluation mode.
+        :return: This query.
+        """
+        self._evaluation_mode_ = mode
+        if self._built_:
+            self._expression_._evaluation_mode_ = mode
+        return self
+
     def _quantify_(
         self,
         quantifier_type: Type[ResultQuantifier] = An,
@@ -391,6 +404,7 @@ class Query(
         self._quantifier_builder_.child = og_child
         self._expression_ = self._quantifier_builder_.expression
         self._expression_._limit_ = self._limit_
+        self._expression_._evaluation_mode_ = self._evaluation_mode_
         return self
 
     def _evaluate__(
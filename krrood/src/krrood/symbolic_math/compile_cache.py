@@ -0,0 +1,212 @@
+"""
+Persistent, content-addressed cache for jit compiled CasADi functions.
+
+Functions are translated to C with CasADi's code generator and built into shared objects with the local C compiler.
+The shared objects are stored in a local directory under a key derived from the serialized symbolic graph of their
+outputs, the layout of their input parameters, their sparsity and the build configuration.
+Identical expressions therefore map to the same file, across processes and restarts, such that the expensive build
+only happens once.
+Functions that are evaluated by the CasADi virtual machine are not cached, since creating them is already cheaper
+than serializing their graph for the key and loading them from disk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import subprocess
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import casadi as ca
+from typing_extensions import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIRECTORY: Path = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "krrood"
+    / "compiled_functions"
+)
+
+
+@dataclass
+class CompiledFunctionCache:
+    """
+    A size-bounded on-disk cache of shared objects built from the generated C code of `ca.Function` objects.
+
+    The least recently used entries are evicted when the total size of the cache exceeds `max_size_in_bytes`.
+    Writes are atomic, so multiple processes can share one cache directory.
+    """
+
+    directory: Path = field(default=DEFAULT_CACHE_DIRECTORY)
+    """
+    Directory in which the serialized functions are stored.
+    """
+    max_size_in_bytes: int = 1024**3
+    """
+    Upper bound for the total size of all files in the cache directory.
+    """
+    shared_object_suffix: str = ".so"
+    """
+    Suffix of the shared objects built from generated C code.
+    """
+    compiler: str = field(default_factory=lambda: os.environ.get("CC", "cc"))
+    """
+    The C compiler used to build shared objects.
+    """
+    compiler_flags: Tuple[str, ...] = ("-O1",)
+    """
+    Optimization flags passed to the compiler.
+    Higher levels barely speed up the generated code, but drastically increase the build time of large expressions.
+    """
+    hits: int = field(default=0, init=False)
+    """
+    Number of lookups that were answered from the cache.
+    """
+    misses: int = field(default=0, init=False)
+    """
+    Number of lookups that had to build a new shared object.
+    """
+    evictions: int = field(default=0, init=False)
+    """
+    Number of files removed to stay below `max_size_in_bytes`.
+    """
+
+    def __post_init__(self):
+        self.directory = Path(self.directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def compute_key(
+        casadi_parameters: List[ca.SX], casadi_outputs: List[ca.SX], sparse: bool
+    ) -> str:
+        """
+        Computes the content address of a function.
+
+        :param casadi_parameters: The input blocks of the function.
+        :param casadi_outputs: The outputs of the function.
+        :param sparse: Whether the function returns sparse results.
+        :return: A hex digest that is identical for identical graphs, parameter layouts and sparsity.
+        """
+        digest = hashlib.sha256()
+        digest.update(ca.__version__.encode())
+        digest.update(b"sparse" if sparse else b"dense")
+        for casadi_sx in casadi_parameters + casadi_outputs:
+            digest.update(str(casadi_sx.shape).encode())
+            digest.update(casadi_sx.sparsity().serialize().encode())
+            digest.update(casadi_sx.serialize().encode())
+        return digest.hexdigest()
+
+    def shared_object_path_of(self, key: str) -> Path:
+        # the build configuration is part of the address, such that changing it invalidates old builds
+        digest = hashlib.sha256(key.encode())
+        digest.update(" ".join((self.compiler,) + self.compiler_flags).encode())
+        return self.directory / f"{digest.hexdigest()}{self.shared_object_suffix}"
+
+    def get_or_build_shared_object(
+        self,
+        casadi_parameters: List[ca.SX],
+        casadi_outputs: List[ca.SX],
+        sparse: bool,
+    ) -> ca.Function:
+        """
+        Looks up a shared object built from the generated C code of a function and builds it on a miss.
+        If no working C compiler is available, a warning is logged and the function is evaluated by
+        the CasADi virtual machine instead.
+
+        :param casadi_parameters: The input blocks of the function.
+        :param casadi_outputs: The outputs of the function.
+        :param sparse: Whether the function returns sparse results.
+        :return: A function computing `casadi_outputs` from `casadi_parameters`,
+            backed by the shared object, if it could be built.
+        """
+        path = self.shared_object_path_of(
+            self.compute_key(casadi_parameters, casadi_outputs, sparse)
+        )
+        if path.exists():
+            try:
+                function = ca.external("f", str(path))
+            except RuntimeError:
+                # corrupted entries are rebuilt
+                pass
+            else:
+                os.utime(path)
+                self.hits += 1
+                return function
+        self.misses += 1
+        function = ca.Function("f", casadi_parameters, casadi_outputs)
+        try:
+            self._build_shared_object(function, path)
+        except (OSError, subprocess.CalledProcessError) as error:
+            logger.warning(
+                f"Could not build shared object, falling back to the casadi virtual machine: {error}"
+            )
+            return function
+        # load the shared object before evicting, which may remove it if it does not fit into the cache
+        function = ca.external("f", str(path))
+        self.evict()
+        return function
+
+    def _build_shared_object(self, function: ca.Function, path: Path) -> None:
+        """
+        Generates C code for `function` and compiles it into a shared object at `path`.
+        The shared object is first built in a temporary directory and then moved atomically into place.
+        """
+        with tempfile.TemporaryDirectory(dir=self.directory) as build_directory:
+            code_generator = ca.CodeGenerator("f.c")
+            code_generator.add(function)
+            code_generator.generate(f"{build_directory}{os.sep}")
+            temporary_path = Path(build_directory) / f"f{self.shared_object_suffix}"
+            subprocess.run(
+                [
+                    self.compiler,
+                    *self.compiler_flags,
+                    "-shared",
+                    "-fPIC",
+                    str(Path(build_directory) / "f.c"),
+                    "-o",
+                    str(temporary_path),
+                ],
+                check=True,
+                capture_output=True,
+            )
+            os.replace(temporary_path, path)
+
+    @property
+    def size_in_bytes(self) -> int:
+        return sum(path.stat().st_size for path in self._entries())
+
+    def _entries(self) -> List[Path]:
+        return list(self.directory.glob(f"*{self.shared_object_suffix}"))
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used entries until the cache fits into `max_size_in_bytes`.
+        """
+        entries = []
+        for path in self._entries():
+            try:
+                entries.append((path.stat(), path))
+            except FileNotFoundError:
+                # removed concurrently by another process
+                continue
+        total_size = sum(stat.st_size for stat, _ in entries)
+        for stat, path in sorted(entries, key=lambda entry: entry[0].st_mtime):
+            if total_size <= self.max_size_in_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= stat.st_size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Removes all entries of the cache and resets the counters.
+        """
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
@@ -51,6 +51,7 @@ from typing_extensions import (
     Any,
 )
 
+from krrood.symbolic_math.compile_cache import CompiledFunctionCache
 from krrood.symbolic_math.exceptions import (
     HasFreeVariablesError,
     DuplicateVariablesError,
@@ -139,8 +140,8 @@ class _DenseLayout(_Layout):
         self.compiled.expression.casadi_sx = ca.densify(
             self.compiled.expression.casadi_sx
         )
-        self.compiled._compiled_casadi_function = ca.Function(
-            "f", casadi_parameters, [self.compiled.expression.casadi_sx]
+        self.compiled._compiled_casadi_function = self.compiled._create_casadi_function(
+            casadi_parameters
         )
         self.compiled._function_buffer, self.compiled._function_evaluator = (
             self.compiled._compiled_casadi_function.buffer()
@@ -164,8 +165,8 @@ class _SparseLayout(_Layout):
         self.compiled.expression.casadi_sx = ca.sparsify(
             self.compiled.expression.casadi_sx
         )
-        self.compiled._compiled_casadi_function = ca.Function(
-            "f", casadi_parameters, [self.compiled.expression.casadi_sx]
+        self.compiled._compiled_casadi_function = self.compiled._create_casadi_function(
+            casadi_parameters
         )
         self.compiled._function_buffer, self.compiled._function_evaluator = (
             self.compiled._compiled_casadi_function.buffer()
@@ -211,6 +212,14 @@ class CompiledFunction:
     """
     Whether to return a sparse matrix or a dense numpy matrix
     """
+    jit_compile: bool = False
+    """
+    If True, C code is generated for the expression and built into a shared object with the local C compiler,
+    instead of evaluating it with the CasADi virtual machine.
+    This increases the compile time, but speeds up the evaluation of large expressions.
+    Shared objects are cached in `compile_cache`, such that the build only happens once per expression,
+    even across restarts of the process.
+    """
     _layout: _Layout = field(init=False)
     """
     The layout strategy to use for the compiled function.
@@ -234,6 +243,21 @@ class CompiledFunction:
     Used to memorize if the result must be recomputed every time.
     """
 
+    _batch_evaluators: Dict[
+        Tuple[int, int], Tuple[ca.FunctionBuffer, partial, np.ndarray]
+    ] = field(init=False, default_factory=dict)
+    """
+    Buffers, evaluators and output arrays of mapped functions used by `evaluate_batch`,
+    indexed by the number of states and threads.
+    """
+
+    compile_cache: ClassVar[Optional[CompiledFunctionCache]] = None
+    """
+    The persistent cache of the shared objects of jit compiled functions, shared by all compiled functions of the
+    process.
+    It is created in the default cache directory on the first jit compilation, unless it has been set before.
+    """
+
     def __post_init__(self):
         # Normalize variable_parameters to VariableParameters
         if self.variable_parameters is None:
@@ -299,6 +323,20 @@ class CompiledFunction:
         self._layout = _SparseLayout(self) if self.sparse else _DenseLayout(self)
         self._layout.compile(self.variable_parameters.to_casadi_parameters())
 
+    def _create_casadi_function(self, casadi_parameters: List[ca.SX]) -> ca.Function:
+        """
+        Creates the casadi function for the expression.
+        If it is jit compiled, its shared object is loaded from or built into `compile_cache`.
+        """
+        casadi_outputs = [self.expression.casadi_sx]
+        if not self.jit_compile:
+            return ca.Function("f", casadi_parameters, casadi_outputs)
+        if CompiledFunction.compile_cache is None:
+            CompiledFunction.compile_cache = CompiledFunctionCache()
+        return CompiledFunction.compile_cache.get_or_build_shared_object(
+            casadi_parameters, casadi_outputs, self.sparse
+        )
+
     def _setup_constant_result(self) -> None:
         """
         Setup result for constant expressions (no parameters).
@@ -325,6 +363,81 @@ class CompiledFunction:
             self._function_evaluator()
         return self._out
 
+    def evaluate_batch(
+        self, states: np.ndarray, number_of_threads: int = 1
+    ) -> np.ndarray:
+        """
+        Evaluates the compiled function for many parameter vectors in one call, using a casadi map.
+
+        :param states: An array of shape (N, number of variables), where each row contains the values of
+            all variable groups of self.variable_parameters, concatenated in their order.
+        :param number_of_threads: If greater than 1, the N evaluations are distributed across this many threads.
+        :return: An array of shape (N, ...), where each entry has the shape of a single evaluation result.
+            For sparse functions, each entry contains the nonzero values in the order of `self._out.data`.
+            .. warning:: The array is preallocated and overwritten by the next call with the same N and number of threads.
+        """
+        states = np.asarray(states, dtype=float)
+        number_of_states = states.shape[0]
+        number_of_variables = len(self.variable_parameters.flatten())
+        if states.ndim != 2 or states.shape[1] != number_of_variables:
+            raise WrongDimensionsError(
+                expected_dimensions=(number_of_states, number_of_variables),
+                actual_dimensions=states.shape,
+            )
+        if self._is_constant:
+            result = self._out.data if self.sparse else self._out
+            return np.repeat(result[np.newaxis], number_of_states, axis=0)
+
+        function_buffer, function_evaluator, out = self._get_batch_evaluator(
+            number_of_states, number_of_threads
+        )
+        # the mapped function expects each group as a column-major (group size, N) block,
+        # which has the memory layout of a C-contiguous (N, group size) array.
+        # the blocks are kept alive in this list until the evaluation is done
+        blocks = []
+        start = 0
+        for arg_idx, group in enumerate(self.variable_parameters.groups):
+            end = start + len(group)
+            blocks.append(np.ascontiguousarray(states[:, start:end]))
+            function_buffer.set_arg(arg_idx, memoryview(blocks[-1]))
+            start = end
+        function_evaluator()
+        return out
+
+    def _get_batch_evaluator(
+        self, number_of_states: int, number_of_threads: int
+    ) -> Tuple[ca.FunctionBuffer, partial, np.ndarray]:
+        """
+        Creates or looks up a mapped casadi function that evaluates `number_of_states` states at once,
+        together with its buffer and a preallocated output array.
+        """
+        key = (number_of_states, number_of_threads)
+        if key in self._batch_evaluators:
+            return self._batch_evaluators[key]
+        if number_of_threads > 1:
+            mapped_function = self._compiled_casadi_function.map(
+                number_of_states, "thread", number_of_threads
+            )
+        else:
+            mapped_function = self._compiled_casadi_function.map(number_of_states)
+        function_buffer, function_evaluator = mapped_function.buffer()
+        if self.sparse:
+            out_memory = out = np.zeros(
+                (number_of_states, self.expression.casadi_sx.nnz())
+            )
+        else:
+            # the mapped result is (rows, N * columns) in column-major order,
+            # so each state occupies a contiguous block of column-major memory
+            rows, columns = self.expression.shape
+            out_memory = np.zeros((number_of_states, columns, rows))
+            if self._out.ndim == 1:
+                out = out_memory.reshape(number_of_states, rows)
+            else:
+                out = out_memory.transpose(0, 2, 1)
+        function_buffer.set_res(0, memoryview(out_memory))
+        self._batch_evaluators[key] = function_buffer, function_evaluator, out
+        return self._batch_evaluators[key]
+
     def __call__(self, *args: np.ndarray) -> np.ndarray | sp.csc_matrix:
         """
         Efficiently evaluate the compiled function with positional arguments by directly writing the memory of the
@@ -394,6 +507,11 @@ class CompiledFunctionWithViews:
     If additional views are required that don't correspond to the expressions directly.
     """
 
+    jit_compile: bool = False
+    """
+    Whether to build the compiled function into a shared object, see `CompiledFunction.jit_compile`.
+    """
+
     compiled_function: CompiledFunction = field(init=False)
     """
     Reference to the compiled function.
@@ -407,7 +525,7 @@ class CompiledFunctionWithViews:
     def __post_init__(self):
         combined_expression = Matrix.vstack(self.expressions)
         self.compiled_function = combined_expression.compile(
-            parameters=self.parameters, sparse=False
+            parameters=self.parameters, sparse=False, jit_compile=self.jit_compile
         )
         slices = []
         start = 0
@@ -597,6 +715,7 @@ class SymbolicMathType(ABC):
         self,
         parameters: Optional[VariableParameters] = None,
         sparse: bool = False,
+        jit_compile: bool = False,
     ) -> CompiledFunction:
         """
         Compiles the function into a representation that can be executed efficiently. This method
@@ -607,9 +726,11 @@ class SymbolicMathType(ABC):
             the configuration for the compiled function. If set to None, no parameters are applied.
         :param sparse: A boolean that determines whether the compiled function should use a
             sparse representation. Defaults to False.
+        :param jit_compile: Whether to generate C code for the function and build it into a shared object
+            instead of evaluating it with the CasADi virtual machine. Defaults to False.
         :return: The compiled function as an instance of CompiledFunction.
         """
-        return CompiledFunction(self, parameters, sparse)
+        return CompiledFunction(self, parameters, sparse, jit_compile)
 
     def evaluate(self) -> np.ndarray:
         """
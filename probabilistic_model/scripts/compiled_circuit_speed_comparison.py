@@ -0,0 +1,106 @@
+import time
+
+import numpy as np
+import pandas as pd
+from random_events.interval import closed
+from random_events.product_algebra import SimpleEvent
+from random_events.variable import Continuous
+
+from probabilistic_model.learning.jpt.jpt import JointProbabilityTree
+from probabilistic_model.learning.jpt.variables import infer_variables_from_dataframe
+from probabilistic_model.learning.nyga_induction import NygaInduction
+from probabilistic_model.probabilistic_circuit.rx.probabilistic_circuit import (
+    ProbabilisticCircuit,
+)
+
+np.random.seed(69)
+
+number_of_samples = 20_000
+number_of_variables = 5
+batch_sizes = [100, 5_000]
+number_of_iterations = 10
+
+
+def per_unit_log_likelihood(model: ProbabilisticCircuit, events: np.ndarray):
+    """
+    Reference implementation that evaluates the circuit unit by unit.
+    """
+    variable_to_index_map = model.variable_to_index_map
+    for layer in reversed(model.layers):
+        for unit in layer:
+            if unit.is_leaf:
+                unit.log_likelihood(
+                    events[:, [variable_to_index_map[v] for v in unit.variables]]
+                )
+            else:
+                unit.log_forward()
+    return model.root.result_of_current_query
+
+
+def per_unit_probability(model: ProbabilisticCircuit, event: SimpleEvent):
+    """
+    Reference implementation that evaluates the circuit unit by unit.
+    """
+    for layer in reversed(model.layers):
+        for unit in layer:
+            if unit.is_leaf:
+                unit.probability_of_simple_event(event)
+            else:
+                unit.forward()
+    return model.root.result_of_current_query
+
+
+def time_query(query, *args) -> float:
+    """
+    :return: The mean latency of the query in milliseconds.
+    """
+    query(*args)
+    start = time.perf_counter()
+    for _ in range(number_of_iterations):
+        query(*args)
+    return (time.perf_counter() - start) / number_of_iterations * 1000
+
+
+def nyga_model() -> ProbabilisticCircuit:
+    data = np.concatenate(
+        [np.random.normal(mean, 0.5, (number_of_samples // 4, 1)) for mean in range(4)]
+    )
+    return NygaInduction(Continuous("x"), min_samples_per_quantile=10).fit(data)
+
+
+def jpt_model() -> ProbabilisticCircuit:
+    covariance = np.random.uniform(0, 1, (number_of_variables, number_of_variables))
+    data = np.random.multivariate_normal(
+        np.zeros(number_of_variables), covariance @ covariance.T, number_of_samples
+    )
+    df = pd.DataFrame(data, columns=[f"x_{i}" for i in range(number_of_variables)])
+    variables = infer_variables_from_dataframe(df, min_samples_per_quantile=10)
+    return JointProbabilityTree(variables, min_samples_per_leaf=0.005).fit(df)
+
+
+print(
+    f"{'model':>6} {'units':>6} {'query':>12} {'events':>7} {'per unit (ms)':>14}"
+    f" {'compiled (ms)':>14}"
+)
+for name, model in [("nyga", nyga_model()), ("jpt", jpt_model())]:
+    event = SimpleEvent.from_data(
+        {variable: closed(-0.5, 1.0) for variable in model.variables}
+    )
+    assert np.isclose(
+        per_unit_probability(model, event), model.probability_of_simple_event(event)
+    )
+    print(
+        f"{name:>6} {len(model.graph):>6} {'probability':>12} {1:>7}"
+        f" {time_query(per_unit_probability, model, event):>14.2f}"
+        f" {time_query(model.probability_of_simple_event, event):>14.2f}"
+    )
+    for batch_size in batch_sizes:
+        events = model.sample(batch_size)
+        assert np.allclose(
+            per_unit_log_likelihood(model, events), model.log_likelihood(events)
+        )
+        print(
+            f"{name:>6} {len(model.graph):>6} {'likelihood':>12} {batch_size:>7}"
+            f" {time_query(per_unit_log_likelihood, model, events):>14.2f}"
+            f" {time_query(model.log_likelihood, events):>14.2f}"
+        )
@@ -0,0 +1,71 @@
+import time
+from unittest import mock
+
+import numpy as np
+from random_events.variable import Continuous
+
+from probabilistic_model.learning.nyga_induction import InductionStep, NygaInduction
+
+np.random.seed(69)
+
+sample_sizes = [1_000, 10_000, 100_000, 200_000]
+min_samples_per_quantile = 20
+
+
+def per_index_best_split(self: InductionStep):
+    """
+    Reference implementation of the split search that evaluates every split index separately.
+    """
+    maximum_log_likelihood = -float("inf")
+    best_split_index = None
+    right_connecting_point = self.right_connecting_point()
+    left_connecting_point = self.left_connecting_point()
+    for split_index in range(
+        self.begin_index + self.min_samples_per_quantile,
+        self.end_index - self.min_samples_per_quantile + 1,
+    ):
+        log_likelihood = self.log_likelihood_of_split_side(
+            split_index, left_connecting_point
+        ) + self.log_likelihood_of_split_side(split_index, right_connecting_point)
+        if log_likelihood > maximum_log_likelihood:
+            maximum_log_likelihood = log_likelihood
+            best_split_index = split_index
+    return maximum_log_likelihood, best_split_index
+
+
+def fit(data: np.ndarray):
+    """
+    :return: The fitted circuit and the time the fit took in seconds.
+    """
+    start = time.perf_counter()
+    model = NygaInduction(
+        Continuous("x"), min_samples_per_quantile=min_samples_per_quantile
+    ).fit(data)
+    return model, time.perf_counter() - start
+
+
+print(f"{'samples':>8} {'per index (s)':>14} {'vectorized (s)':>15} {'leaves':>7}")
+for number_of_samples in sample_sizes:
+    # a mixture of grasp-like clusters, rounded like logged sensor data
+    data = np.round(
+        np.concatenate(
+            [
+                np.random.normal(mean, 0.1, number_of_samples // 4)
+                for mean in [-1.0, 0.0, 0.5, 2.0]
+            ]
+        ),
+        5,
+    )
+
+    with mock.patch.object(InductionStep, "compute_best_split", per_index_best_split):
+        reference_model, reference_time = fit(data)
+    model, vectorized_time = fit(data)
+
+    points = np.linspace(data.min(), data.max(), 1000).reshape(-1, 1)
+    assert np.array_equal(
+        reference_model.log_likelihood(points), model.log_likelihood(points)
+    )
+    print(
+        f"{number_of_samples:>8} {reference_time:>14.2f} {vectorized_time:>15.2f}"
+        f" {len(model.leaves):>7}"
+    )
@@ -0,0 +1,116 @@
+import time
+
+import numpy as np
+import pandas as pd
+from random_events.variable import Continuous
+
+from probabilistic_model.learning.jpt.jpt import JointProbabilityTree
+from probabilistic_model.learning.jpt.variables import infer_variables_from_dataframe
+from probabilistic_model.learning.nyga_induction import NygaInduction
+from probabilistic_model.probabilistic_circuit.rx.probabilistic_circuit import (
+    ProbabilisticCircuit,
+    SumUnit,
+)
+
+np.random.seed(69)
+
+number_of_samples = 20_000
+number_of_variables = 5
+amounts = [10_000, 1_000_000]
+chunk_size = 100_000
+
+
+def per_unit_sample(model: ProbabilisticCircuit, amount: int) -> np.ndarray:
+    """
+    Reference implementation that routes the sample rows through the circuit unit by unit.
+    """
+    variable_to_index_map = model.variable_to_index_map
+    for unit in model.graph.nodes():
+        unit.result_of_current_query = []
+    model.root.result_of_current_query.append(np.arange(amount))
+    samples = np.full((amount, len(variable_to_index_map)), np.nan)
+
+    for layer in model.layers:
+        for unit in layer:
+            if not unit.result_of_current_query:
+                continue
+            rows = np.concatenate(unit.result_of_current_query)
+            if unit.is_leaf:
+                columns = [variable_to_index_map[v] for v in unit.variables]
+                samples[rows[:, None], columns] = unit.distribution.sample(len(rows))
+            elif isinstance(unit, SumUnit):
+                log_weighted_subcircuits = unit.log_weighted_subcircuits
+                weights = np.exp(
+                    [log_weight for log_weight, _ in log_weighted_subcircuits]
+                )
+                counts = np.random.multinomial(len(rows), pvals=weights)
+                np.random.shuffle(rows)
+                offset = 0
+                for count, (_, subcircuit) in zip(counts, log_weighted_subcircuits):
+                    if count:
+                        subcircuit.result_of_current_query.append(
+                            rows[offset : offset + count]
+                        )
+                        offset += count
+            else:
+                for subcircuit in unit.subcircuits:
+                    subcircuit.result_of_current_query.append(rows)
+    return samples
+
+
+def chunked_sample(model: ProbabilisticCircuit, amount: int) -> float:
+    """
+    Draw samples in chunks and reduce every chunk right away, as a consumer of a sample stream would.
+
+    :return: The mean of the first variable.
+    """
+    return (
+        sum(chunk[:, 0].sum() for chunk in model.sample_in_chunks(amount, chunk_size))
+        / amount
+    )
+
+
+def time_sampler(sampler, *args) -> float:
+    """
+    :return: The latency of the sampler in seconds.
+    """
+    start = time.perf_counter()
+    sampler(*args)
+    return time.perf_counter() - start
+
+
+def nyga_model() -> ProbabilisticCircuit:
+    data = np.concatenate(
+        [np.random.normal(mean, 0.5, (number_of_samples // 4, 1)) for mean in range(4)]
+    )
+    return NygaInduction(Continuous("x"), min_samples_per_quantile=10).fit(data)
+
+
+def jpt_model() -> ProbabilisticCircuit:
+    covariance = np.random.uniform(0, 1, (number_of_variables, number_of_variables))
+    data = np.random.multivariate_normal(
+        np.zeros(number_of_variables), covariance @ covariance.T, number_of_samples
+    )
+    df = pd.DataFrame(data, columns=[f"x_{i}" for i in range(number_of_variables)])
+    variables = infer_variables_from_dataframe(df, min_samples_per_quantile=10)
+    return JointProbabilityTree(variables, min_samples_per_leaf=0.005).fit(df)
+
+
+print(
+    f"{'model':>6} {'units':>6} {'amount':>9} {'per unit (s)':>13}"
+    f" {'vectorized (s)':>15} {'chunked (s)':>12}"
+)
+for name, model in [("nyga", nyga_model()), ("jpt", jpt_model())]:
+    for amount in amounts:
+        reference_samples = per_unit_sample(model, amount)
+        samples = model.sample(amount)
+        assert not np.isnan(samples).any()
+        assert np.allclose(
+            reference_samples.mean(axis=0), samples.mean(axis=0), atol=0.05
+        )
+        print(
+            f"{name:>6} {len(model.graph):>6} {amount:>9}"
+            f" {time_sampler(per_unit_sample, model, amount):>13.3f}"
+            f" {time_sampler(model.sample, amount):>15.3f}"
+            f" {time_sampler(chunked_sample, model, amount):>12.3f}"
+        )
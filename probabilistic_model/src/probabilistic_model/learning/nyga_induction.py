@@ -205,41 +205,70 @@ class InductionStep:
         """
         Compute the best split of the data.
 
-        The best split of the data is computed by evaluating the log likelihood of every possible split and memorizing
-        the best one.
+        The best split of the data is computed by evaluating the log likelihood of every possible split at once and
+        choosing the first one with the maximum log likelihood.
 
         :return: The maximum log likelihood and the best split index.
         """
+        split_indices = np.arange(
+            self.begin_index + self.min_samples_per_quantile,
+            self.end_index - self.min_samples_per_quantile + 1,
+        )
+        log_likelihoods = self.log_likelihood_of_splits(split_indices)
 
-        # initialize the maximum likelihood and the best split index
-        maximum_log_likelihood = -float("inf")
-        best_split_index = None
+        # only splits with a finite likelihood can be chosen, like in a search that memorizes strict improvements
+        # over -inf
+        log_likelihoods[~(log_likelihoods > -float("inf"))] = -float("inf")
+        if len(log_likelihoods) == 0 or not log_likelihoods.max() > -float("inf"):
+            return -float("inf"), None
 
-        # calculate the connecting points
-        right_connecting_point = self.right_connecting_point()
-        left_connecting_point = self.left_connecting_point()
+        best = np.argmax(log_likelihoods)
+        return float(log_likelihoods[best]), int(split_indices[best])
 
-        # for every possible splitting index
-        for split_index in range(
-            self.begin_index + self.min_samples_per_quantile,
-            self.end_index - self.min_samples_per_quantile + 1,
-        ):
+    def log_likelihood_of_splits(self, split_indices: npt.NDArray) -> npt.NDArray:
+        """
+        Calculate the log likelihood of splitting the data at each of the given indices.
+
+        This evaluates the same terms as `log_likelihood_of_split_side` for the left and the right side of each split,
+        using the cumulative sums of the weights and log weights instead of iterating over the splits.
 
-            # calculate log likelihoods
-            log_likelihood_left = self.log_likelihood_of_split_side(
-                split_index, left_connecting_point
+        :param split_indices: The indices of the splits.
+        :return: The log likelihood of each split.
+        """
+        # calculate the split values and the log densities of both sides
+        split_values = (self.data[split_indices - 1] + self.data[split_indices]) / 2
+        log_density_left = np.log(np.abs(split_values - self.left_connecting_point()))
+        log_density_right = np.log(np.abs(split_values - self.right_connecting_point()))
+
+        # calculate the log of the weight of both partitions in the sum node
+        cumulative_weights_at_split = self.cumulative_weights[split_indices]
+        with np.errstate(divide="ignore"):
+            log_weight_sum_left = np.log(
+                cumulative_weights_at_split - self.cumulative_weights[self.begin_index]
             )
-            log_likelihood_right = self.log_likelihood_of_split_side(
-                split_index, right_connecting_point
+            log_weight_sum_right = np.log(
+                self.cumulative_weights[self.end_index] - cumulative_weights_at_split
             )
-            log_likelihood = log_likelihood_left + log_likelihood_right
+        log_weight_sum = np.log(self.total_weights)
 
-            # update the maximum likelihood and the best split index
-            if log_likelihood > maximum_log_likelihood:
-                maximum_log_likelihood = log_likelihood
-                best_split_index = split_index
+        # calculate the sum of the logarithmic log_weights of the samples in both partitions
+        cumulative_log_weights_at_split = self.cumulative_log_weights[split_indices]
+        sum_of_log_weights_left = (
+            cumulative_log_weights_at_split
+            - self.cumulative_log_weights[self.begin_index]
+        )
+        sum_of_log_weights_right = (
+            self.cumulative_log_weights[self.end_index]
+            - cumulative_log_weights_at_split
+        )
 
-        return maximum_log_likelihood, best_split_index
+        log_likelihood_left = (split_indices - self.begin_index) * (
+            log_weight_sum_left - log_weight_sum - log_density_left
+        ) + sum_of_log_weights_left
+        log_likelihood_right = (self.end_index - split_indices) * (
+            log_weight_sum_right - log_weight_sum - log_density_right
+        ) + sum_of_log_weights_right
+        return log_likelihood_left + log_likelihood_right
 
     def log_likelihood_without_split(self) -> float:
         """
@@ -14,6 +14,7 @@ import numpy as np
 import rustworkx as rx
 import rustworkx.visualization
 import tqdm
+from scipy.stats import norm
 from sortedcontainers import SortedSet
 from typing_extensions import (
     List,
@@ -25,6 +26,8 @@ from typing_extensions import (
     Iterable,
     Callable,
     Union,
+    Type,
+    Iterator,
 )
 
 from probabilistic_model.distributions.distributions import (
@@ -34,7 +37,9 @@ from probabilistic_model.distributions.distributions import (
     DiscreteDistribution,
     ContinuousDistribution,
 )
+from probabilistic_model.distributions.gaussian import GaussianDistribution
 from probabilistic_model.distributions.helper import make_dirac
+from probabilistic_model.distributions.uniform import UniformDistribution
 from probabilistic_model.exceptions import IntractableError
 from probabilistic_model.probabilistic_model import (
     ProbabilisticModel,
@@ -42,8 +47,8 @@ from probabilistic_model.probabilistic_model import (
     CenterType,
     MomentType,
 )
-from probabilistic_model.utils import MissingDict, logsumexp
-from random_events.interval import SimpleInterval, Interval
+from probabilistic_model.utils import MissingDict, logsumexp, interval_as_array
+from random_events.interval import SimpleInterval, Interval, Bound
 from random_events.product_algebra import VariableMap, SimpleEvent, Event
 from random_events.set import Set
 from krrood.adapters.json_serializer import SubclassJSONSerializer, to_json, from_json
@@ -235,9 +240,14 @@ class Unit(SubclassJSONSerializer, ABC):
         """
         Draw samples from the circuit.
 
-        For sampling, a node gets requested a number of samples from all his parents.
-        The parents write into the `result_of_current_query` attribute a tuple describing the beginning index of the
-        sampling and how many samples are requested.
+        For sampling, every unit accumulates in ``result_of_current_query`` the indices of the sample rows that
+        its parents routed to it, as a list of index arrays.
+        Inner units route their rows to their subcircuits and leaves write the samples of their rows.
+
+        .. note::
+
+            :meth:`ProbabilisticCircuit.sample` does not call this, it routes all rows through the compiled
+            circuit at once.
         """
         raise NotImplementedError
 
@@ -324,10 +334,8 @@ class LeafUnit(Unit):
         """
         Sample from the distribution and write the samples into the samples array.
 
-        During sampling each node accumulates, in ``result_of_current_query``, the
-        indices of the rows in ``samples`` that are routed to it (as a list of
-        index arrays, one per parent contribution). This leaf draws all of its
-        samples in a single batched call instead of once per request.
+        This leaf draws the samples of all rows that its parents routed to it in a single call, as its leaf
+        group in the compiled circuit does, see :meth:`LeafGroup.sample`.
 
         :param samples: The array to write the samples into.
         :param variable_to_index_map: The map from variables to column indices in the samples array.
@@ -404,6 +412,23 @@ class InnerUnit(Unit, ABC):
     def _from_json(cls, data: Dict[str, Any], **kwargs) -> Self:
         return cls()
 
+    def route_sample_rows(self):
+        """
+        Route the sample rows accumulated from this unit's parents to its subcircuits, as the compiled circuit
+        of :attr:`probabilistic_circuit` does during sampling.
+        """
+        # a subcircuit legitimately receives no rows when an ancestor mixture
+        # assigns it zero samples; there is then nothing to route onward
+        if not self.result_of_current_query:
+            return
+        compiled = self.probabilistic_circuit.compiled
+        for subcircuit, rows in compiled.route(
+            self,
+            np.concatenate(self.result_of_current_query),
+            compiled.log_weights(self.probabilistic_circuit.graph),
+        ):
+            subcircuit.result_of_current_query.append(rows)
+
     def add_subcircuit(self, subcircuit: Unit, log_weight: float = None):
         """
         Add a subcircuit to the subcircuits of this unit.
@@ -517,37 +542,10 @@ class SumUnit(InnerUnit):
         """
         Route the sample rows accumulated from this unit's parents to its subcircuits.
 
-        Every row routed to a mixture is assigned to exactly one subcircuit, drawn
-        according to the subcircuit weights. The rows are partitioned in a single
-        multinomial draw rather than once per parent request, which keeps the work
-        proportional to the number of samples instead of the number of paths through
-        the circuit.
+        Every row routed to a mixture is assigned to exactly one subcircuit, drawn according to the subcircuit
+        weights, see :meth:`CompiledSumLayer.route`.
         """
-        # a subcircuit legitimately receives no rows when an ancestor mixture
-        # assigns it zero samples; there is then nothing to route onward
-        if not self.result_of_current_query:
-            return
-
-        # all sample rows routed to this unit by its parents
-        rows = np.concatenate(self.result_of_current_query)
-
-        # fetch weights and subcircuits together to keep them aligned
-        log_weighted_subcircuits = self.log_weighted_subcircuits
-        weights = np.exp([log_weight for log_weight, _ in log_weighted_subcircuits])
-
-        # assign every row to one subcircuit according to the weights
-        counts = np.random.multinomial(len(rows), pvals=weights)
-
-        # shuffle the rows so the contiguous chunks handed to the subcircuits are
-        # an unbiased partition
-        np.random.shuffle(rows)
-
-        offset = 0
-        for count, (_, subcircuit) in zip(counts, log_weighted_subcircuits):
-            if not count:
-                continue
-            subcircuit.result_of_current_query.append(rows[offset : offset + count])
-            offset += count
+        self.route_sample_rows()
 
     def mount_with_interaction_terms(
         self, other: Self, interaction_model: ProbabilisticModel
@@ -857,18 +855,10 @@ class ProductUnit(InnerUnit):
         """
         Route the sample rows accumulated from this unit's parents to its subcircuits.
 
-        A decomposable product factorizes over disjoint variables, so every sample
-        row is forwarded unchanged to each subcircuit; the subcircuits then fill in
-        their respective columns of the same rows.
+        A decomposable product factorizes over disjoint variables, so every sample row is forwarded unchanged to
+        each subcircuit, see :meth:`CompiledProductLayer.route`.
         """
-        # a subcircuit legitimately receives no rows when an ancestor mixture
-        # assigns it zero samples; there is then nothing to route onward
-        if not self.result_of_current_query:
-            return
-        # a decomposable product routes every one of its rows to each subcircuit
-        rows = np.concatenate(self.result_of_current_query)
-        for subcircuit in self.subcircuits:
-            subcircuit.result_of_current_query.append(rows)
+        self.route_sample_rows()
 
     def attach_marginal_circuit(
         self,
@@ -929,9 +919,17 @@ class ProbabilisticCircuit(ProbabilisticModel, SubclassJSONSerializer):
     Cached layers of the graph. Invalidated whenever the topology of the graph changes.
     """
 
+    _compiled_cache: Optional[CompiledCircuit] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    """
+    Cached flattened representation of the graph that is used for inference.
+    Invalidated whenever the topology of the graph changes.
+    """
+
     def _invalidate_topology_cache(self):
         """
-        Invalidate the cached root and layers.
+        Invalidate the cached root, layers and compiled circuit.
 
         This must be called whenever nodes or edges are added to or removed from
         the graph. Pure edge-weight updates (which do not change the topology) do
@@ -941,6 +939,7 @@ class ProbabilisticCircuit(ProbabilisticModel, SubclassJSONSerializer):
         """
         self._root_cache = None
         self._layers_cache = None
+        self._compiled_cache = None
 
     def __len__(self):
         """
@@ -980,6 +979,20 @@ class ProbabilisticCircuit(ProbabilisticModel, SubclassJSONSerializer):
             )
         return self._layers_cache
 
+    @property
+    def compiled(self) -> CompiledCircuit:
+        """
+        The flattened representation of this circuit that is used for inference.
+        It is compiled lazily and recompiled whenever the topology of the graph changed.
+
+        :return: The compiled circuit.
+        """
+        if self._compiled_cache is None or not self._compiled_cache.is_compiled_from(
+            self.graph
+        ):
+            self._compiled_cache = CompiledCircuit.from_circuit(self)
+        return self._compiled_cache
+
     @property
     def leaves(self) -> List[LeafUnit]:
         return self.root.leaves
@@ -1144,55 +1157,26 @@ class ProbabilisticCircuit(ProbabilisticModel, SubclassJSONSerializer):
             raise ValueError(f"No root found.")
 
     def log_likelihood(self, events: npt.NDArray) -> npt.NDArray:
-        variable_to_index_map = self.variable_to_index_map
-        for layer in reversed(self.layers):
-            for unit in layer:  # open all the procesess
-                if unit.is_leaf:
-                    unit: LeafUnit
-                    unit.log_likelihood(
-                        events[
-                            :,
-                            [
-                                variable_to_index_map[variable]
-                                for variable in unit.variables
-                            ],
-                        ]
-                    )
-                else:
-                    unit: InnerUnit
-                    unit.log_forward()  # Synch trheads 1
-        return self.root.result_of_current_query
+        compiled = self.compiled
+        values = compiled.log_likelihood(events, compiled.log_weights(self.graph))
+        compiled.store_results(values)
+        return values[compiled.root_position]
 
     def cumulative_distribution_function(self, events: npt.NDArray) -> npt.NDArray:
-        variable_to_index_map = self.variable_to_index_map
-        for layer in reversed(self.layers):
-            for unit in layer:
-                unit: LeafUnit
-                if unit.is_leaf:
-                    unit.cumulative_distribution(
-                        events[
-                            :,
-                            [
-                                variable_to_index_map[variable]
-                                for variable in unit.variables
-                            ],
-                        ]
-                    )
-                else:
-                    unit: InnerUnit
-                    unit.forward()
-        return self.root.result_of_current_query
+        compiled = self.compiled
+        values = compiled.cumulative_distribution_function(
+            events, compiled.log_weights(self.graph)
+        )
+        compiled.store_results(values)
+        return values[compiled.root_position]
 
     def probability_of_simple_event(self, event: SimpleEvent) -> float:
-        for layer in reversed(self.layers):
-            for unit in layer:
-                if unit.is_leaf:
-                    unit: LeafUnit
-                    unit.probability_of_simple_event(event)
-                else:
-                    unit: InnerUnit
-                    unit.forward()
-        return self.root.result_of_current_query
+        compiled = self.compiled
+        values = compiled.probability_of_simple_event(
+            event, compiled.log_weights(self.graph)
+        )[:, 0]
+        compiled.store_results(values)
+        return values[compiled.root_position]
 
     def log_mode(self, check_determinism: bool = True) -> Tuple[Event, float]:
         if check_determinism:
@@ -1403,26 +1387,23 @@ class ProbabilisticCircuit(ProbabilisticModel, SubclassJSONSerializer):
         return result.marginal_in_place(variables)
 
     def sample(self, amount: int) -> npt.NDArray:
-        # initialize all results
-        for node in self.graph.nodes():
-            node.result_of_current_query = []
+        compiled = self.compiled
+        return compiled.sample(amount, compiled.log_weights(self.graph))
 
-        variable_to_index_map = self.variable_to_index_map
-
-        # the root is responsible for every row of the output array
-        self.root.result_of_current_query.append(np.arange(amount))
-
-        # initialize the samples
-        samples = np.full((amount, len(variable_to_index_map)), np.nan)
-
-        # forward through the circuit to sample
-        [
-            node.sample(samples, variable_to_index_map)
-            for layer in self.layers
-            for node in layer
-        ]
+    def sample_in_chunks(
+        self, amount: int, chunk_size: int = 100_000
+    ) -> Iterator[npt.NDArray]:
+        """
+        Draw samples in chunks of a fixed size, such that the memory stays bounded for large amounts.
 
-        return samples
+        :param amount: The total number of samples to draw.
+        :param chunk_size: The maximum number of samples per chunk.
+        :return: An iterator over the chunks of samples.
+        """
+        compiled = self.compiled
+        log_weights = compiled.log_weights(self.graph)
+        for start in range(0, amount, chunk_size):
+            yield compiled.sample(min(chunk_size, amount - start), log_weights)
 
     def moment(self, order: OrderType, center: CenterType) -> MomentType:
         variable_to_index_map = self.variable_to_index_map
@@ -1562,6 +1543,8 @@ class ProbabilisticCircuit(ProbabilisticModel, SubclassJSONSerializer):
         :param new_variables: The new variables to set.
         """
         self.root.update_variables(new_variables)
+        # renaming variables may reorder the columns the leaves are evaluated on
+        self._compiled_cache = None
 
     def is_deterministic(self) -> bool:
         """
@@ -2150,3 +2133,847 @@ def leaf(
         return UnivariateDiscreteLeaf(
             distribution, probabilistic_circuit=probabilistic_circuit
         )
+
+
+def concatenate_rows(blocks: List[npt.NDArray]) -> npt.NDArray:
+    """
+    Concatenate blocks of sample rows without copying a single block.
+
+    :param blocks: The blocks to concatenate.
+    :return: The concatenated rows.
+    """
+    if len(blocks) == 1:
+        return blocks[0]
+    return np.concatenate(blocks)
+
+
+@dataclass
+class RoutedRows:
+    """
+    Sample rows that a unit routed to its children, grouped by child.
+    """
+
+    rows: npt.NDArray
+    """
+    The sample rows, where the rows of the i-th child follow the rows of the children before it.
+    """
+
+    child_positions: npt.NDArray
+    """
+    The rows of the children in the value matrix of the compiled circuit.
+    """
+
+    counts: npt.NDArray
+    """
+    The number of rows of every child.
+    """
+
+
+@dataclass
+class LeafGroup:
+    """
+    The leaves of a :class:`CompiledCircuit` whose distributions have the same type and variables.
+
+    This group evaluates its leaves one after another on the precomputed columns of its variables.
+    Subclasses of :class:`VectorizedLeafGroup` evaluate all leaves of a group at once.
+    """
+
+    distribution_type: Type[ProbabilisticModel]
+    """
+    The type of the distributions of the leaves.
+    """
+
+    units: List[LeafUnit]
+    """
+    The leaves of this group.
+    """
+
+    positions: npt.NDArray
+    """
+    The rows of the leaves in the value matrix of the compiled circuit.
+    """
+
+    columns: List[int]
+    """
+    The column indices of the variables of the leaves in the events.
+    """
+
+    def log_likelihood(self, events: npt.NDArray, values: npt.NDArray):
+        """
+        Write the log-likelihood of the events under every leaf into the value matrix.
+
+        :param events: The events to evaluate.
+        :param values: The value matrix of the compiled circuit.
+        """
+        events = events[:, self.columns]
+        for unit, position in zip(self.units, self.positions):
+            values[position] = unit.distribution.log_likelihood(events)
+
+    def cumulative_distribution_function(
+        self, events: npt.NDArray, values: npt.NDArray
+    ):
+        """
+        Write the cumulative distribution function of every leaf at the events into the value matrix.
+
+        :param events: The events to evaluate.
+        :param values: The value matrix of the compiled circuit.
+        """
+        events = events[:, self.columns]
+        for unit, position in zip(self.units, self.positions):
+            values[position] = unit.distribution.cumulative_distribution_function(
+                events
+            )
+
+    def probability_of_simple_event(self, event: SimpleEvent, values: npt.NDArray):
+        """
+        Write the probability of the event under every leaf into the value matrix.
+
+        :param event: The event to evaluate.
+        :param values: The value matrix of the compiled circuit.
+        """
+        for unit, position in zip(self.units, self.positions):
+            values[position] = unit.distribution.probability_of_simple_event(event)
+
+    def sample(
+        self,
+        rows: npt.NDArray,
+        leaf_indices: npt.NDArray,
+        counts: npt.NDArray,
+        samples: npt.NDArray,
+    ):
+        """
+        Draw the samples of all rows that were routed to the leaves of this group.
+        Every distribution is sampled once per block of rows it was routed.
+
+        :param rows: The sample rows, grouped into blocks of rows that were routed to the same leaf.
+        :param leaf_indices: The index of the leaf in this group of every block.
+        :param counts: The number of rows of every block.
+        :param samples: The array to write the samples into.
+        """
+        ends = np.cumsum(counts)
+        for leaf_index, count, end in zip(leaf_indices, counts, ends):
+            samples[rows[end - count : end, None], self.columns] = self.units[
+                leaf_index
+            ].distribution.sample(count)
+
+
+@dataclass
+class VectorizedLeafGroup(LeafGroup, ABC):
+    """
+    A group of univariate leaves that is evaluated with a few numpy calls per query.
+
+    The distributions are read from the leaves on every query, since they may be replaced or changed in place
+    without changing the topology of the circuit.
+    If a distribution does not have the type of the group anymore, the group falls back to evaluating its
+    leaves one after another.
+    """
+
+    def distributions(self) -> Optional[List[ProbabilisticModel]]:
+        """
+        :return: The distributions of the leaves or None if any of them changed its type.
+        """
+        distributions = [unit.distribution for unit in self.units]
+        if all(
+            type(distribution) is self.distribution_type
+            for distribution in distributions
+        ):
+            return distributions
+        return None
+
+    def log_likelihood(self, events: npt.NDArray, values: npt.NDArray):
+        distributions = self.distributions()
+        if distributions is None:
+            return super().log_likelihood(events, values)
+        values[self.positions] = self.vectorized_log_likelihood(
+            distributions, events[None, :, self.columns[0]].astype(float)
+        )
+
+    def cumulative_distribution_function(
+        self, events: npt.NDArray, values: npt.NDArray
+    ):
+        distributions = self.distributions()
+        if distributions is None:
+            return super().cumulative_distribution_function(events, values)
+        values[self.positions] = self.vectorized_cumulative_distribution_function(
+            distributions, events[None, :, self.columns[0]].astype(float)
+        )
+
+    def probability_of_simple_event(self, event: SimpleEvent, values: npt.NDArray):
+        distributions = self.distributions()
+        if distributions is None:
+            return super().probability_of_simple_event(event, values)
+        points = interval_as_array(event[distributions[0].variable])
+        upper_bound_cdf = self.vectorized_cumulative_distribution_function(
+            distributions, points[None, :, 1]
+        )
+        lower_bound_cdf = self.vectorized_cumulative_distribution_function(
+            distributions, points[None, :, 0]
+        )
+        values[self.positions, 0] = (upper_bound_cdf - lower_bound_cdf).sum(axis=1)
+
+    def sample(
+        self,
+        rows: npt.NDArray,
+        leaf_indices: npt.NDArray,
+        counts: npt.NDArray,
+        samples: npt.NDArray,
+    ):
+        distributions = self.distributions()
+        if distributions is None:
+            return super().sample(rows, leaf_indices, counts, samples)
+        samples[rows, self.columns[0]] = self.vectorized_sample(
+            distributions, leaf_indices, counts
+        )
+
+    @abstractmethod
+    def vectorized_log_likelihood(
+        self, distributions: List[ProbabilisticModel], x: npt.NDArray
+    ) -> npt.NDArray:
+        """
+        :param distributions: The distributions of the leaves.
+        :param x: The value of the variable in every event as a row.
+        :return: The log-likelihood of every value under every distribution, one row per distribution.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def vectorized_cumulative_distribution_function(
+        self, distributions: List[ProbabilisticModel], x: npt.NDArray
+    ) -> npt.NDArray:
+        """
+        :param distributions: The distributions of the leaves.
+        :param x: The value of the variable in every event as a row.
+        :return: The cumulative distribution function of every distribution at every value, one row per
+            distribution.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def vectorized_sample(
+        self,
+        distributions: List[ProbabilisticModel],
+        leaf_indices: npt.NDArray,
+        counts: npt.NDArray,
+    ) -> npt.NDArray:
+        """
+        :param distributions: The distributions of the leaves.
+        :param leaf_indices: The index of the distribution of every block of samples.
+        :param counts: The number of samples of every block.
+        :return: The samples of all blocks, one after another.
+        """
+        raise NotImplementedError
+
+
+@dataclass
+class UniformLeafGroup(VectorizedLeafGroup):
+    """
+    A group of leaves with uniform distributions.
+    """
+
+    def vectorized_log_likelihood(
+        self, distributions: List[UniformDistribution], x: npt.NDArray
+    ) -> npt.NDArray:
+        intervals = [distribution.interval for distribution in distributions]
+        lower = np.array([interval.lower for interval in intervals])
+        upper = np.array([interval.upper for interval in intervals])
+
+        # turn open bounds into closed ones, such that inclusion is checked with two comparisons
+        smallest = np.where(
+            [interval.left == Bound.CLOSED for interval in intervals],
+            lower,
+            np.nextafter(lower, np.inf),
+        )
+        largest = np.where(
+            [interval.right == Bound.OPEN for interval in intervals],
+            np.nextafter(upper, -np.inf),
+            upper,
+        )
+        included = x >= smallest[:, None]
+        included &= x <= largest[:, None]
+
+        result = np.full(included.shape, -np.inf)
+        np.copyto(
+            result,
+            np.broadcast_to(-np.log(upper - lower)[:, None], result.shape),
+            where=included,
+        )
+        return result
+
+    def vectorized_cumulative_distribution_function(
+        self, distributions: List[UniformDistribution], x: npt.NDArray
+    ) -> npt.NDArray:
+        lower = np.array([distribution.lower for distribution in distributions])[
+            :, None
+        ]
+        upper = np.array([distribution.upper for distribution in distributions])[
+            :, None
+        ]
+        return np.minimum(1, np.maximum(0, (x - lower) / (upper - lower)))
+
+    def vectorized_sample(
+        self,
+        distributions: List[UniformDistribution],
+        leaf_indices: npt.NDArray,
+        counts: npt.NDArray,
+    ) -> npt.NDArray:
+        lower = np.array([distribution.lower for distribution in distributions])
+        upper = np.array([distribution.upper for distribution in distributions])
+        return np.random.uniform(
+            np.repeat(lower[leaf_indices], counts),
+            np.repeat(upper[leaf_indices], counts),
+        )
+
+
+@dataclass
+class GaussianLeafGroup(VectorizedLeafGroup):
+    """
+    A group of leaves with Gaussian distributions.
+    """
+
+    def parameters(
+        self, distributions: List[GaussianDistribution]
+    ) -> Tuple[npt.NDArray, npt.NDArray]:
+        """
+        :param distributions: The distributions of the leaves.
+        :return: The locations and scales of the distributions as columns.
+        """
+        location = np.array([distribution.location for distribution in distributions])
+        scale = np.array([distribution.scale for distribution in distributions])
+        return location[:, None], scale[:, None]
+
+    def vectorized_log_likelihood(
+        self, distributions: List[GaussianDistribution], x: npt.NDArray
+    ) -> npt.NDArray:
+        location, scale = self.parameters(distributions)
+        return norm.logpdf(x, loc=location, scale=scale)
+
+    def vectorized_cumulative_distribution_function(
+        self, distributions: List[GaussianDistribution], x: npt.NDArray
+    ) -> npt.NDArray:
+        location, scale = self.parameters(distributions)
+        return norm.cdf(x, loc=location, scale=scale)
+
+    def vectorized_sample(
+        self,
+        distributions: List[GaussianDistribution],
+        leaf_indices: npt.NDArray,
+        counts: npt.NDArray,
+    ) -> npt.NDArray:
+        location, scale = self.parameters(distributions)
+        return np.random.normal(
+            np.repeat(location[leaf_indices, 0], counts),
+            np.repeat(scale[leaf_indices, 0], counts),
+        )
+
+
+vectorized_leaf_groups: Dict[Type[ProbabilisticModel], Type[VectorizedLeafGroup]] = {
+    UniformDistribution: UniformLeafGroup,
+    GaussianDistribution: GaussianLeafGroup,
+}
+"""
+The vectorized leaf group for every distribution type that has one.
+"""
+
+
+@dataclass
+class CompiledProductLayer:
+    """
+    Product units of a :class:`CompiledCircuit` that only depend on units of lower layers.
+    The children of the units are stored in compressed sparse row format.
+    """
+
+    positions: npt.NDArray
+    """
+    The rows of the units in the value matrix of the compiled circuit.
+    """
+
+    child_pointers: npt.NDArray
+    """
+    The children of the i-th unit are at ``child_positions[child_pointers[i]:child_pointers[i + 1]]``.
+    """
+
+    child_positions: npt.NDArray
+    """
+    The rows of the children of all units in the value matrix of the compiled circuit.
+    """
+
+    def log_forward(self, values: npt.NDArray, log_weights: npt.NDArray):
+        """
+        Write the log-space result of the units into the value matrix.
+
+        :param values: The value matrix of the compiled circuit.
+        :param log_weights: The log-weights of the sum edges of the compiled circuit.
+        """
+        values[self.positions] = np.add.reduceat(
+            values[self.child_positions], self.child_pointers[:-1], axis=0
+        )
+
+    def forward(self, values: npt.NDArray, log_weights: npt.NDArray):
+        """
+        Write the linear-space result of the units into the value matrix.
+
+        :param values: The value matrix of the compiled circuit.
+        :param log_weights: The log-weights of the sum edges of the compiled circuit.
+        """
+        values[self.positions] = np.multiply.reduceat(
+            values[self.child_positions], self.child_pointers[:-1], axis=0
+        )
+
+    def route(
+        self, unit_index: int, rows: npt.NDArray, log_weights: npt.NDArray
+    ) -> List[RoutedRows]:
+        """
+        Route the sample rows of a unit of this layer to its children.
+        A decomposable product routes every row to each of its children, which fill in their respective
+        columns of the same row.
+
+        :param unit_index: The index of the unit in this layer.
+        :param rows: The sample rows that arrived at the unit.
+        :param log_weights: The log-weights of the sum edges of the compiled circuit.
+        :return: The rows routed to the children of the unit.
+        """
+        child_positions = self.child_positions[
+            self.child_pointers[unit_index] : self.child_pointers[unit_index + 1]
+        ]
+        counts = np.array([len(rows)])
+        return [
+            RoutedRows(rows, child_positions[child : child + 1], counts)
+            for child in range(len(child_positions))
+        ]
+
+
+@dataclass
+class CompiledSumLayer(CompiledProductLayer):
+    """
+    Sum units of a :class:`CompiledCircuit` that only depend on units of lower layers.
+    """
+
+    weights: slice
+    """
+    The log-weights of the edges to the children of this layer in the log-weights of the compiled circuit.
+    """
+
+    def log_forward(self, values: npt.NDArray, log_weights: npt.NDArray):
+        weighted = values[self.child_positions]
+        weighted += log_weights[self.weights, None]
+        starts = self.child_pointers[:-1]
+        maximum = np.maximum.reduceat(weighted, starts, axis=0)
+        # avoid NaN when a whole mixture is -inf (or +inf): subtract 0.0 instead
+        maximum[~np.isfinite(maximum)] = 0.0
+        weighted -= np.repeat(maximum, np.diff(self.child_pointers), axis=0)
+        np.exp(weighted, out=weighted)
+        result = np.add.reduceat(weighted, starts, axis=0)
+        with np.errstate(divide="ignore"):
+            np.log(result, out=result)
+        values[self.positions] = result + maximum
+
+    def forward(self, values: npt.NDArray, log_weights: npt.NDArray):
+        weighted = (
+            np.exp(log_weights[self.weights, None]) * values[self.child_positions]
+        )
+        values[self.positions] = np.add.reduceat(
+            weighted, self.child_pointers[:-1], axis=0
+        )
+
+    def route(
+        self, unit_index: int, rows: npt.NDArray, log_weights: npt.NDArray
+    ) -> List[RoutedRows]:
+        """
+        Route every sample row of a unit of this layer to exactly one of its children, drawn according to the
+        weights.
+        The number of rows of every child is drawn from a single multinomial distribution, and the children
+        receive contiguous blocks of the shuffled rows.
+        """
+        edges = slice(
+            self.child_pointers[unit_index], self.child_pointers[unit_index + 1]
+        )
+        weights = np.exp(log_weights[self.weights][edges])
+        counts = np.random.multinomial(len(rows), weights / weights.sum())
+        children = np.flatnonzero(counts)
+        if len(children) > 1:
+            # the rows may be shared with the siblings of a product, so shuffle a copy
+            rows = np.random.permutation(rows)
+        return [
+            RoutedRows(rows, self.child_positions[edges][children], counts[children])
+        ]
+
+
+@dataclass
+class CompiledCircuit:
+    """
+    Flattened representation of the topology of a :class:`ProbabilisticCircuit`.
+
+    Every unit owns a row in a value matrix that holds its result for all events of a query.
+    The leaves are grouped by the type of their distribution and the inner units are grouped into layers of
+    units that only depend on units of lower layers, such that a query is evaluated with a few numpy calls
+    per layer instead of Python calls per unit.
+    The log-weights of the sum units are read from the graph on every query, since they can change
+    without changing the topology.
+    """
+
+    units: List[Unit]
+    """
+    The units of the circuit, where the i-th unit owns the i-th row of the value matrix.
+    """
+
+    root_position: int
+    """
+    The row of the root in the value matrix.
+    """
+
+    leaf_groups: List[LeafGroup]
+    """
+    The leaves grouped by the type and variables of their distributions.
+    """
+
+    layers: List[CompiledProductLayer]
+    """
+    The layers of inner units, ordered from the leaves to the root.
+    """
+
+    weighted_edges: npt.NDArray
+    """
+    The indices of the edges of all sum units in the edges of the graph, in the order of the layers.
+    """
+
+    leaf_group_of_position: npt.NDArray
+    """
+    The index of the leaf group of every leaf, or -1 for inner units.
+    """
+
+    index_in_leaf_group: npt.NDArray
+    """
+    The index of every leaf in its leaf group.
+    """
+
+    number_of_variables: int
+    """
+    The number of variables of the circuit.
+    """
+
+    number_of_nodes: int
+    """
+    The number of nodes in the graph this was compiled from.
+    """
+
+    number_of_edges: int
+    """
+    The number of edges in the graph this was compiled from.
+    """
+
+    @classmethod
+    def from_circuit(cls, circuit: ProbabilisticCircuit) -> Self:
+        """
+        Compile a circuit.
+
+        :param circuit: The circuit to compile.
+        :return: The compiled circuit.
+        """
+        graph = circuit.graph
+        variable_to_index_map = circuit.variable_to_index_map
+
+        # the outgoing edges of every node as (child, edge index) in the order of the edges of the graph
+        children: Dict[int, List[Tuple[int, int]]] = {
+            index: [] for index in graph.node_indices()
+        }
+        for edge_index, (parent, child) in enumerate(graph.edge_list()):
+            children[parent].append((child, edge_index))
+
+        # the height of a unit is the length of the longest path to a leaf
+        height: Dict[int, int] = {}
+        for index in reversed(rx.topological_sort(graph)):
+            height[index] = 1 + max(
+                (height[child] for child, _ in children[index]), default=-1
+            )
+
+        units = [graph[index] for index in graph.node_indices()]
+        position_of_index = {
+            unit.index: position for position, unit in enumerate(units)
+        }
+
+        leaves: Dict[Tuple[type, Tuple[int, ...]], List[LeafUnit]] = {}
+        inner_units: Dict[Tuple[int, bool], List[InnerUnit]] = {}
+        for unit in units:
+            if unit.is_leaf:
+                unit: LeafUnit
+                columns = tuple(
+                    variable_to_index_map[variable] for variable in unit.variables
+                )
+                leaves.setdefault((type(unit.distribution), columns), []).append(unit)
+            elif isinstance(unit, (SumUnit, ProductUnit)):
+                inner_units.setdefault(
+                    (height[unit.index], isinstance(unit, SumUnit)), []
+                ).append(unit)
+            else:
+                raise NotImplementedError(f"Cannot compile units of type {type(unit)}.")
+
+        leaf_groups = []
+        for (distribution_type, columns), group in leaves.items():
+            group_type = (
+                vectorized_leaf_groups.get(distribution_type, LeafGroup)
+                if len(columns) == 1
+                else LeafGroup
+            )
+            leaf_groups.append(
+                group_type(
+                    distribution_type=distribution_type,
+                    units=group,
+                    positions=np.array(
+                        [position_of_index[unit.index] for unit in group]
+                    ),
+                    columns=list(columns),
+                )
+            )
+
+        layers = []
+        weighted_edges = []
+        for height_of_layer, is_sum_layer in sorted(inner_units):
+            group = inner_units[height_of_layer, is_sum_layer]
+            edges = [children[unit.index] for unit in group]
+            positions = np.array([position_of_index[unit.index] for unit in group])
+            child_pointers = np.cumsum(
+                [0] + [len(edges_of_unit) for edges_of_unit in edges]
+            )
+            child_positions = np.array(
+                [
+                    position_of_index[child]
+                    for edges_of_unit in edges
+                    for child, _ in edges_of_unit
+                ],
+                dtype=int,
+            )
+            if is_sum_layer:
+                weights = slice(
+                    len(weighted_edges), len(weighted_edges) + len(child_positions)
+                )
+                weighted_edges.extend(
+                    edge_index
+                    for edges_of_unit in edges
+                    for _, edge_index in edges_of_unit
+                )
+                layers.append(
+                    CompiledSumLayer(
+                        positions, child_pointers, child_positions, weights
+                    )
+                )
+            else:
+                layers.append(
+                    CompiledProductLayer(positions, child_pointers, child_positions)
+                )
+
+        leaf_group_of_position = np.full(len(units), -1)
+        index_in_leaf_group = np.zeros(len(units), dtype=int)
+        for leaf_group_index, leaf_group in enumerate(leaf_groups):
+            leaf_group_of_position[leaf_group.positions] = leaf_group_index
+            index_in_leaf_group[leaf_group.positions] = np.arange(
+                len(leaf_group.positions)
+            )
+
+        return cls(
+            units=units,
+            root_position=position_of_index[circuit.root.index],
+            leaf_groups=leaf_groups,
+            layers=layers,
+            weighted_edges=np.array(weighted_edges, dtype=int),
+            leaf_group_of_position=leaf_group_of_position,
+            index_in_leaf_group=index_in_leaf_group,
+            number_of_variables=len(variable_to_index_map),
+            number_of_nodes=graph.num_nodes(),
+            number_of_edges=graph.num_edges(),
+        )
+
+    def is_compiled_from(self, graph: rx.PyDAG[Unit]) -> bool:
+        """
+        Check if this was compiled from the current topology of a graph.
+        Topology changes are reported through :meth:`ProbabilisticCircuit._invalidate_topology_cache`.
+        Comparing the size of the graph additionally catches edges that are added to the graph directly.
+
+        :param graph: The graph to check.
+        :return: True if the graph has as many nodes and edges as the compiled one.
+        """
+        return (
+            graph.num_nodes() == self.number_of_nodes
+            and graph.num_edges() == self.number_of_edges
+        )
+
+    def log_weights(self, graph: rx.PyDAG[Unit]) -> npt.NDArray:
+        """
+        :param graph: The graph this was compiled from.
+        :return: The current log-weights of the edges of all sum units in the order of the layers.
+        """
+        edge_data = graph.edges()
+        return np.fromiter(
+            (edge_data[edge_index] for edge_index in self.weighted_edges),
+            dtype=float,
+            count=len(self.weighted_edges),
+        )
+
+    def log_likelihood(
+        self, events: npt.NDArray, log_weights: npt.NDArray
+    ) -> npt.NDArray:
+        """
+        :param events: The events to evaluate.
+        :param log_weights: The log-weights of the sum units.
+        :return: The log-likelihood of every event under every unit, one row per unit.
+        """
+        values = np.empty((len(self.units), len(events)))
+        for leaf_group in self.leaf_groups:
+            leaf_group.log_likelihood(events, values)
+        for layer in self.layers:
+            layer.log_forward(values, log_weights)
+        return values
+
+    def cumulative_distribution_function(
+        self, events: npt.NDArray, log_weights: npt.NDArray
+    ) -> npt.NDArray:
+        """
+        :param events: The events to evaluate.
+        :param log_weights: The log-weights of the sum units.
+        :return: The cumulative distribution function of every unit at every event, one row per unit.
+        """
+        values = np.empty((len(self.units), len(events)))
+        for leaf_group in self.leaf_groups:
+            leaf_group.cumulative_distribution_function(events, values)
+        for layer in self.layers:
+            layer.forward(values, log_weights)
+        return values
+
+    def probability_of_simple_event(
+        self, event: SimpleEvent, log_weights: npt.NDArray
+    ) -> npt.NDArray:
+        """
+        :param event: The event to evaluate.
+        :param log_weights: The log-weights of the sum units.
+        :return: The probability of the event under every unit as a matrix with one column.
+        """
+        values = np.empty((len(self.units), 1))
+        for leaf_group in self.leaf_groups:
+            leaf_group.probability_of_simple_event(event, values)
+        for layer in self.layers:
+            layer.forward(values, log_weights)
+        return values
+
+    def sample(self, amount: int, log_weights: npt.NDArray) -> npt.NDArray:
+        """
+        Draw samples by ancestral sampling.
+
+        Every sample row starts at the root and is routed through the layers from the root to the leaves.
+        Every unit routes all rows that arrived at it at once, where a sum unit draws how many of them
+        each child receives from a single multinomial distribution.
+        The rows routed to leaves are collected per leaf group, such that every leaf group draws all of its
+        samples at once.
+
+        :param amount: The number of samples to draw.
+        :param log_weights: The log-weights of the sum units.
+        :return: The samples.
+        """
+        samples = np.full((amount, self.number_of_variables), np.nan)
+
+        # the blocks of rows that arrived at every inner unit that was reached
+        arrived: Dict[int, List[npt.NDArray]] = {}
+        # the rows routed to every leaf group
+        arrived_at_leaves: List[List[RoutedRows]] = [[] for _ in self.leaf_groups]
+
+        self.distribute(
+            RoutedRows(
+                np.arange(amount), np.array([self.root_position]), np.array([amount])
+            ),
+            arrived,
+            arrived_at_leaves,
+        )
+        for layer in reversed(self.layers):
+            for unit_index, position in enumerate(layer.positions):
+                if position not in arrived:
+                    continue
+                for routed_rows in layer.route(
+                    unit_index, concatenate_rows(arrived.pop(position)), log_weights
+                ):
+                    self.distribute(routed_rows, arrived, arrived_at_leaves)
+
+        for leaf_group, blocks in zip(self.leaf_groups, arrived_at_leaves):
+            if not blocks:
+                continue
+            leaf_group.sample(
+                concatenate_rows([block.rows for block in blocks]),
+                self.index_in_leaf_group[
+                    np.concatenate([block.child_positions for block in blocks])
+                ],
+                np.concatenate([block.counts for block in blocks]),
+                samples,
+            )
+        return samples
+
+    def route(
+        self, unit: InnerUnit, rows: npt.NDArray, log_weights: npt.NDArray
+    ) -> List[Tuple[Unit, npt.NDArray]]:
+        """
+        Route the sample rows that arrived at a single inner unit to its children, as during sampling.
+
+        :param unit: The inner unit.
+        :param rows: The sample rows that arrived at the unit.
+        :param log_weights: The log-weights of the sum units.
+        :return: The children that received rows, together with their rows.
+        """
+        position = next(
+            position for position, other in enumerate(self.units) if other is unit
+        )
+        layer, unit_index = next(
+            (layer, np.flatnonzero(layer.positions == position)[0])
+            for layer in self.layers
+            if position in layer.positions
+        )
+        result = []
+        for routed_rows in layer.route(unit_index, rows, log_weights):
+            ends = np.cumsum(routed_rows.counts)
+            for child_position, count, end in zip(
+                routed_rows.child_positions, routed_rows.counts, ends
+            ):
+                result.append(
+                    (self.units[child_position], routed_rows.rows[end - count : end])
+                )
+        return result
+
+    def distribute(
+        self,
+        routed_rows: RoutedRows,
+        arrived: Dict[int, List[npt.NDArray]],
+        arrived_at_leaves: List[List[RoutedRows]],
+    ):
+        """
+        Hand rows that were routed to some children to the inner units and leaf groups of the children.
+
+        :param routed_rows: The routed rows.
+        :param arrived: The blocks of rows that arrived at every inner unit.
+        :param arrived_at_leaves: The rows routed to every leaf group.
+        """
+        child_positions = routed_rows.child_positions
+        counts = routed_rows.counts
+        leaf_groups = self.leaf_group_of_position[child_positions]
+        is_leaf = leaf_groups >= 0
+        ends = np.cumsum(counts)
+        for child in np.flatnonzero(~is_leaf):
+            arrived.setdefault(child_positions[child], []).append(
+                routed_rows.rows[ends[child] - counts[child] : ends[child]]
+            )
+        if not is_leaf.any():
+            return
+        for leaf_group in np.unique(leaf_groups[is_leaf]):
+            in_leaf_group = leaf_groups == leaf_group
+            arrived_at_leaves[leaf_group].append(
+                routed_rows
+                if in_leaf_group.all()
+                else RoutedRows(
+                    routed_rows.rows[np.repeat(in_leaf_group, counts)],
+                    child_positions[in_leaf_group],
+                    counts[in_leaf_group],
+                )
+            )
+
+    def store_results(self, values: npt.NDArray):
+        """
+        Write the result of every unit into its ``result_of_current_query``, e.g. for plotting the inference.
+
+        :param values: The value matrix of a query.
+        """
+        for unit, value in zip(self.units, values):
+            unit.result_of_current_query = value
@@ -0,0 +1,80 @@
+import os
+import time
+from importlib.resources import files
+from pathlib import Path
+
+from semantic_digital_twin.adapters.urdf import URDFParser
+from semantic_digital_twin.collision_checking.collision_matrix import CollisionMatrix
+from semantic_digital_twin.collision_checking.trimesh_collision_detector import (
+    FCLCollisionDetector,
+)
+from semantic_digital_twin.robots.pr2 import PR2
+from semantic_digital_twin.spatial_types import HomogeneousTransformationMatrix
+from semantic_digital_twin.world import World
+
+
+def load_pr2_kitchen_world() -> World:
+    """
+    Loads the PR2 and places it in front of the small kitchen shipped with the resources.
+    Resolving the PR2 description requires a sourced ROS workspace.
+    """
+    world = URDFParser.from_file(file_path=PR2.get_ros_file_path()).parse()
+    PR2.from_world(world)
+    kitchen_path = os.path.join(
+        Path(files("semantic_digital_twin")).parent.parent,
+        "resources",
+        "urdf",
+        "kitchen-small.urdf",
+    )
+    kitchen_world = URDFParser.from_file(file_path=kitchen_path).parse()
+    world.merge_world_at_pose(
+        kitchen_world, HomogeneousTransformationMatrix.from_xyz_rpy(-1.5, 0, 0)
+    )
+    return world
+
+
+def run(
+    collision_detector: FCLCollisionDetector,
+    collision_matrix: CollisionMatrix,
+    number_of_iterations: int,
+):
+    collision_detector.check_collisions(collision_matrix)
+    start = time.perf_counter()
+    for _ in range(number_of_iterations):
+        result = collision_detector.check_collisions(collision_matrix)
+    elapsed = time.perf_counter() - start
+    return elapsed / number_of_iterations, len(result.contacts)
+
+
+def main():
+    world = load_pr2_kitchen_world()
+    collision_detector = FCLCollisionDetector(_world=world)
+    number_of_iterations = 20
+
+    print(
+        f"\nFCL distance queries on PR2 + kitchen-small "
+        f"({len(world.bodies_with_collision)} bodies with collision):"
+    )
+    print(
+        f"{'distance':>9} {'pairs':>8} {'broadphase':>11} {'time (ms)':>10}"
+        f" {'pairs/s':>12} {'contacts':>9}"
+    )
+    for distance in [0.05, 0.1, 0.5]:
+        collision_matrix = CollisionMatrix.create_all_checks(
+            distance=distance, world=world
+        )
+        number_of_pairs = len(collision_matrix.collision_checks)
+        for use_broadphase in [False, True]:
+            collision_detector.use_broadphase = use_broadphase
+            seconds_per_call, number_of_contacts = run(
+                collision_detector, collision_matrix, number_of_iterations
+            )
+            print(
+                f"{distance:>9.2f} {number_of_pairs:>8} {str(use_broadphase):>11}"
+                f" {seconds_per_call * 1000:>10.2f}"
+                f" {number_of_pairs / seconds_per_call:>12.0f} {number_of_contacts:>9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import json
+import os
+import time
+from importlib.resources import files
+from pathlib import Path
+
+from typing_extensions import Optional
+
+from krrood.adapters.json_serializer import from_json, to_json
+from semantic_digital_twin.adapters.mesh import STLParser
+from semantic_digital_twin.world_description.mesh_store import (
+    BinaryMeshSerialization,
+    mesh_store,
+)
+from semantic_digital_twin.world_description.world_entity import Body
+
+
+def load_body(file_name: str) -> Body:
+    """
+    Loads the body of a mesh that is shipped with the resources.
+    """
+    return (
+        STLParser(
+            os.path.join(
+                Path(files("semantic_digital_twin")).parent.parent,
+                "resources",
+                "stl",
+                file_name,
+            )
+        )
+        .parse()
+        .root
+    )
+
+
+def round_trip(
+    body: Body,
+    binary_mesh_serialization: Optional[BinaryMeshSerialization] = None,
+    receiver_knows_mesh: bool = False,
+) -> tuple[int, float, float]:
+    """
+    Serializes a body to a JSON string and deserializes it again, like a synchronization message.
+    Unless the receiver knows the mesh, the mesh store is cleared in between, as if the receiver was another process.
+
+    :return: The size of the message in kB and the latencies of the serialization and deserialization in ms.
+    """
+    start = time.perf_counter()
+    if binary_mesh_serialization is None:
+        message = json.dumps(to_json(body))
+    else:
+        with binary_mesh_serialization.activate():
+            message = json.dumps(to_json(body))
+    serialization_time = time.perf_counter() - start
+    if not receiver_knows_mesh:
+        mesh_store.clear()
+    start = time.perf_counter()
+    from_json(json.loads(message))
+    deserialization_time = time.perf_counter() - start
+    return len(message) / 1000, serialization_time * 1000, deserialization_time * 1000
+
+
+def main():
+    print("\nSerialization of a body with a mesh, as sent in a world modification:")
+    print(
+        f"{'mesh':>15} {'encoding':>17} {'size (kB)':>10} {'serialize (ms)':>15}"
+        f" {'deserialize (ms)':>17}"
+    )
+    for file_name in ["milk.stl", "jeroen_cup.stl"]:
+        body = load_body(file_name)
+        binary_mesh_serialization = BinaryMeshSerialization()
+        for encoding, serialization, receiver_knows_mesh in [
+            ("JSON", None, False),
+            ("binary", binary_mesh_serialization, False),
+            ("binary reference", binary_mesh_serialization, True),
+        ]:
+            size, serialization_time, deserialization_time = round_trip(
+                body, serialization, receiver_knows_mesh
+            )
+            print(
+                f"{file_name:>15} {encoding:>17} {size:>10.1f}"
+                f" {serialization_time:>15.1f} {deserialization_time:>17.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
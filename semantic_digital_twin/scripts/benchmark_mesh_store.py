@@ -0,0 +1,99 @@
+import os
+import time
+import tracemalloc
+from copy import deepcopy
+from importlib.resources import files
+from pathlib import Path
+
+import trimesh
+from trimesh.visual.texture import TextureVisuals
+
+from semantic_digital_twin.world_description.geometry import Mesh, Scale
+from semantic_digital_twin.world_description.mesh_store import mesh_store
+
+
+def per_instance_mesh(self: Mesh) -> trimesh.Trimesh:
+    """
+    Reference implementation that loads and caches the mesh for every shape separately.
+    """
+    mesh = self.__dict__.get("_per_instance_mesh")
+    if mesh is None:
+        mesh = trimesh.load_mesh(self.filename)
+        mesh.apply_scale(self.scale.to_np())
+        if not isinstance(mesh.visual, TextureVisuals):
+            mesh.visual.vertex_colors = trimesh.visual.color.to_rgba(
+                self.color.to_rgba()
+            )
+        self.__dict__["_per_instance_mesh"] = mesh
+    return mesh
+
+
+def house_shapes(number_of_objects: int) -> list[Mesh]:
+    """
+    Creates the mesh shapes of a house in which every asset is referenced by many objects,
+    using the meshes shipped with the resources as assets.
+    Every third object is scaled, like the furniture of ProcTHOR houses that is fitted to its room.
+    """
+    resources = os.path.join(
+        Path(files("semantic_digital_twin")).parent.parent, "resources"
+    )
+    assets = [
+        os.path.join(resources, "stl", "milk.stl"),
+        os.path.join(resources, "stl", "jeroen_cup.stl"),
+        os.path.join(resources, "obj", "cylinder.obj"),
+    ]
+    return [
+        Mesh(
+            filename=assets[i % len(assets)],
+            scale=Scale(1.5, 1.5, 1.5) if i % 3 == 0 else Scale(),
+        )
+        for i in range(number_of_objects)
+    ]
+
+
+def load_house(number_of_objects: int, number_of_copies: int) -> tuple[float, float]:
+    """
+    Loads the meshes of a house and of copies of it, as they are made when worlds are copied or merged.
+
+    :return: The time in seconds and the peak of the allocated memory in MB.
+    """
+    mesh_store.clear()
+    tracemalloc.start()
+    start = time.perf_counter()
+    shapes = house_shapes(number_of_objects)
+    for _ in range(number_of_copies):
+        shapes.extend(deepcopy(shapes[:number_of_objects]))
+    for shape in shapes:
+        shape.mesh.bounds
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def main():
+    number_of_copies = 2
+    print(f"\nLoading the meshes of a house with {number_of_copies} copies of it:")
+    print(
+        f"{'objects':>8} {'meshes':>8} {'time (s)':>9} {'memory (MB)':>12}"
+        f" {'store time (s)':>15} {'store memory (MB)':>18}"
+    )
+    for number_of_objects in [100, 400]:
+        shared_time, shared_memory = load_house(number_of_objects, number_of_copies)
+        mesh_property = Mesh.mesh
+        Mesh.mesh = property(per_instance_mesh)
+        try:
+            reference_time, reference_memory = load_house(
+                number_of_objects, number_of_copies
+            )
+        finally:
+            Mesh.mesh = mesh_property
+        print(
+            f"{number_of_objects:>8} {number_of_objects * (number_of_copies + 1):>8}"
+            f" {reference_time:>9.2f} {reference_memory:>12.1f}"
+            f" {shared_time:>15.2f} {shared_memory:>18.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
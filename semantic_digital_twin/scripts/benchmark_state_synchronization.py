@@ -0,0 +1,198 @@
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from unittest import mock
+
+import numpy as np
+import std_msgs.msg
+from typing_extensions import Callable, Dict, List
+
+from semantic_digital_twin.adapters.ros.messages import WorldStateUpdate, WorldUpdate
+from semantic_digital_twin.adapters.ros.world_synchronizer import (
+    Synchronizer,
+    WorldSynchronizer,
+)
+from semantic_digital_twin.datastructures.prefixed_name import PrefixedName
+from semantic_digital_twin.spatial_types import Vector3
+from semantic_digital_twin.world import World
+from semantic_digital_twin.world_description.connections import RevoluteConnection
+from semantic_digital_twin.world_description.world_entity import Body
+
+
+@dataclass
+class SubscriptionInfo:
+    node_name: str
+
+
+@dataclass
+class LoopbackNetwork:
+    """
+    Delivers published messages synchronously to all subscriptions of their topic, without ROS.
+    """
+
+    subscriptions: Dict[str, List[tuple[str, Callable]]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    number_of_messages: int = 0
+    number_of_bytes: int = 0
+
+    def publish(self, topic: str, message: std_msgs.msg.String):
+        if topic == "/acknowledge":
+            return
+        self.number_of_messages += 1
+        self.number_of_bytes += len(message.data)
+        for _, callback in list(self.subscriptions[topic]):
+            callback(message)
+
+
+@dataclass
+class LoopbackPublisher:
+    network: LoopbackNetwork
+    topic: str
+
+    def publish(self, message: std_msgs.msg.String):
+        self.network.publish(self.topic, message)
+
+
+@dataclass
+class LoopbackNode:
+    """
+    The part of the rclpy node interface that the synchronizers use.
+    """
+
+    name: str
+    network: LoopbackNetwork
+
+    def get_name(self) -> str:
+        return self.name
+
+    def create_subscription(self, message_type, topic, callback, qos_profile):
+        subscription = (self.name, callback)
+        self.network.subscriptions[topic].append(subscription)
+        return topic, subscription
+
+    def destroy_subscription(self, subscription):
+        topic, subscription = subscription
+        self.network.subscriptions[topic].remove(subscription)
+
+    def create_publisher(self, message_type, topic, qos_profile):
+        return LoopbackPublisher(self.network, topic)
+
+    def destroy_publisher(self, publisher: LoopbackPublisher):
+        pass
+
+    def get_subscriptions_info_by_topic(self, topic: str) -> List[SubscriptionInfo]:
+        return [SubscriptionInfo(name) for name, _ in self.network.subscriptions[topic]]
+
+
+def reference_on_state_change(self: WorldSynchronizer, **kwargs):
+    """
+    Reference implementation that publishes the changed positions as lists of ids and floats.
+    """
+    changes = self.compute_state_changes()
+    if not changes:
+        return
+    state_message = WorldStateUpdate(
+        meta_data=self.meta_data,
+        ids=list(changes.keys()),
+        states=list(changes.values()),
+    )
+    self._publish_or_defer(
+        WorldUpdate(meta_data=self.meta_data, state_update=state_message)
+    )
+    self.update_previous_world_state()
+
+
+def build_chain(world: World, number_of_joints: int):
+    """
+    Adds a kinematic chain of revolute joints to the world.
+    """
+    with world.modify_world():
+        parent = Body(name=PrefixedName("link_0"))
+        world.add_kinematic_structure_entity(parent)
+        for i in range(1, number_of_joints + 1):
+            child = Body(name=PrefixedName(f"link_{i}"))
+            world.add_connection(
+                RevoluteConnection.create_with_dofs(
+                    world, parent, child, axis=Vector3.Z()
+                )
+            )
+            parent = child
+
+
+def run(
+    number_of_joints: int, number_of_changed_joints: int, number_of_messages: int
+) -> tuple[float, float]:
+    """
+    Synchronizes state changes from one world to another through the loopback network.
+
+    :return: The number of messages per second and the mean size of a message in bytes.
+    """
+    network = LoopbackNetwork()
+    sender_world, receiver_world = World(), World()
+    sender = WorldSynchronizer(
+        node=LoopbackNode("sender", network), _world=sender_world
+    )
+    receiver = WorldSynchronizer(
+        node=LoopbackNode("receiver", network), _world=receiver_world
+    )
+    build_chain(sender_world, number_of_joints)
+    degree_of_freedom_ids = list(sender_world.state.keys())
+
+    network.number_of_messages = network.number_of_bytes = 0
+    start = time.perf_counter()
+    for i in range(number_of_messages):
+        changed = np.random.choice(
+            number_of_joints, number_of_changed_joints, replace=False
+        )
+        for index in changed:
+            sender_world.state[degree_of_freedom_ids[index]].position = i * 1e-3
+        sender_world.notify_state_change()
+    elapsed = time.perf_counter() - start
+
+    assert np.allclose(receiver_world.state.positions, sender_world.state.positions)
+    sender.close()
+    receiver.close()
+    return (
+        network.number_of_messages / elapsed,
+        network.number_of_bytes / network.number_of_messages,
+    )
+
+
+def main():
+    np.random.seed(69)
+    number_of_messages = 500
+    print("\nState synchronization between two worlds through a loopback network:")
+    print(
+        f"{'DOFs':>6} {'changed':>8} {'encoding':>9} {'messages/s':>11}"
+        f" {'bytes/message':>14}"
+    )
+    for number_of_joints, number_of_changed_joints in [(50, 10), (200, 200)]:
+        for encoding in ["JSON", "packed"]:
+            if encoding == "JSON":
+                with (
+                    mock.patch.object(
+                        WorldSynchronizer, "on_state_change", reference_on_state_change
+                    ),
+                    mock.patch.object(
+                        Synchronizer,
+                        "_references_world_entities",
+                        lambda self, data: True,
+                    ),
+                ):
+                    result = run(
+                        number_of_joints, number_of_changed_joints, number_of_messages
+                    )
+            else:
+                result = run(
+                    number_of_joints, number_of_changed_joints, number_of_messages
+                )
+            messages_per_second, bytes_per_message = result
+            print(
+                f"{number_of_joints:>6} {number_of_changed_joints:>8} {encoding:>9}"
+                f" {messages_per_second:>11.0f} {bytes_per_message:>14.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
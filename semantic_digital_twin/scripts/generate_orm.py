@@ -18,6 +18,9 @@ import semantic_digital_twin.orm.model
 import semantic_digital_twin.adapters.procthor.procthor_resolver
 from krrood.adapters.json_serializer import SubclassJSONSerializer
 from krrood.ormatic.ormatic import ORMatic
+from semantic_digital_twin.collision_checking.collision_detector import (
+    CollisionCheckingResult,
+)
 from semantic_digital_twin.reasoning.predicates import ContainsType
 from semantic_digital_twin.semantic_annotations.position_descriptions import (
     SemanticDirection,
@@ -25,6 +28,7 @@ from semantic_digital_twin.semantic_annotations.position_descriptions import (
 from semantic_digital_twin.spatial_computations.forward_kinematics import (
     ForwardKinematicsManager,
 )
+from semantic_digital_twin.spatial_computations.raytracer import BodyCollisionGeometry
 from semantic_digital_twin.world import (
     ResetStateContextManager,
     WorldModelUpdateContextManager,
@@ -35,12 +39,26 @@ ignore_classes = {
     ResetStateContextManager,
     WorldModelUpdateContextManager,
     ForwardKinematicsManager,
+    BodyCollisionGeometry,
+    CollisionCheckingResult,
     semantic_digital_twin.adapters.procthor.procthor_resolver.ProcthorResolver,
     ContainsType,
     SemanticDirection,
     SubclassJSONSerializer,
 }
 
+# the ros adapters can only be imported if ROS is installed, otherwise ORMatic skips their modules anyway
+try:
+    import semantic_digital_twin.adapters.ros.messages
+    import semantic_digital_twin.adapters.ros.world_synchronizer
+
+    ignore_classes |= {
+        semantic_digital_twin.adapters.ros.messages.PackedWorldStateUpdate,
+        semantic_digital_twin.adapters.ros.world_synchronizer.ReceivedStateTable,
+    }
+except ImportError:
+    pass
+
 
 def generate_orm():
     """
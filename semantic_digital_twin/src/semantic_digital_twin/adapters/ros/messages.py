@@ -1,9 +1,11 @@
+import base64
 import uuid
 from abc import ABC
 from dataclasses import dataclass, field
 from krrood.utils import memoize
 from uuid import UUID
 
+import numpy as np
 from typing_extensions import Dict, Any, Self, List, Optional
 
 from krrood.adapters.json_serializer import SubclassJSONSerializer, to_json, from_json
@@ -83,6 +85,54 @@ class Acknowledgment:
     """The metadata identifying the acknowledging node."""
 
 
+@dataclass
+class MeshContentRequest:
+    """
+    Message requesting the content of a mesh that has been received as a reference to its content hash only.
+    """
+
+    content_hash: str
+    """The content hash of the requested mesh."""
+
+    node_meta_data: MetaData
+    """The metadata identifying the requesting node."""
+
+
+@dataclass
+class MeshContent:
+    """
+    Message containing the content of a mesh, in response to a MeshContentRequest.
+    The vertices and faces are little-endian float32 and int32 buffers, encoded as base64.
+    """
+
+    content_hash: str
+    """The content hash of the mesh."""
+
+    file_type: str
+    """The type of the file that the mesh has been loaded from."""
+
+    vertices: str
+    """The vertices of the unprocessed mesh."""
+
+    faces: str
+    """The faces of the unprocessed mesh."""
+
+    node_meta_data: MetaData
+    """The metadata identifying the responding node."""
+
+    @property
+    def mesh_json(self) -> Dict[str, Any]:
+        """
+        :return: The JSON data of the mesh, as serialized by a BinaryMeshSerialization.
+        """
+        return {
+            "content_hash": self.content_hash,
+            "file_type": self.file_type,
+            "vertices": self.vertices,
+            "faces": self.faces,
+        }
+
+
 @dataclass
 class WorldStateUpdate(Message):
     """
@@ -96,6 +146,66 @@ class WorldStateUpdate(Message):
     """The states of the changed free variables."""
 
 
+@dataclass
+class PackedWorldStateUpdate(Message, SubclassJSONSerializer):
+    """
+    Compact update of the free variables of a world state.
+
+    The free variables are referenced by their index in the state of the sender.
+    The ids of the free variables in that order form a table that is only sent when the receivers may not know it
+    yet, i.e. with the first update of a model version of the sender or after new subscribers appeared, and
+    periodically to recover receivers that missed it. Updates that contain the table contain the complete state.
+    Receivers cache the table per sender.
+    Indices and values are sent as little-endian int32 and float64 buffers, encoded as base64.
+    """
+
+    model_version: int
+    """The model version of the sender that the indices refer to."""
+
+    indices: np.ndarray
+    """The indices of the changed free variables in the state of the sender."""
+
+    values: np.ndarray
+    """The values of the changed free variables."""
+
+    ids: Optional[List[UUID]] = None
+    """The ids of all free variables of the sender in the order of its state, if the table is sent."""
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            **super().to_json(),
+            "meta_data": to_json(self.meta_data),
+            "publication_event_id": to_json(self.publication_event_id),
+            "model_version": self.model_version,
+            "indices": base64.b64encode(self.indices.astype("<i4").tobytes()).decode(
+                "ascii"
+            ),
+            "values": base64.b64encode(self.values.astype("<f8").tobytes()).decode(
+                "ascii"
+            ),
+            "ids": (
+                None
+                if self.ids is None
+                else [str(identifier) for identifier in self.ids]
+            ),
+        }
+
+    @classmethod
+    def _from_json(cls, data: Dict[str, Any], **kwargs) -> Self:
+        return cls(
+            meta_data=from_json(data["meta_data"]),
+            publication_event_id=from_json(data["publication_event_id"]),
+            model_version=data["model_version"],
+            indices=np.frombuffer(base64.b64decode(data["indices"]), dtype="<i4"),
+            values=np.frombuffer(base64.b64decode(data["values"]), dtype="<f8"),
+            ids=(
+                None
+                if data["ids"] is None
+                else [UUID(identifier) for identifier in data["ids"]]
+            ),
+        )
+
+
 @dataclass
 class ModificationBlock(Message):
     """
@@ -125,6 +235,9 @@ class WorldUpdate(Message):
     state_update: Optional[WorldStateUpdate] = None
     """The state values to apply, if any."""
 
+    packed_state_update: Optional[PackedWorldStateUpdate] = None
+    """The state values to apply in their packed form, if any."""
+
 
 @dataclass
 class LoadModel(Message):
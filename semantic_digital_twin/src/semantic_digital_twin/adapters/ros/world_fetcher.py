@@ -12,6 +12,7 @@ from semantic_digital_twin.adapters.world_entity_kwargs_tracker import (
 )
 from semantic_digital_twin.world import World
 from semantic_digital_twin.adapters.ros.messages import WorldModelSnapshot
+from semantic_digital_twin.world_description.mesh_store import BinaryMeshSerialization
 
 
 @dataclass
@@ -90,6 +91,7 @@ class FetchWorldServer:
 
         This ensures a receiver can rebuild the model from the modification blocks
         and then apply the most recent state values.
+        The content of every mesh is included once, as binary buffers.
         """
         # Build snapshot object and serialize through its serializer
         snapshot = WorldModelSnapshot(
@@ -100,7 +102,8 @@ class FetchWorldServer:
             states=list(self.world.state.positions),
         )
 
-        return json.dumps(snapshot.to_json())
+        with BinaryMeshSerialization().activate():
+            return json.dumps(snapshot.to_json())
 
     def close(self):
         """
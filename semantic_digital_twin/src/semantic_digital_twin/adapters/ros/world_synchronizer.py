@@ -4,7 +4,7 @@ import threading
 from abc import abstractmethod
 from dataclasses import dataclass, field
 from functools import cached_property
-from typing import ClassVar, Optional, Set, Type, List, Dict
+from typing import ClassVar, Optional, Set, Type, List, Dict, Any, Tuple
 from uuid import UUID
 
 import numpy as np
@@ -26,6 +26,9 @@ from semantic_digital_twin.adapters.ros.messages import (
     LoadModel,
     Acknowledgment,
     WorldUpdate,
+    PackedWorldStateUpdate,
+    MeshContentRequest,
+    MeshContent,
 )
 from semantic_digital_twin.adapters.world_entity_kwargs_tracker import (
     WorldEntityWithIDKwargsTracker,
@@ -38,8 +41,14 @@ from semantic_digital_twin.exceptions import (
     MissingPublishChangesKWARG,
     ApplyMissedMessagesWhileWorldIsBeingModifiedError,
     StateUpdateContainsUnknownDegreesOfFreedomError,
+    UnknownMeshContentError,
 )
 from semantic_digital_twin.world import World
+from semantic_digital_twin.world_description.geometry import Mesh
+from semantic_digital_twin.world_description.mesh_store import (
+    BinaryMeshSerialization,
+    mesh_store,
+)
 from semantic_digital_twin.world_description.world_entity import (
     WorldEntityWithClassBasedID,
 )
@@ -52,6 +61,11 @@ class Synchronizer(WorldEntityWithClassBasedID):
 
     It manages publishers and subscribers, ensuring proper cleanup after use.
     The communication is JSON string based.
+    Meshes are sent as binary buffers the first time their content is published and as references to their
+    content hash afterward.
+    Receivers that get a reference to a mesh they do not know, e.g. because they joined after its content had
+    been published or missed the message that contained it, request its content on the mesh content topic and
+    hold back this and all later messages until it has been received.
 
     .. warning::
 
@@ -91,6 +105,11 @@ class Synchronizer(WorldEntityWithClassBasedID):
     The name of the acknowledgment topic. Synchronous publication of world state waits until all subscribers have acknowledged on this topic.
     """
 
+    mesh_content_topic_name: Optional[str] = "/mesh_content"
+    """
+    The name of the topic on which the content of meshes is requested and sent.
+    """
+
     publisher: Optional[Publisher] = field(init=False, default=None)
     """
     The publisher used to publish the world state.
@@ -111,6 +130,16 @@ class Synchronizer(WorldEntityWithClassBasedID):
     The subscriber that receives acknowledgment messages from other nodes.
     """
 
+    mesh_content_publisher: Optional[Publisher] = field(init=False, default=None)
+    """
+    The publisher used to request and send the content of meshes on the mesh content topic.
+    """
+
+    mesh_content_subscriber: Optional[Subscription] = field(init=False, default=None)
+    """
+    The subscriber that receives requests for and the content of meshes from other nodes.
+    """
+
     message_type: ClassVar[Optional[Type[Message]]] = None
     """The type of the message that is sent and received."""
 
@@ -137,6 +166,21 @@ class Synchronizer(WorldEntityWithClassBasedID):
     """
     Serializes :meth:`publish` so concurrent publications cannot unintentionally override the shared
     acknowledgment-tracking state (``_current_publication_event_id`` / ``_received_acknowledgments``).
+    It also keeps messages that reference a mesh from being published before the message that contains it.
+    """
+
+    _mesh_serialization: BinaryMeshSerialization = field(
+        default_factory=BinaryMeshSerialization
+    )
+    """
+    The serialization of the meshes in the published messages, which remembers the meshes that have been sent.
+    """
+
+    _received_messages: List[Dict[str, Any]] = field(default_factory=list)
+    """
+    The JSON data of the received messages that have not been applied yet, in the order of their receipt.
+    A message stays in here while it references a mesh whose content has not been received, such that later
+    messages are not applied before it.
     """
 
     def __post_init__(self):
@@ -158,6 +202,15 @@ class Synchronizer(WorldEntityWithClassBasedID):
         self.acknowledge_publisher = self.node.create_publisher(
             std_msgs.msg.String, topic=self.acknowledge_topic_name, qos_profile=10
         )
+        self.mesh_content_subscriber = self.node.create_subscription(
+            std_msgs.msg.String,
+            topic=self.mesh_content_topic_name,
+            callback=self.mesh_content_callback,
+            qos_profile=10,
+        )
+        self.mesh_content_publisher = self.node.create_publisher(
+            std_msgs.msg.String, topic=self.mesh_content_topic_name, qos_profile=10
+        )
 
     @cached_property
     def meta_data(self) -> MetaData:
@@ -173,22 +226,57 @@ class Synchronizer(WorldEntityWithClassBasedID):
     def subscription_callback(self, message: std_msgs.msg.String):
         """
         Wrap the origin subscription callback by self-skipping and disabling the next world callback.
+        Messages are applied in the order of their receipt, see `_apply_received_messages`.
         Holds the world lock while deserializing to ensure no changes happen while building the tracker and
         running from_json.
 
         :param message: The incoming ROS string message containing a serialized synchronization message.
         """
+        data = json.loads(message.data)
         with self._world._world_lock:
-            tracker = WorldEntityWithIDKwargsTracker.from_world(self._world)
-            deserialized_message = from_json(
-                json.loads(message.data), **tracker.create_kwargs()
-            )
+            self._received_messages.append(data)
+            self._apply_received_messages()
 
-            if deserialized_message.meta_data == self.meta_data:
+    def _apply_received_messages(self):
+        """
+        Deserializes and applies the received messages in order, until one of them references a mesh whose content
+        is unknown.
+        The content of that mesh is requested again with every call, in case the request or its response got lost.
+        """
+        while self._received_messages:
+            try:
+                deserialized_message = self._deserialize(self._received_messages[0])
+            except UnknownMeshContentError as error:
+                self.request_mesh_content(error.content_hash)
                 return
+            self._received_messages.pop(0)
+
+            if deserialized_message.meta_data == self.meta_data:
+                continue
 
             self._subscription_callback(deserialized_message)
 
+    def _deserialize(self, data: Dict[str, Any]) -> Message:
+        """
+        :param data: The JSON data of a received message.
+        :return: The deserialized message.
+        """
+        if self._references_world_entities(data):
+            tracker = WorldEntityWithIDKwargsTracker.from_world(self._world)
+            return from_json(data, **tracker.create_kwargs())
+        return from_json(data)
+
+    @staticmethod
+    def _references_world_entities(data: Dict[str, Any]) -> bool:
+        """
+        Messages reference the entities of the world only through model modifications, so the costly kwargs
+        tracker is only needed to deserialize those.
+
+        :param data: The JSON data of a received message.
+        :return: Whether the message contains model modifications.
+        """
+        return data.get("modification_block") is not None
+
     def acknowledge_message(self, message: message_type):
         if self.acknowledge_publisher is None:
             return
@@ -200,6 +288,76 @@ class Synchronizer(WorldEntityWithClassBasedID):
             std_msgs.msg.String(data=json.dumps(to_json(acknowledgment)))
         )
 
+    def request_mesh_content(self, content_hash: str):
+        """
+        Requests the content of a mesh from the synchronizers that have published it.
+
+        :param content_hash: The content hash of the mesh.
+        """
+        self.node.get_logger().warning(
+            f"Requesting the content of the mesh with the hash {content_hash}, "
+            f"which has been received as a reference only."
+        )
+        request = MeshContentRequest(
+            content_hash=content_hash, node_meta_data=self.meta_data
+        )
+        self.mesh_content_publisher.publish(
+            std_msgs.msg.String(data=json.dumps(to_json(request)))
+        )
+
+    def mesh_content_callback(self, msg: std_msgs.msg.String):
+        """
+        Answers requests for the content of meshes that this synchronizer has published, and resolves received
+        content such that the messages that wait for it can be applied.
+
+        :param msg: The incoming ROS string message containing a serialized mesh content request or mesh content.
+        """
+        message = from_json(json.loads(msg.data))
+        if message.node_meta_data == self.meta_data:
+            return
+        if isinstance(message, MeshContentRequest):
+            self._answer_mesh_content_request(message)
+        else:
+            self._receive_mesh_content(message)
+
+    def _answer_mesh_content_request(self, request: MeshContentRequest):
+        """
+        Publishes the content of the requested mesh, if this synchronizer has published it.
+
+        :param request: The request for the content of a mesh.
+        """
+        if (
+            request.content_hash
+            not in self._mesh_serialization.serialized_content_hashes
+        ):
+            return
+        filename = mesh_store.file_of_content_hash(request.content_hash)
+        if filename is None:
+            return
+        mesh_json = BinaryMeshSerialization.content_to_json(filename)
+        content = MeshContent(
+            content_hash=request.content_hash,
+            file_type=filename.split(".")[-1],
+            vertices=mesh_json["vertices"],
+            faces=mesh_json["faces"],
+            node_meta_data=self.meta_data,
+        )
+        self.mesh_content_publisher.publish(
+            std_msgs.msg.String(data=json.dumps(to_json(content)))
+        )
+
+    def _receive_mesh_content(self, content: MeshContent):
+        """
+        Resolves the received content of a mesh to a file and applies the messages that have been waiting for it.
+
+        :param content: The content of a mesh.
+        """
+        with self._world._world_lock:
+            if not self._received_messages:
+                return
+            Mesh.file_of_binary_mesh_json(content.mesh_json)
+            self._apply_received_messages()
+
     def acknowledge_callback(self, msg: std_msgs.msg.String):
         """
         Called when subscribers of the sync topic acknowledge receipt of synchronization notifications.
@@ -261,14 +419,15 @@ class Synchronizer(WorldEntityWithClassBasedID):
         """
 
         if not self.synchronous:
-            self.publisher.publish(std_msgs.msg.String(data=json.dumps(to_json(msg))))
+            with self._publish_lock:
+                self.publisher.publish(self._serialize(msg))
             return
 
         with self._publish_lock, self._acknowledge_condition_variable:
             self._current_publication_event_id = msg.publication_event_id
             self._expected_acknowledgment_count = self._snapshot_subscribers()
             self._received_acknowledgments = set()
-            self.publisher.publish(std_msgs.msg.String(data=json.dumps(to_json(msg))))
+            self.publisher.publish(self._serialize(msg))
 
             success = self._acknowledge_condition_variable.wait_for(
                 lambda: len(self._received_acknowledgments)
@@ -282,6 +441,14 @@ class Synchronizer(WorldEntityWithClassBasedID):
             self._expected_acknowledgment_count = 0
             self._received_acknowledgments = set()
 
+    def _serialize(self, msg: Message) -> std_msgs.msg.String:
+        """
+        :param msg: The message to publish.
+        :return: The ROS string message containing the serialized message.
+        """
+        with self._mesh_serialization.activate():
+            return std_msgs.msg.String(data=json.dumps(to_json(msg)))
+
     def close(self):
         """
         Clean up publishers and subscribers.
@@ -302,6 +469,57 @@ class Synchronizer(WorldEntityWithClassBasedID):
             self.node.destroy_publisher(self.acknowledge_publisher)
             self.acknowledge_publisher = None
 
+        if self.mesh_content_subscriber is not None:
+            self.node.destroy_subscription(self.mesh_content_subscriber)
+            self.mesh_content_subscriber = None
+
+        if self.mesh_content_publisher is not None:
+            self.node.destroy_publisher(self.mesh_content_publisher)
+            self.mesh_content_publisher = None
+
+
+@dataclass
+class ReceivedStateTable:
+    """
+    The ids of the degrees of freedom of a sender in the order of its state, as received with a packed world state
+    update.
+    """
+
+    model_version: int
+    """
+    The model version of the sender that the table belongs to.
+    """
+
+    ids: List[UUID]
+    """
+    The ids of the degrees of freedom of the sender in the order of its state.
+    """
+
+    _local_indices: Optional[np.ndarray] = field(default=None, init=False)
+    """
+    The index of every degree of freedom of the table in the local state, or -1 if it is unknown.
+    """
+
+    _local_model_version: Optional[int] = field(default=None, init=False)
+    """
+    The local model version that the local indices have been computed for.
+    """
+
+    def local_indices(self, world: World) -> np.ndarray:
+        """
+        :param world: The local world.
+        :return: The index of every degree of freedom of the table in the state of the world, or -1 if the world
+            does not contain it.
+        """
+        model_version = world.get_world_model_manager().version
+        if self._local_model_version != model_version:
+            self._local_indices = np.array(
+                [world.state._index.get(identifier, -1) for identifier in self.ids],
+                dtype=int,
+            )
+            self._local_model_version = model_version
+        return self._local_indices
+
 
 @dataclass
 class ModelReloadSynchronizer(Synchronizer):
@@ -407,6 +625,31 @@ class WorldSynchronizer(Synchronizer, ModelChangeCallback, StateChangeCallback):
     These messages can be applied later by calling ``apply_missed_messages()``.
     """
 
+    state_table_resend_interval: int = 100
+    """
+    The number of packed state updates after which the table of degree of freedom ids is published again, together
+    with the complete state, so that receivers that missed the table or some updates recover.
+    """
+
+    _sent_state_table_key: Optional[Tuple[int, int]] = field(
+        default=None, init=False, repr=False
+    )
+    """
+    The model version and number of subscribers for which the table of degree of freedom ids has last been published.
+    """
+
+    _state_updates_since_state_table: int = field(default=0, init=False, repr=False)
+    """
+    The number of packed state updates that have been published without the table of degree of freedom ids.
+    """
+
+    _received_state_tables: Dict[MetaData, ReceivedStateTable] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    """
+    The latest table of degree of freedom ids of every sender.
+    """
+
     def __post_init__(self):
         Synchronizer.__post_init__(self)
         if self.synchronize_model:
@@ -438,16 +681,34 @@ class WorldSynchronizer(Synchronizer, ModelChangeCallback, StateChangeCallback):
         if not publish_changes:
             return
 
-        changes = self.compute_state_changes()
-        if not changes:
+        changed_indices = self.compute_changed_state_indices()
+        if len(changed_indices) == 0:
             return
 
-        state_message = WorldStateUpdate(
+        model_version = self._world.get_world_model_manager().version
+        state_table_key = (model_version, self._snapshot_subscribers())
+        send_state_table = (
+            state_table_key != self._sent_state_table_key
+            or self._state_updates_since_state_table >= self.state_table_resend_interval
+        )
+        if send_state_table:
+            # receivers that missed earlier updates catch up with the complete state
+            changed_indices = np.arange(len(self._world.state))
+            self._sent_state_table_key = state_table_key
+            self._state_updates_since_state_table = 0
+        else:
+            self._state_updates_since_state_table += 1
+
+        state_message = PackedWorldStateUpdate(
             meta_data=self.meta_data,
-            ids=list(changes.keys()),
-            states=list(changes.values()),
+            model_version=model_version,
+            indices=changed_indices,
+            values=self._world.state.positions[changed_indices],
+            ids=list(self._world.state.keys()) if send_state_table else None,
+        )
+        update = WorldUpdate(
+            meta_data=self.meta_data, packed_state_update=state_message
         )
-        update = WorldUpdate(meta_data=self.meta_data, state_update=state_message)
         self._publish_or_defer(update)
         self.update_previous_world_state()
 
@@ -469,30 +730,26 @@ class WorldSynchronizer(Synchronizer, ModelChangeCallback, StateChangeCallback):
         else:
             self.publish(update)
 
-    def compute_state_changes(self) -> Dict[UUID, float]:
-        """Return only DOF positions that changed since the last snapshot."""
-        degree_of_freedom_identifiers = self._world.state.keys()
+    def compute_changed_state_indices(self) -> np.ndarray:
+        """Return the indices of the DOF positions that changed since the last snapshot."""
         current_positions = self._world.state.positions
         previous_positions = self.previous_world_state_data
 
         if previous_positions.shape != current_positions.shape:
-            return {
-                identifier: float(value)
-                for identifier, value in zip(
-                    degree_of_freedom_identifiers, current_positions
-                )
-            }
+            return np.arange(len(current_positions))
 
         changed_mask = ~np.isclose(
             current_positions, previous_positions, rtol=1e-8, atol=1e-12, equal_nan=True
         )
-        if not np.any(changed_mask):
-            return {}
+        return np.flatnonzero(changed_mask)
 
-        changed_indices = np.nonzero(changed_mask)[0]
+    def compute_state_changes(self) -> Dict[UUID, float]:
+        """Return only DOF positions that changed since the last snapshot."""
+        degree_of_freedom_identifiers = self._world.state.keys()
+        current_positions = self._world.state.positions
         return {
             degree_of_freedom_identifiers[index]: float(current_positions[index])
-            for index in changed_indices
+            for index in self.compute_changed_state_indices()
         }
 
     def _subscription_callback(self, message: WorldUpdate):
@@ -513,6 +770,8 @@ class WorldSynchronizer(Synchronizer, ModelChangeCallback, StateChangeCallback):
                 self._apply_model(message.modification_block)
             if message.state_update is not None:
                 self._apply_state(message.state_update)
+            if message.packed_state_update is not None:
+                self._apply_packed_state(message.packed_state_update)
 
     def _apply_model(self, modification_block_message: ModificationBlock):
         """
@@ -549,6 +808,45 @@ class WorldSynchronizer(Synchronizer, ModelChangeCallback, StateChangeCallback):
             self.update_previous_world_state()
         self._world.notify_state_change(publish_changes=False)
 
+    def _apply_packed_state(self, state_update_message: PackedWorldStateUpdate):
+        """
+        Applies a packed state update, using the table of degree of freedom ids of its sender to map its indices to
+        the local state.
+        Updates whose table has not been received are skipped, since the sender periodically publishes the table
+        together with the complete state.
+        Raises a StateUpdateContainsUnknownDegreesOfFreedomError if we receive unknown degrees of freedom.
+        """
+        sender = state_update_message.meta_data
+        if state_update_message.ids is not None:
+            self._received_state_tables[sender] = ReceivedStateTable(
+                model_version=state_update_message.model_version,
+                ids=state_update_message.ids,
+            )
+        state_table = self._received_state_tables.get(sender)
+        if (
+            state_table is None
+            or state_table.model_version != state_update_message.model_version
+        ):
+            self.node.get_logger().warning(
+                f"Skipping a state update for model version {state_update_message.model_version} of "
+                f"{sender.node_name}, since its table of degree of freedom ids has not been received yet."
+            )
+            return
+
+        indices = state_table.local_indices(self._world)[state_update_message.indices]
+        unknown = indices < 0
+        if np.any(unknown):
+            raise StateUpdateContainsUnknownDegreesOfFreedomError(
+                unknown_identifiers=[
+                    state_table.ids[index]
+                    for index in state_update_message.indices[unknown]
+                ]
+            )
+        with self._world._world_lock:
+            self._world.state._data[0, indices] = state_update_message.values
+            self.update_previous_world_state()
+        self._world.notify_state_change(publish_changes=False)
+
     def apply_missed_messages(self):
         """Apply buffered messages accumulated while the synchronizer was paused.
 
@@ -26,19 +26,109 @@ from semantic_digital_twin.world_description.world_entity import (
 class CollisionCheckingResult:
     """
     Result of a collision checking operation.
+    The contacts are stored column-wise, such that consumers can process all of them with numpy.
     """
 
-    contacts: list[ClosestPoints] = field(default_factory=list)
+    bodies: list[Body] = field(default_factory=list)
     """
-    List of contacts detected during the collision checking operation.
+    The bodies that the body indices of the contacts refer to.
+    """
+    body_a_indices: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=int))
+    """
+    Index of the first body of every contact in `bodies`.
+    """
+    body_b_indices: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=int))
+    """
+    Index of the second body of every contact in `bodies`.
+    """
+    distances: np.ndarray = field(default_factory=lambda: np.empty(0))
+    """
+    Closest distance between the two bodies of every contact.
+    """
+    root_P_points_on_body_a: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 4))
+    )
+    """
+    Closest point on body_a of every contact with respect to the worlds root, shape (number of contacts, 4).
+    """
+    root_P_points_on_body_b: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 4))
+    )
+    """
+    Closest point on body_b of every contact with respect to the worlds root, shape (number of contacts, 4).
+    """
+    root_V_contact_normals_from_b_to_a: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 4))
+    )
+    """
+    Contact normal of every contact with respect to the worlds root, shape (number of contacts, 4).
     """
 
+    @classmethod
+    def from_contacts(cls, contacts: list[ClosestPoints]) -> Self:
+        """
+        Creates a result from a list of contacts.
+        :param contacts: The contacts.
+        :return: The result with one row per contact.
+        """
+        index_of_body: dict[Body, int] = {}
+        body_a_indices = [
+            index_of_body.setdefault(contact.body_a, len(index_of_body))
+            for contact in contacts
+        ]
+        body_b_indices = [
+            index_of_body.setdefault(contact.body_b, len(index_of_body))
+            for contact in contacts
+        ]
+        return cls(
+            bodies=list(index_of_body),
+            body_a_indices=np.array(body_a_indices, dtype=int),
+            body_b_indices=np.array(body_b_indices, dtype=int),
+            distances=np.array([contact.distance for contact in contacts], dtype=float),
+            root_P_points_on_body_a=np.array(
+                [contact.root_P_point_on_body_a for contact in contacts], dtype=float
+            ).reshape(-1, 4),
+            root_P_points_on_body_b=np.array(
+                [contact.root_P_point_on_body_b for contact in contacts], dtype=float
+            ).reshape(-1, 4),
+            root_V_contact_normals_from_b_to_a=np.array(
+                [contact.root_V_contact_normal_from_b_to_a for contact in contacts],
+                dtype=float,
+            ).reshape(-1, 4),
+        )
+
+    def __len__(self) -> int:
+        return len(self.distances)
+
     def any(self) -> bool:
         """
         Check if there are any contacts in the result.
         :return: True if there are contacts, False otherwise.
         """
-        return len(self.contacts) > 0
+        return len(self) > 0
+
+    def get_contact(self, index: int) -> ClosestPoints:
+        """
+        :param index: The index of the contact.
+        :return: The contact at `index`.
+        """
+        return ClosestPoints(
+            body_a=self.bodies[self.body_a_indices[index]],
+            body_b=self.bodies[self.body_b_indices[index]],
+            distance=float(self.distances[index]),
+            root_P_point_on_body_a=self.root_P_points_on_body_a[index],
+            root_P_point_on_body_b=self.root_P_points_on_body_b[index],
+            root_V_contact_normal_from_b_to_a=self.root_V_contact_normals_from_b_to_a[
+                index
+            ],
+        )
+
+    @property
+    def contacts(self) -> list[ClosestPoints]:
+        """
+        List of contacts detected during the collision checking operation.
+        """
+        return [self.get_contact(index) for index in range(len(self))]
 
 
 @dataclass
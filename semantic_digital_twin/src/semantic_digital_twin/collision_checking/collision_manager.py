@@ -234,6 +234,8 @@ class CollisionManager(ModelChangeCallback):
         """
         self.collision_matrix = collision_matrix
         clear_memoization_cache(self)
+        for consumer in self.collision_consumers:
+            consumer.on_collision_matrix_update()
 
     def compute_collisions(self) -> CollisionCheckingResult:
         """
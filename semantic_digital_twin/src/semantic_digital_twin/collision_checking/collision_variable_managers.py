@@ -1,7 +1,11 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Callable
+from typing import Callable, Any
+
+from typing_extensions import TYPE_CHECKING
 
 import numpy as np
 
@@ -21,6 +25,9 @@ from semantic_digital_twin.spatial_types import Vector3, Point3
 from semantic_digital_twin.spatial_types.math import inverse_frame
 from semantic_digital_twin.world_description.world_entity import Body
 
+if TYPE_CHECKING:
+    from semantic_digital_twin.world import World
+
 
 @dataclass
 class BaseCollisionVariableManager(CollisionGroupConsumer, ABC):
@@ -54,6 +61,66 @@ class BaseCollisionVariableManager(CollisionGroupConsumer, ABC):
     """
     A block that is used to reset the collision data.
     """
+    _lookup_tables_outdated: bool = field(default=True, init=False)
+    """
+    Whether the lookup tables have to be recomputed before the next collision results are ingested.
+    They become outdated when the world model, the collision matrix or the registrations change.
+    """
+    _slot_of_body: dict[Body, int] = field(default_factory=dict, init=False)
+    """
+    Maps every body of the collision groups to its row in the lookup tables.
+    Bodies that are not in any collision group use the last row.
+    """
+    _buffer_distances: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 0)), init=False
+    )
+    """
+    The buffer-zone distance of every avoided body pair, indexed by the slots of body a and body b.
+    """
+    _violated_distances: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 0)), init=False
+    )
+    """
+    The violated distance of every avoided body pair, indexed by the slots of body a and body b.
+    """
+    _result_bodies: list[Body] | None = field(default=None, init=False)
+    """
+    The bodies of the last ingested collision checking result.
+    """
+    _slots_of_result_bodies: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=int), init=False
+    )
+    """
+    The slot of every body of the last ingested collision checking result.
+    """
+    _registered_keys: list[Any] = field(default_factory=list, init=False)
+    """
+    The registered groups or group combinations in the order of the indices used in the lookup tables.
+    """
+    _last_collision_result: CollisionCheckingResult = field(
+        default_factory=CollisionCheckingResult, init=False
+    )
+    """
+    The last ingested collision checking result.
+    """
+    _last_contact_indices: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=int), init=False
+    )
+    """
+    The contacts of the last result that belong to a registered key, sorted by key and distance.
+    """
+    _last_contact_keys: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=int), init=False
+    )
+    """
+    The index of the registered key of every contact in `_last_contact_indices`.
+    """
+    _last_contact_swapped: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=bool), init=False
+    )
+    """
+    Whether body a and body b of every contact in `_last_contact_indices` are swapped for its registered key.
+    """
 
     def __post_init__(self):
         self._single_reset_block = np.zeros(self.block_size)
@@ -104,8 +171,155 @@ class BaseCollisionVariableManager(CollisionGroupConsumer, ABC):
         """
         self.float_variable_data.data[self._reset_indices] = self._reset_values
 
+    def on_world_model_update(self, world: World):
+        super().on_world_model_update(world)
+        self._lookup_tables_outdated = True
+
     def on_collision_matrix_update(self):
-        pass
+        self._lookup_tables_outdated = True
+
+    @property
+    def last_closest_contacts(self) -> dict[Any, list[ClosestPoints]]:
+        """
+        The contacts of the last collision check for every registered key, sorted by distance.
+        Body a of every contact belongs to the first group of its key.
+        """
+        contacts = defaultdict(list)
+        for index, key, swapped in zip(
+            self._last_contact_indices,
+            self._last_contact_keys,
+            self._last_contact_swapped,
+        ):
+            contact = self._last_collision_result.get_contact(index)
+            contacts[self._registered_keys[key]].append(
+                contact.reverse() if swapped else contact
+            )
+        return contacts
+
+    @abstractmethod
+    def _update_group_tables(self, bodies: list[Body]):
+        """
+        Recomputes the lookup tables that map slots to registered keys.
+        :param bodies: The bodies of the collision groups in the order of their slots.
+        """
+
+    @abstractmethod
+    def _is_avoided_pair(self, slot_a: int, slot_b: int) -> bool:
+        """
+        :return: Whether the contacts between the bodies in the slots are written into the data buffer,
+            with body a in the first group of the key.
+        """
+
+    def _update_lookup_tables(self):
+        """
+        Recomputes the lookup tables, including the buffer-zone and violated distances of all avoided body pairs
+        of the collision matrix, such that they don't have to be looked up per contact.
+        """
+        bodies = [body for group in self.collision_groups for body in group.bodies]
+        self._slot_of_body = {body: slot for slot, body in enumerate(bodies)}
+        self._result_bodies = None
+        self._update_group_tables(bodies)
+
+        self._buffer_distances = np.full((len(bodies) + 1, len(bodies) + 1), np.nan)
+        self._violated_distances = np.full_like(self._buffer_distances, np.nan)
+        for collision_check in self.collision_manager.collision_matrix.collision_checks:
+            for body_a, body_b in [
+                (collision_check.body_a, collision_check.body_b),
+                (collision_check.body_b, collision_check.body_a),
+            ]:
+                slot_a = self._slot_of_body.get(body_a)
+                slot_b = self._slot_of_body.get(body_b)
+                if slot_a is None or slot_b is None:
+                    continue
+                if not self._is_avoided_pair(slot_a, slot_b):
+                    continue
+                self._buffer_distances[slot_a, slot_b] = (
+                    self.collision_manager.get_buffer_zone_distance(body_a, body_b)
+                )
+                self._violated_distances[slot_a, slot_b] = (
+                    self.collision_manager.get_violated_distance(body_a, body_b)
+                )
+        self._lookup_tables_outdated = False
+
+    def _get_body_slots(
+        self, collision_result: CollisionCheckingResult
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        :param collision_result: The collision checking result to ingest.
+        :return: The slots of body a and body b of every contact.
+        """
+        if self._lookup_tables_outdated:
+            self._update_lookup_tables()
+        if collision_result.bodies is not self._result_bodies:
+            self._result_bodies = collision_result.bodies
+            self._slots_of_result_bodies = np.fromiter(
+                (
+                    self._slot_of_body.get(body, len(self._slot_of_body))
+                    for body in collision_result.bodies
+                ),
+                dtype=int,
+                count=len(collision_result.bodies),
+            )
+        return (
+            self._slots_of_result_bodies[collision_result.body_a_indices],
+            self._slots_of_result_bodies[collision_result.body_b_indices],
+        )
+
+    def _store_last_contacts(
+        self,
+        collision_result: CollisionCheckingResult,
+        contact_indices: np.ndarray,
+        keys: np.ndarray,
+        swapped: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sorts the contacts that belong to registered keys by key and distance and remembers them for
+        `last_closest_contacts`.
+        :param collision_result: The ingested collision checking result.
+        :param contact_indices: The contacts that belong to a registered key.
+        :param keys: The index of the registered key of every contact.
+        :param swapped: Whether body a and body b of every contact are swapped for its key.
+        :return: The sorted contact indices, keys and swapped flags.
+        """
+        order = np.lexsort((collision_result.distances[contact_indices], keys))
+        self._last_collision_result = collision_result
+        self._last_contact_indices = contact_indices[order]
+        self._last_contact_keys = keys[order]
+        self._last_contact_swapped = swapped[order]
+        return (
+            self._last_contact_indices,
+            self._last_contact_keys,
+            self._last_contact_swapped,
+        )
+
+    @staticmethod
+    def _compute_group_T_root(
+        groups: list[CollisionGroup], group_indices: np.ndarray
+    ) -> np.ndarray:
+        """
+        Computes the transformation from the world root to the root of every group once per group.
+        :param groups: The groups.
+        :param group_indices: Indices into `groups`.
+        :return: The transformation of the group of every index, shape (number of indices, 4, 4).
+        """
+        unique_indices, inverse = np.unique(group_indices, return_inverse=True)
+        group_T_root = np.empty((len(unique_indices), 4, 4))
+        for i, group_index in enumerate(unique_indices):
+            root = groups[group_index].root
+            group_T_root[i] = root._world.compute_forward_kinematics_np(
+                root, root._world.root
+            )
+        return group_T_root[inverse]
+
+    def _write_data_blocks(self, start_indices: np.ndarray, blocks: np.ndarray):
+        """
+        Writes data blocks into the collision buffer with a single scatter.
+        :param start_indices: The index of the first entry of every block in the collision buffer.
+        :param blocks: The blocks, shape (number of blocks, block size).
+        """
+        self.float_variable_data.data[
+            start_indices[:, None] + np.arange(self.block_size)
+        ] = blocks
 
 
 @dataclass
@@ -150,95 +364,118 @@ class ExternalCollisionVariableManager(BaseCollisionVariableManager):
     Offset of the violated_distance variable in the block.
     """
 
-    last_closest_contacts: dict[CollisionGroup, list[ClosestPoints]] = field(init=False)
+    _registered_group_of_slot: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=int), init=False
+    )
+    """
+    The index of the registered group of the body in every slot, or -1 if it does not belong to one.
+    """
+    _group_start_indices: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=int), init=False
+    )
+    """
+    The index of the first data block of every registered group in the collision buffer.
+    """
+    _group_max_avoided_bodies: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=int), init=False
+    )
+    """
+    The maximum number of avoided collisions of every registered group.
+    """
 
     def get_contact_distance_offset(self) -> int:
         return self._contact_distance_offset
 
+    def _update_group_tables(self, bodies: list[Body]):
+        self._registered_keys = list(self.registered_groups)
+        index_of_registered_group = {
+            group: index for index, group in enumerate(self._registered_keys)
+        }
+        self._registered_group_of_slot = np.full(len(bodies) + 1, -1)
+        for group in self.collision_groups:
+            for body in group.bodies:
+                self._registered_group_of_slot[self._slot_of_body[body]] = (
+                    index_of_registered_group.get(group, -1)
+                )
+        self._group_start_indices = np.array(
+            list(self.registered_groups.values()), dtype=int
+        )
+        self._group_max_avoided_bodies = np.array(
+            [
+                group.get_max_avoided_bodies(self.collision_manager)
+                for group in self._registered_keys
+            ],
+            dtype=int,
+        )
+
+    def _is_avoided_pair(self, slot_a: int, slot_b: int) -> bool:
+        return (
+            self._registered_group_of_slot[slot_a] >= 0
+            and self._registered_group_of_slot[slot_b] < 0
+        )
+
     def on_compute_collisions(self, collision: CollisionCheckingResult):
         """
         Takes collisions, checks if they are external, and inserts them
         into the buffer at the right place.
+        The closest collisions of every registered group are selected with a sort by group and distance,
+        and all data blocks are written with a single scatter.
         """
         self.reset_collision_data()
-        self.last_closest_contacts = defaultdict(list)
-        for collision in collision.contacts:
-            group_a = self.get_collision_group(collision.body_a)
-            group_b = self.get_collision_group(collision.body_b)
-            if (group_a in self.registered_groups) == (
-                group_b in self.registered_groups
-            ):
-                continue
-            if group_a not in self.registered_groups:
-                # swap group_a and group_b, such that group_a is the registered group
-                collision = collision.reverse()
-                group_a, group_b = group_b, group_a
-            self.last_closest_contacts[group_a].append(collision)
-
-        for group_a, collisions in self.last_closest_contacts.items():
-            collisions = sorted(collisions, key=lambda c: c.distance)
-            for i in range(
-                min(
-                    len(collisions),
-                    group_a.get_max_avoided_bodies(self.collision_manager),
-                )
-            ):
-                collision = collisions[i]
-                group_a_T_root = group_a.root._world.compute_forward_kinematics_np(
-                    group_a.root, group_a.root._world.root
-                )
-                group_a_P_pa = group_a_T_root @ collision.root_P_point_on_body_a
-                self.insert_data_block(
-                    group=group_a,
-                    idx=i,
-                    group_a_P_point_on_a=group_a_P_pa,
-                    root_V_contact_normal=collision.root_V_contact_normal_from_b_to_a,
-                    contact_distance=collision.distance,
-                    buffer_distance=self.collision_manager.get_buffer_zone_distance(
-                        collision.body_a, collision.body_b
-                    ),
-                    violated_distance=self.collision_manager.get_violated_distance(
-                        collision.body_a, collision.body_b
-                    ),
-                )
+        slots_a, slots_b = self._get_body_slots(collision)
+        groups_a = self._registered_group_of_slot[slots_a]
+        groups_b = self._registered_group_of_slot[slots_b]
+        # swap body a and body b, such that body a belongs to the registered group
+        swapped = groups_a < 0
+        external = np.flatnonzero(swapped != (groups_b < 0))
+        contact_indices, groups, swapped = self._store_last_contacts(
+            collision,
+            external,
+            np.where(swapped, groups_b, groups_a)[external],
+            swapped[external],
+        )
 
-    def insert_data_block(
-        self,
-        group: CollisionGroup,
-        idx: int,
-        group_a_P_point_on_a: np.ndarray,
-        root_V_contact_normal: np.ndarray,
-        contact_distance: float,
-        buffer_distance: float,
-        violated_distance: float,
-    ):
-        """
-        Inserts a data block into the collision buffer.
-        :param group: Registered collision group of the external collision.
-        :param idx: Index of the collision in the collision buffer.
-        :param group_a_P_point_on_a: Point on body A in the contact frame.
-        :param root_V_contact_normal: Contact normal in the root frame.
-        :param contact_distance: Distance between the bodies at the contact point.
-        :param buffer_distance: Buffer distance for collision detection.
-        :param violated_distance: Violated distance for collision detection.
-        """
-        start_idx = self.registered_groups[group] + idx * self.block_size
-        self.float_variable_data.data[
-            start_idx : start_idx + self._contact_normal_offset
-        ] = group_a_P_point_on_a[:3]
-        self.float_variable_data.data[
-            start_idx
-            + self._contact_normal_offset : start_idx
-            + self._contact_distance_offset
-        ] = root_V_contact_normal[:3]
-        self.float_variable_data.data[start_idx + self._contact_distance_offset] = (
-            contact_distance
+        rank_in_group = np.arange(len(groups)) - np.searchsorted(groups, groups)
+        kept = rank_in_group < self._group_max_avoided_bodies[groups]
+        contact_indices, groups, swapped, rank_in_group = (
+            contact_indices[kept],
+            groups[kept],
+            swapped[kept],
+            rank_in_group[kept],
         )
-        self.float_variable_data.data[start_idx + self._buffer_distance_offset] = (
-            buffer_distance
+        if len(contact_indices) == 0:
+            return
+
+        slots_a, slots_b = slots_a[contact_indices], slots_b[contact_indices]
+        slots_a, slots_b = (
+            np.where(swapped, slots_b, slots_a),
+            np.where(swapped, slots_a, slots_b),
+        )
+        root_P_point_on_a = np.where(
+            swapped[:, None],
+            collision.root_P_points_on_body_b[contact_indices],
+            collision.root_P_points_on_body_a[contact_indices],
+        )
+        root_V_contact_normal = (
+            collision.root_V_contact_normals_from_b_to_a[contact_indices]
+            * np.where(swapped, -1.0, 1.0)[:, None]
+        )
+        group_a_T_root = self._compute_group_T_root(self._registered_keys, groups)
+        group_a_P_point_on_a = np.einsum(
+            "nij,nj->ni", group_a_T_root, root_P_point_on_a
         )
-        self.float_variable_data.data[start_idx + self._violated_distance_offset] = (
-            violated_distance
+
+        self._write_data_blocks(
+            self._group_start_indices[groups] + rank_in_group * self.block_size,
+            np.column_stack(
+                (
+                    group_a_P_point_on_a[:, :3],
+                    root_V_contact_normal[:, :3],
+                    collision.distances[contact_indices],
+                    self._buffer_distances[slots_a, slots_b],
+                    self._violated_distances[slots_a, slots_b],
+                )
+            ),
         )
 
     def register_group_of_body(self, body: Body):
@@ -250,6 +487,7 @@ class ExternalCollisionVariableManager(BaseCollisionVariableManager):
             return
         start_idx = len(self.float_variable_data.data)
         self.registered_groups[group] = start_idx
+        self._lookup_tables_outdated = True
         for index in range(group.get_max_avoided_bodies(self.collision_manager)):
             block_start_idx = len(self.float_variable_data.data)
             self._block_start_indices.append(block_start_idx)
@@ -327,9 +565,25 @@ class SelfCollisionVariableManager(BaseCollisionVariableManager):
     Maps body combinations to the index of point_on_body_a in the collision buffer.
     """
 
-    last_closest_contacts: dict[
-        tuple[CollisionGroup, CollisionGroup], list[ClosestPoints]
-    ] = field(init=False)
+    _group_of_slot: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=int), init=False
+    )
+    """
+    The index of the collision group of the body in every slot, or -1 if it does not belong to one.
+    """
+    _combination_of_group_pair: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 0), dtype=int), init=False
+    )
+    """
+    The index of the registered group combination of every pair of collision group indices, or -1 if the pair
+    is not registered. The last row and column belong to bodies without collision group.
+    """
+    _combination_start_indices: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=int), init=False
+    )
+    """
+    The index of the data block of every registered group combination in the collision buffer.
+    """
 
     @property
     def block_size(self) -> int:
@@ -363,108 +617,105 @@ class SelfCollisionVariableManager(BaseCollisionVariableManager):
     def get_contact_distance_offset(self) -> int:
         return self._contact_distance_offset
 
-    def on_compute_collisions(self, collision_result: CollisionCheckingResult):
-        """
-        Takes collisions, checks if they are external, and inserts them
-        into the buffer at the right place.
-        """
-        self.reset_collision_data()
-        self.last_closest_contacts = defaultdict(list)
-        for collision in collision_result.contacts:
-            key = (
-                self.get_collision_group(collision.body_b),
-                self.get_collision_group(collision.body_a),
-            )
-            # 1. check if collision is external
-            if key in self.registered_group_combinations:
-                collision = collision.reverse()
-            else:
-                key = tuple(reversed(key))
-            if key not in self.registered_group_combinations:
-                continue
-            self.last_closest_contacts[key].append(collision)
-
-        for key, collisions in self.last_closest_contacts.items():
-            self.last_closest_contacts[key] = sorted(
-                collisions, key=lambda c: c.distance
-            )
-
-        for (group_a, group_b), collisions in self.last_closest_contacts.items():
-            closest_contact = collisions[0]
-            group_a_T_root = group_a.root._world.compute_forward_kinematics_np(
-                group_a.root, group_a.root._world.root
-            )
-            group_a_P_pa = group_a_T_root @ closest_contact.root_P_point_on_body_a
-
-            group_b_T_root = group_b.root._world.compute_forward_kinematics_np(
-                group_b.root, group_b.root._world.root
-            )
-            group_b_P_pb = group_b_T_root @ closest_contact.root_P_point_on_body_b
-
-            group_b_V_contact_normal = (
-                group_b_T_root @ closest_contact.root_V_contact_normal_from_b_to_a
-            )
+    def _update_group_tables(self, bodies: list[Body]):
+        self._registered_keys = list(self.registered_group_combinations)
+        self._group_of_slot = np.full(len(bodies) + 1, -1)
+        for group_index, group in enumerate(self.collision_groups):
+            for body in group.bodies:
+                self._group_of_slot[self._slot_of_body[body]] = group_index
+        index_of_group = {
+            group: index for index, group in enumerate(self.collision_groups)
+        }
+        self._combination_of_group_pair = np.full(
+            (len(self.collision_groups) + 1, len(self.collision_groups) + 1), -1
+        )
+        for combination_index, (group_a, group_b) in enumerate(self._registered_keys):
+            if group_a in index_of_group and group_b in index_of_group:
+                self._combination_of_group_pair[
+                    index_of_group[group_a], index_of_group[group_b]
+                ] = combination_index
+        self._combination_start_indices = np.array(
+            list(self.registered_group_combinations.values()), dtype=int
+        )
 
-            self.insert_data_block(
-                group_a=group_a,
-                group_b=group_b,
-                group_a_P_point_on_a=group_a_P_pa,
-                group_b_P_point_on_b=group_b_P_pb,
-                group_b_V_contact_normal=group_b_V_contact_normal,
-                contact_distance=closest_contact.distance,
-                buffer_distance=self.collision_manager.get_buffer_zone_distance(
-                    closest_contact.body_a, closest_contact.body_b
-                ),
-                violated_distance=self.collision_manager.get_violated_distance(
-                    closest_contact.body_a, closest_contact.body_b
-                ),
-            )
+    def _is_avoided_pair(self, slot_a: int, slot_b: int) -> bool:
+        return (
+            self._combination_of_group_pair[
+                self._group_of_slot[slot_a], self._group_of_slot[slot_b]
+            ]
+            >= 0
+        )
 
-    def insert_data_block(
-        self,
-        group_a: CollisionGroup,
-        group_b: CollisionGroup,
-        group_a_P_point_on_a: np.ndarray,
-        group_b_P_point_on_b: np.ndarray,
-        group_b_V_contact_normal: np.ndarray,
-        contact_distance: float,
-        buffer_distance: float,
-        violated_distance: float,
-    ):
+    def on_compute_collisions(self, collision_result: CollisionCheckingResult):
         """
-        Inserts a data block into the collision buffer.
-        :param group_a: Registered collision group of body A.
-        :param group_b: Registered collision group of body B.
-        :param group_a_P_point_on_a: Point on body A in the contact frame.
-        :param group_b_P_point_on_b: Point on body B in the contact frame.
-        :param group_b_V_contact_normal: Contact normal in the root frame.
-        :param contact_distance: Distance between the bodies at the contact point.
-        :param buffer_distance: Buffer distance for collision detection.
-        :param violated_distance: Violated distance for collision detection.
+        Takes collisions, checks if they are between registered group combinations, and inserts the closest one
+        of every combination into the buffer at the right place.
+        The closest collisions are selected with a sort by combination and distance,
+        and all data blocks are written with a single scatter.
         """
-        block_start_idx = self.registered_group_combinations[group_a, group_b]
-
-        start_idx = block_start_idx + self._point_on_a_offset
-        end_idx = block_start_idx + self._point_on_b_offset
-        self.float_variable_data.data[start_idx:end_idx] = group_a_P_point_on_a[:3]
+        self.reset_collision_data()
+        slots_a, slots_b = self._get_body_slots(collision_result)
+        groups_a = self._group_of_slot[slots_a]
+        groups_b = self._group_of_slot[slots_b]
+        # swap body a and body b, if the combination is registered the other way around
+        reversed_combinations = self._combination_of_group_pair[groups_b, groups_a]
+        swapped = reversed_combinations >= 0
+        combinations = np.where(
+            swapped,
+            reversed_combinations,
+            self._combination_of_group_pair[groups_a, groups_b],
+        )
+        registered = np.flatnonzero(combinations >= 0)
+        contact_indices, combinations, swapped = self._store_last_contacts(
+            collision_result,
+            registered,
+            combinations[registered],
+            swapped[registered],
+        )
 
-        start_idx = end_idx
-        end_idx = block_start_idx + self._contact_normal_offset
-        self.float_variable_data.data[start_idx:end_idx] = group_b_P_point_on_b[:3]
+        closest = np.flatnonzero(np.diff(combinations, prepend=-1))
+        if len(closest) == 0:
+            return
+        contact_indices, combinations, swapped = (
+            contact_indices[closest],
+            combinations[closest],
+            swapped[closest],
+        )
 
-        start_idx = end_idx
-        end_idx = block_start_idx + self._contact_distance_offset
-        self.float_variable_data.data[start_idx:end_idx] = group_b_V_contact_normal[:3]
+        slots_a, slots_b = slots_a[contact_indices], slots_b[contact_indices]
+        slots_a, slots_b = (
+            np.where(swapped, slots_b, slots_a),
+            np.where(swapped, slots_a, slots_b),
+        )
+        points_on_a = collision_result.root_P_points_on_body_a[contact_indices]
+        points_on_b = collision_result.root_P_points_on_body_b[contact_indices]
+        root_P_point_on_a = np.where(swapped[:, None], points_on_b, points_on_a)
+        root_P_point_on_b = np.where(swapped[:, None], points_on_a, points_on_b)
+        root_V_contact_normal = (
+            collision_result.root_V_contact_normals_from_b_to_a[contact_indices]
+            * np.where(swapped, -1.0, 1.0)[:, None]
+        )
 
-        self.float_variable_data.data[
-            block_start_idx + self._contact_distance_offset
-        ] = contact_distance
-        self.float_variable_data.data[
-            block_start_idx + self._buffer_distance_offset
-        ] = buffer_distance
-        self.float_variable_data.data[
-            block_start_idx + self._violated_distance_offset
-        ] = violated_distance
+        groups_a = [group_a for group_a, _ in self._registered_keys]
+        groups_b = [group_b for _, group_b in self._registered_keys]
+        group_a_T_root = self._compute_group_T_root(groups_a, combinations)
+        group_b_T_root = self._compute_group_T_root(groups_b, combinations)
+
+        self._write_data_blocks(
+            self._combination_start_indices[combinations],
+            np.column_stack(
+                (
+                    np.einsum("nij,nj->ni", group_a_T_root, root_P_point_on_a)[:, :3],
+                    np.einsum("nij,nj->ni", group_b_T_root, root_P_point_on_b)[:, :3],
+                    np.einsum("nij,nj->ni", group_b_T_root, root_V_contact_normal)[
+                        :, :3
+                    ],
+                    collision_result.distances[contact_indices],
+                    self._buffer_distances[slots_a, slots_b],
+                    self._violated_distances[slots_a, slots_b],
+                )
+            ),
+        )
 
     def body_pair_to_group_pair(
         self, body_a: Body, body_b: Body
@@ -486,6 +737,7 @@ class SelfCollisionVariableManager(BaseCollisionVariableManager):
 
         start_idx = len(self.float_variable_data.data)
         self.registered_group_combinations[key] = start_idx
+        self._lookup_tables_outdated = True
         self._block_start_indices.append(start_idx)
         self._update_reset_indices(start_idx)
         self.get_group_a_P_point_on_a_symbol(*key)
@@ -17,7 +17,6 @@ from platformdirs import user_cache_dir
 from semantic_digital_twin.collision_checking.collision_detector import (
     CollisionDetector,
     CollisionCheckingResult,
-    ClosestPoints,
 )
 from semantic_digital_twin.collision_checking.collision_matrix import CollisionMatrix
 from semantic_digital_twin.pipeline.mesh_decomposition.base import MeshDecomposer
@@ -311,6 +310,14 @@ class BulletCollisionDetector(CollisionDetector):
     The bullet collision objects in the order they are added to the world.
     This is only a cache for performance reasons.
     """
+    _ordered_bodies: List[Body] = field(default_factory=list, init=False)
+    """
+    The bodies of `_ordered_bullet_objects`, which the body indices of the collision checking results refer to.
+    """
+    _index_of_body_id: Dict[UUID, int] = field(default_factory=dict, init=False)
+    """
+    Maps the id of every body to its index in `_ordered_bodies`.
+    """
     mesh_decomposer: Optional[MeshDecomposer] = field(
         default_factory=VHACDMeshDecomposer
     )
@@ -328,6 +335,10 @@ class BulletCollisionDetector(CollisionDetector):
         for body in self._world.bodies_with_collision:
             self.add_body(body)
         self._ordered_bullet_objects = list(self.body_to_bullet_object.values())
+        self._ordered_bodies = list(self.body_to_bullet_object.keys())
+        self._index_of_body_id = {
+            body.id: index for index, body in enumerate(self._ordered_bodies)
+        }
 
     def clear(self):
         for o in self.kineverse_world.collision_objects:
@@ -372,19 +383,29 @@ class BulletCollisionDetector(CollisionDetector):
             self.kineverse_world.get_closest_filtered_map_batch(query)
         )
         return CollisionCheckingResult(
-            [
-                ClosestPoints(
-                    body_a=self._world.get_kinematic_structure_entity_by_id(
-                        collision.obj_a.name
-                    ),
-                    body_b=self._world.get_kinematic_structure_entity_by_id(
-                        collision.obj_b.name
-                    ),
-                    distance=collision.contact_distance,
-                    root_P_point_on_body_a=collision.map_P_pa,
-                    root_P_point_on_body_b=collision.map_P_pb,
-                    root_V_contact_normal_from_b_to_a=collision.world_V_n,
-                )
-                for collision in result
-            ]
+            bodies=self._ordered_bodies,
+            body_a_indices=np.fromiter(
+                (self._index_of_body_id[collision.obj_a.name] for collision in result),
+                dtype=int,
+                count=len(result),
+            ),
+            body_b_indices=np.fromiter(
+                (self._index_of_body_id[collision.obj_b.name] for collision in result),
+                dtype=int,
+                count=len(result),
+            ),
+            distances=np.fromiter(
+                (collision.contact_distance for collision in result),
+                dtype=float,
+                count=len(result),
+            ),
+            root_P_points_on_body_a=np.array(
+                [collision.map_P_pa for collision in result], dtype=float
+            ).reshape(-1, 4),
+            root_P_points_on_body_b=np.array(
+                [collision.map_P_pb for collision in result], dtype=float
+            ).reshape(-1, 4),
+            root_V_contact_normals_from_b_to_a=np.array(
+                [collision.world_V_n for collision in result], dtype=float
+            ).reshape(-1, 4),
         )
@@ -3,14 +3,17 @@ from dataclasses import dataclass, field
 import fcl
 import numpy as np
 from trimesh.collision import CollisionManager, mesh_to_BVH
-from typing_extensions import Optional, Dict
+from typing_extensions import Optional, Dict, List
 
 from semantic_digital_twin.collision_checking.collision_detector import (
     CollisionDetector,
     ClosestPoints,
     CollisionCheckingResult,
 )
-from semantic_digital_twin.collision_checking.collision_matrix import CollisionMatrix
+from semantic_digital_twin.collision_checking.collision_matrix import (
+    CollisionMatrix,
+    CollisionCheck,
+)
 from semantic_digital_twin.world_description.world_entity import Body
 
 
@@ -36,7 +39,22 @@ class FCLCollisionDetector(CollisionDetector):
     """
     The FCL collision objects for each body in the world
     """
+    _local_aabbs: Dict[Body, np.ndarray] = field(default_factory=dict, init=False)
+    """
+    The axis aligned bounding box of each body's collision mesh in its own frame, stored as a (2, 3) array of
+    lower and upper corner.
+    """
+    _world_aabbs: Dict[Body, np.ndarray] = field(default_factory=dict, init=False)
+    """
+    The axis aligned bounding box of each body's collision mesh in the world frame, updated together with the
+    transforms of the FCL collision objects.
+    """
     buffer: float = field(default=0.05, init=False)
+    use_broadphase: bool = field(default=True, init=False)
+    """
+    If True, collision checks whose world aligned bounding boxes are farther apart than the distance threshold
+    of the check are culled before the expensive distance computation of FCL.
+    """
 
     def sync_world_model(self) -> None:
         """
@@ -48,18 +66,21 @@ class FCLCollisionDetector(CollisionDetector):
             self._collision_objects.keys()
         )
         for body in bodies_to_be_added:
+            combined_mesh = body.collision.combined_mesh
+            root_T_body = body.global_transform.to_np()
             self._collision_objects[body] = fcl.CollisionObject(
-                mesh_to_BVH(body.collision.combined_mesh),
-                fcl.Transform(
-                    body.global_transform.to_np()[:3, :3],
-                    body.global_transform.to_np()[:3, 3],
-                ),
+                mesh_to_BVH(combined_mesh),
+                fcl.Transform(root_T_body[:3, :3], root_T_body[:3, 3]),
             )
+            self._local_aabbs[body] = np.array(combined_mesh.bounds, dtype=float)
+            self._update_world_aabb(body, root_T_body)
         bodies_to_be_removed = set(self._collision_objects.keys()) - set(
             self._world.bodies_with_collision
         )
         for body in bodies_to_be_removed:
             del self._collision_objects[body]
+            del self._local_aabbs[body]
+            del self._world_aabbs[body]
 
     def sync_world_state(self) -> None:
         """
@@ -68,12 +89,60 @@ class FCLCollisionDetector(CollisionDetector):
         if self._last_synced_state == self._world.state.version:
             return
         for body, coll_obj in self._collision_objects.items():
+            root_T_body = body.global_transform.to_np()
             coll_obj.setTransform(
-                fcl.Transform(
-                    body.global_transform.to_np()[:3, :3],
-                    body.global_transform.to_np()[:3, 3],
-                )
+                fcl.Transform(root_T_body[:3, :3], root_T_body[:3, 3])
             )
+            self._update_world_aabb(body, root_T_body)
+
+    def _update_world_aabb(self, body: Body, root_T_body: np.ndarray) -> None:
+        """
+        Transforms the local bounding box of a body into a world aligned bounding box.
+        The result encloses the rotated local box, so it is conservative but never too small.
+
+        :param body: The body whose world aligned bounding box is updated.
+        :param root_T_body: The 4x4 transform of the body with respect to the world root.
+        """
+        lower, upper = self._local_aabbs[body]
+        center = root_T_body[:3, :3] @ ((lower + upper) / 2) + root_T_body[:3, 3]
+        half_extents = np.abs(root_T_body[:3, :3]) @ ((upper - lower) / 2)
+        self._world_aabbs[body] = np.stack(
+            (center - half_extents, center + half_extents)
+        )
+
+    def _broadphase(
+        self, collision_checks: List[CollisionCheck]
+    ) -> List[CollisionCheck]:
+        """
+        Culls all collision checks whose bodies are guaranteed to be farther apart than the distance threshold.
+        The gap between two world aligned bounding boxes is a lower bound of the distance between the bodies,
+        so no check that could produce a contact is removed.
+
+        :param collision_checks: The collision checks to filter.
+        :return: The collision checks that have to be computed by the narrow phase.
+        """
+        if not collision_checks:
+            return collision_checks
+        aabbs_a = np.array(
+            [self._world_aabbs[check.body_a] for check in collision_checks]
+        )
+        aabbs_b = np.array(
+            [self._world_aabbs[check.body_b] for check in collision_checks]
+        )
+        thresholds = np.fromiter(
+            (check.distance for check in collision_checks),
+            dtype=float,
+            count=len(collision_checks),
+        )
+        gaps = np.maximum(
+            np.maximum(aabbs_a[:, 0] - aabbs_b[:, 1], aabbs_b[:, 0] - aabbs_a[:, 1]),
+            0,
+        )
+        lower_bound_distances = np.linalg.norm(gaps, axis=1)
+        return [
+            collision_checks[index]
+            for index in np.flatnonzero(lower_bound_distances <= thresholds)
+        ]
 
     def check_collisions(
         self, collision_matrix: CollisionMatrix
@@ -82,15 +151,16 @@ class FCLCollisionDetector(CollisionDetector):
         Checks for collisions in the current world state. The collision manager from trimesh returns all collisions,
         which are then filtered based on the provided collision matrix. If there are multiple contacts between two bodies,
         only the first contact is returned.
+        If `use_broadphase` is set, checks between bodies whose bounding boxes are too far apart are skipped.
 
         :param collision_matrix: An optional set of CollisionCheck objects to filter the collisions. If None is provided, all collisions are checked.
         :return: A list of Collision objects representing the detected collisions.
         """
         result = []
-        for collision_check in collision_matrix.collision_checks:
+        collision_checks = list(collision_matrix.collision_checks)
+        for collision_check in collision_checks:
             body_a = collision_check.body_a
             body_b = collision_check.body_b
-            distance = collision_check.distance
             if (
                 body_a not in self._collision_objects
                 or body_b not in self._collision_objects
@@ -98,6 +168,12 @@ class FCLCollisionDetector(CollisionDetector):
                 raise ValueError(
                     f"One of the bodies {body_a.name}, {body_b.name} does not have collision enabled or is not part of the world."
                 )
+        if self.use_broadphase:
+            collision_checks = self._broadphase(collision_checks)
+        for collision_check in collision_checks:
+            body_a = collision_check.body_a
+            body_b = collision_check.body_b
+            distance = collision_check.distance
             distance_request = fcl.DistanceRequest(
                 enable_nearest_points=True, enable_signed_distance=True
             )
@@ -129,7 +205,7 @@ class FCLCollisionDetector(CollisionDetector):
                 )
             )
 
-        return CollisionCheckingResult(result)
+        return CollisionCheckingResult.from_contacts(result)
 
     def reset_cache(self):
         pass
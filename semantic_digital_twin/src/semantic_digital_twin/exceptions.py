@@ -218,6 +218,39 @@ class NonMonotonicTimeError(LogicalError):
         return ""
 
 
+@dataclass
+class ReadOnlyTrajectoryError(LogicalError):
+    """
+    Raised when attempting to append a world state to a trajectory that was opened read-only.
+    """
+
+    directory: str
+
+    def error_message(self) -> str:
+        return f"The trajectory in {self.directory} was opened read-only."
+
+    def suggest_correction(self) -> str:
+        return "Append to the trajectory that records into this directory instead."
+
+
+@dataclass
+class UnknownMeshContentError(LogicalError):
+    """
+    Raised when a mesh is received as a reference to its content hash, but its content has never been received.
+    """
+
+    content_hash: str
+
+    def error_message(self) -> str:
+        return f"The content of the mesh with the hash {self.content_hash} is unknown."
+
+    def suggest_correction(self) -> str:
+        return (
+            "Request the content of the mesh from the sender of the reference, or fetch the world from its origin "
+            "before applying further updates to it."
+        )
+
+
 @dataclass
 class MismatchingCommandLengthError(DataclassException, ValueError):
     """
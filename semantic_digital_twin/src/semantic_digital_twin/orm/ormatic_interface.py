@@ -223,25 +223,6 @@ class Sage10kSceneDAO_rooms_association(Base, AssociationDataAccessObject):
     )
 
 
-class CollisionCheckingResultDAO_contacts_association(
-    Base, AssociationDataAccessObject
-):
-    __tablename__ = "_30943416093470573366535430635148087213656332547341162949685825"
-
-    database_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-
-    source_collisioncheckingresultdao_id: Mapped[int] = mapped_column(
-        ForeignKey("CollisionCheckingResultDAO.database_id")
-    )
-    target_closestpointsdao_id: Mapped[int] = mapped_column(
-        ForeignKey("ClosestPointsDAO.database_id")
-    )
-
-    target: Mapped[ClosestPointsDAO] = relationship(
-        "ClosestPointsDAO", foreign_keys=[target_closestpointsdao_id], lazy="selectin"
-    )
-
-
 class CollisionGroupDAO_bodies_association(Base, AssociationDataAccessObject):
     __tablename__ = "_61428407002132739694257719785249721483169019459943026085884624"
 
@@ -5030,29 +5011,6 @@ class ClosestPointsDAO(
     )
 
 
-class CollisionCheckingResultDAO(
-    Base,
-    DataAccessObject[
-        semantic_digital_twin.collision_checking.collision_detector.CollisionCheckingResult
-    ],
-):
-    __tablename__ = "CollisionCheckingResultDAO"
-
-    database_id: Mapped[builtins.int] = mapped_column(
-        Integer, primary_key=True, use_existing_column=True
-    )
-
-    contacts: Mapped[builtins.list[CollisionCheckingResultDAO_contacts_association]] = (
-        relationship(
-            "CollisionCheckingResultDAO_contacts_association",
-            collection_class=builtins.list,
-            cascade="all, delete-orphan",
-            foreign_keys="[CollisionCheckingResultDAO_contacts_association.source_collisioncheckingresultdao_id]",
-            lazy="selectin",
-        )
-    )
-
-
 class CollisionGroupDAO(
     Base,
     DataAccessObject[
@@ -6437,6 +6395,48 @@ class QuaternionConversionErrorDAO(
     }
 
 
+class ReadOnlyTrajectoryErrorDAO(
+    LogicalErrorDAO,
+    DataAccessObject[semantic_digital_twin.exceptions.ReadOnlyTrajectoryError],
+):
+    __tablename__ = "ReadOnlyTrajectoryErrorDAO"
+
+    database_id: Mapped[builtins.int] = mapped_column(
+        ForeignKey(LogicalErrorDAO.database_id),
+        primary_key=True,
+        use_existing_column=True,
+    )
+
+    directory: Mapped[builtins.str] = mapped_column(use_existing_column=True)
+
+    __mapper_args__ = {
+        "polymorphic_identity": "ReadOnlyTrajectoryErrorDAO",
+        "inherit_condition": database_id == LogicalErrorDAO.database_id,
+        "polymorphic_load": "selectin",
+    }
+
+
+class UnknownMeshContentErrorDAO(
+    LogicalErrorDAO,
+    DataAccessObject[semantic_digital_twin.exceptions.UnknownMeshContentError],
+):
+    __tablename__ = "UnknownMeshContentErrorDAO"
+
+    database_id: Mapped[builtins.int] = mapped_column(
+        ForeignKey(LogicalErrorDAO.database_id),
+        primary_key=True,
+        use_existing_column=True,
+    )
+
+    content_hash: Mapped[builtins.str] = mapped_column(use_existing_column=True)
+
+    __mapper_args__ = {
+        "polymorphic_identity": "UnknownMeshContentErrorDAO",
+        "inherit_condition": database_id == LogicalErrorDAO.database_id,
+        "polymorphic_load": "selectin",
+    }
+
+
 class RootNodeNotFoundErrorDAO(
     Base, DataAccessObject[semantic_digital_twin.exceptions.RootNodeNotFoundError]
 ):
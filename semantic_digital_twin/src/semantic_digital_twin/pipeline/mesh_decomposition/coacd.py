@@ -151,7 +151,7 @@ class COACDMeshDecomposer(MeshDecomposer):
         """
         new_geometry = []
 
-        trimesh_mesh = mesh.mesh
+        trimesh_mesh = mesh.mesh.copy()
         if mesh.scale.x == mesh.scale.y == mesh.scale.z:
             trimesh_mesh.apply_scale(mesh.scale.x)
         else:
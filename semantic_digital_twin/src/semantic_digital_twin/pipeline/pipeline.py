@@ -105,7 +105,7 @@ class CenterLocalGeometryAndPreserveWorldPose(Step):
 
             for coll in body.collision:
                 if isinstance(coll, Mesh):
-                    m = coll.mesh
+                    m = coll.mutable_mesh
                     if m.vertices.shape[0] > 0:
                         m.vertices -= center
 
@@ -21,7 +21,6 @@ from semantic_digital_twin.spatial_computations.ik_solver import (
     MaxIterationsException,
     UnreachableException,
 )
-from semantic_digital_twin.spatial_computations.raytracer import RayTracer
 from semantic_digital_twin.spatial_types import Vector3, Point3
 from semantic_digital_twin.spatial_types.spatial_types import (
     HomogeneousTransformationMatrix,
@@ -85,8 +84,7 @@ def get_visible_bodies(camera: Camera) -> List[KinematicStructureEntity]:
     :param camera: The camera for which the visible objects should be returned
     :return: A list of bodies/regions that are visible from the camera
     """
-    rt = RayTracer(camera._world)
-    rt.update_scene()
+    rt = camera._world.ray_tracer
 
     # This ignores the camera orientation and sets it to identity
     cam_pose = np.eye(4, dtype=float)
@@ -149,8 +147,7 @@ def occluding_bodies(camera: Camera, body: Body) -> List[Body]:
         world_without_occlusion.add_connection(root_to_copied_body)
 
     # get segmentation mask without occlusion
-    ray_tracer_without_occlusion = RayTracer(world_without_occlusion)
-    ray_tracer_without_occlusion.update_scene()
+    ray_tracer_without_occlusion = world_without_occlusion.ray_tracer
     segmentation_mask_without_occlusion = (
         ray_tracer_without_occlusion.create_segmentation_mask(
             camera_pose, resolution=256, min_distance=0.1
@@ -158,8 +155,7 @@ def occluding_bodies(camera: Camera, body: Body) -> List[Body]:
     )
 
     # get segmentation mask with occlusion
-    ray_tracer_with_occlusion = RayTracer(camera._world)
-    ray_tracer_with_occlusion.update_scene()
+    ray_tracer_with_occlusion = camera._world.ray_tracer
     segmentation_mask_with_occlusion = (
         ray_tracer_with_occlusion.create_segmentation_mask(
             camera_pose, resolution=256, min_distance=0.1
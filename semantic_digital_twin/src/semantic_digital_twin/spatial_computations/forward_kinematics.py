@@ -6,7 +6,7 @@ from uuid import UUID
 
 import numpy as np
 import rustworkx.visit
-from typing_extensions import List
+from typing_extensions import List, Optional, Tuple
 
 from krrood.symbolic_math.symbolic_math import (
     CompiledFunction,
@@ -56,6 +56,56 @@ class ForwardKinematicsManager(ModelChangeCallback):
 
     body_id_to_all_fk_index: Dict[UUID, int] = field(init=False, repr=False)
 
+    full_recompute_threshold: float = field(default=0.5, init=False, repr=False)
+    """
+    If more than this fraction of all kinematic structure entities is affected by a state change,
+    all forward kinematics are recomputed at once instead of only the affected subtrees.
+    """
+
+    jit_compile: bool = field(default=False, init=False, repr=False)
+    """
+    If True, the stacked forward kinematics of all entities are built into a shared object from generated C code,
+    see `CompiledFunction.jit_compile`.
+    """
+
+    _positions_of_last_recompute: Optional[np.ndarray] = field(init=False, repr=False)
+    """
+    Copy of the world state positions used in the last recompute, used to detect which DOFs changed.
+    None if the next recompute has to evaluate all forward kinematics.
+    """
+
+    _graph_index_to_entity_index: Dict[int, int] = field(init=False, repr=False)
+    """
+    Maps the index of a kinematic structure entity in the kinematic structure graph to its index in
+    `kinematic_structure_entities`.
+    """
+
+    _subtree_roots_of_position: List[List[int]] = field(init=False, repr=False)
+    """
+    For each position in the world state, the indices of the kinematic structure entities whose parent connection
+    depends on it. All forward kinematics in the subtrees starting at these entities depend on the position.
+    """
+
+    _subtree_entity_indices: Dict[int, np.ndarray] = field(init=False, repr=False)
+    """
+    Maps the index of a subtree root to the sorted indices of all kinematic structure entities in its subtree.
+    Filled lazily.
+    """
+
+    _compiled_subtree_fks: Dict[int, CompiledFunction] = field(init=False, repr=False)
+    """
+    Maps the index of a subtree root to a compiled function of the stacked forward kinematics of its subtree.
+    Compiled lazily, the first time only this subtree has to be updated.
+    """
+
+    _compiled_fks_for_batches: Dict[Tuple[UUID, UUID], CompiledFunction] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    """
+    Maps (root id, tip id) to a compiled function of root_T_tip, used by `compute_np_batch`.
+    Unlike memoized results, these stay valid until the model changes.
+    """
+
     def on_model_change(self, **kwargs):
         if len(self._world.kinematic_structure_entities) == 0:
             return
@@ -92,20 +142,162 @@ class ForwardKinematicsManager(ModelChangeCallback):
         self.compiled_all_fks = all_fks.compile(
             parameters=VariableParameters.from_lists(
                 self._world.state.position_float_variables
-            )
+            ),
+            jit_compile=self.jit_compile,
         )
         self.compiled_all_fks.bind_args_to_memory_view(0, self._world.state.positions)
         self.body_id_to_all_fk_index = {
             body.id: i * 4
             for i, body in enumerate(self._world.kinematic_structure_entities)
         }
+        self._compile_subtree_lookup()
+        self._compiled_fks_for_batches = {}
+
+    def _compile_subtree_lookup(self) -> None:
+        """
+        Computes which subtrees of the kinematic structure depend on which position of the world state.
+        The subtree functions themselves are compiled lazily in `_get_compiled_subtree_fk`.
+        """
+        entities = self._world.kinematic_structure_entities
+        graph_index_to_entity_index = {
+            entity.index: i for i, entity in enumerate(entities)
+        }
+        variable_to_position_index = {
+            variable: i
+            for i, variable in enumerate(self._world.state.position_float_variables)
+        }
+        self._subtree_roots_of_position = [
+            [] for _ in range(len(variable_to_position_index))
+        ]
+        for connection in self._world.connections:
+            child_index = graph_index_to_entity_index[connection.child.index]
+            for variable in connection.origin_expression.free_variables():
+                position_index = variable_to_position_index.get(variable)
+                if position_index is not None:
+                    self._subtree_roots_of_position[position_index].append(child_index)
+        self._graph_index_to_entity_index = graph_index_to_entity_index
+        self._subtree_entity_indices = {}
+        self._compiled_subtree_fks = {}
+        self._positions_of_last_recompute = None
+
+    def _get_subtree_entity_indices(self, root_index: int) -> np.ndarray:
+        """
+        :param root_index: Index of the subtree root in `kinematic_structure_entities`.
+        :return: Sorted indices of all kinematic structure entities in the subtree, including its root.
+        """
+        if root_index not in self._subtree_entity_indices:
+            root = self._world.kinematic_structure_entities[root_index]
+            descendants = rustworkx.descendants(
+                self._world.kinematic_structure, root.index
+            )
+            self._subtree_entity_indices[root_index] = np.array(
+                sorted(
+                    [root_index]
+                    + [
+                        self._graph_index_to_entity_index[graph_index]
+                        for graph_index in descendants
+                    ]
+                ),
+                dtype=int,
+            )
+        return self._subtree_entity_indices[root_index]
+
+    def _get_compiled_subtree_fk(self, root_index: int) -> CompiledFunction:
+        """
+        :param root_index: Index of the subtree root in `kinematic_structure_entities`.
+        :return: Compiled function of the stacked root_T_kse of all entities in the subtree, bound to the world state.
+        """
+        if root_index not in self._compiled_subtree_fks:
+            entities = self._world.kinematic_structure_entities
+            subtree_fks = Matrix.vstack(
+                [
+                    self.root_T_kse_expression_cache[entities[i].id]
+                    for i in self._get_subtree_entity_indices(root_index)
+                ]
+            )
+            compiled_subtree_fks = subtree_fks.compile(
+                parameters=VariableParameters.from_lists(
+                    self._world.state.position_float_variables
+                )
+            )
+            compiled_subtree_fks.bind_args_to_memory_view(
+                0, self._world.state.positions
+            )
+            self._compiled_subtree_fks[root_index] = compiled_subtree_fks
+        return self._compiled_subtree_fks[root_index]
+
+    def _compute_dirty_subtree_roots(self, changed_positions: np.ndarray) -> List[int]:
+        """
+        :param changed_positions: Indices of the positions that changed since the last recompute.
+        :return: Indices of the roots of all subtrees that have to be recomputed,
+            without subtrees that are already contained in another dirty subtree.
+        """
+        candidate_roots = {
+            root_index
+            for position_index in changed_positions
+            for root_index in self._subtree_roots_of_position[position_index]
+        }
+        dirty_roots = []
+        covered = np.zeros(len(self.body_id_to_all_fk_index), dtype=bool)
+        for root_index in sorted(
+            candidate_roots,
+            key=lambda i: len(self._get_subtree_entity_indices(i)),
+            reverse=True,
+        ):
+            if covered[root_index]:
+                continue
+            covered[self._get_subtree_entity_indices(root_index)] = True
+            dirty_roots.append(root_index)
+        return dirty_roots
 
     def recompute(self) -> None:
         """
         Clears cache and recomputes all forward kinematics. Should be called after a state update.
+        Only the subtrees that depend on positions which changed since the last call are recomputed
+        and patched into `forward_kinematics_for_all_bodies`.
         """
         clear_memoization_cache(self)
+        positions = self._world.state.positions
+        if (
+            self._positions_of_last_recompute is None
+            or self._world.world_is_being_modified
+            or positions.shape != self._positions_of_last_recompute.shape
+        ):
+            # the subtree lookup is only valid for the model it was compiled for
+            self._recompute_all(positions)
+            return
+        changed_positions = np.flatnonzero(
+            positions != self._positions_of_last_recompute
+        )
+        if len(changed_positions) == 0:
+            return
+        dirty_roots = self._compute_dirty_subtree_roots(changed_positions)
+        number_of_dirty_entities = sum(
+            len(self._get_subtree_entity_indices(root_index))
+            for root_index in dirty_roots
+        )
+        if (
+            number_of_dirty_entities
+            > len(self.body_id_to_all_fk_index) * self.full_recompute_threshold
+        ):
+            self._recompute_all(positions)
+            return
+        for root_index in dirty_roots:
+            subtree_fks = self._get_compiled_subtree_fk(root_index).evaluate()
+            entity_indices = self._get_subtree_entity_indices(root_index)
+            row_indices = (entity_indices[:, None] * 4 + np.arange(4)).ravel()
+            self.forward_kinematics_for_all_bodies[row_indices] = subtree_fks
+        self._positions_of_last_recompute[changed_positions] = positions[
+            changed_positions
+        ]
+
+    def _recompute_all(self, positions: np.ndarray) -> None:
+        """
+        Recomputes the forward kinematics of all kinematic structure entities.
+        :param positions: The current positions of the world state.
+        """
         self.forward_kinematics_for_all_bodies = self.compiled_all_fks.evaluate()
+        self._positions_of_last_recompute = positions.copy()
 
     @copy_memoize
     def compose_expression(
@@ -187,3 +379,34 @@ class ForwardKinematicsManager(ModelChangeCallback):
             return np.eye(4)
 
         return root_T_map @ map_T_tip
+
+    def compute_np_batch(
+        self,
+        root: KinematicStructureEntity,
+        tip: KinematicStructureEntity,
+        positions: np.ndarray,
+        number_of_threads: int = 1,
+    ) -> np.ndarray:
+        """
+        Computes root_T_tip for many world states at once, without touching the current world state.
+
+        :param root: Root body for which the kinematics are computed.
+        :param tip: Tip body to which the kinematics are computed.
+        :param positions: An array of shape (N, number of degrees of freedom),
+            where each row contains positions in the order of the world state.
+        :param number_of_threads: The number of threads used to evaluate the states.
+        :return: An array of shape (N, 4, 4) with a transformation matrix for each row of positions.
+            .. warning:: The array is reused by the next call with the same root, tip and N.
+        """
+        key = (root.id, tip.id)
+        if key not in self._compiled_fks_for_batches:
+            self._compiled_fks_for_batches[key] = self.compose_expression(
+                root, tip
+            ).compile(
+                parameters=VariableParameters.from_lists(
+                    self._world.state.position_float_variables
+                )
+            )
+        return self._compiled_fks_for_batches[key].evaluate_batch(
+            positions, number_of_threads
+        )
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing_extensions import Tuple, List, TYPE_CHECKING
+from dataclasses import dataclass
+from uuid import UUID
+
+from typing_extensions import Tuple, List, TYPE_CHECKING, Dict, Self
 
 import numpy as np
 import trimesh
 from trimesh import Scene
 
 from semantic_digital_twin.datastructures.types import NpMatrix4x4
+from semantic_digital_twin.world_description.geometry import Shape
 from semantic_digital_twin.world_description.world_entity import Body
 from semantic_digital_twin.spatial_types.spatial_types import GenericSpatialType
 
@@ -14,7 +18,61 @@ if TYPE_CHECKING:
     from semantic_digital_twin.world import World
 
 
+@dataclass
+class BodyCollisionGeometry:
+    """
+    The collision meshes of a body in the local frames of its collision shapes, as used by the ray tracer.
+    """
+
+    body: Body
+    """
+    The body the geometry belongs to.
+    """
+    shape_versions: Tuple[int, ...]
+    """
+    Versions of the collision shapes the meshes were created from, used to detect changed or replaced collision
+    shapes.
+    """
+    node_names: List[str]
+    """
+    Names of the nodes of the collision meshes in the trimesh scene.
+    """
+    meshes: List[trimesh.Trimesh]
+    """
+    The collision meshes, relative to the origins of their shapes.
+    """
+    origins: np.ndarray
+    """
+    The origins of the collision shapes relative to the body, with shape (number of shapes, 4, 4).
+    """
+
+    @classmethod
+    def from_body(cls, body: Body) -> Self:
+        return cls(
+            body=body,
+            shape_versions=cls.shape_versions_of(body),
+            node_names=[f"{body.id}_collision_{i}" for i in range(len(body.collision))],
+            meshes=[collision.mesh for collision in body.collision],
+            origins=np.array(
+                [collision.origin.to_np() for collision in body.collision]
+            ).reshape((-1, 4, 4)),
+        )
+
+    @staticmethod
+    def shape_versions_of(body: Body) -> Tuple[int, ...]:
+        return tuple(collision.version for collision in body.collision)
+
+
 class RayTracer:
+    """
+    Ray tracing against the collision geometry of all bodies of a world.
+
+    The collision meshes are concatenated into a single mesh, which is cached together with its acceleration
+    structure until the world changes.
+    State changes only move the vertices of the bodies that moved, model changes only add or remove the
+    geometry of the affected bodies.
+    Use `World.ray_tracer` to share one ray tracer between all queries on a world.
+    """
 
     world: World
     """
@@ -28,20 +86,24 @@ class RayTracer:
     """
     Last state version of the world to which the ray tracer was updated.
     """
-    index_to_body: dict
+    _last_shape_version: int
+    """
+    The latest version of any shape when the ray tracer was updated, see `Shape.latest_version`.
     """
-    Maps the index of a body to the body itself.
+    body_geometries: Dict[UUID, BodyCollisionGeometry]
     """
-    scene_to_index: dict
+    Maps the id of each body with collision geometry to its geometry in the scene.
     """
-    Maps the index in the trimesh scene to the index of the body in the world.
+    node_to_body: Dict[str, Body]
+    """
+    Maps the name of a node in the trimesh scene to the body it belongs to.
     """
     scene: Scene
     """
     The trimesh scene used for ray tracing which mirrors the world.
     """
 
-    def __init__(self, world):
+    def __init__(self, world: World):
         """
         Initializes the RayTracer with the given world.
 
@@ -50,62 +112,156 @@ class RayTracer:
         self.world = world
         self._last_world_model = -1
         self._last_world_state = -1
-        self.index_to_body = {}
-        self.scene_to_index = {}
+        self._last_shape_version = -1
+        self.body_geometries = {}
+        self.node_to_body = {}
 
         self.scene = Scene()
+        self._mesh = None
+        self._concatenate_geometries()
         self.update_scene()
 
     def update_scene(self):
         """
         Updates the ray tracer scene with the current state of the world.
-        This method should be called whenever the world changes to ensure the ray tracer has the latest information.
+        This is called by all queries, such that they always use the latest model and state of the world.
         """
-        if self._last_world_model != self.world.get_world_model_manager().version:
-            self.add_missing_bodies()
+        if (
+            self._last_world_model != self.world.get_world_model_manager().version
+            or self._last_shape_version != Shape.latest_version
+        ):
+            # shapes may also be changed in place without changing the model of the world
+            self.update_bodies()
             self._last_world_model = self.world.get_world_model_manager().version
+            self._last_shape_version = Shape.latest_version
+            # the forward kinematics of all bodies may have been reordered
+            self._last_world_state = -1
         if self._last_world_state != self.world.state.version:
             self.update_transforms()
             self._last_world_state = self.world.state.version
 
-    def add_missing_bodies(self):
+    def update_bodies(self):
         """
-        Adds all bodies from the world to the ray tracer scene that are not already present.
+        Adds the geometry of new bodies to the scene, removes the geometry of bodies that are no longer part
+        of the world and replaces the geometry of bodies whose collision shapes changed.
         """
-        # Bodies are added to the scene with their name as the node name plus a suffix for collision geometries.
-        # We check if a body is not in the complete list of all node names in the scene graph.
-        # If the body is not present, we add it to the scene.
-        bodies_to_add = [
-            body
-            for body in self.world.bodies
-            if body.name.name not in "\t".join(self.scene.graph.nodes)
-        ]
-        for body in bodies_to_add:
-            for i, collision in enumerate(body.collision):
+        bodies = {body.id: body for body in self.world.bodies if body.collision}
+        removed_body_ids = self.body_geometries.keys() - bodies.keys()
+        for body_id in removed_body_ids:
+            self._remove_body_geometry(body_id)
+        changed = bool(removed_body_ids)
+        for body_id, body in bodies.items():
+            geometry = self.body_geometries.get(body_id)
+            if geometry is not None:
+                if geometry.shape_versions == BodyCollisionGeometry.shape_versions_of(
+                    body
+                ):
+                    continue
+                self._remove_body_geometry(body_id)
+            geometry = BodyCollisionGeometry.from_body(body)
+            for node_name, mesh in zip(geometry.node_names, geometry.meshes):
                 self.scene.add_geometry(
-                    collision.mesh,
-                    node_name=body.name.name + f"_collision_{i}",
+                    mesh,
+                    node_name=node_name,
+                    geom_name=node_name,
                     parent_node_name="world",
-                    transform=self.world.compute_forward_kinematics_np(
-                        self.world.root, body
-                    )
-                    @ collision.origin.to_np(),
                 )
-                self.scene_to_index[body.name.name + f"_collision_{i}"] = body.index
-                self.index_to_body[body.index] = body
+                self.node_to_body[node_name] = body
+            self.body_geometries[body_id] = geometry
+            changed = True
+        if changed:
+            self._concatenate_geometries()
+
+    def _remove_body_geometry(self, body_id: UUID):
+        geometry = self.body_geometries.pop(body_id)
+        self.scene.delete_geometry(geometry.node_names)
+        for node_name in geometry.node_names:
+            del self.node_to_body[node_name]
+
+    def _concatenate_geometries(self):
+        """
+        Stacks the local vertices and the faces of all collision meshes into flat arrays,
+        such that the combined mesh can be updated without visiting the scene graph.
+        """
+        geometries = list(self.body_geometries.values())
+        meshes = [mesh for geometry in geometries for mesh in geometry.meshes]
+        self._node_names = [
+            node_name for geometry in geometries for node_name in geometry.node_names
+        ]
+        self._node_bodies = [
+            geometry.body for geometry in geometries for _ in geometry.node_names
+        ]
+        self._node_origins = np.concatenate(
+            [np.empty((0, 4, 4))] + [geometry.origins for geometry in geometries]
+        )
+        self._node_transforms = np.full_like(self._node_origins, np.nan)
+        vertex_counts = [len(mesh.vertices) for mesh in meshes]
+        self._vertex_offsets = np.cumsum([0] + vertex_counts)
+        self._local_vertices = np.concatenate(
+            [np.empty((0, 3))] + [np.asarray(mesh.vertices) for mesh in meshes]
+        )
+        self._vertices = self._local_vertices.copy()
+        self._faces = np.concatenate(
+            [np.empty((0, 3), dtype=np.int64)]
+            + [
+                np.asarray(mesh.faces) + offset
+                for mesh, offset in zip(meshes, self._vertex_offsets)
+            ]
+        )
+        triangle_nodes = np.repeat(
+            np.arange(len(meshes)), [len(mesh.faces) for mesh in meshes]
+        )
+        node_bodies = np.empty(len(self._node_bodies), dtype=object)
+        node_bodies[:] = self._node_bodies
+        self._triangle_bodies = node_bodies[triangle_nodes]
+        self._mesh = None
 
     def update_transforms(self):
         """
-        Updates the transforms of all bodies in the ray tracer scene.
-        This is necessary to ensure that the ray tracing uses the correct positions and orientations.
+        Updates the transforms of all collision meshes in the ray tracer scene.
+        The transforms are computed in one batch from the forward kinematics of all bodies and only the
+        meshes whose transform changed are moved.
         """
-        for body in self.world.bodies:
-            for i, collision in enumerate(body.collision):
-                transform = (
-                    self.world.compute_forward_kinematics_np(self.world.root, body)
-                    @ collision.origin.to_np()
-                )
-                self.scene.graph[body.name.name + f"_collision_{i}"] = transform
+        forward_kinematics = self.world._forward_kinematic_manager
+        root_T_bodies = forward_kinematics.forward_kinematics_for_all_bodies.reshape(
+            (-1, 4, 4)
+        )[
+            np.array(
+                [
+                    forward_kinematics.body_id_to_all_fk_index[body.id] // 4
+                    for body in self._node_bodies
+                ],
+                dtype=int,
+            )
+        ]
+        root_T_nodes = root_T_bodies @ self._node_origins
+        changed_nodes = np.flatnonzero(
+            np.any(root_T_nodes != self._node_transforms, axis=(1, 2))
+        )
+        for node in changed_nodes:
+            root_T_node = root_T_nodes[node]
+            self.scene.graph[self._node_names[node]] = root_T_node
+            vertices = slice(self._vertex_offsets[node], self._vertex_offsets[node + 1])
+            self._vertices[vertices] = (
+                self._local_vertices[vertices] @ root_T_node[:3, :3].T
+                + root_T_node[:3, 3]
+            )
+        if len(changed_nodes) > 0:
+            self._node_transforms = root_T_nodes
+            self._mesh = None
+
+    @property
+    def mesh(self) -> trimesh.Trimesh:
+        """
+        :return: The collision geometry of all bodies concatenated into one mesh in the root frame of the world.
+            The mesh is cached until the world changes, such that its acceleration structure for ray queries is reused.
+        """
+        self.update_scene()
+        if self._mesh is None:
+            self._mesh = trimesh.Trimesh(
+                vertices=self._vertices.copy(), faces=self._faces, process=False
+            )
+        return self._mesh
 
     def create_segmentation_mask(
         self,
@@ -266,7 +422,9 @@ class RayTracer:
             raise ValueError("Origin and target points must have the same shape.")
 
         ray_directions = target_points - origin_points
-        points, index_ray, index_tri = self.scene.to_mesh().ray.intersects_location(
+        if len(self._faces) == 0:
+            return np.empty((0, 3)), np.empty(0, dtype=int), []
+        points, index_ray, index_tri = self.mesh.ray.intersects_location(
             origin_points, ray_directions, multiple_hits=multiple_hits
         )
         dist = np.linalg.norm(points - origin_points[index_ray], axis=1)
@@ -276,9 +434,6 @@ class RayTracer:
         index_ray = index_ray[valid_indices]
         index_tri = index_tri[valid_indices]
 
-        bodies = self.scene.triangles_node[index_tri]
-
-        # map the name of the scene objects to the index
-        bodies = [self.index_to_body[self.scene_to_index[body]] for body in bodies]
+        bodies = self._triangle_bodies[index_tri].tolist()
 
         return points, index_ray, bodies
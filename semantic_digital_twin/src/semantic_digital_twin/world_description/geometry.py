@@ -8,7 +8,6 @@ import tempfile
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from dataclasses import dataclass, field, fields
-from functools import cached_property
 
 from plyfile import PlyData
 import numpy as np
@@ -16,7 +15,16 @@ import trimesh
 import trimesh.exchange.stl
 from PIL import Image
 from trimesh.visual.texture import TextureVisuals, SimpleMaterial
-from typing_extensions import Optional, List, Dict, Any, Self, Tuple, TYPE_CHECKING
+from typing_extensions import (
+    Optional,
+    List,
+    Dict,
+    Any,
+    Self,
+    Tuple,
+    TYPE_CHECKING,
+    ClassVar,
+)
 
 from krrood.adapters.json_serializer import SubclassJSONSerializer, to_json, from_json
 from random_events.interval import SimpleInterval, Bound, closed
@@ -29,6 +37,11 @@ from semantic_digital_twin.spatial_types import (
     Vector3,
 )
 from semantic_digital_twin.utils import IDGenerator
+from semantic_digital_twin.exceptions import UnknownMeshContentError
+from semantic_digital_twin.world_description.mesh_store import (
+    mesh_store,
+    BinaryMeshSerialization,
+)
 
 if TYPE_CHECKING:
     from semantic_digital_twin.world_description.world_entity import (
@@ -40,6 +53,11 @@ if TYPE_CHECKING:
 
 id_generator = IDGenerator()
 
+shape_versions = itertools.count(1)
+"""
+Source of the versions of shapes, such that no two shapes of the process ever have the same version.
+"""
+
 logger = logging.getLogger(__name__)
 
 
@@ -313,6 +331,34 @@ class Shape(ABC, SubclassJSONSerializer, HasSimulatorProperties):
 
     color: Color = field(default_factory=Color)
 
+    latest_version: ClassVar[int] = 0
+    """
+    The version that has been handed out last to any shape.
+    If it did not change, no shape of the process changed.
+    """
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        self.mark_as_changed()
+
+    def mark_as_changed(self):
+        """
+        Gives this shape a new version.
+        Setting an attribute of a shape does this automatically. Call this after modifying a nested object of the
+        shape in place, e.g. its origin.
+        """
+        version = next(shape_versions)
+        object.__setattr__(self, "_version", version)
+        Shape.latest_version = version
+
+    @property
+    def version(self) -> int:
+        """
+        The version of this shape, which changes whenever the shape changes and is never shared with a different
+        shape, such that caches of the geometry of shapes can detect changed and replaced shapes.
+        """
+        return self._version
+
     @property
     @abstractmethod
     def local_frame_bounding_box(self) -> BoundingBox:
@@ -368,9 +414,13 @@ class Shape(ABC, SubclassJSONSerializer, HasSimulatorProperties):
         new_props = {
             f.name: deepcopy(getattr(self, f.name))
             for f in shape_props
-            if f.name not in ["origin"]
+            if f.name not in ["origin"] and f.init
         }
-        return self.__class__(origin=new_origin, **new_props)
+        new_shape = self.__class__(origin=new_origin, **new_props)
+        for f in shape_props:
+            if not f.init:
+                setattr(new_shape, f.name, deepcopy(getattr(self, f.name)))
+        return new_shape
 
 
 @dataclass(eq=False)
@@ -390,6 +440,12 @@ class Mesh(Shape):
     Filename of the mesh.
     """
 
+    _mesh: Optional[trimesh.Trimesh] = field(default=None, init=False, repr=False)
+    """
+    A mesh of this shape only that replaces the one from the mesh store, e.g. because a texture has been added to it
+    or because it has been modified in place through `mutable_mesh`.
+    """
+
     @property
     def local_frame_bounding_box(self) -> BoundingBox:
         """
@@ -400,33 +456,65 @@ class Mesh(Shape):
 
     def to_json(self) -> Dict[str, Any]:
         # Serialize the raw (unscaled, unprocessed) mesh geometry and the scale separately
-        base_mesh = trimesh.load_mesh(self.filename, process=False)
+        binary_mesh_serialization = BinaryMeshSerialization.active()
+        if binary_mesh_serialization is not None:
+            mesh_json = binary_mesh_serialization.mesh_to_json(self.filename)
+        else:
+            base_mesh = trimesh.load_mesh(self.filename, process=False)
+            mesh_json = {"mesh": base_mesh.to_dict()}
         file_type = self.filename.split(".")[-1]
         return {
             **super().to_json(),
-            "mesh": base_mesh.to_dict(),
+            **mesh_json,
             "scale": to_json(self.scale),
             "file_type": file_type,
         }
 
     @classmethod
     def _from_json(cls, data: Dict[str, Any], **kwargs) -> Mesh:
-        # Recreate the trimesh without processing to preserve exact topology
-        mesh = trimesh.Trimesh(
-            vertices=data["mesh"]["vertices"],
-            faces=data["mesh"]["faces"],
-            process=False,
-        )
         origin = from_json(data["origin"], **kwargs)
         scale = from_json(data["scale"], **kwargs)
         file_type = data["file_type"]
         color = from_json(data["color"], **kwargs)
-        instance = cls.from_trimesh(
-            mesh=mesh, origin=origin, scale=scale, file_type=file_type
-        )
+        if "content_hash" in data:
+            instance = cls(
+                origin=origin,
+                scale=scale,
+                filename=cls.file_of_binary_mesh_json(data),
+            )
+        else:
+            # Recreate the trimesh without processing to preserve exact topology
+            mesh = trimesh.Trimesh(
+                vertices=data["mesh"]["vertices"],
+                faces=data["mesh"]["faces"],
+                process=False,
+            )
+            instance = cls.from_trimesh(
+                mesh=mesh, origin=origin, scale=scale, file_type=file_type
+            )
         instance.color = color
         return instance
 
+    @classmethod
+    def file_of_binary_mesh_json(cls, data: Dict[str, Any]) -> str:
+        """
+        Resolves a mesh that has been serialized with a BinaryMeshSerialization to a file.
+        Received meshes are written to a file once and found by their content hash afterward.
+
+        :param data: The JSON data of the mesh.
+        :return: The path of a file with the content of the mesh.
+        """
+        content_hash = data["content_hash"]
+        filename = mesh_store.file_of_content_hash(content_hash)
+        if filename is not None:
+            return filename
+        mesh = BinaryMeshSerialization.mesh_from_json(data)
+        if mesh is None:
+            raise UnknownMeshContentError(content_hash=content_hash)
+        filename = cls.from_trimesh(mesh=mesh, file_type=data["file_type"]).filename
+        mesh_store.register_file(content_hash, filename)
+        return filename
+
     @classmethod
     def add_uv(cls, mesh: trimesh.Trimesh, uv: np.ndarray) -> trimesh.Trimesh:
         faces = mesh.faces
@@ -463,16 +551,36 @@ class Mesh(Shape):
         copy_mesh.apply_scale(scale.to_np())
         return copy_mesh
 
-    @cached_property
+    @property
     def mesh(self) -> trimesh.Trimesh:
         """
         The mesh object.
+        It is loaded lazily from the mesh store and shared with all meshes that use the same file content,
+        scale and color, hence it must not be modified.
+        """
+        if self._mesh is not None:
+            return self._mesh
+        return mesh_store.get(
+            self.filename,
+            (self.scale.x, self.scale.y, self.scale.z),
+            self.color.to_rgba(),
+        )
+
+    @mesh.setter
+    def mesh(self, mesh: trimesh.Trimesh):
+        self._mesh = mesh
+
+    @property
+    def mutable_mesh(self) -> trimesh.Trimesh:
         """
-        mesh = trimesh.load_mesh(self.filename)
-        mesh.apply_scale(self.scale.to_np())
-        if not isinstance(mesh.visual, TextureVisuals):
-            mesh.visual.vertex_colors = trimesh.visual.color.to_rgba(self.color.to_rgba())
-        return mesh
+        The mesh object of this shape, which may be modified in place.
+        The first access replaces the shared mesh from the mesh store with a copy that belongs to this shape only.
+        """
+        if self._mesh is None:
+            self._mesh = self.mesh.copy()
+        # the caller may modify the mesh in place
+        self.mark_as_changed()
+        return self._mesh
 
     @classmethod
     def from_file(
@@ -488,7 +596,7 @@ class Mesh(Shape):
         file_mesh = cls(filename=file_path, **kwargs)
         if texture_file_path is not None:
             file_mesh.mesh = cls.add_texture(
-                mesh=file_mesh.mesh, texture_file_path=texture_file_path
+                mesh=file_mesh.mesh.copy(), texture_file_path=texture_file_path
             )
         return file_mesh
 
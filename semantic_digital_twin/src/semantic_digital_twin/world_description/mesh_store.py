@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+import numpy as np
+import trimesh
+from trimesh.visual.texture import TextureVisuals
+from typing_extensions import Dict, Optional, Tuple, Set, Iterator, Any, Self
+
+ScaleKey = Tuple[float, float, float]
+"""
+The scale of a mesh along x, y and z.
+"""
+
+ColorKey = Tuple[float, float, float, float]
+"""
+The RGBA color of a mesh.
+"""
+
+MeshKey = Tuple[str, ScaleKey, Optional[ColorKey]]
+"""
+Identifies a derived mesh by the content hash of its file, its scale and its color.
+The color is None for textured meshes, since their vertex colors are not used.
+"""
+
+
+@dataclass
+class MeshStore:
+    """
+    Process-wide store for meshes that are loaded from files.
+
+    Mesh files are identified by the hash of their content, such that the same asset is loaded only once,
+    no matter how many shapes, world copies or merged worlds reference it.
+    The loaded meshes are immutable and shared between all shapes that use them.
+
+    The scaled and colored meshes that shapes use are derived from the loaded ones and kept in a bounded
+    least-recently-used cache.
+    Since the derived meshes are shared, so is everything trimesh caches on them, e.g. bounding volume hierarchies
+    for ray queries and convex hulls.
+    """
+
+    maximum_number_of_derived_meshes: int = 1024
+    """
+    The number of scaled and colored meshes that are kept before the least recently used ones are evicted.
+    """
+
+    _content_hash_of_file: Dict[str, str] = field(default_factory=dict, init=False)
+    """
+    The content hash of every file that has been loaded.
+    Files are assumed not to change while the process is running.
+    """
+
+    _file_of_content_hash: Dict[str, str] = field(default_factory=dict, init=False)
+    """
+    A file for every content hash that has been seen, such that meshes can be resolved by their content hash.
+    """
+
+    _loaded_meshes: Dict[str, trimesh.Trimesh] = field(default_factory=dict, init=False)
+    """
+    The immutable mesh of every content hash, as loaded from the file.
+    """
+
+    _derived_meshes: OrderedDict[MeshKey, trimesh.Trimesh] = field(
+        default_factory=OrderedDict, init=False
+    )
+    """
+    The immutable scaled and colored meshes, in the order of their last use.
+    """
+
+    def content_hash(self, filename: str) -> str:
+        """
+        :param filename: The path of a mesh file.
+        :return: The hash of the content of the file.
+        """
+        content_hash = self._content_hash_of_file.get(filename)
+        if content_hash is None:
+            with open(filename, "rb") as file:
+                content_hash = hashlib.sha256(file.read()).hexdigest()
+            self.register_file(content_hash, filename)
+        return content_hash
+
+    def register_file(self, content_hash: str, filename: str):
+        """
+        Registers a file under a content hash.
+        Files that are written from received meshes are registered under the content hash of the sender, such that
+        later references to the same content are resolved without receiving the mesh again.
+
+        :param content_hash: The content hash.
+        :param filename: The path of a mesh file with that content.
+        """
+        self._content_hash_of_file[filename] = content_hash
+        self._file_of_content_hash.setdefault(content_hash, filename)
+
+    def file_of_content_hash(self, content_hash: str) -> Optional[str]:
+        """
+        :param content_hash: A content hash.
+        :return: The path of a file with that content, or None if no such file is known.
+        """
+        return self._file_of_content_hash.get(content_hash)
+
+    def loaded_mesh(self, filename: str) -> trimesh.Trimesh:
+        """
+        Loads the mesh of a file, unless a file with the same content has been loaded before.
+
+        :param filename: The path of a mesh file.
+        :return: The immutable mesh as loaded from the file.
+        """
+        content_hash = self.content_hash(filename)
+        mesh = self._loaded_meshes.get(content_hash)
+        if mesh is None:
+            mesh = trimesh.load_mesh(filename)
+            mesh.mutable = False
+            self._loaded_meshes[content_hash] = mesh
+        return mesh
+
+    def get(self, filename: str, scale: ScaleKey, color: ColorKey) -> trimesh.Trimesh:
+        """
+        :param filename: The path of a mesh file.
+        :param scale: The scale of the mesh along x, y and z.
+        :param color: The RGBA color of the mesh. It is ignored for textured meshes.
+        :return: The immutable scaled and colored mesh, shared with all other callers that use the same file
+            content, scale and color.
+        """
+        loaded_mesh = self.loaded_mesh(filename)
+        if isinstance(loaded_mesh.visual, TextureVisuals):
+            color = None
+        key = (self.content_hash(filename), scale, color)
+        mesh = self._derived_meshes.get(key)
+        if mesh is not None:
+            self._derived_meshes.move_to_end(key)
+            return mesh
+
+        mesh = loaded_mesh.copy()
+        mesh.apply_scale(np.array(scale))
+        if color is not None:
+            mesh.visual.vertex_colors = trimesh.visual.color.to_rgba(color)
+        mesh.mutable = False
+        self._derived_meshes[key] = mesh
+        if len(self._derived_meshes) > self.maximum_number_of_derived_meshes:
+            self._derived_meshes.popitem(last=False)
+        return mesh
+
+    def clear(self):
+        """
+        Removes all meshes and content hashes from the store.
+        """
+        self._content_hash_of_file.clear()
+        self._file_of_content_hash.clear()
+        self._loaded_meshes.clear()
+        self._derived_meshes.clear()
+
+
+mesh_store = MeshStore()
+"""
+The mesh store that is shared by all meshes of the process.
+"""
+
+
+_active_binary_mesh_serialization: ContextVar[Optional[BinaryMeshSerialization]] = (
+    ContextVar("_active_binary_mesh_serialization", default=None)
+)
+"""
+The binary mesh serialization that is active in the current context, if any.
+"""
+
+
+@dataclass
+class BinaryMeshSerialization:
+    """
+    Serializes meshes as the content hash of their file and their vertices and faces as little-endian float32 and
+    int32 buffers, encoded as base64, instead of JSON lists of numbers.
+
+    The buffers of a mesh are only included the first time its content hash is serialized with this instance.
+    Receivers resolve later references from their mesh store, so one instance must be used per stream of messages
+    that are received in order, e.g. per synchronization topic.
+    Receivers that have missed the buffers, e.g. because they joined late, have to request them with
+    `content_to_json`.
+    """
+
+    serialized_content_hashes: Set[str] = field(default_factory=set)
+    """
+    The content hashes whose buffers have already been serialized.
+    """
+
+    @contextmanager
+    def activate(self) -> Iterator[Self]:
+        """
+        Makes meshes use this serialization in their `to_json` within the context.
+        """
+        token = _active_binary_mesh_serialization.set(self)
+        try:
+            yield self
+        finally:
+            _active_binary_mesh_serialization.reset(token)
+
+    @staticmethod
+    def active() -> Optional[BinaryMeshSerialization]:
+        """
+        :return: The serialization that is active in the current context, or None if meshes are serialized as JSON.
+        """
+        return _active_binary_mesh_serialization.get()
+
+    def mesh_to_json(self, filename: str) -> Dict[str, Any]:
+        """
+        :param filename: The path of a mesh file.
+        :return: The content hash of the file and, unless it has been serialized before, the buffers of its
+            unprocessed mesh.
+        """
+        content_hash = mesh_store.content_hash(filename)
+        if content_hash in self.serialized_content_hashes:
+            return {"content_hash": content_hash}
+        self.serialized_content_hashes.add(content_hash)
+        return self.content_to_json(filename)
+
+    @staticmethod
+    def content_to_json(filename: str) -> Dict[str, Any]:
+        """
+        :param filename: The path of a mesh file.
+        :return: The content hash of the file and the buffers of its unprocessed mesh.
+        """
+        content_hash = mesh_store.content_hash(filename)
+        mesh = trimesh.load_mesh(filename, process=False)
+        return {
+            "content_hash": content_hash,
+            "vertices": base64.b64encode(mesh.vertices.astype("<f4").tobytes()).decode(
+                "ascii"
+            ),
+            "faces": base64.b64encode(mesh.faces.astype("<i4").tobytes()).decode(
+                "ascii"
+            ),
+        }
+
+    @staticmethod
+    def mesh_from_json(data: Dict[str, Any]) -> Optional[trimesh.Trimesh]:
+        """
+        :param data: The JSON data of a mesh that has been serialized with `mesh_to_json`.
+        :return: The unprocessed mesh, or None if the data does not contain its buffers.
+        """
+        if "vertices" not in data:
+            return None
+        return trimesh.Trimesh(
+            vertices=np.frombuffer(base64.b64decode(data["vertices"]), dtype="<f4")
+            .reshape(-1, 3)
+            .astype(float),
+            faces=np.frombuffer(base64.b64decode(data["faces"]), dtype="<i4").reshape(
+                -1, 3
+            ),
+            process=False,
+        )
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import json
 import threading
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Union, Iterator, Optional
 from uuid import UUID
 
-from typing_extensions import MutableMapping, List, Dict, Self, TYPE_CHECKING
+from typing_extensions import (
+    MutableMapping,
+    List,
+    Dict,
+    Self,
+    TYPE_CHECKING,
+    ClassVar,
+)
 
 import numpy as np
 
@@ -19,6 +28,7 @@ from semantic_digital_twin.exceptions import (
     MismatchingCommandLengthError,
     WrongWorldModelVersion,
     NonMonotonicTimeError,
+    ReadOnlyTrajectoryError,
 )
 from semantic_digital_twin.spatial_types.derivatives import Derivatives
 
@@ -458,6 +468,11 @@ class WorldStateTrajectory:
     This class is used to track and manage a sequence of world states at various
     timestamps. It provides functionality to append new states to the trajectory,
     and to retrieve states or their timing information.
+
+    The states are stored in preallocated arrays whose capacity doubles when they are full,
+    such that appending is amortized constant time and all accessors return views instead of copies.
+    If a directory is given, the arrays are memory-mapped files in that directory, such that long
+    recordings spill to disk and can be reopened read-only with :meth:`from_directory`.
     """
 
     world: World
@@ -466,17 +481,31 @@ class WorldStateTrajectory:
     """List of DOF ids in column order."""
     _index: Dict[UUID, int] = field(default_factory=dict)
     """Maps DOF ids to column indices."""
-    _times: List[float] = field(default_factory=list, repr=False)
-    """List of timestamps corresponding to the recorded world states."""
-    _data: List[np.ndarray] = field(default_factory=list, repr=False)
+    _directory: Optional[Path] = field(default=None, repr=False)
+    """
+    The directory of the memory-mapped files of this trajectory.
+    If None, the trajectory is kept in memory.
+    """
+    initial_capacity: ClassVar[int] = 64
+    """Number of time steps allocated for the first states."""
+    ids_file_name: ClassVar[str] = "degrees_of_freedom.json"
+    """Name of the file that stores the DOF ids in column order."""
+    times_file_name: ClassVar[str] = "times.bin"
+    """Name of the file that stores the timestamps."""
+    data_file_name: ClassVar[str] = "data.bin"
+    """Name of the file that stores the world state data."""
+    _times: np.ndarray = field(init=False, repr=False)
     """
-    List containing the recorded world state data as numpy arrays.
-    Each array has shape (4, N).
+    Preallocated array of timestamps corresponding to the recorded world states.
+    Unused entries are NaN.
     """
-    _times_cache: Optional[np.ndarray] = field(default=None, init=False, repr=False)
-    """Cache for the numpy array of timestamps."""
-    _data_cache: Optional[np.ndarray] = field(default=None, init=False, repr=False)
-    """Cache for the numpy array of world state data."""
+    _data: np.ndarray = field(init=False, repr=False)
+    """
+    Preallocated array containing the recorded world state data.
+    It has shape (capacity, 4, N).
+    """
+    _length: int = field(default=0, init=False, repr=False)
+    """Number of recorded world states."""
     _world_version: int = field(init=False)
     """
     The version of the world model at the time of trajectory creation.
@@ -485,14 +514,23 @@ class WorldStateTrajectory:
 
     def __post_init__(self):
         self._world_version = self.world.get_world_model_manager().version
+        if self._directory is None:
+            self._times = np.full(self.initial_capacity, np.nan)
+            self._data = np.zeros((self.initial_capacity, 4, len(self._ids)))
+            return
+        self._directory.mkdir(parents=True, exist_ok=True)
+        with open(self._directory / self.ids_file_name, "w") as file:
+            json.dump([str(dof_id) for dof_id in self._ids], file)
+        for file_name in (self.data_file_name, self.times_file_name):
+            open(self._directory / file_name, "wb").close()
+        self._extend_files(self.initial_capacity)
+        self._times, self._data = self._map_files(self.initial_capacity, mode="r+")
 
     @property
     def times(self) -> np.ndarray:
         """Array of timestamps corresponding to the recorded world states."""
         with self.world_lock():
-            if self._times_cache is None:
-                self._times_cache = np.array(self._times, dtype=float)
-            return self._times_cache
+            return self._times[: self._length]
 
     @property
     def data(self) -> np.ndarray:
@@ -503,15 +541,20 @@ class WorldStateTrajectory:
         The third dimension indexes the DOFs.
         """
         with self.world_lock():
-            if self._data_cache is None:
-                if not self._data:
-                    # return an empty array with the correct number of dimensions
-                    return np.zeros((0, 4, len(self._ids)), dtype=float)
-                self._data_cache = np.stack(self._data, axis=0)
-            return self._data_cache
+            return self._data[: self._length]
+
+    @property
+    def capacity(self) -> int:
+        """Number of time steps that fit into the preallocated arrays."""
+        return len(self._times)
 
     @classmethod
-    def from_world_state(cls, state: WorldState, time: float):
+    def from_world_state(
+        cls,
+        state: WorldState,
+        time: float,
+        directory: Optional[Union[str, Path]] = None,
+    ):
         """
         Creates an instance of the class using the given world state and timestamp.
 
@@ -519,15 +562,107 @@ class WorldStateTrajectory:
             object of type `WorldState`.
         :param time: The timestamp associated with the state. This represents the
             specific time as a floating-point value.
+        :param directory: If given, the trajectory is recorded into memory-mapped files in this directory.
         :return: An instance of the class created using the provided world state and timestamp.
         """
-        return cls(
+        trajectory = cls(
             world=state._world,
             _ids=state._ids.copy(),
             _index=state._index.copy(),
-            _times=[time],
-            _data=[state._data.copy()],
+            _directory=None if directory is None else Path(directory),
+        )
+        trajectory.append(state, time)
+        return trajectory
+
+    @classmethod
+    def from_directory(cls, world: World, directory: Union[str, Path]) -> Self:
+        """
+        Opens a trajectory that was recorded into a directory read-only.
+        The arrays are memory-mapped without copying them, such that other processes can analyze a
+        trajectory while it is still being recorded.
+        Only the states that were recorded when the trajectory is opened are visible.
+
+        :param world: The world the trajectory belongs to.
+        :param directory: The directory the trajectory was recorded into.
+        :return: The read-only trajectory.
+        """
+        directory = Path(directory)
+        with open(directory / cls.ids_file_name) as file:
+            ids = [UUID(dof_id) for dof_id in json.load(file)]
+        trajectory = cls.__new__(cls)
+        trajectory.world = world
+        trajectory._ids = ids
+        trajectory._index = {dof_id: index for index, dof_id in enumerate(ids)}
+        trajectory._directory = directory
+        trajectory._world_version = world.get_world_model_manager().version
+        capacity = (directory / cls.times_file_name).stat().st_size // 8
+        trajectory._times, trajectory._data = trajectory._map_files(capacity, mode="r")
+        # unused entries of the timestamps are NaN and the timestamps are strictly increasing
+        trajectory._length = int(np.count_nonzero(~np.isnan(trajectory._times)))
+        return trajectory
+
+    def _extend_files(self, capacity: int):
+        """
+        Extends the files of a memory-mapped trajectory to the capacity.
+        Readers derive the capacity from the size of the timestamp file and the number of recorded states from its
+        entries that are not NaN. Hence, the data file is extended first and the new timestamps are written as NaN,
+        such that concurrent readers never see a data file that is too short or timestamps of unrecorded states.
+
+        :param capacity: The number of time steps the files have to hold.
+        """
+        item_size = np.dtype(float).itemsize
+        with open(self._directory / self.data_file_name, "r+b") as file:
+            file.truncate(capacity * 4 * len(self._ids) * item_size)
+        times_path = self._directory / self.times_file_name
+        number_of_new_times = capacity - times_path.stat().st_size // item_size
+        with open(times_path, "ab") as file:
+            file.write(np.full(number_of_new_times, np.nan).tobytes())
+
+    def _map_files(self, capacity: int, mode: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Memory-maps the files of the trajectory.
+
+        :param capacity: The number of time steps to map.
+        :param mode: The mode of :class:`numpy.memmap`.
+        :return: The mapped timestamps and world state data.
+        """
+        times = np.memmap(
+            self._directory / self.times_file_name,
+            dtype=float,
+            mode=mode,
+            shape=(capacity,),
+        )
+        data = np.memmap(
+            self._directory / self.data_file_name,
+            dtype=float,
+            mode=mode,
+            shape=(capacity, 4, len(self._ids)),
         )
+        return times, data
+
+    def _grow(self):
+        """
+        Doubles the capacity of the preallocated arrays.
+        """
+        capacity = 2 * self.capacity
+        if self._directory is None:
+            times = np.full(capacity, np.nan)
+            data = np.zeros((capacity, 4, len(self._ids)))
+            times[: self._length] = self._times[: self._length]
+            data[: self._length] = self._data[: self._length]
+            self._times, self._data = times, data
+            return
+        self.flush()
+        self._extend_files(capacity)
+        self._times, self._data = self._map_files(capacity, mode="r+")
+
+    def flush(self):
+        """
+        Writes the recorded states of a memory-mapped trajectory to disk.
+        """
+        if isinstance(self._times, np.memmap) and self._times.flags.writeable:
+            self._data.flush()
+            self._times.flush()
 
     def world_lock(self):
         return self.world._world_lock
@@ -543,24 +678,32 @@ class WorldStateTrajectory:
             greater than the last time in the series.
         """
         with self.world_lock():
+            if not self._times.flags.writeable:
+                raise ReadOnlyTrajectoryError(directory=str(self._directory))
             current_world_model_version = state._world.get_world_model_manager().version
             if current_world_model_version != self._world_version:
                 raise WrongWorldModelVersion(
                     expected_version=self._world_version,
                     actual_version=current_world_model_version,
                 )
-            if self._times and time <= self._times[-1]:
+            if self._length and time <= self._times[self._length - 1]:
                 raise NonMonotonicTimeError(
-                    last_time=float(self._times[-1]), attempted_time=time
+                    last_time=float(self._times[self._length - 1]),
+                    attempted_time=time,
                 )
-            self._times.append(time)
-            self._data.append(state._data.copy())
-            self._times_cache = None
-            self._data_cache = None
+            if self._length == self.capacity:
+                self._grow()
+            self._data[self._length] = state._data
+            # the timestamp is written last, since it marks the state as recorded for readers of the files
+            self._times[self._length] = time
+            self._length += 1
+
+    def __len__(self) -> int:
+        return self._length
 
     def keys(self) -> Iterator[float]:
         with self.world_lock():
-            yield from self._times
+            yield from self.times.tolist()
 
     def values(self) -> Iterator[WorldStateView]:
         """
@@ -574,9 +717,9 @@ class WorldStateTrajectory:
                 at each time step.
         """
         with self.world_lock():
-            for idx in range(len(self._times)):
+            for data in self.data:
                 yield WorldStateView(
-                    self._data[idx], self._ids, self._index, self.world._world_lock
+                    data, self._ids, self._index, self.world._world_lock
                 )
 
     def items(self) -> Iterator[tuple[float, WorldStateView]]:
@@ -3,11 +3,14 @@ from copy import deepcopy
 import numpy as np
 import pytest
 
+from coraplex.datastructures.enums import Arms
 from coraplex.locations.costmaps import (
     OccupancyCostmap,
     GaussianCostmap,
     OrientationGenerator,
+    ReachabilityCostmap,
 )
+from coraplex.locations.reachability import ReachabilityMap, build_reachability_map
 from semantic_digital_twin.spatial_types import HomogeneousTransformationMatrix
 from semantic_digital_twin.spatial_types import Vector3
 from semantic_digital_twin.spatial_types.spatial_types import Pose, Point3
@@ -142,6 +145,73 @@ def test_sample_reachability(immutable_model_world):
         assert pose.to_position().x > 3
 
 
+def test_reachability_map_save_load(tmp_path):
+    reachability = np.zeros((3, 3, 3))
+    reachability[2, 1, 1] = 0.5
+    reachability_map = ReachabilityMap(
+        robot_name="PR2",
+        arm=Arms.RIGHT,
+        resolution=0.5,
+        origin=np.array([-0.5, -0.5, 0.0]),
+        reachability=reachability,
+    )
+    reachability_map.save(str(tmp_path))
+
+    loaded = ReachabilityMap.load("PR2", Arms.RIGHT, str(tmp_path))
+
+    assert loaded.resolution == 0.5
+    assert np.all(loaded.reachability == reachability)
+    assert loaded.reachability_at(
+        np.array([[0.5, 0.0, 0.5], [0.0, 0.0, 0.0], [5.0, 0.0, 0.0]])
+    ) == pytest.approx([0.5, 0.0, 0.0])
+
+
+def test_reachability_costmap(immutable_model_world):
+    world, robot_view, context = immutable_model_world
+    reachability = np.zeros((30, 3, 3))
+    reachability[12:18, 1, 1] = 1
+    reachability_map = ReachabilityMap(
+        robot_name="PR2",
+        arm=Arms.RIGHT,
+        resolution=0.05,
+        origin=np.array([0.0, -0.05, 0.75]),
+        reachability=reachability,
+    )
+
+    reachability_costmap = ReachabilityCostmap(
+        resolution=0.02,
+        height=200,
+        width=200,
+        origin=Pose.from_xyz_quaternion(0, 0, 0, 0, 0, 0, 1, world.root),
+        reachability_map=reachability_map,
+        target_height=0.8,
+        world=world,
+    )
+
+    # Only a ring with a radius between 0.575 and 0.875 meters around the origin is reachable
+    distances = [
+        np.linalg.norm(pose.to_position().to_np()[:2]) for pose in reachability_costmap
+    ]
+    assert distances
+    assert min(distances) >= 0.575 - 0.02
+    assert max(distances) <= 0.875 + 0.02
+    assert reachability_costmap.map[100, 100] == 0
+
+
+def test_build_reachability_map(immutable_model_world):
+    world, robot_view, context = immutable_model_world
+
+    reachability_map = build_reachability_map(
+        robot_view, Arms.RIGHT, resolution=0.2, reach=0.2, orientations=[(0, 0, 0)]
+    )
+
+    assert reachability_map.robot_name == type(robot_view).__name__
+    assert reachability_map.reachability.shape == (3, 3, 3)
+    assert np.all(
+        (reachability_map.reachability >= 0) & (reachability_map.reachability <= 1)
+    )
+
+
 # ----- Sampling test ---------------
 
 
@@ -1,3 +1,4 @@
+import threading
 from copy import deepcopy
 
 import pytest
@@ -16,6 +17,7 @@ from coraplex.datastructures.dataclasses import Context
 
 from coraplex.datastructures.enums import Arms, ApproachDirection, VerticalAlignment
 from coraplex.datastructures.grasp import GraspDescription
+from coraplex.exceptions import ForkWithLiveThreads
 from coraplex.locations.factories import (
     reachability_location,
     visibility_location,
@@ -388,3 +390,66 @@ def test_giskard_location_pose(immutable_multiple_robot_simple_apartment):
 
     assert len(pose.to_position().to_list()) == 4
     assert len(pose.to_quaternion().to_list()) == 4
+
+
+def test_giskard_location_pose_in_workers(immutable_multiple_robot_simple_apartment):
+    world, robot, context = immutable_multiple_robot_simple_apartment
+    plan = sequential(
+        [
+            ParkArmsAction(Arms.BOTH),
+            MoveTorsoAction(TorsoState.HIGH),
+        ],
+        context,
+    )
+
+    with simulated_robot:
+        plan.perform()
+
+        world.notify_state_change()
+
+        location = giskard_reachability_location(
+            world.get_body_by_name("milk.stl"),
+            context,
+            Arms.RIGHT,
+            GraspDescription(
+                ApproachDirection.FRONT,
+                VerticalAlignment.NoAlignment,
+                ViewManager.get_end_effector_view(Arms.RIGHT, robot),
+            ),
+            number_of_workers=2,
+        )
+
+        pose = next(iter(location))
+
+    assert len(pose.to_position().to_list()) == 4
+    assert pose.reference_frame == world.root
+    statistics = location.generator.statistics
+    assert statistics.number_of_workers == 2
+    assert statistics.number_of_valid_candidates >= 1
+    assert statistics.time_to_first_valid_pose is not None
+
+
+def test_giskard_location_refuses_to_fork_with_live_threads(
+    immutable_multiple_robot_simple_apartment,
+):
+    world, robot, context = immutable_multiple_robot_simple_apartment
+    location = giskard_reachability_location(
+        world.get_body_by_name("milk.stl"),
+        context,
+        Arms.RIGHT,
+        GraspDescription(
+            ApproachDirection.FRONT,
+            VerticalAlignment.NoAlignment,
+            ViewManager.get_end_effector_view(Arms.RIGHT, robot),
+        ),
+        number_of_workers=2,
+    )
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait)
+    thread.start()
+    try:
+        with pytest.raises(ForkWithLiveThreads):
+            next(iter(location))
+    finally:
+        stop.set()
+        thread.join()
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from sqlalchemy import select
 
@@ -14,6 +15,7 @@ from coraplex.plans.plan import Plan
 from coraplex.robot_plans.actions.composite.transporting import TransportAction
 from coraplex.robot_plans.actions.core.navigation import NavigateAction
 from coraplex.robot_plans.actions.core.robot_body import MoveTorsoAction, ParkArmsAction
+from giskardpy.motion_statechart.motion_statechart import StateHistory
 from semantic_digital_twin.datastructures.definitions import TorsoState
 from semantic_digital_twin.spatial_types.spatial_types import Pose
 
@@ -145,3 +147,23 @@ def test_replay_complex_plan_from_db(coraplex_testing_session, complex_plan):
     fetched_plan = session.scalars(select(PlanMappingDAO)).one()
 
     recreated_plan = fetched_plan.from_dao()
+
+
+def test_state_history_serialization(coraplex_testing_session):
+    session = coraplex_testing_session
+    history = StateHistory(max_length=3)
+    for control_cycle in range(7):
+        history.append(
+            control_cycle, np.full(2, control_cycle), np.full(2, -control_cycle)
+        )
+
+    dao = to_dao(history)
+    session.add(dao)
+    session.commit()
+
+    restored = session.scalars(select(StateHistoryMappingDAO)).one().from_dao()
+    assert restored.control_cycles.tolist() == [4, 5, 6]
+    assert np.array_equal(restored.life_cycle_states, history.life_cycle_states)
+    assert np.array_equal(restored.observation_states, history.observation_states)
+    assert restored.number_of_transitions == 7
+    assert restored.max_length == 3
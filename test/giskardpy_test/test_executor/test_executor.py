@@ -0,0 +1,26 @@
+from giskardpy.executor import Executor
+from giskardpy.motion_statechart.context import MotionStatechartContext
+from giskardpy.motion_statechart.graph_node import EndMotion
+from giskardpy.motion_statechart.monitors.payload_monitors import CountSeconds
+from giskardpy.motion_statechart.motion_statechart import MotionStatechart
+from giskardpy.qp.qp_controller_config import QPControllerConfig
+from semantic_digital_twin.world import World
+
+
+def test_tick_until_end_stops_at_stop_condition():
+    msc = MotionStatechart()
+    msc.add_node(counter := CountSeconds(seconds=1.0))
+    msc.add_node(EndMotion.when_true(counter))
+
+    kin_sim = Executor(
+        context=MotionStatechartContext(
+            world=World(),
+            qp_controller_config=QPControllerConfig.create_with_simulation_defaults(),
+        ),
+    )
+    kin_sim.compile(msc)
+    kin_sim.tick_until_end(
+        timeout=1000, stop_condition=lambda: kin_sim.control_cycles >= 5
+    )
+    assert kin_sim.control_cycles == 5
+    assert not kin_sim.motion_statechart.is_end_motion()
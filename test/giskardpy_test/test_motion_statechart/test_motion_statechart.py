@@ -35,6 +35,7 @@ from giskardpy.motion_statechart.monitors.payload_monitors import (
 )
 from giskardpy.motion_statechart.motion_statechart import (
     MotionStatechart,
+    StateHistory,
 )
 from giskardpy.motion_statechart.tasks.align_planes import AlignPlanes
 from giskardpy.motion_statechart.tasks.cartesian_tasks import (
@@ -455,14 +456,14 @@ class TestMotionStatechartLogic:
 
         assert len(msc.history) == 5
         # %% node1
-        assert msc.history.get_life_cycle_history_of_node(node1) == [
+        assert msc.history.get_life_cycle_history_of_node(node1).tolist() == [
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
         ]
-        assert msc.history.get_observation_history_of_node(node1) == [
+        assert msc.history.get_observation_history_of_node(node1).tolist() == [
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
@@ -470,14 +471,14 @@ class TestMotionStatechartLogic:
             ObservationStateValues.TRUE,
         ]
         # %% node2
-        assert msc.history.get_life_cycle_history_of_node(node2) == [
+        assert msc.history.get_life_cycle_history_of_node(node2).tolist() == [
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
         ]
-        assert msc.history.get_observation_history_of_node(node2) == [
+        assert msc.history.get_observation_history_of_node(node2).tolist() == [
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.TRUE,
@@ -485,14 +486,14 @@ class TestMotionStatechartLogic:
             ObservationStateValues.TRUE,
         ]
         # %% node3
-        assert msc.history.get_life_cycle_history_of_node(node3) == [
+        assert msc.history.get_life_cycle_history_of_node(node3).tolist() == [
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
         ]
-        assert msc.history.get_observation_history_of_node(node3) == [
+        assert msc.history.get_observation_history_of_node(node3).tolist() == [
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.TRUE,
@@ -500,14 +501,14 @@ class TestMotionStatechartLogic:
             ObservationStateValues.TRUE,
         ]
         # %% end
-        assert msc.history.get_life_cycle_history_of_node(end) == [
+        assert msc.history.get_life_cycle_history_of_node(end).tolist() == [
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
         ]
-        assert msc.history.get_observation_history_of_node(end) == [
+        assert msc.history.get_observation_history_of_node(end).tolist() == [
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
@@ -536,7 +537,7 @@ class TestMotionStatechartLogic:
         kin_sim.tick_until_end()
         assert len(msc.history) == 7
         # %% goal
-        assert msc.history.get_life_cycle_history_of_node(goal) == [
+        assert msc.history.get_life_cycle_history_of_node(goal).tolist() == [
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.RUNNING,
@@ -545,7 +546,7 @@ class TestMotionStatechartLogic:
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
         ]
-        assert msc.history.get_observation_history_of_node(goal) == [
+        assert msc.history.get_observation_history_of_node(goal).tolist() == [
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
@@ -555,7 +556,7 @@ class TestMotionStatechartLogic:
             ObservationStateValues.TRUE,
         ]
         # %% node1
-        assert msc.history.get_life_cycle_history_of_node(node1) == [
+        assert msc.history.get_life_cycle_history_of_node(node1).tolist() == [
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
@@ -564,7 +565,7 @@ class TestMotionStatechartLogic:
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
         ]
-        assert msc.history.get_observation_history_of_node(node1) == [
+        assert msc.history.get_observation_history_of_node(node1).tolist() == [
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.TRUE,
@@ -574,7 +575,7 @@ class TestMotionStatechartLogic:
             ObservationStateValues.TRUE,
         ]
         # %% sub_node1
-        assert msc.history.get_life_cycle_history_of_node(goal.sub_node1) == [
+        assert msc.history.get_life_cycle_history_of_node(goal.sub_node1).tolist() == [
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.RUNNING,
@@ -583,7 +584,7 @@ class TestMotionStatechartLogic:
             LifeCycleValues.DONE,
             LifeCycleValues.DONE,
         ]
-        assert msc.history.get_observation_history_of_node(goal.sub_node1) == [
+        assert msc.history.get_observation_history_of_node(goal.sub_node1).tolist() == [
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
@@ -593,7 +594,7 @@ class TestMotionStatechartLogic:
             ObservationStateValues.TRUE,
         ]
         # %% sub_node2
-        assert msc.history.get_life_cycle_history_of_node(goal.sub_node2) == [
+        assert msc.history.get_life_cycle_history_of_node(goal.sub_node2).tolist() == [
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.NOT_STARTED,
@@ -602,7 +603,7 @@ class TestMotionStatechartLogic:
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
         ]
-        assert msc.history.get_observation_history_of_node(goal.sub_node2) == [
+        assert msc.history.get_observation_history_of_node(goal.sub_node2).tolist() == [
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
@@ -612,7 +613,7 @@ class TestMotionStatechartLogic:
             ObservationStateValues.TRUE,
         ]
         # %% sub_node2
-        assert msc.history.get_life_cycle_history_of_node(end) == [
+        assert msc.history.get_life_cycle_history_of_node(end).tolist() == [
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.NOT_STARTED,
@@ -621,7 +622,7 @@ class TestMotionStatechartLogic:
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
         ]
-        assert msc.history.get_observation_history_of_node(end) == [
+        assert msc.history.get_observation_history_of_node(end).tolist() == [
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
@@ -971,6 +972,108 @@ def test_count_ticks():
     assert kin_sim.control_cycles == 3 + 1
 
 
+def test_life_cycle_callback_table():
+    table = MotionStatechart.life_cycle_callback_table
+    for previous in LifeCycleValues:
+        assert table[previous, previous] is None
+        if previous != LifeCycleValues.NOT_STARTED:
+            assert table[previous, LifeCycleValues.NOT_STARTED] == "on_reset"
+    assert table[LifeCycleValues.NOT_STARTED, LifeCycleValues.RUNNING] == "on_start"
+    assert table[LifeCycleValues.RUNNING, LifeCycleValues.PAUSED] == "on_pause"
+    assert table[LifeCycleValues.PAUSED, LifeCycleValues.RUNNING] == "on_unpause"
+    assert table[LifeCycleValues.RUNNING, LifeCycleValues.DONE] == "on_end"
+    assert table[LifeCycleValues.PAUSED, LifeCycleValues.DONE] == "on_end"
+    assert table[LifeCycleValues.NOT_STARTED, LifeCycleValues.DONE] is None
+
+
+class TestStateHistory:
+    def test_only_changes_are_recorded(self):
+        history = StateHistory()
+        life_cycle_state = np.zeros(3)
+        observation_state = np.zeros(3)
+        history.append(0, life_cycle_state, observation_state)
+        history.append(1, life_cycle_state, observation_state)
+        life_cycle_state[1] = LifeCycleValues.RUNNING
+        history.append(2, life_cycle_state, observation_state)
+        observation_state[2] = ObservationStateValues.TRUE
+        history.append(3, life_cycle_state, observation_state)
+
+        assert len(history) == 3
+        assert history.control_cycles.tolist() == [0, 2, 3]
+        assert history.life_cycle_states[:, 1].tolist() == [
+            LifeCycleValues.NOT_STARTED,
+            LifeCycleValues.RUNNING,
+            LifeCycleValues.RUNNING,
+        ]
+        assert history.observation_states[-1, 2] == ObservationStateValues.TRUE
+        # the history stores copies of the states
+        assert history.observation_states[0, 2] == 0
+
+    def test_growth(self):
+        history = StateHistory()
+        number_of_transitions = 3 * StateHistory.initial_capacity + 1
+        for control_cycle in range(number_of_transitions):
+            history.append(
+                control_cycle, np.full(2, control_cycle), np.full(2, -control_cycle)
+            )
+        assert len(history) == number_of_transitions
+        assert history.control_cycles.tolist() == list(range(number_of_transitions))
+        assert np.all(history.life_cycle_states[:, 1] == history.control_cycles)
+        assert np.all(history.observation_states[:, 0] == -history.control_cycles)
+
+    def test_bounded(self):
+        history = StateHistory(max_length=5)
+        for control_cycle in range(23):
+            history.append(
+                control_cycle, np.full(2, control_cycle), np.full(2, control_cycle)
+            )
+            assert len(history) == min(control_cycle + 1, 5)
+            assert history.control_cycles[-1] == control_cycle
+        assert history.number_of_transitions == 23
+        assert history.control_cycles.tolist() == [18, 19, 20, 21, 22]
+        assert history.life_cycle_states[:, 0].tolist() == [18, 19, 20, 21, 22]
+        assert history._control_cycles.shape[0] == 10
+
+    def test_from_transitions(self):
+        history = StateHistory(max_length=3)
+        for control_cycle in range(7):
+            history.append(
+                control_cycle, np.full(2, control_cycle), np.full(2, -control_cycle)
+            )
+        restored = StateHistory.from_transitions(
+            history.control_cycles,
+            history.life_cycle_states,
+            history.observation_states,
+            max_length=history.max_length,
+            number_of_transitions=history.number_of_transitions,
+        )
+        assert restored.control_cycles.tolist() == [4, 5, 6]
+        assert np.array_equal(restored.life_cycle_states, history.life_cycle_states)
+        assert np.array_equal(restored.observation_states, history.observation_states)
+        assert restored.number_of_transitions == 7
+
+    @pytest.mark.parametrize("max_length", [0, -1])
+    def test_max_length_has_to_be_positive(self, max_length: int):
+        with pytest.raises(ValueError):
+            StateHistory(max_length=max_length)
+
+    def test_bounded_motion_statechart(self):
+        msc = MotionStatechart()
+        msc.history = StateHistory(max_length=2)
+        msc.add_node(counter := CountControlCycles(control_cycles=5))
+        msc.add_node(EndMotion.when_true(counter))
+        kin_sim = Executor(MotionStatechartContext(world=World()))
+        kin_sim.compile(motion_statechart=msc)
+        kin_sim.tick_until_end()
+
+        assert len(msc.history) == 2
+        assert msc.history.number_of_transitions > 2
+        assert msc.history.get_observation_history_of_node(counter).tolist() == [
+            ObservationStateValues.TRUE,
+            ObservationStateValues.TRUE,
+        ]
+
+
 class TestEndMotion:
     def test_end_motion_when_all_done1(self, tmp_path):
         msc = MotionStatechart()
@@ -1450,7 +1553,7 @@ class TestLifeCycleTransitions:
 
         assert len(msc.history) == 14
         # %% count_node1 history
-        assert msc.history.get_life_cycle_history_of_node(count_node1) == [
+        assert msc.history.get_life_cycle_history_of_node(count_node1).tolist() == [
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
@@ -1466,7 +1569,7 @@ class TestLifeCycleTransitions:
             LifeCycleValues.DONE,
             LifeCycleValues.DONE,
         ]
-        assert msc.history.get_observation_history_of_node(count_node1) == [
+        assert msc.history.get_observation_history_of_node(count_node1).tolist() == [
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.TRUE,
@@ -1484,7 +1587,7 @@ class TestLifeCycleTransitions:
         ]
 
         # %% count_node2 history
-        assert msc.history.get_life_cycle_history_of_node(count_node2) == [
+        assert msc.history.get_life_cycle_history_of_node(count_node2).tolist() == [
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.NOT_STARTED,
@@ -1500,7 +1603,7 @@ class TestLifeCycleTransitions:
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
         ]
-        assert msc.history.get_observation_history_of_node(count_node2) == [
+        assert msc.history.get_observation_history_of_node(count_node2).tolist() == [
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
@@ -1518,7 +1621,7 @@ class TestLifeCycleTransitions:
         ]
 
         # %% end_count_node1 history
-        assert msc.history.get_life_cycle_history_of_node(end_count_node1) == [
+        assert msc.history.get_life_cycle_history_of_node(end_count_node1).tolist() == [
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
@@ -1534,7 +1637,9 @@ class TestLifeCycleTransitions:
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
         ]
-        assert msc.history.get_observation_history_of_node(end_count_node1) == [
+        assert msc.history.get_observation_history_of_node(
+            end_count_node1
+        ).tolist() == [
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.FALSE,
@@ -1552,7 +1657,7 @@ class TestLifeCycleTransitions:
         ]
 
         # %% end_node history
-        assert msc.history.get_life_cycle_history_of_node(end_node) == [
+        assert msc.history.get_life_cycle_history_of_node(end_node).tolist() == [
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.NOT_STARTED,
@@ -1568,7 +1673,7 @@ class TestLifeCycleTransitions:
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
         ]
-        assert msc.history.get_observation_history_of_node(end_node) == [
+        assert msc.history.get_observation_history_of_node(end_node).tolist() == [
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
@@ -1586,7 +1691,7 @@ class TestLifeCycleTransitions:
         ]
 
         # %% pulse_node1 history
-        assert msc.history.get_life_cycle_history_of_node(pulse_node1) == [
+        assert msc.history.get_life_cycle_history_of_node(pulse_node1).tolist() == [
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.RUNNING,
@@ -1602,7 +1707,7 @@ class TestLifeCycleTransitions:
             LifeCycleValues.DONE,
             LifeCycleValues.DONE,
         ]
-        assert msc.history.get_observation_history_of_node(pulse_node1) == [
+        assert msc.history.get_observation_history_of_node(pulse_node1).tolist() == [
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
@@ -1620,7 +1725,7 @@ class TestLifeCycleTransitions:
         ]
 
         # %% pulse_node2 history
-        assert msc.history.get_life_cycle_history_of_node(pulse_node2) == [
+        assert msc.history.get_life_cycle_history_of_node(pulse_node2).tolist() == [
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.NOT_STARTED,
             LifeCycleValues.NOT_STARTED,
@@ -1636,7 +1741,7 @@ class TestLifeCycleTransitions:
             LifeCycleValues.RUNNING,
             LifeCycleValues.RUNNING,
         ]
-        assert msc.history.get_observation_history_of_node(pulse_node2) == [
+        assert msc.history.get_observation_history_of_node(pulse_node2).tolist() == [
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
             ObservationStateValues.UNKNOWN,
@@ -5,6 +5,7 @@ import scipy.sparse as sp
 from giskardpy.qp.qp_data import (
     QPData,
     QPDataExplicit,
+    QPDataFilterCache,
 )
 from giskardpy.qp.solvers.qp_solver_piqp import QPSolverPIQP
 
@@ -336,3 +337,93 @@ def test_sadness_qp17(sadness_qp17):
 def test_sadness_qp21(sadness_qp21):
     qp_data = sadness_qp21
     QPSolverPIQP().solver_call(qp_data)
+
+
+def test_filter_cache():
+    number_of_dofs, number_of_eq_slacks, number_of_neq_slacks = 4, 2, 3
+    number_of_variables = number_of_dofs + number_of_eq_slacks + number_of_neq_slacks
+    rng = np.random.default_rng(42)
+    equality_matrix = sp.random(
+        5, number_of_variables, density=0.5, format="csc", rng=rng
+    )
+    inequality_matrix = sp.random(
+        6, number_of_variables, density=0.5, format="csc", rng=rng
+    )
+    filter_cache = QPDataFilterCache()
+
+    def create_qp_data(quadratic_weights: np.ndarray, **kwargs) -> QPDataExplicit:
+        equality_matrix.data[:] = rng.random(equality_matrix.nnz)
+        inequality_matrix.data[:] = rng.random(inequality_matrix.nnz)
+        return QPDataExplicit(
+            quadratic_weights=quadratic_weights,
+            linear_weights=rng.random(number_of_variables),
+            box_lower_constraints=-np.ones(number_of_variables),
+            box_upper_constraints=np.ones(number_of_variables),
+            equality_matrix=equality_matrix,
+            equality_bounds=rng.random(5),
+            inequality_matrix=inequality_matrix,
+            inequality_lower_bounds=-rng.random(6),
+            inequality_upper_bounds=rng.random(6),
+            num_equality_slack_variables=number_of_eq_slacks,
+            num_inequality_slack_variables=number_of_neq_slacks,
+            **kwargs,
+        )
+
+    weight_patterns = [
+        np.array([1, 1, 1, 1, 1, 0, 1, 0, 1], dtype=float),
+        np.array([1, 1, 1, 1, 1, 0, 1, 0, 1], dtype=float),
+        np.array([1, 1, 1, 1, 0, 1, 1, 1, 0], dtype=float),
+        np.array([1, 1, 1, 1, 1, 1, 1, 1, 1], dtype=float),
+    ]
+    for quadratic_weights in weight_patterns:
+        qp_data = create_qp_data(quadratic_weights, filter_cache=filter_cache)
+        expected = QPDataExplicit(
+            **{
+                **qp_data.__dict__,
+                "equality_matrix": equality_matrix.copy(),
+                "inequality_matrix": inequality_matrix.copy(),
+                "filter_cache": None,
+            }
+        ).apply_filters()
+        actual = qp_data.apply_filters()
+        assert np.array_equal(
+            actual.equality_matrix.toarray(), expected.equality_matrix.toarray()
+        )
+        assert np.array_equal(
+            actual.inequality_matrix.toarray(), expected.inequality_matrix.toarray()
+        )
+        assert np.array_equal(actual.equality_bounds, expected.equality_bounds)
+    assert (filter_cache.hits, filter_cache.misses) == (1, 3)
+
+
+def test_filter_cache_detects_changed_sparsity_pattern():
+    # the slack variable of the second equality constraint is removed with its row
+    quadratic_weights = np.array([1, 1, 1, 0], dtype=float)
+    filter_cache = QPDataFilterCache()
+
+    def filter_with_cache(equality_matrix: sp.csc_matrix) -> sp.csc_matrix:
+        return (
+            QPDataExplicit(
+                quadratic_weights=quadratic_weights,
+                linear_weights=np.zeros(4),
+                box_lower_constraints=-np.ones(4),
+                box_upper_constraints=np.ones(4),
+                equality_matrix=equality_matrix,
+                equality_bounds=np.zeros(2),
+                inequality_matrix=sp.csc_matrix((0, 4)),
+                inequality_lower_bounds=np.zeros(0),
+                inequality_upper_bounds=np.zeros(0),
+                num_equality_slack_variables=2,
+                num_inequality_slack_variables=0,
+                filter_cache=filter_cache,
+            )
+            .apply_filters()
+            .equality_matrix.toarray()
+        )
+
+    # same shape, number of nonzeros and column pointers, but different row indices
+    first = sp.csc_matrix(np.array([[1.0, 2.0, 0.0, 0.0], [0.0, 0.0, 3.0, 0.0]]))
+    second = sp.csc_matrix(np.array([[1.0, 0.0, 2.0, 0.0], [0.0, 3.0, 0.0, 0.0]]))
+    assert np.array_equal(filter_with_cache(first), [[1.0, 2.0, 0.0]])
+    assert np.array_equal(filter_with_cache(second), [[1.0, 0.0, 2.0]])
+    assert (filter_cache.hits, filter_cache.misses) == (0, 2)
@@ -78,3 +78,37 @@ def test_joint_goal(solver, pr2_world_state_reset):
     )
     kin_sim.compile(motion_statechart=msc)
     kin_sim.tick_until_end()
+
+
+def test_piqp_reuses_setup(pr2_world_state_reset):
+    pytest.importorskip("piqp")
+    from giskardpy.qp.solvers.qp_solver_piqp import QPSolverPIQP
+
+    msc = MotionStatechart()
+    msc.add_node(
+        joint_goal := JointPositionList(
+            goal_state=JointState.from_str_dict(
+                {"torso_lift_joint": 0.2}, world=pr2_world_state_reset
+            )
+        )
+    )
+    msc.add_node(EndMotion.when_true(joint_goal))
+
+    kin_sim = Executor(
+        MotionStatechartContext(
+            world=pr2_world_state_reset,
+            qp_controller_config=QPControllerConfig(
+                target_frequency=20,
+                prediction_horizon=7,
+                qp_solver_class=QPSolverPIQP,
+            ),
+        )
+    )
+    kin_sim.compile(motion_statechart=msc)
+    kin_sim.tick_until_end()
+    qp_solver = kin_sim.qp_controller.qp_solver
+    assert len(qp_solver.solve_times) == min(
+        kin_sim.control_cycles, qp_solver.solve_times.maxlen
+    )
+    # the structure of the qp only changes when filters change the active set
+    assert qp_solver.number_of_setups < kin_sim.control_cycles
@@ -1,3 +1,4 @@
+import math
 from collections import defaultdict
 from dataclasses import dataclass
 
@@ -739,6 +740,66 @@ def test_nearest_object_type():
     assert best_object_and_distance[min_distance] == 1
 
 
+def test_aggregations_are_accumulated_in_a_single_pass(departments_and_employees):
+    departments, employees = departments_and_employees
+    emp = variable(Employee, domain=employees)
+    department = emp.department
+    salary = emp.salary
+    aggregators = [
+        count := eql.count(emp),
+        distinct_count := eql.count(salary, distinct=True),
+        total := eql.sum(salary),
+        average := eql.average(salary),
+        maximum := eql.max(salary),
+        minimum := eql.min(salary),
+        mode := eql.mode(salary),
+    ]
+    query = a(set_of(department, *aggregators).grouped_by(department))
+
+    salaries = defaultdict(list)
+    for employee in employees:
+        salaries[employee.department].append(employee.salary)
+    assert [
+        (result[department], *(result[aggregator] for aggregator in aggregators))
+        for result in query.evaluate()
+    ] == [
+        (
+            d,
+            len(values),
+            len(set(values)),
+            sum(values),
+            sum(values) / len(values),
+            max(values),
+            min(values),
+            max(values, key=values.count),
+        )
+        for d, values in salaries.items()
+    ]
+
+    grouped_by = query._grouped_by_expression_
+    assert [aggregator._id_ for aggregator in grouped_by.accumulated_aggregators] == [
+        aggregator._id_ for aggregator in aggregators
+    ]
+    assert grouped_by.ids_of_collected_variables == {department._id_}
+
+
+def test_accumulated_sum_of_integers_is_exact():
+    values = [3, True, 2**70, -5]
+    result = eql.sum(variable(object, domain=values)).tolist()[0]
+    assert result == 2**70 - 1
+    assert type(result) is int
+
+
+def test_accumulated_sum_and_average_of_floats():
+    values = [0.1, 3, 0.7, 0.25, 0.2]
+    assert eql.sum(variable(object, domain=values)).tolist()[0] == pytest.approx(
+        math.fsum(values)
+    )
+    assert eql.average(variable(object, domain=values)).tolist()[0] == pytest.approx(
+        math.fsum(values) / len(values)
+    )
+
+
 def test_count_range():
     domain = ["chair", "chair", ..., ..., ..., "table"]
     type_var = variable(object, domain=domain)
@@ -1340,3 +1340,73 @@ def test_presentation_example():
     q = an(entity(r).where(r.battery > 50, not_(r.tasks[0].completed)))
     visualize_query_graph(q, figure_size=(20, 20), spacing_x=2, spacing_y=2)
     assert q.tolist() == [robots[2]]
+
+
+@dataclass(frozen=True)
+class CountingKey:
+    value: int
+    comparisons: List[int]
+
+    def __eq__(self, other):
+        self.comparisons.append(1)
+        return isinstance(other, CountingKey) and self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+
+def test_equality_join_of_independent_variables_is_a_hash_join():
+    @dataclass
+    class Parent:
+        key: CountingKey
+
+    @dataclass
+    class Child:
+        parent_key: CountingKey
+
+    comparisons = []
+    parents = [Parent(CountingKey(i, comparisons)) for i in range(100)]
+    children = [Child(CountingKey(i % 50, comparisons)) for i in range(100)]
+
+    parent = variable(Parent, parents)
+    child = variable(Child, children)
+    query = a(set_of(parent, child).where(parent.key == child.parent_key))
+    results = [(result[parent], result[child]) for result in query.evaluate()]
+
+    assert results == [
+        (p, c) for p in parents for c in children if p.key.value == c.parent_key.value
+    ]
+    # Only matching pairs are compared, instead of all 100 * 100 pairs.
+    assert len(comparisons) < 1000
+
+
+def test_equality_join_of_unhashable_values():
+    first = variable(list, [["a"], ["b", "c"], [], ["c", "b"]])
+    second = variable(set, [{"c", "b"}, {"a"}])
+    query = a(set_of(first, second).where(first == second))
+    assert [(result[first], result[second]) for result in query.evaluate()] == [
+        (["a"], {"a"}),
+        (["b", "c"], {"c", "b"}),
+        (["c", "b"], {"c", "b"}),
+    ]
+
+
+def test_equality_join_under_negation_keeps_false_results():
+    first = variable(int, [1, 2, 3])
+    second = variable(int, [2, 3, 4])
+    query = a(set_of(first, second).where(not_(first == second)))
+    assert len(query.tolist()) == 7
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_order_by_with_limit_keeps_only_the_first_results(descending):
+    values = [(i * 7) % 10 for i in range(30)]
+    number = variable(int, domain=values)
+    key = lambda value: value // 3
+    query = an(
+        entity(number).ordered_by(variable=number, key=key, descending=descending)
+    )
+    expected = sorted(values, key=key, reverse=descending)
+    assert query.tolist() == expected
+    for limit in [1, 5, 29, 30, 40]:
+        assert list(query.limit(limit).evaluate()) == expected[:limit]
@@ -6,6 +6,7 @@ import pytest
 
 from krrood.entity_query_language.core.base_expressions import SymbolicExpression
 from krrood.entity_query_language.core.mapped_variable import Attribute
+from krrood.entity_query_language.enums import EvaluationMode
 from krrood.entity_query_language.evaluation import is_condition_participant
 from krrood.entity_query_language._stack import CallStack
 from krrood.entity_query_language._monitoring import monitored
@@ -176,6 +177,32 @@ def test_explain_inference_deeply_nested():
     assert "level_3" in explanation_with_trace
 
 
+def test_fast_evaluation_does_not_explain_inferences():
+    """
+    Test that queries evaluated in the fast mode infer the same instances without explanations.
+    """
+    person_factory = inference(Person)
+    explained_query = entity(person_factory(name="Ada"))
+    fast_query = entity(person_factory(name="Ada")).evaluation_mode(EvaluationMode.Fast)
+
+    explained_results = list(explained_query.evaluate())
+    fast_results = list(fast_query.evaluate())
+
+    assert explained_results == fast_results
+    assert explain_inference(explained_results[0]) is not None
+    assert explain_inference(fast_results[0]) is None
+
+
+def test_fast_evaluation_of_conditions():
+    items = [Item(value=i) for i in range(10)]
+    item = variable(Item, items)
+    query = entity(item).where(or_(item.value < 2, not_(item.value < 8)))
+
+    expected = [items[0], items[1], items[8], items[9]]
+    assert query.tolist() == expected
+    assert query.evaluation_mode(EvaluationMode.Fast).tolist() == expected
+
+
 def test_query_stack_tracking():
     """
     Test that Query objects automatically record their creation stack.
@@ -17,9 +17,15 @@ from dataclasses import dataclass
 
 import pytest
 
-from krrood.entity_query_language._stack import CallStack, StackFrame
+from krrood.entity_query_language._monitoring import monitored
+from krrood.entity_query_language import _stack
+from krrood.entity_query_language._stack import (
+    CallStack,
+    DeferredCallStack,
+    StackFrame,
+)
 from krrood.entity_query_language.explanation.explanation import explain_inference
-from krrood.entity_query_language.factories import entity, inference
+from krrood.entity_query_language.factories import entity, inference, variable
 from krrood.symbol_graph.symbol_graph import Symbol
 
 
@@ -213,6 +219,47 @@ def test_call_stack_is_from_method_false():
     assert CallStack(frames).is_from_method() is False
 
 
+# ---------------------------------------------------------------------------
+# DeferredCallStack
+# ---------------------------------------------------------------------------
+
+
+def test_deferred_call_stack_resolves_to_captured_call_stack():
+    deferred, eager = DeferredCallStack.capture(), CallStack.capture()
+    assert len(deferred) == len(eager)
+    assert [(f.filename, f.function_name, f.module_name) for f in deferred] == [
+        (f.filename, f.function_name, f.module_name) for f in eager
+    ]
+    frames = deferred.frames
+    assert frames[0].function_name == (
+        "test_deferred_call_stack_resolves_to_captured_call_stack"
+    )
+    assert frames[0].code_snippet.startswith("deferred, eager")
+    assert deferred.frames is frames
+
+
+def test_deferred_call_stack_records_owner_class():
+    class Inner:
+        def capture(self):
+            return DeferredCallStack.capture()
+
+    frame = Inner().capture().frames[0]
+    assert frame.class_object is Inner
+    assert frame.function_object is Inner.capture
+
+
+def test_code_properties_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(_stack, "_code_properties", {})
+    monkeypatch.setattr(_stack, "_maximum_number_of_code_properties", 3)
+    for index in range(10):
+        namespace = {"DeferredCallStack": DeferredCallStack}
+        exec(
+            f"def capture_{index}():\n    return DeferredCallStack.capture()", namespace
+        )
+        namespace[f"capture_{index}"]()
+        assert len(_stack._code_properties) <= 3
+
+
 # ---------------------------------------------------------------------------
 # InferenceExplanation stack query methods
 # ---------------------------------------------------------------------------
@@ -331,3 +378,26 @@ def test_root_frame_in_outermost_wins():
     # The outermost test_stack frame is the test function itself, not inner()
     assert root is not None
     assert root.function_name == "test_root_frame_in_outermost_wins"
+
+
+# ---------------------------------------------------------------------------
+# MonitoredRegistry
+# ---------------------------------------------------------------------------
+
+
+def test_monitoring_can_be_disabled_for_the_process():
+    monitored.disable()
+    try:
+        with monitored.disabled():
+            pass
+        assert monitored.is_enabled is False
+        unmonitored_variable = variable(int, [1])
+    finally:
+        monitored.enable()
+    assert monitored.get_stack(unmonitored_variable) is None
+
+    monitored_variable = variable(int, [1])
+    stack = monitored.get_stack(monitored_variable)
+    assert "test_monitoring_can_be_disabled_for_the_process" in [
+        frame.function_name for frame in stack
+    ]
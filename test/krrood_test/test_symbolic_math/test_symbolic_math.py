@@ -1,4 +1,6 @@
 import operator
+import os
+import shutil
 
 import casadi as ca
 import numpy as np
@@ -7,9 +9,11 @@ import scipy
 import scipy.sparse as sp
 
 import krrood.symbolic_math.symbolic_math as sm
+from krrood.symbolic_math.compile_cache import CompiledFunctionCache
 from krrood.symbolic_math.exceptions import (
     HasFreeVariablesError,
     NotSquareMatrixError,
+    WrongDimensionsError,
 )
 from krrood.symbolic_math.symbolic_math import VariableParameters
 from test.krrood_test.test_symbolic_math.reference_implementations import (
@@ -725,6 +729,35 @@ class TestCompiledFunction:
                 datas[i][:] = np.random.rand(element_size)
             assert np.isclose(f.evaluate(), np.sum(datas))
 
+    @pytest.mark.parametrize("sparse", bool_values)
+    @pytest.mark.parametrize("number_of_threads", [1, 3])
+    def test_evaluate_batch(self, sparse, number_of_threads):
+        s1, s2, s3 = sm.create_float_variables(["s1", "s2", "s3"])
+        e = sm.Matrix([[sm.sin(s1) * s2, 0, s3], [0, s1 + s2 * s3, 1]])
+        f = e.compile(
+            parameters=VariableParameters.from_lists([s1], [s2, s3]), sparse=sparse
+        )
+        states = np.random.rand(7, 3)
+        actual = f.evaluate_batch(states, number_of_threads)
+        assert actual.shape[0] == 7
+        for state, result in zip(states, actual):
+            expected = f(state[:1].copy(), state[1:].copy())
+            if sparse:
+                expected = expected.data
+            assert np.allclose(result, expected)
+
+    def test_evaluate_batch_vector_and_constant(self):
+        s1, s2 = sm.create_float_variables(["s1", "s2"])
+        f = sm.Vector([s1 * s2, s2]).compile()
+        states = np.array([[1.0, 2.0], [3.0, 4.0]])
+        assert np.allclose(f.evaluate_batch(states), [[2, 2], [12, 4]])
+
+        f_constant = sm.Matrix([[1, 2]]).compile()
+        assert np.allclose(f_constant.evaluate_batch(np.zeros((3, 0))), [[[1, 2]]] * 3)
+
+        with pytest.raises(WrongDimensionsError):
+            f.evaluate_batch(np.zeros((3, 3)))
+
     def test_missing_free_variables(self):
         s1, s2 = sm.create_float_variables(["s1", "s2"])
         e = sm.sqrt(sm.cos(s1) + sm.sin(s2))
@@ -732,6 +765,75 @@ class TestCompiledFunction:
             e.compile(parameters=VariableParameters.from_lists([s1]))
 
 
+@pytest.mark.skipif(
+    shutil.which(os.environ.get("CC", "cc")) is None, reason="no C compiler"
+)
+class TestCompiledFunctionCache:
+
+    @pytest.fixture
+    def compile_cache(self, tmp_path):
+        cache = CompiledFunctionCache(directory=tmp_path)
+        sm.CompiledFunction.compile_cache = cache
+        yield cache
+        sm.CompiledFunction.compile_cache = None
+
+    def test_hit_after_recompile(self, compile_cache):
+        s1, s2 = sm.create_float_variables(["s1", "s2"])
+        e = sm.sqrt(sm.cos(s1) + sm.sin(s2))
+        expected = np.sqrt(np.cos(420.0) + np.sin(69.0))
+
+        e_f = e.compile(jit_compile=True)
+        assert (compile_cache.hits, compile_cache.misses) == (0, 1)
+        e_f2 = e.compile(jit_compile=True)
+        assert (compile_cache.hits, compile_cache.misses) == (1, 1)
+        assert np.allclose(e_f2(np.array([420.0, 69.0])), expected)
+        assert np.allclose(e_f(np.array([420.0, 69.0])), expected)
+
+    def test_virtual_machine_functions_are_not_cached(self, compile_cache):
+        s1, s2 = sm.create_float_variables(["s1", "s2"])
+        (s1 * s2).compile()
+        assert (compile_cache.hits, compile_cache.misses) == (0, 0)
+        assert compile_cache.size_in_bytes == 0
+
+    def test_key_depends_on_layout_and_sparsity(self, compile_cache):
+        s1, s2 = sm.create_float_variables(["s1", "s2"])
+        e = sm.Matrix([[s1 + s2, 0], [0, s1 * s2]])
+        e.compile(jit_compile=True)
+        e.compile(sparse=True, jit_compile=True)
+        e.compile(
+            parameters=VariableParameters.from_lists([s1], [s2]), jit_compile=True
+        )
+        e.compile(parameters=VariableParameters.from_lists([s2, s1]), jit_compile=True)
+        assert (compile_cache.hits, compile_cache.misses) == (0, 4)
+
+        actual = e.compile(sparse=True, jit_compile=True)(np.array([2.0, 3.0]))
+        assert compile_cache.hits == 1
+        assert np.allclose(actual.toarray(), [[5, 0], [0, 6]])
+
+    def test_eviction(self, compile_cache):
+        s1 = sm.FloatVariable(name="s1")
+        compile_cache.max_size_in_bytes = 0
+        (s1 * 2).compile(jit_compile=True)
+        assert compile_cache.evictions == 1
+        assert compile_cache.size_in_bytes == 0
+
+    def test_jit_compile_matches_virtual_machine(self, compile_cache):
+        s1, s2 = sm.create_float_variables(["s1", "s2"])
+        e = sm.Matrix([[sm.sin(s1) * s2, 0], [0, sm.sqrt(s1 + s2)]])
+        args = np.array([1.5, 2.5])
+        for sparse in [False, True]:
+            expected = e.compile(sparse=sparse)(args)
+            actual = e.compile(sparse=sparse, jit_compile=True)(args)
+            if sparse:
+                expected, actual = expected.toarray(), actual.toarray()
+            assert np.allclose(actual, expected)
+        assert len(list(compile_cache.directory.glob("*.so"))) == 2
+
+        misses = compile_cache.misses
+        e.compile(jit_compile=True)
+        assert compile_cache.misses == misses
+
+
 class TestScalar:
     def test_bool_casting(self):
         v = sm.FloatVariable(name="muh")
@@ -158,6 +158,16 @@ class InductionStepTestCase(unittest.TestCase):
         maximum, index = self.induction_step.compute_best_split()
         self.assertEqual(index, 5)
 
+    def test_log_likelihood_of_splits(self):
+        split_indices = np.arange(1, 6)
+        log_likelihoods = self.induction_step.log_likelihood_of_splits(split_indices)
+        for split_index, log_likelihood in zip(split_indices, log_likelihoods):
+            self.assertEqual(
+                log_likelihood,
+                self.induction_step.log_likelihood_of_split_side(split_index, 1)
+                + self.induction_step.log_likelihood_of_split_side(split_index, 9),
+            )
+
     def test_construct_left_induction_step(self):
         induction_step = self.induction_step.construct_left_induction_step(1)
         self.assertEqual(induction_step.begin_index, 0)
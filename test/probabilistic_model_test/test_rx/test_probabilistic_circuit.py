@@ -380,5 +380,180 @@ class MixedLeafTruncationTestCase(unittest.TestCase):
         self.assertAlmostEqual(truncated.probability(event), 1.0, places=9)
 
 
+class CompiledCircuitTestCase(unittest.TestCase):
+    """
+    The compiled evaluation must match evaluating the circuit unit by unit.
+    """
+
+    x = Continuous("x")
+    y = Continuous("y")
+    n = Integer("n")
+
+    def setUp(self):
+        np.random.seed(69)
+        circuit = ProbabilisticCircuit()
+        root = SumUnit(probabilistic_circuit=circuit)
+        shared = leaf(
+            IntegerDistribution(
+                variable=self.n,
+                probabilities=MissingDict(float, {0: 0.5, 1: 0.3, 2: 0.2}),
+            ),
+            circuit,
+        )
+        for index in range(3):
+            component = ProductUnit(probabilistic_circuit=circuit)
+            component.add_subcircuit(
+                leaf(GaussianDistribution(index, 1.0 + index, variable=self.x), circuit)
+            )
+            mixture = SumUnit(probabilistic_circuit=circuit)
+            mixture.add_subcircuit(
+                leaf(
+                    UniformDistribution(
+                        closed(index, index + 2).simple_sets[0], variable=self.y
+                    ),
+                    circuit,
+                ),
+                np.log(0.3),
+            )
+            mixture.add_subcircuit(
+                leaf(
+                    UniformDistribution(
+                        closed(-1, index).simple_sets[0], variable=self.y
+                    ),
+                    circuit,
+                ),
+                np.log(0.7),
+            )
+            component.add_subcircuit(mixture)
+            component.add_subcircuit(shared)
+            root.add_subcircuit(component, np.log(index + 1.0))
+        root.normalize()
+        self.model = circuit
+        # the variables are ordered as n, x, y
+        self.events = np.column_stack(
+            (np.random.randint(0, 4, 100), np.random.uniform(-3, 4, (100, 2)))
+        )
+
+    def evaluate_per_unit(self, leaf_query, inner_query):
+        for layer in reversed(self.model.layers):
+            for unit in layer:
+                if unit.is_leaf:
+                    leaf_query(unit)
+                else:
+                    inner_query(unit)
+        return self.model.root.result_of_current_query
+
+    def columns_of(self, unit: LeafUnit):
+        return [
+            self.model.variable_to_index_map[variable] for variable in unit.variables
+        ]
+
+    def test_log_likelihood(self):
+        expected = self.evaluate_per_unit(
+            lambda unit: unit.log_likelihood(self.events[:, self.columns_of(unit)]),
+            lambda unit: unit.log_forward(),
+        )
+        log_likelihood = self.model.log_likelihood(self.events)
+        self.assertTrue(np.isneginf(log_likelihood).any())
+        np.testing.assert_allclose(log_likelihood, expected)
+
+    def test_cumulative_distribution_function(self):
+        expected = self.evaluate_per_unit(
+            lambda unit: unit.cumulative_distribution(
+                self.events[:, self.columns_of(unit)]
+            ),
+            lambda unit: unit.forward(),
+        )
+        np.testing.assert_allclose(
+            self.model.cumulative_distribution_function(self.events), expected
+        )
+
+    def test_probability_of_simple_event(self):
+        event = SimpleEvent.from_data(
+            {self.x: closed(0, 1), self.y: closed(0.5, 3), self.n: closed(0, 1)}
+        )
+        expected = self.evaluate_per_unit(
+            lambda unit: unit.probability_of_simple_event(event),
+            lambda unit: unit.forward(),
+        )
+        self.assertAlmostEqual(self.model.probability_of_simple_event(event), expected)
+
+    def test_recompilation(self):
+        compiled = self.model.compiled
+        self.assertIs(self.model.compiled, compiled)
+
+        # weight updates are read on every query
+        root = self.model.root
+        self.model.add_edge(root, root.subcircuits[0], 0.0)
+        root.normalize()
+        self.assertIs(self.model.compiled, compiled)
+        expected = self.evaluate_per_unit(
+            lambda unit: unit.log_likelihood(self.events[:, self.columns_of(unit)]),
+            lambda unit: unit.log_forward(),
+        )
+        np.testing.assert_allclose(self.model.log_likelihood(self.events), expected)
+
+        # topology changes recompile the circuit
+        shared = next(unit for unit in self.model.leaves if self.n in unit.variables)
+        component = ProductUnit(probabilistic_circuit=self.model)
+        component.add_subcircuit(
+            leaf(GaussianDistribution(-1.0, 0.5, variable=self.x), self.model)
+        )
+        component.add_subcircuit(
+            leaf(
+                UniformDistribution(closed(0, 1).simple_sets[0], variable=self.y),
+                self.model,
+            )
+        )
+        component.add_subcircuit(shared)
+        root.add_subcircuit(component, np.log(0.5))
+        self.assertIsNot(self.model.compiled, compiled)
+        expected = self.evaluate_per_unit(
+            lambda unit: unit.log_likelihood(self.events[:, self.columns_of(unit)]),
+            lambda unit: unit.log_forward(),
+        )
+        np.testing.assert_allclose(self.model.log_likelihood(self.events), expected)
+
+    def test_sample(self):
+        samples = self.model.sample(20000)
+        self.assertEqual(samples.shape, (20000, 3))
+        self.assertFalse(np.isnan(samples).any())
+        self.assertTrue(np.isfinite(self.model.log_likelihood(samples)).all())
+
+        event = SimpleEvent.from_data(
+            {self.x: closed(0, 1), self.y: closed(0.5, 3), self.n: closed(0, 1)}
+        )
+        inside = (
+            (samples[:, 0] <= 1)
+            & (samples[:, 1] >= 0)
+            & (samples[:, 1] <= 1)
+            & (samples[:, 2] >= 0.5)
+            & (samples[:, 2] <= 3)
+        )
+        self.assertAlmostEqual(
+            inside.mean(), self.model.probability_of_simple_event(event), delta=0.02
+        )
+
+    def test_sample_in_chunks(self):
+        chunks = list(self.model.sample_in_chunks(25, chunk_size=10))
+        self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 5])
+        self.assertFalse(np.isnan(np.concatenate(chunks)).any())
+
+    def test_sample_per_unit(self):
+        for node in self.model.graph.nodes():
+            node.result_of_current_query = []
+        self.model.root.result_of_current_query.append(np.arange(20000))
+        samples = np.full((20000, 3), np.nan)
+        for layer in self.model.layers:
+            for node in layer:
+                node.sample(samples, self.model.variable_to_index_map)
+
+        self.assertFalse(np.isnan(samples).any())
+        self.assertTrue(np.isfinite(self.model.log_likelihood(samples)).all())
+        np.testing.assert_allclose(
+            samples.mean(axis=0), self.model.sample(20000).mean(axis=0), atol=0.1
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
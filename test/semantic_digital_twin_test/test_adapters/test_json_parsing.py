@@ -1,3 +1,4 @@
+import json
 import os
 from copy import deepcopy
 
@@ -16,6 +17,7 @@ from semantic_digital_twin.exceptions import (
     SpatialTypeNotJsonSerializable,
     WorldEntityWithIDNotInKwargs,
     MissingWorldError,
+    UnknownMeshContentError,
 )
 from semantic_digital_twin.spatial_types import (
     Point3,
@@ -31,6 +33,10 @@ from semantic_digital_twin.world import World
 from semantic_digital_twin.world_description.connections import FixedConnection
 from semantic_digital_twin.world_description.degree_of_freedom import DegreeOfFreedom
 from semantic_digital_twin.world_description.geometry import Box
+from semantic_digital_twin.world_description.mesh_store import (
+    BinaryMeshSerialization,
+    mesh_store,
+)
 from semantic_digital_twin.world_description.shape_collection import ShapeCollection
 from semantic_digital_twin.world_description.world_entity import Body
 
@@ -320,3 +326,42 @@ def test_json_serialization_with_mesh():
     for c1 in body.collision:
         for c2 in body2.collision:
             assert (trimesh.boolean.difference([c1.mesh, c2.mesh])).is_empty
+
+
+def test_binary_json_serialization_with_mesh():
+    body: Body = (
+        STLParser(
+            os.path.join(
+                os.path.dirname(__file__),
+                "..",
+                "..",
+                "..",
+                "semantic_digital_twin",
+                "resources",
+                "stl",
+                "milk.stl",
+            )
+        )
+        .parse()
+        .root
+    )
+
+    with BinaryMeshSerialization().activate():
+        first_json_data = to_json(body)
+        reference_json_data = to_json(body)
+    json_data = to_json(body)
+    assert "vertices" in json.dumps(first_json_data)
+    assert "vertices" not in json.dumps(reference_json_data)
+    assert len(json.dumps(first_json_data)) < len(json.dumps(json_data)) / 2
+
+    # a receiver that has never seen the content of the mesh
+    mesh_store.clear()
+    with pytest.raises(UnknownMeshContentError):
+        from_json(reference_json_data)
+
+    body2 = from_json(first_json_data)
+    body3 = from_json(reference_json_data)
+    for c1 in body.collision:
+        for c2, c3 in zip(body2.collision, body3.collision):
+            assert np.allclose(c1.mesh.vertices, c2.mesh.vertices, atol=1e-6)
+            assert c2.filename == c3.filename
@@ -139,3 +139,30 @@ def test_all_collisions(world_setup_simple, collision_detector):
     ).contacts
     assert len(collisions) == 1
     assert {collisions[0].body_a, collisions[0].body_b} == {body1, body2}
+
+
+def test_broadphase_matches_narrowphase(world_setup_simple):
+    world, body1, body2, body3, body4, body5 = world_setup_simple
+    body3.parent_connection.origin = HomogeneousTransformationMatrix.from_xyz_rpy(
+        -10, -10, 10
+    )
+    body4.parent_connection.origin = HomogeneousTransformationMatrix.from_xyz_rpy(
+        10, 10, 10
+    )
+    tcd = FCLCollisionDetector(_world=world)
+    collision_matrix = CollisionMatrix.create_all_checks(distance=0.5, world=world)
+
+    candidates = tcd._broadphase(list(collision_matrix.collision_checks))
+    assert len(candidates) < len(collision_matrix.collision_checks)
+    assert all(
+        body3 not in check.bodies() and body4 not in check.bodies()
+        for check in candidates
+    )
+
+    with_broadphase = tcd.check_collisions(collision_matrix).contacts
+    tcd.use_broadphase = False
+    without_broadphase = tcd.check_collisions(collision_matrix).contacts
+    assert set(with_broadphase) == set(without_broadphase)
+    for contact in with_broadphase:
+        reference = next(c for c in without_broadphase if c == contact)
+        assert np.isclose(contact.distance, reference.distance)
@@ -4,6 +4,9 @@ from krrood.symbolic_math.float_variable_data import (
     FloatVariableData,
 )
 from krrood.symbolic_math.symbolic_math import Vector, VariableParameters, FloatVariable
+from semantic_digital_twin.collision_checking.collision_detector import (
+    CollisionCheckingResult,
+)
 from semantic_digital_twin.collision_checking.collision_matrix import (
     MaxAvoidedCollisionsOverride,
 )
@@ -122,6 +125,49 @@ class TestExternalCollisionExpressionManager:
         )
         assert np.allclose(result, expected)
 
+    def test_contact_order_and_orientation(self, cylinder_bot_world):
+        float_variable_data = FloatVariableData()
+        env1 = cylinder_bot_world.get_kinematic_structure_entity_by_name("environment")
+        env2 = cylinder_bot_world.get_kinematic_structure_entity_by_name("environment2")
+        robot = cylinder_bot_world.get_semantic_annotations_by_type(MinimalRobot)[0]
+        collision_manager = cylinder_bot_world.collision_manager
+        collision_manager.temporary_rules.append(
+            AvoidCollisionBetweenGroups(
+                buffer_zone_distance=10,
+                violated_distance=0.0,
+                body_group_a=[robot.root],
+                body_group_b=[env1, env2],
+            )
+        )
+        collision_manager.max_avoided_bodies_rules.append(
+            MaxAvoidedCollisionsOverride(2, {robot.root})
+        )
+        collision_manager.add_collision_consumer(
+            external_collisions := ExternalCollisionVariableManager(float_variable_data)
+        )
+        external_collisions.register_group_of_body(robot.root)
+        collision_manager.update_collision_matrix()
+        contacts = collision_manager.compute_collisions().contacts
+        assert len(contacts) == 2
+        expected_data = float_variable_data.data.copy()
+
+        # reversed contacts, in reversed order, plus a contact that is too far away to be avoided
+        far_contact = contacts[0].reverse()
+        far_contact.distance = 5.0
+        external_collisions.on_compute_collisions(
+            CollisionCheckingResult.from_contacts(
+                [far_contact] + [contact.reverse() for contact in reversed(contacts)]
+            )
+        )
+        assert np.allclose(float_variable_data.data, expected_data)
+
+        group = external_collisions.get_collision_group(robot.root)
+        closest_contacts = external_collisions.last_closest_contacts[group]
+        assert [contact.distance for contact in closest_contacts] == sorted(
+            contact.distance for contact in contacts + [far_contact]
+        )
+        assert all(contact.body_a in group.bodies for contact in closest_contacts)
+
 
 class TestSelfCollisionExpressionManager:
     def test_simple(self, self_collision_bot_world):
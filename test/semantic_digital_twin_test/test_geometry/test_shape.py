@@ -1,8 +1,14 @@
 import os
+import shutil
+from copy import deepcopy
 from importlib.resources import files
 from pathlib import Path
 
-from semantic_digital_twin.world_description.geometry import Mesh
+import numpy as np
+import pytest
+
+from semantic_digital_twin.world_description.geometry import Mesh, Scale, Color
+from semantic_digital_twin.world_description.mesh_store import MeshStore
 
 
 def test_shape():
@@ -23,3 +29,43 @@ def test_shape():
     assert mesh.filename.startswith("/tmp/")
     assert mesh.filename.endswith(".obj")
     assert len(mesh.mesh.visual.uv) == 8527
+
+
+def test_meshes_share_file_content(tmp_path):
+    milk_path = os.path.join(
+        Path(files("semantic_digital_twin")).parent.parent,
+        "resources",
+        "stl",
+        "milk.stl",
+    )
+    copied_milk_path = tmp_path / "milk_copy.stl"
+    shutil.copy(milk_path, copied_milk_path)
+
+    mesh = Mesh(filename=milk_path)
+    same_content = Mesh(filename=str(copied_milk_path))
+    scaled = Mesh(filename=milk_path, scale=Scale(2.0, 2.0, 2.0))
+    colored = Mesh(filename=milk_path, color=Color.RED())
+
+    assert mesh.mesh is same_content.mesh
+    assert mesh.mesh is deepcopy(mesh).mesh
+    assert scaled.mesh is not mesh.mesh
+    assert np.allclose(scaled.mesh.vertices, 2 * mesh.mesh.vertices)
+    assert np.all(colored.mesh.visual.vertex_colors == [255, 0, 0, 255])
+    with pytest.raises(ValueError):
+        mesh.mesh.apply_scale(2.0)
+
+
+def test_mesh_store_evicts_least_recently_used():
+    milk_path = os.path.join(
+        Path(files("semantic_digital_twin")).parent.parent,
+        "resources",
+        "stl",
+        "milk.stl",
+    )
+    store = MeshStore(maximum_number_of_derived_meshes=2)
+    small = store.get(milk_path, (1.0, 1.0, 1.0), (1.0, 1.0, 1.0, 1.0))
+    large = store.get(milk_path, (2.0, 2.0, 2.0), (1.0, 1.0, 1.0, 1.0))
+    assert store.get(milk_path, (1.0, 1.0, 1.0), (1.0, 1.0, 1.0, 1.0)) is small
+    store.get(milk_path, (3.0, 3.0, 3.0), (1.0, 1.0, 1.0, 1.0))
+    assert store.get(milk_path, (1.0, 1.0, 1.0), (1.0, 1.0, 1.0, 1.0)) is small
+    assert store.get(milk_path, (2.0, 2.0, 2.0), (1.0, 1.0, 1.0, 1.0)) is not large
@@ -10,7 +10,7 @@ from semantic_digital_twin.pipeline.mesh_decomposition.box_decomposer import (
 from semantic_digital_twin.pipeline.mesh_decomposition.coacd import COACDMeshDecomposer
 from semantic_digital_twin.pipeline.mesh_decomposition.vhacd import VHACDMeshDecomposer
 from semantic_digital_twin.pipeline.pipeline import Pipeline
-from semantic_digital_twin.world_description.geometry import Box
+from semantic_digital_twin.world_description.geometry import Box, Scale
 
 
 @pytest.fixture(scope="function")
@@ -39,6 +39,19 @@ def test_coacd(jeroen_cup_world_fixture):
     assert len(cup.collision.shapes) > old_collision_length
 
 
+def test_coacd_with_non_unit_scale(jeroen_cup_world_fixture):
+    [cup] = jeroen_cup_world_fixture.bodies
+    [mesh] = cup.collision.shapes
+    mesh.scale = Scale(2.0, 2.0, 2.0)
+    shared_vertices = mesh.mesh.vertices.copy()
+
+    pipeline = Pipeline([COACDMeshDecomposer(threshold=0.2)])
+    pipeline.apply(jeroen_cup_world_fixture)
+
+    assert len(cup.collision.shapes) > 1
+    assert (mesh.mesh.vertices == shared_vertices).all()
+
+
 def test_vhacd(jeroen_cup_world_fixture):
     [cup] = jeroen_cup_world_fixture.bodies
     old_collision_length = len(cup.collision.shapes)
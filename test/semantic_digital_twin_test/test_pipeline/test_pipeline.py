@@ -8,6 +8,7 @@ from importlib.resources import files
 from pathlib import Path
 
 from semantic_digital_twin.adapters.fbx import FBXParser
+from semantic_digital_twin.adapters.mesh import STLParser
 from semantic_digital_twin.adapters.procthor.procthor_pipelines import (
     dresser_from_body_in_world,
     drawer_from_body_in_world,
@@ -118,6 +119,28 @@ class PipelineTestCase(unittest.TestCase):
 
         self.assertEqual(original_bounding_boxes, new_bounding_boxes)
 
+    def test_center_local_geometry_of_shared_meshes(self):
+        stl_path = os.path.join(
+            Path(files("semantic_digital_twin")).parent.parent,
+            "resources",
+            "stl",
+            "jeroen_cup.stl",
+        )
+        world = STLParser(stl_path).parse()
+        [cup] = world.bodies
+        [mesh] = cup.collision.shapes
+        other_world = STLParser(stl_path).parse()
+        [other_mesh] = other_world.root.collision.shapes
+        shared_vertices = other_mesh.mesh.vertices.copy()
+
+        Pipeline(steps=[CenterLocalGeometryAndPreserveWorldPose()]).apply(world)
+
+        centered_bounds = mesh.mesh.bounds
+        np.testing.assert_almost_equal(
+            (centered_bounds[0] + centered_bounds[1]) / 2, np.zeros(3)
+        )
+        np.testing.assert_equal(other_mesh.mesh.vertices, shared_vertices)
+
     def test_body_replace(self):
         dresser_pattern = re.compile(r"^.*dresser_(?!drawer\b).*$", re.IGNORECASE)
         world = FBXParser(self.fbx_path).parse()
@@ -5,6 +5,7 @@ from semantic_digital_twin.spatial_types.spatial_types import (
     HomogeneousTransformationMatrix,
 )
 from semantic_digital_twin.testing import ray_test_world
+from semantic_digital_twin.world_description.geometry import Box, Scale
 
 
 def test_create_segmentation_mask(ray_test_world):
@@ -152,3 +153,70 @@ def test_max_distance(ray_test_world):
     hits, indices, bodies = rt.ray_test(rays, targets, max_distance=1)
 
     assert len(hits) == 0
+
+
+def test_ray_tracer_is_updated_incrementally(ray_test_world):
+    world, body1, body2, body3, body4 = ray_test_world
+    rt = world.ray_tracer
+    assert world.ray_tracer is rt
+
+    mesh = rt.mesh
+    # queries without changes of the world reuse the scene
+    rt.ray_test(np.array([1, 0, 0.1]), np.array([-1, 0, 0.1]))
+    assert rt.mesh is mesh
+
+    world.get_connection(world.root, body1).origin = np.array(
+        [[1, 0, 0, 1], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+    )
+    hits, indices, bodies = rt.ray_test(np.array([1, 1, 0.1]), np.array([1, -1, 0.1]))
+    assert rt.mesh is not mesh
+    assert bodies == [body1]
+
+    geometry_of_body1 = rt.body_geometries[body1.id]
+    with world.modify_world():
+        world.remove_connection(world.get_connection(world.root, body4))
+        world.remove_kinematic_structure_entity(body4)
+    rt.update_scene()
+    assert body4.id not in rt.body_geometries
+    assert rt.body_geometries[body1.id] is geometry_of_body1
+    assert set(rt.node_to_body.values()) == {body1, body2, body3}
+    assert len(rt.scene.geometry) == 3
+
+    hits, indices, bodies = rt.ray_test(np.array([1, 1, 0.1]), np.array([1, -1, 0.1]))
+    assert bodies == [body1]
+
+
+def test_ray_tracer_detects_changed_shapes(ray_test_world):
+    world, body1, body2, body3, body4 = ray_test_world
+    rt = world.ray_tracer
+    world.get_connection(world.root, body1).origin = np.array(
+        [[1, 0, 0, 1], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+    )
+    hits, indices, bodies = rt.ray_test(np.array([1, 1, 0.1]), np.array([1, -1, 0.1]))
+    assert bodies == [body1]
+    assert np.isclose(hits[0][1], 0.125)
+
+    geometry_of_body1 = rt.body_geometries[body1.id]
+    geometry_of_body2 = rt.body_geometries[body2.id]
+    # changes of shapes in place are detected without modifying the world
+    body1.collision[0].scale = Scale(1, 1, 1)
+    hits, indices, bodies = rt.ray_test(np.array([1, 1, 0.1]), np.array([1, -1, 0.1]))
+    assert rt.body_geometries[body1.id] is not geometry_of_body1
+    assert rt.body_geometries[body2.id] is geometry_of_body2
+    assert bodies == [body1]
+    assert np.isclose(hits[0][1], 0.5)
+
+    # replaced shapes are detected, even if they are allocated at the address of the old shape
+    geometry_of_body1 = rt.body_geometries[body1.id]
+    body1.collision.shapes[0] = Box(
+        origin=HomogeneousTransformationMatrix.from_xyz_rpy(),
+        scale=Scale(0.5, 0.5, 0.5),
+    )
+    hits, indices, bodies = rt.ray_test(np.array([1, 1, 0.1]), np.array([1, -1, 0.1]))
+    assert rt.body_geometries[body1.id] is not geometry_of_body1
+    assert np.isclose(hits[0][1], 0.25)
+
+    # queries without changes of any shape reuse the scene
+    mesh = rt.mesh
+    rt.ray_test(np.array([1, 1, 0.1]), np.array([1, -1, 0.1]))
+    assert rt.mesh is mesh
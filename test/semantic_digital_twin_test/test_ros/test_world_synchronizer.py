@@ -15,6 +15,7 @@ import numpy as np
 import pytest
 import rclpy
 import sqlalchemy
+import std_msgs.msg
 from rclpy.executors import SingleThreadedExecutor
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -27,6 +28,9 @@ from semantic_digital_twin.adapters.ros.messages import (
     LoadModel,
     Acknowledgment,
     WorldUpdate,
+    PackedWorldStateUpdate,
+    MeshContentRequest,
+    MeshContent,
 )
 from semantic_digital_twin.adapters.ros.world_synchronizer import (
     ModelReloadSynchronizer,
@@ -50,7 +54,7 @@ from semantic_digital_twin.semantic_annotations.semantic_annotations import (
     Fridge,
     Drawer,
 )
-from semantic_digital_twin.spatial_types import Vector3
+from semantic_digital_twin.spatial_types import Vector3, HomogeneousTransformationMatrix
 from semantic_digital_twin.world import World
 from semantic_digital_twin.world_description.connections import (
     Connection6DoF,
@@ -58,7 +62,12 @@ from semantic_digital_twin.world_description.connections import (
     PrismaticConnection,
 )
 from semantic_digital_twin.world_description.degree_of_freedom import DegreeOfFreedom
-from semantic_digital_twin.world_description.geometry import Scale
+from semantic_digital_twin.world_description.geometry import Scale, Mesh
+from semantic_digital_twin.world_description.mesh_store import (
+    BinaryMeshSerialization,
+    mesh_store,
+)
+from semantic_digital_twin.world_description.shape_collection import ShapeCollection
 from semantic_digital_twin.world_description.world_entity import (
     Body,
     SemanticAnnotation,
@@ -1241,6 +1250,30 @@ def test_world_state_update_serialization_round_trip():
     assert restored.publication_event_id == original.publication_event_id
 
 
+def test_packed_world_state_update_serialization_round_trip():
+    """
+    Verify that PackedWorldStateUpdate survives a to_json/from_json round trip, with and without its ids.
+    """
+    meta = MetaData(node_name="test_node", process_id=42)
+    for ids in [[uuid.uuid4(), uuid.uuid4(), uuid.uuid4()], None]:
+        original = PackedWorldStateUpdate(
+            meta_data=meta,
+            model_version=3,
+            indices=np.array([0, 2]),
+            values=np.array([1.5, -2.5]),
+            ids=ids,
+        )
+
+        restored = from_json(json.loads(json.dumps(to_json(original))))
+
+        assert isinstance(restored, PackedWorldStateUpdate)
+        assert restored.model_version == original.model_version
+        assert np.array_equal(restored.indices, original.indices)
+        assert np.array_equal(restored.values, original.values)
+        assert restored.ids == original.ids
+        assert restored.publication_event_id == original.publication_event_id
+
+
 def test_load_model_serialization_round_trip():
     """
     Verify that LoadModel survives a to_json/from_json round trip.
@@ -1274,6 +1307,103 @@ def test_acknowledgment_serialization_round_trip():
     assert restored.node_meta_data.process_id == 1
 
 
+def test_mesh_content_serialization_round_trip():
+    """
+    Verify that MeshContentRequest and MeshContent survive a to_json/from_json round trip.
+    """
+    meta = MetaData(node_name="mesh_content_node", process_id=1)
+    request = MeshContentRequest(content_hash="abc", node_meta_data=meta)
+    content = MeshContent(
+        content_hash="abc",
+        file_type="stl",
+        vertices="AAAA",
+        faces="BBBB",
+        node_meta_data=meta,
+    )
+
+    restored_request = from_json(to_json(request))
+    restored_content = from_json(to_json(content))
+
+    assert isinstance(restored_request, MeshContentRequest)
+    assert restored_request.content_hash == "abc"
+    assert restored_request.node_meta_data.node_name == "mesh_content_node"
+    assert isinstance(restored_content, MeshContent)
+    assert restored_content.mesh_json == {
+        "content_hash": "abc",
+        "file_type": "stl",
+        "vertices": "AAAA",
+        "faces": "BBBB",
+    }
+
+
+def test_unknown_mesh_content_is_requested_from_sender(rclpy_node):
+    """
+    A receiver that gets a mesh as a reference to its content hash only, e.g. because it joined late or missed the
+    message with the content, requests the content from the sender and holds the message back until it arrives.
+    """
+    w1 = World(name="w1")
+    w2 = World(name="w2")
+
+    synchronizer_1 = WorldSynchronizer(node=rclpy_node, _world=w1)
+    # the receiver does not listen to the topic of the sender, such that its messages are delivered by hand
+    synchronizer_2 = WorldSynchronizer(
+        node=rclpy_node, _world=w2, topic_name="/semantic_digital_twin/late_joiner"
+    )
+    published_messages = []
+    subscription = rclpy_node.create_subscription(
+        std_msgs.msg.String,
+        synchronizer_1.topic_name,
+        published_messages.append,
+        10,
+    )
+    time.sleep(0.2)
+
+    milk = os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "..",
+        "..",
+        "semantic_digital_twin",
+        "resources",
+        "stl",
+        "milk.stl",
+    )
+    content_hash = mesh_store.content_hash(milk)
+    # the content has been published before the receiver joined
+    synchronizer_1._mesh_serialization.serialized_content_hashes.add(content_hash)
+
+    body = Body(name=PrefixedName("milk"))
+    mesh = Mesh(
+        filename=milk,
+        origin=HomogeneousTransformationMatrix.from_xyz_rpy(reference_frame=body),
+    )
+    body.collision = ShapeCollection([mesh], reference_frame=body)
+    with w1.modify_world():
+        w1.add_kinematic_structure_entity(body)
+
+    assert wait_for_condition(lambda: len(published_messages) == 1)
+    assert "vertices" not in published_messages[0].data
+
+    # the receiver has never seen the content of the mesh
+    mesh_store.clear()
+    synchronizer_2.subscription_callback(published_messages[0])
+    assert len(synchronizer_2._received_messages) == 1
+    assert len(w2.kinematic_structure_entities) == 0
+
+    # the sender knows its files, which the cleared mesh store has forgotten, so the receiver asks again
+    mesh_store.content_hash(milk)
+    synchronizer_2.request_mesh_content(content_hash)
+
+    assert wait_for_condition(lambda: len(w2.kinematic_structure_entities) == 1)
+    assert not synchronizer_2._received_messages
+    received_mesh = w2.get_kinematic_structure_entity_by_id(body.id).collision[0]
+    assert np.allclose(received_mesh.mesh.vertices, mesh.mesh.vertices, atol=1e-6)
+
+    rclpy_node.destroy_subscription(subscription)
+    synchronizer_1.close()
+    synchronizer_2.close()
+
+
 def test_acknowledgement_with_missed_messages(rclpy_node):
     import rclpy
     from rclpy.executors import SingleThreadedExecutor
@@ -2101,6 +2231,84 @@ def test_apply_state_with_unknown_identifier_raises(rclpy_node):
     world_synchronizer.close()
 
 
+def test_apply_packed_state_with_known_and_missing_state_table(rclpy_node):
+    """
+    _apply_packed_state must skip updates whose table of degree of freedom ids has not been received, and apply
+    updates through the cached table once it has been received.
+    """
+    world = create_dummy_world()
+    world_synchronizer = WorldSynchronizer(node=rclpy_node, _world=world)
+    sender = MetaData(node_name="sender", process_id=42)
+    model_version = world.get_world_model_manager().version
+    ids = list(reversed(world.state.keys()))
+    initial_positions = world.state.positions.copy()
+
+    without_table = PackedWorldStateUpdate(
+        meta_data=sender,
+        model_version=model_version,
+        indices=np.array([0]),
+        values=np.array([2.5]),
+    )
+    world_synchronizer._apply_packed_state(without_table)
+    assert np.array_equal(world.state.positions, initial_positions)
+
+    with_table = PackedWorldStateUpdate(
+        meta_data=sender,
+        model_version=model_version,
+        indices=np.arange(len(ids)),
+        values=np.arange(len(ids), dtype=float),
+        ids=ids,
+    )
+    world_synchronizer._apply_packed_state(with_table)
+    for value, identifier in enumerate(ids):
+        assert world.state[identifier].position == value
+
+    world_synchronizer._apply_packed_state(without_table)
+    assert world.state[ids[0]].position == 2.5
+
+    of_unknown_model_version = PackedWorldStateUpdate(
+        meta_data=sender,
+        model_version=model_version + 1,
+        indices=np.array([0]),
+        values=np.array([-1.0]),
+    )
+    world_synchronizer._apply_packed_state(of_unknown_model_version)
+    assert world.state[ids[0]].position == 2.5
+
+    world_synchronizer.close()
+
+
+def test_state_table_is_resent_periodically(rclpy_node):
+    """
+    The table of degree of freedom ids must be published again after ``state_table_resend_interval`` updates,
+    together with the complete state.
+    """
+    world = create_dummy_world()
+    world_synchronizer = WorldSynchronizer(
+        node=rclpy_node, _world=world, state_table_resend_interval=2
+    )
+
+    published = []
+    world_synchronizer.publish = published.append
+
+    for position in range(4):
+        world.state._data[0, 0] = position + 1.0
+        world.notify_state_change()
+
+    world_synchronizer.close()
+
+    state_updates = [update.packed_state_update for update in published]
+    assert [state_update.ids is not None for state_update in state_updates] == [
+        True,
+        False,
+        False,
+        True,
+    ]
+    assert np.array_equal(state_updates[1].indices, [0])
+    assert np.array_equal(state_updates[3].indices, np.arange(len(world.state)))
+    assert state_updates[3].ids == list(world.state.keys())
+
+
 def test_close_destroys_acknowledge_publisher_and_subscriber(rclpy_node):
     """
     After close(), both acknowledge_publisher and acknowledge_subscriber must be None.
@@ -2262,7 +2470,7 @@ def test_state_publish_does_not_hold_world_lock(rclpy_node):
 
     def probing_publish(msg):
         lock_free = probe_lock_is_free(w._world_lock, 0.3)
-        if msg.state_update is not None:
+        if msg.packed_state_update is not None:
             state_publish_lock_free.append(lock_free)
         return original_publish(msg)
 
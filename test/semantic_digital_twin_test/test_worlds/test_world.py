@@ -21,6 +21,7 @@ from semantic_digital_twin.exceptions import (
     DofNotInWorldStateError,
     WrongWorldModelVersion,
     NonMonotonicTimeError,
+    ReadOnlyTrajectoryError,
     WorldEntityNotFoundError,
     BrokenWorldModificationHistoryError,
     WorldEntityNotFoundError,
@@ -299,6 +300,44 @@ def test_compute_fk_expression(world_setup):
     np.testing.assert_array_almost_equal(fk, fk2)
 
 
+def test_incremental_fk_recompute(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    fk_manager = world._forward_kinematic_manager
+    fk_manager.full_recompute_threshold = 1.0
+    connection: PrismaticConnection = world.get_connection(r1, r2)
+    root_connection: Connection6DoF = world.get_connection(world.root, bf)
+
+    world.state[connection.dof.id].position = 1.0
+    world.notify_state_change()
+    # the dof is shared by the prismatic and the revolute connection
+    assert len(fk_manager._compiled_subtree_fks) == 2
+    world.state[root_connection.x.id].position = 2.0
+    world.notify_state_change()
+
+    for entity in world.kinematic_structure_entities:
+        np.testing.assert_array_almost_equal(
+            world.compute_forward_kinematics_np(world.root, entity),
+            fk_manager.compose_expression(world.root, entity).evaluate(),
+        )
+
+
+def test_compute_fk_np_batch(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    fk_manager = world._forward_kinematic_manager
+    positions = np.tile(world.state.positions, (5, 1))
+    for connection in [world.get_connection(l1, l2), world.get_connection(r1, r2)]:
+        dof_index = world.state.keys().index(connection.dof.id)
+        positions[:, dof_index] = np.random.rand(5)
+    actual = fk_manager.compute_np_batch(l2, r2, positions)
+    assert actual.shape == (5, 4, 4)
+    for state_positions, l2_T_r2 in zip(positions, actual):
+        world.state.positions[:] = state_positions
+        world.notify_state_change()
+        np.testing.assert_array_almost_equal(
+            l2_T_r2, world.compute_forward_kinematics_np(l2, r2)
+        )
+
+
 def test_apply_control_commands(world_setup):
     world, l1, l2, bf, r1, r2 = world_setup
     state_memory_id = id(world.state._data)
@@ -1311,6 +1350,78 @@ def test_world_state_trajectory(world_setup, tmp_path):
         traj.append(world.state, time + dt)
 
 
+def test_world_state_trajectory_growth(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    traj = WorldStateTrajectory.from_world_state(world.state, 0.0)
+    cmd = np.array([100.0, 0, 0, 0, 0, 0, 0, 0])
+    dt = 0.01
+    number_of_steps = 2 * WorldStateTrajectory.initial_capacity
+    for i in range(1, number_of_steps + 1):
+        world.apply_control_commands(cmd, dt, Derivatives.jerk)
+        traj.append(world.state, i * dt)
+
+    assert len(traj) == number_of_steps + 1
+    assert traj.capacity >= len(traj)
+    np.testing.assert_allclose(traj.times, np.arange(number_of_steps + 1) * dt)
+    np.testing.assert_allclose(traj.data[-1], world.state._data)
+
+    # accessors are views into the preallocated arrays
+    assert np.shares_memory(traj.data, traj._data)
+    assert np.shares_memory(traj.times, traj._times)
+    _, view = next(traj.items())
+    assert np.shares_memory(view.data, traj._data)
+
+
+def test_world_state_trajectory_memory_mapped(world_setup, tmp_path):
+    world, l1, l2, bf, r1, r2 = world_setup
+    directory = tmp_path / "trajectory"
+    traj = WorldStateTrajectory.from_world_state(world.state, 0.0, directory)
+    cmd = np.array([100.0, 0, 0, 0, 0, 0, 0, 0])
+    dt = 0.01
+    for i in range(1, 2 * WorldStateTrajectory.initial_capacity):
+        world.apply_control_commands(cmd, dt, Derivatives.jerk)
+        traj.append(world.state, i * dt)
+    traj.flush()
+
+    reopened = WorldStateTrajectory.from_directory(world, directory)
+    assert len(reopened) == len(traj)
+    assert reopened._ids == traj._ids
+    np.testing.assert_array_equal(reopened.times, traj.times)
+    np.testing.assert_array_equal(reopened.data, traj.data)
+    assert isinstance(reopened._data, np.memmap)
+    assert not reopened.data.flags.writeable
+    with pytest.raises(ReadOnlyTrajectoryError):
+        reopened.append(world.state, 10.0)
+
+    # the recorder keeps appending after the trajectory was reopened
+    traj.append(world.state, 10.0)
+    assert len(WorldStateTrajectory.from_directory(world, directory)) == len(traj)
+
+
+def test_world_state_trajectory_files_are_consistent_while_growing(
+    world_setup, tmp_path, monkeypatch
+):
+    world, l1, l2, bf, r1, r2 = world_setup
+    directory = tmp_path / "trajectory"
+    extend_files = WorldStateTrajectory._extend_files
+    readers = []
+
+    def extend_files_and_read(trajectory: WorldStateTrajectory, capacity: int):
+        extend_files(trajectory, capacity)
+        # a reader that opens the trajectory before the writer mapped the extended files
+        readers.append(WorldStateTrajectory.from_directory(world, directory))
+        assert len(readers[-1]) == len(trajectory)
+        assert readers[-1].capacity == capacity
+
+    monkeypatch.setattr(WorldStateTrajectory, "_extend_files", extend_files_and_read)
+    traj = WorldStateTrajectory.from_world_state(world.state, 0.0, directory)
+    for i in range(1, 2 * WorldStateTrajectory.initial_capacity + 1):
+        traj.append(world.state, i * 0.01)
+
+    assert len(readers) == 3
+    assert np.all(np.isnan(traj._times[len(traj) :]))
+
+
 def test_merge_into_empty_world(world_setup):
     world, _, _, _, _, _ = world_setup
     world2 = deepcopy(world)